@@ -0,0 +1,102 @@
+"""
+약물 지식 IVF-Flat 인덱스의 recall@k 대비 지연 시간 벤치마크.
+
+기존 인덱스(--index) 또는 군집 구조를 가진 합성 벡터(--synthetic N)로 측정합니다.
+질의는 인덱스 벡터에 잡음을 더해 만들고, 전체 스캔(정확 검색) 결과를 정답으로 nprobe별 recall을 계산합니다.
+
+    uv run python -m ai_worker.benchmarks.ann_index --synthetic 50000 --dim 768 --k 10
+    uv run python -m ai_worker.benchmarks.ann_index --index ai_worker/indexes/drug_knowledge
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from ai_worker.retrieval.ivf_index import IVFFlatIndex, build_ivf_index
+
+
+def synthetic_index(directory: Path, size: int, dim: int, families: int) -> IVFFlatIndex:
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(1, size // 200), dim)).astype(np.float32)
+    vectors = centers[rng.integers(len(centers), size=size)] + 0.35 * rng.standard_normal((size, dim)).astype(
+        np.float32
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    family_names = [f"family-{i}" for i in range(families)]
+    return build_ivf_index(
+        directory,
+        vectors,
+        doc_ids=[str(i) for i in range(size)],
+        texts=[f"passage {i}" for i in range(size)],
+        families=[family_names[i % families] for i in range(size)],
+    )
+
+
+def make_queries(index: IVFFlatIndex, count: int) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    base = np.asarray(index.vectors[rng.integers(len(index), size=count)], dtype=np.float32)
+    queries = base + 0.05 * rng.standard_normal(base.shape, dtype=np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def timed(fn) -> tuple[list, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def report(index: IVFFlatIndex, queries: np.ndarray, k: int, nprobes: list[int], families: list[str] | None) -> None:
+    exact = [timed(lambda q=q: index.exact_search(q, k=k, families=families)) for q in queries]
+    truth = [{hit.doc_id for hit in hits} for hits, _ in exact]
+    exact_ms = [ms for _, ms in exact]
+    label = f"filter={families}" if families else "unfiltered"
+    print(f"[{label}] n={len(index)} nlist={index.meta['nlist']} queries={len(queries)} k={k}")
+    print(f"{'nprobe':>8} {'recall@k':>9} {'mean_ms':>8} {'p95_ms':>8} {'speedup':>8}")
+    for nprobe in nprobes:
+        runs = [
+            timed(lambda q=q, nprobe=nprobe: index.search(q, k=k, nprobe=nprobe, families=families)) for q in queries
+        ]
+        recall = statistics.fmean(
+            len({hit.doc_id for hit in hits} & expected) / max(1, len(expected))
+            for (hits, _), expected in zip(runs, truth, strict=True)
+        )
+        latencies = sorted(ms for _, ms in runs)
+        mean_ms = statistics.fmean(latencies)
+        print(
+            f"{nprobe:>8} {recall:>9.3f} {mean_ms:>8.3f} {latencies[int(0.95 * (len(latencies) - 1))]:>8.3f} "
+            f"{statistics.fmean(exact_ms) / mean_ms:>7.1f}x"
+        )
+    print(f"{'exact':>8} {1.0:>9.3f} {statistics.fmean(exact_ms):>8.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="IVF-Flat recall@k vs latency benchmark")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--index", type=Path, help="구축된 인덱스 디렉토리")
+    source.add_argument("--synthetic", type=int, metavar="N", help="합성 벡터 N개로 임시 인덱스 구축")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--families", type=int, default=20, help="합성 인덱스의 성분 계열 수")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--filter", nargs="+", default=None, help="필터 검색 측정에 사용할 성분 계열")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.index:
+            index = IVFFlatIndex(args.index)
+        else:
+            index = synthetic_index(Path(tmp), args.synthetic, args.dim, args.families)
+        queries = make_queries(index, args.queries)
+        report(index, queries, args.k, args.nprobe, None)
+        filter_families = args.filter or (index.meta["families"][:1] if index.meta["families"] else None)
+        if filter_families:
+            report(index, queries, args.k, args.nprobe, filter_families)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+OCR 약품명 정규화(SymSpell 자모 색인) 조회 벤치마크.
+
+약품 마스터 CSV(--master) 또는 합성 제품명(--synthetic N)으로 색인을 구축하고,
+제품명에 OCR형 잡음(자모 오인식, 단위 표기 변경, 괄호/공백 누락)을 넣은 질의로
+top-1 정확도, 조회 지연 시간(µs)과 전체 선형 스캔 대비 속도를 측정합니다.
+
+    uv run python -m ai_worker.benchmarks.drug_normalizer --synthetic 50000
+    uv run python -m ai_worker.benchmarks.drug_normalizer --master ai_worker/data/drug_master.csv
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from ai_worker.text.drug_normalizer import DrugEntry, DrugNormalizer
+
+# 실제 제품명에 자주 쓰이는 음절 (합성 제품명 생성용)
+_SYLLABLES = list(
+    "가나다라마바사아자차카타파하고노도로모보소오조코토포호구누두루무부수우주쿠투푸후기니디리미비시이지키티피히"
+    "게네데레메베세에제케테페헤그느드르므브스으즈크트프흐갈날달랄말발살알잘칼탈팔할간난단란만반산안잔칸탄판한"
+    "곤논돈론몬본손온존콘톤폰혼린민빈신인진틴핀힌롤놀졸콜톨폴셀렐벨텔펠델락록릭맥벡펙텍렉넥덱솔돌몰볼"
+    "트렌렌센젠덴펜벤텐엔큐뮤듀류뉴슈쥬프람그람리딘라진타민세핌플록옥삭톡신마이신"
+)
+_FORMS = ["정", "캡슐", "서방정", "연질캡슐", "시럽", "현탁액", "필름코팅정", "구강붕해정"]
+_STRENGTHS = ["2.5", "5", "10", "20", "25", "40", "50", "100", "250", "500", "650", "1000"]
+_UNITS = {"밀리그램": ["mg", "밀리그람", "㎎", " mg"], "mg": ["밀리그램", "밀리그람", "㎎"]}
+
+
+def synthetic_entries(size: int) -> list[DrugEntry]:
+    rng = random.Random(0)
+    # 괄호 성분명을 제외한 제품명(함량 포함)이 겹치지 않도록 생성합니다.
+    names: dict[str, str] = {}
+    while len(names) < size:
+        product = "".join(rng.choices(_SYLLABLES, k=rng.randint(2, 5))) + rng.choice(_FORMS) + rng.choice(_STRENGTHS)
+        ingredient = "".join(rng.choices(_SYLLABLES, k=rng.randint(3, 6)))
+        names.setdefault(product, f"{product}{rng.choice(list(_UNITS))}({ingredient})")
+    return [DrugEntry(name=name, code=f"{index:09d}") for index, name in enumerate(sorted(names.values()))]
+
+
+def _perturb_syllable(char: str, rng: random.Random) -> str:
+    offset = ord(char) - 0xAC00
+    initial, medial, final = offset // 588, offset // 28 % 21, offset % 28
+    part = rng.randrange(3)
+    if part == 0:
+        initial = rng.randrange(19)
+    elif part == 1:
+        medial = rng.randrange(21)
+    else:
+        final = rng.randrange(28)
+    return chr(0xAC00 + (initial * 21 + medial) * 28 + final)
+
+
+def ocr_noise(name: str, rng: random.Random, max_errors: int) -> str:
+    """
+    제품명에 OCR에서 흔한 변형을 적용합니다: 괄호 성분명 누락, 단위 표기 변경, 공백 삽입, 자모 오인식.
+    """
+    text = name.split("(")[0] if rng.random() < 0.7 else name
+    for unit, aliases in _UNITS.items():
+        if unit in text and rng.random() < 0.5:
+            text = text.replace(unit, rng.choice(aliases), 1)
+            break
+    chars = list(text)
+    if rng.random() < 0.3:
+        chars.insert(rng.randrange(1, len(chars)), " ")
+    hangul = [index for index, char in enumerate(chars) if "가" <= char <= "힣"]
+    for index in rng.sample(hangul, k=min(len(hangul), rng.randint(0, max_errors))):
+        chars[index] = _perturb_syllable(chars[index], rng)
+    return "".join(chars)
+
+
+def timed_us[T](fn: Callable[[], T]) -> tuple[T, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1_000_000
+
+
+def report(label: str, latencies: list[float]) -> float:
+    latencies = sorted(latencies)
+    mean_us = statistics.fmean(latencies)
+    print(
+        f"{label:<10} mean={mean_us:.1f}us p50={latencies[len(latencies) // 2]:.1f}us "
+        f"p95={latencies[int(0.95 * (len(latencies) - 1))]:.1f}us"
+    )
+    return mean_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drug-name normalizer lookup benchmark")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--master", type=Path, help="약품 마스터 CSV (name, code 열)")
+    source.add_argument("--synthetic", type=int, metavar="N", help="합성 제품명 N개로 색인 구축")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--linear-queries", type=int, default=50, help="선형 스캔 기준 측정에 사용할 질의 수")
+    parser.add_argument("--max-distance", type=int, default=2)
+    parser.add_argument("--max-errors", type=int, default=1, help="질의당 자모 오인식 음절 수 상한")
+    args = parser.parse_args()
+
+    if args.master:
+        entries = DrugNormalizer.from_csv(args.master).entries
+    else:
+        entries = synthetic_entries(args.synthetic)
+
+    normalizer, build_us = timed_us(lambda: DrugNormalizer(entries, max_distance=args.max_distance))
+    print(
+        f"entries={len(normalizer)} terms={normalizer.term_count} deletes={normalizer.delete_count} "
+        f"build={build_us / 1_000_000:.2f}s"
+    )
+
+    rng = random.Random(1)
+    targets = rng.choices(normalizer.entries, k=args.queries)
+    queries = [ocr_noise(entry.name, rng, args.max_errors) for entry in targets]
+
+    runs = [timed_us(partial(normalizer.lookup, query, limit=5)) for query in queries]
+    top5 = statistics.fmean(
+        any(match.code == entry.code for match in matches) for (matches, _), entry in zip(runs, targets, strict=True)
+    )
+    best = [timed_us(partial(normalizer.normalize, query)) for query in queries]
+    top1 = statistics.fmean(
+        match is not None and match.code == entry.code for (match, _), entry in zip(best, targets, strict=True)
+    )
+    print(f"queries={len(queries)} top1={top1:.3f} top5={top5:.3f}")
+    mean_us = report("lookup(5)", [us for _, us in runs])
+    report("normalize", [us for _, us in best])
+
+    linear = [timed_us(partial(normalizer.linear_lookup, query, limit=5)) for query in queries[: args.linear_queries]]
+    linear_mean = statistics.fmean(us for _, us in linear)
+    agree = statistics.fmean(
+        [match.code for match in fast] == [match.code for match in slow]
+        for (fast, _), (slow, _) in zip(runs, linear, strict=False)
+    )
+    print(f"{'linear':<10} mean={linear_mean:.1f}us speedup={linear_mean / mean_us:.0f}x agreement={agree:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+API → 워커 이미지 전달 방식 벤치마크: 인라인(base64를 작업 메시지에 포함) vs 공유 저장소 참조(blob + mmap).
+
+합성 휴대폰 사진(JPEG)을 작업으로 만들어 Redis 큐에 넣고 꺼내 디코딩하기까지를 방식별로 측정합니다.
+  - payload_kb: 작업 메시지 크기
+  - redis_kb: 큐에 쌓인 작업 하나가 차지하는 Redis 메모리 (MEMORY USAGE / 작업 수)
+  - handoff_ms: 인코딩/기록 → RPUSH → BLPOP → 파싱 → 이미지 버퍼 열기 (디코딩 제외)
+  - e2e_ms: handoff + 이미지 디코딩(RGB 변환)
+
+    uv run python -m ai_worker.benchmarks.image_handoff --redis-url redis://localhost:6379 --size 3024x4032 --jobs 50
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import redis
+from PIL import Image
+
+from ai_worker.core import config
+from ai_worker.core.blobs import open_image
+
+QUEUE_KEY = "bench:image_handoff"
+
+
+def synthetic_photo(width: int, height: int, seed: int) -> bytes:
+    noise = Image.effect_noise((width // 4, height // 4), 40 + seed % 20).resize((width, height))
+    buffer = io.BytesIO()
+    Image.merge("RGB", (noise, noise.rotate(90, expand=False), noise)).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def make_payload(mode: str, image: bytes) -> dict:
+    sha256 = hashlib.sha256(image).hexdigest()
+    if mode == "inline":
+        return {"image_b64": base64.b64encode(image).decode(), "image_sha256": sha256}
+    # app/services/blob_store.py와 같은 방식으로 기록합니다.
+    relative = f"{sha256[:2]}/{sha256}"
+    path = Path(config.BLOB_DIR) / relative
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temp.write_bytes(image)
+        os.replace(temp, path)
+    return {"blob": {"sha256": sha256, "path": relative, "size": len(image)}, "image_sha256": sha256}
+
+
+def measure(client: redis.Redis, mode: str, images: list[bytes]) -> dict[str, float]:
+    client.delete(QUEUE_KEY)
+    payload_sizes = []
+    for image in images:
+        job = json.dumps({"job_id": uuid.uuid4().hex, "task": "cnn", "payload": make_payload(mode, image)})
+        payload_sizes.append(len(job))
+        client.rpush(QUEUE_KEY, job)
+    redis_bytes = client.memory_usage(QUEUE_KEY) or sum(payload_sizes)
+    client.delete(QUEUE_KEY)
+
+    handoff_ms, e2e_ms = [], []
+    for image in images:
+        started = time.perf_counter()
+        job = json.dumps({"job_id": uuid.uuid4().hex, "task": "cnn", "payload": make_payload(mode, image)})
+        client.rpush(QUEUE_KEY, job)
+        _, raw = client.blpop([QUEUE_KEY])
+        with open_image(json.loads(raw)["payload"]) as source:
+            opened = time.perf_counter()
+            Image.open(source.stream()).convert("RGB")
+        finished = time.perf_counter()
+        handoff_ms.append((opened - started) * 1000)
+        e2e_ms.append((finished - started) * 1000)
+
+    def p95(values: list[float]) -> float:
+        return sorted(values)[int(0.95 * (len(values) - 1))]
+
+    return {
+        "payload_kb": statistics.fmean(payload_sizes) / 1024,
+        "redis_kb": redis_bytes / len(images) / 1024,
+        "handoff_ms": statistics.fmean(handoff_ms),
+        "handoff_p95": p95(handoff_ms),
+        "e2e_ms": statistics.fmean(e2e_ms),
+        "e2e_p95": p95(e2e_ms),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="inline base64 vs shared blob image handoff benchmark")
+    parser.add_argument("--redis-url", default=config.REDIS_URL)
+    parser.add_argument("--size", default="3024x4032", help="합성 사진 크기 (WxH)")
+    parser.add_argument("--images", type=int, default=5, help="서로 다른 합성 사진 수")
+    parser.add_argument("--jobs", type=int, default=30)
+    args = parser.parse_args()
+
+    width, height = map(int, args.size.split("x"))
+    distinct = [synthetic_photo(width, height, seed) for seed in range(args.images)]
+    images = [distinct[index % len(distinct)] for index in range(args.jobs)]
+    print(f"image={args.size} jpeg_kb={statistics.fmean(map(len, distinct)) / 1024:.0f} jobs={args.jobs}")
+
+    client = redis.Redis.from_url(args.redis_url)
+    with tempfile.TemporaryDirectory() as blob_dir:
+        config.BLOB_DIR = blob_dir
+        columns = ("payload_kb", "redis_kb", "handoff_ms", "handoff_p95", "e2e_ms", "e2e_p95")
+        print(f"{'mode':<8}" + "".join(f"{column:>13}" for column in columns))
+        for mode in ("inline", "blob"):
+            result = measure(client, mode, images)
+            print(f"{mode:<8}" + "".join(f"{result[column]:>13.2f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
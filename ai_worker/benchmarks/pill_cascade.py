@@ -0,0 +1,99 @@
+"""
+알약 인식 캐스케이드 오프라인 벤치마크.
+
+ImageFolder 구조(<images>/<pill_name>/*.jpg)의 검증 이미지에 대해 경량/대형 모델을 모두 한 번씩 실행한 뒤,
+임계값별로 승격 비율, 평균 지연 시간(항상 대형+각인 OCR 대비 절감량), top-1 정확도를 출력합니다.
+
+    uv run python -m ai_worker.benchmarks.pill_cascade --images data/pill_val --thresholds 0.5 0.6 0.7
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ai_worker.tasks import ocr
+from ai_worker.tasks.pill_cascade import load_fast_classifier, load_large_classifier, preprocess
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+@dataclass
+class Sample:
+    label: str
+    fast_top1: str
+    fast_confidence: float
+    preprocess_ms: float
+    fast_ms: float
+    large_top1: str
+    escalated_ms: float  # 대형 모델 + 각인 OCR
+
+
+def measure(images: Path) -> list[Sample]:
+    fast, large = load_fast_classifier(), load_large_classifier()
+    samples = []
+    for path in sorted(p for p in images.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES):
+        image_bytes = path.read_bytes()
+
+        started = time.perf_counter()
+        tensor = preprocess(image_bytes)
+        preprocess_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        fast_top = fast.predict(tensor, top_k=1)[0]
+        fast_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        large_top = large.predict(tensor, top_k=1)[0]
+        ocr.recognize_imprint(image_bytes)
+        escalated_ms = (time.perf_counter() - started) * 1000
+
+        samples.append(
+            Sample(
+                label=path.parent.name,
+                fast_top1=fast_top["pill_name"],
+                fast_confidence=fast_top["confidence"],
+                preprocess_ms=preprocess_ms,
+                fast_ms=fast_ms,
+                large_top1=large_top["pill_name"],
+                escalated_ms=escalated_ms,
+            )
+        )
+    return samples
+
+
+def report(samples: list[Sample], thresholds: list[float]) -> None:
+    # 비교 기준: 모든 입력을 전처리 + 대형 모델 + 각인 OCR로 처리하는 단일 단계 파이프라인
+    baseline_ms = statistics.fmean(s.preprocess_ms + s.escalated_ms for s in samples)
+    baseline_acc = statistics.fmean(s.large_top1 == s.label for s in samples)
+    print(f"samples={len(samples)} baseline(large+imprint) mean={baseline_ms:.1f}ms top1={baseline_acc:.3f}")
+    print(f"{'threshold':>9} {'escalated':>9} {'mean_ms':>8} {'saved_ms':>8} {'saved%':>7} {'top1':>6}")
+    for threshold in thresholds:
+        escalated = [s.fast_confidence < threshold for s in samples]
+        latencies = [
+            s.preprocess_ms + s.fast_ms + (s.escalated_ms if esc else 0)
+            for s, esc in zip(samples, escalated, strict=True)
+        ]
+        correct = [(s.large_top1 if esc else s.fast_top1) == s.label for s, esc in zip(samples, escalated, strict=True)]
+        mean_ms = statistics.fmean(latencies)
+        print(
+            f"{threshold:>9.2f} {statistics.fmean(escalated):>9.1%} {mean_ms:>8.1f} "
+            f"{baseline_ms - mean_ms:>8.1f} {(baseline_ms - mean_ms) / baseline_ms:>7.1%} {statistics.fmean(correct):>6.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pill recognition cascade benchmark")
+    parser.add_argument("--images", type=Path, required=True, help="ImageFolder 구조의 검증 이미지 디렉토리")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.6, 0.7, 0.8])
+    args = parser.parse_args()
+
+    samples = measure(args.images)
+    if not samples:
+        raise SystemExit(f"no images found under {args.images}")
+    report(samples, args.thresholds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+처방전 OCR 원문 파서 처리량 벤치마크.
+
+표 형식/서술 형식이 섞인 합성 처방전(기본 10,000건)에 구분선, 표 기호, 전각 문자, "1일" → "l일" 같은
+OCR 잡음을 넣어 파싱하고, 처리량(건/초, MB/초)과 정답 대비 행 재현율·필드 정확도를 측정합니다.
+
+    uv run python -m ai_worker.benchmarks.prescription_parser --count 10000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from dataclasses import dataclass
+
+from ai_worker.text.prescription_parser import parse_prescription
+
+_HOSPITALS = [
+    "서울대학교병원",
+    "연세세브란스병원",
+    "행복내과의원",
+    "우리소아청소년과의원",
+    "강남보건소",
+    "튼튼정형외과의원",
+]
+_STEMS = [
+    "타이레놀",
+    "아모디핀",
+    "노바스크",
+    "리피토",
+    "글리아티린",
+    "록소닌",
+    "뮤코스타",
+    "알마겔",
+    "세레콕시브",
+    "판토록",
+]
+_FORMS = ["정", "캡슐", "서방정", "필름코팅정", "연질캡슐"]
+_UNITS = {"mg": ["mg", "밀리그램", "밀리그람", "㎎", " mg"], "mcg": ["마이크로그램", "mcg", "㎍"]}
+_USAGES = ["식후30분", "식후 30분", "취침전", "아침 식전", "", "필요시"]
+_NOISE_LINES = ["=" * 40, "-" * 32, "| | | |", "___ ㅣ ---", "※ 본 처방전은 발행일로부터 3일간 유효합니다", ""]
+
+
+@dataclass
+class ExpectedDrug:
+    strength: float
+    unit: str
+    dose: float
+    frequency: int
+    duration: int
+
+
+def _dose_text(dose: float, rng: random.Random) -> str:
+    return rng.choice(["½", "1/2", "0.5"]) if dose == 0.5 else f"{dose:g}"
+
+
+def _row(drug: ExpectedDrug, rng: random.Random) -> str:
+    name = f"{rng.choice(_STEMS)}{rng.choice(_FORMS)}"
+    strength = f"{drug.strength:g}{rng.choice(_UNITS[drug.unit])}"
+    one = rng.choice(["1", "1", "1", "l"])  # OCR이 숫자 1을 영문 l로 읽는 경우
+    if rng.random() < 0.5:
+        separator = rng.choice([" | ", "  ", "\t", " │ "])
+        cells = [
+            f"{name}{strength}",
+            _dose_text(drug.dose, rng),
+            str(drug.frequency),
+            str(drug.duration),
+            rng.choice(_USAGES),
+        ]
+        return separator.join(cells)
+    return (
+        f"{name} {strength}  {one}회 {_dose_text(drug.dose, rng)}정  {one}일 {drug.frequency}회  "
+        f"{rng.choice(['', '총 '])}{drug.duration}일{rng.choice(['분', ''])}  {rng.choice(_USAGES)}"
+    )
+
+
+def synthetic_prescription(rng: random.Random) -> tuple[str, dict]:
+    hospital = rng.choice(_HOSPITALS)
+    year, month, day = rng.randint(2020, 2025), rng.randint(1, 12), rng.randint(1, 28)
+    date_text = rng.choice([f"{year}-{month:02d}-{day:02d}", f"{year}.{month}.{day}", f"{year}년 {month}월 {day}일"])
+    drugs = [
+        ExpectedDrug(
+            strength=rng.choice([2.5, 5, 10, 20, 100, 250, 500, 650]),
+            unit=rng.choice(["mg", "mg", "mg", "mcg"]),
+            dose=rng.choice([0.5, 1, 1, 1, 2]),
+            frequency=rng.choice([1, 2, 3, 3, 4]),
+            duration=rng.choice([3, 5, 7, 14, 30, 90]),
+        )
+        for _ in range(rng.randint(1, 6))
+    ]
+    lines = [
+        "처 방 전",
+        f"요양기관명: {hospital}   전화번호 02-123-4567",
+        f"교부일자 {date_text}  교부번호 제 {rng.randint(1, 99999)} 호",
+        rng.choice(_NOISE_LINES),
+        "처방 의약품의 명칭 | 1회 투약량 | 1일 투여횟수 | 총 투약일수 | 용법",
+    ]
+    for drug in drugs:
+        lines.append(_row(drug, rng))
+        if rng.random() < 0.3:
+            lines.append(rng.choice(_NOISE_LINES))
+    lines.append("조제약사 성명 홍길동 (인)")
+    text = "\n".join(lines)
+    if rng.random() < 0.1:
+        text = text.translate({ord(c): ord(c) + 0xFEE0 for c in "0123456789"})  # 전각 숫자
+    expected = {"hospital_name": hospital, "prescribed_date": f"{year}-{month:02d}-{day:02d}", "drugs": drugs}
+    return text, expected
+
+
+def _matches(parsed, expected: ExpectedDrug) -> bool:
+    dose = parsed.dose_count if parsed.dose_count is not None else 1
+    return (
+        parsed.strength_amount == expected.strength
+        and parsed.strength_unit == expected.unit
+        and dose == expected.dose
+        and parsed.daily_frequency == expected.frequency
+        and parsed.duration_days == expected.duration
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prescription text parser throughput benchmark")
+    parser.add_argument("--count", type=int, default=10000, help="합성 처방전 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = [synthetic_prescription(rng) for _ in range(args.count)]
+    texts = [text for text, _ in corpus]
+    size_mb = sum(len(text.encode("utf-8")) for text in texts) / 1_000_000
+    lines = sum(text.count("\n") + 1 for text in texts)
+
+    elapsed = []
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        results = [parse_prescription(text) for text in texts]
+        elapsed.append(time.perf_counter() - started)
+    best = min(elapsed)
+
+    expected_rows = sum(len(expected["drugs"]) for _, expected in corpus)
+    found_rows = sum(
+        min(len(result.drugs), len(expected["drugs"])) for result, (_, expected) in zip(results, corpus, strict=True)
+    )
+    exact_rows = sum(
+        _matches(parsed, drug)
+        for result, (_, expected) in zip(results, corpus, strict=True)
+        for parsed, drug in zip(result.drugs, expected["drugs"], strict=False)
+    )
+    header_ok = statistics.fmean(
+        result.hospital_name == expected["hospital_name"] and result.prescribed_date == expected["prescribed_date"]
+        for result, (_, expected) in zip(results, corpus, strict=True)
+    )
+
+    print(f"prescriptions={args.count} lines={lines} size={size_mb:.2f}MB rounds={args.rounds}")
+    print(
+        f"throughput={args.count / best:,.0f} prescriptions/s  {lines / best:,.0f} lines/s  {size_mb / best:.2f} MB/s "
+        f"(best {best * 1000:.0f} ms, {best / args.count * 1_000_000:.1f} us/prescription)"
+    )
+    print(
+        f"row_recall={found_rows / expected_rows:.4f} row_exact={exact_rows / expected_rows:.4f} "
+        f"header_exact={header_ok:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+워커 기동(import → warm-up) 벤치마크.
+
+작업 구성마다 새 인터프리터를 띄워 워커 본체 import, 작업 모듈 import(torch/sentence-transformers 등 프레임워크 포함),
+warm-up(모델 적재 + 첫 추론), 이후 같은 합성 추론 한 번의 시간과 최대 RSS를 측정합니다.
+샤드별로 필요한 프레임워크만 import할 때와 전체 작업을 적재할 때의 기동 비용을 비교할 수 있습니다.
+
+    uv run python -m ai_worker.benchmarks.startup --tasks ocr cnn embed,retrieve all --repeat 3
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+COLUMNS = ("worker_import_ms", "task_import_ms", "warmup_ms", "steady_ms", "max_rss_mb")
+
+
+def measure_child(tasks: list[str]) -> dict[str, float]:
+    """
+    (자식 프로세스) 워커 기동 단계별 시간을 측정합니다.
+    """
+    started = time.perf_counter()
+    import ai_worker.main  # noqa: F401
+    from ai_worker.tasks import TASK_MODULES, load_tasks, warm_up_tasks
+
+    worker_imported = time.perf_counter()
+    registry = load_tasks(tasks or list(TASK_MODULES))
+    tasks_imported = time.perf_counter()
+    warm_up_tasks(registry)
+    warmed = time.perf_counter()
+    warm_up_tasks(registry)
+    steady = time.perf_counter()
+    return {
+        "worker_import_ms": (worker_imported - started) * 1000,
+        "task_import_ms": (tasks_imported - worker_imported) * 1000,
+        "warmup_ms": (warmed - tasks_imported) * 1000,
+        "steady_ms": (steady - warmed) * 1000,
+        # Linux에서 ru_maxrss는 KB 단위입니다.
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_child(spec: str) -> dict[str, float]:
+    completed = subprocess.run(
+        [sys.executable, "-m", "ai_worker.benchmarks.startup", "--child", spec],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ai_worker import/warm-up startup benchmark")
+    parser.add_argument(
+        "--tasks", nargs="+", default=["ocr", "cnn", "embed,retrieve", "all"], help="작업 구성 (쉼표로 묶음, all=전체)"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        tasks = [] if args.child == "all" else args.child.split(",")
+        print(json.dumps(measure_child(tasks)))
+        return
+
+    print(f"{'tasks':<16}" + "".join(f"{column:>18}" for column in COLUMNS))
+    for spec in args.tasks:
+        runs = [run_child(spec) for _ in range(args.repeat)]
+        medians = {column: statistics.median(run[column] for run in runs) for column in COLUMNS}
+        print(f"{spec:<16}" + "".join(f"{medians[column]:>18.1f}" for column in COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import base64
+import io
+import mmap
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from ai_worker.core import config
+
+
+@dataclass
+class ImageSource:
+    data: bytes | mmap.mmap  # 이미지/PDF 바이너리 (공유 저장소 참조면 파일을 읽기 전용으로 매핑한 버퍼)
+    path: str | None = None  # 공유 저장소 파일 경로 (인라인 페이로드면 None)
+
+    def stream(self) -> BinaryIO:
+        """
+        PIL 등 파일 객체를 받는 디코더에 넘길 스트림을 반환합니다. 매핑된 버퍼는 복사 없이 그대로 읽힙니다.
+        """
+        if isinstance(self.data, bytes):
+            return io.BytesIO(self.data)
+        self.data.seek(0)
+        return self.data  # type: ignore[return-value]
+
+
+def resolve_blob(reference: dict[str, Any]) -> Path:
+    """
+    작업 페이로드의 저장소 참조(sha256, path, size)를 공유 저장소 안의 파일 경로로 바꿉니다.
+
+    Raises:
+        ValueError: 참조 경로가 저장소 밖을 가리키는 경우
+    """
+    root = Path(config.BLOB_DIR).resolve()
+    path = (root / reference["path"]).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"blob path escapes blob dir: {reference['path']}")
+    return path
+
+
+@contextmanager
+def open_image(payload: dict[str, Any]) -> Iterator[ImageSource]:
+    """
+    작업 페이로드의 이미지를 엽니다. 저장소 참조(blob)면 파일을 mmap으로 매핑해 큐 메시지나 힙으로 복사하지 않고,
+    API 서버와 저장소를 공유하지 않는 배포에서 쓰는 인라인 페이로드(image_b64)는 디코딩합니다.
+
+    Args:
+        payload (dict): blob(sha256/path/size) 또는 image_b64
+
+    Yields:
+        ImageSource: 이미지 바이너리 버퍼와 파일 경로 (with 블록이 끝나면 매핑 해제)
+
+    Raises:
+        ValueError: 파일 크기가 참조와 다른 경우 (기록 중이거나 손상된 파일)
+    """
+    reference = payload.get("blob")
+    if reference is None:
+        yield ImageSource(base64.b64decode(payload["image_b64"]))
+        return
+
+    path = resolve_blob(reference)
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size != reference["size"]:
+            raise ValueError(f"blob {reference['sha256']} has {size} bytes, expected {reference['size']}")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield ImageSource(mapped, str(path))
+
+
+def prune_blobs(max_age_seconds: float) -> int:
+    """
+    마지막 사용(API 서버가 같은 이미지를 다시 넘길 때 수정 시각을 갱신) 후 max_age_seconds가 지난 파일을 지웁니다.
+    큐에 있는 작업은 마감 전까지 파일을 읽을 수 있어야 하므로 BLOB_MIN_AGE_SECONDS보다 최근 파일은 남깁니다.
+    여러 워커가 동시에 정리해도 되도록 이미 지워진 파일은 무시합니다.
+
+    파일을 바로 지우지 않고 임시 이름으로 옮긴 뒤 수정 시각을 다시 확인합니다. 확인과 삭제 사이에 API 서버가 같은 이미지를
+    재사용(수정 시각 갱신)했으면 되돌리고, 옮긴 뒤에 재사용하면 API 서버는 파일이 없으므로 새로 기록합니다.
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    root = Path(config.BLOB_DIR)
+    if not root.is_dir():
+        return 0
+    expired_before = time.time() - max(max_age_seconds, config.BLOB_MIN_AGE_SECONDS)
+    removed = 0
+    for path in root.glob("*/*"):
+        try:
+            if path.stat().st_mtime >= expired_before:
+                continue
+            if path.name.endswith(".tmp"):  # 기록이나 정리 도중 중단된 프로세스가 남긴 임시 파일
+                path.unlink()
+                continue
+            doomed = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            os.rename(path, doomed)
+            if doomed.stat().st_mtime >= expired_before:
+                os.replace(doomed, path)  # 그 사이 API 서버가 새로 기록했어도 같은 내용
+                continue
+            doomed.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
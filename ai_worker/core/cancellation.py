@@ -0,0 +1,89 @@
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+
+from ai_worker.core import default_logger
+from ai_worker.schemas.jobs import CANCEL_CHANNEL
+
+
+class JobCancelledError(Exception):
+    """
+    요청한 쪽이 더 이상 결과를 기다리지 않아(취소 또는 마감 시각 경과) 작업을 중단할 때 발생합니다.
+    """
+
+
+@dataclass
+class JobContext:
+    job_id: str
+    deadline: float | None  # 마감 시각 (unix epoch 초)
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+    def check(self) -> None:
+        """
+        Raises:
+            JobCancelledError: 취소되었거나 마감 시각이 지난 경우
+        """
+        if self.cancelled.is_set():
+            raise JobCancelledError(f"job {self.job_id} cancelled")
+        if self.deadline is not None and time.time() > self.deadline:
+            raise JobCancelledError(f"job {self.job_id} deadline exceeded")
+
+
+# asyncio.to_thread는 컨텍스트를 복사해 넘기므로 처리 스레드 안의 작업 코드에서도 현재 작업의 컨텍스트를 읽을 수 있습니다.
+_current_job: ContextVar[JobContext | None] = ContextVar("current_job", default=None)
+
+
+def check_cancelled() -> None:
+    """
+    작업 코드의 단계 사이(전처리 → 추론 → 후처리, PDF 페이지 사이 등)에서 호출합니다.
+    현재 작업이 취소되었거나 마감 시각이 지났으면 JobCancelledError를 발생시켜 남은 단계를 건너뜁니다.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.check()
+
+
+class CancellationRegistry:
+    """
+    처리 중인 작업의 컨텍스트를 보관하고, 취소 채널(Pub/Sub)로 들어온 작업 ID를 해당 컨텍스트에 반영합니다.
+    """
+
+    def __init__(self):
+        self._active: dict[str, JobContext] = {}
+
+    def start(self, job_id: str, deadline: float | None) -> JobContext:
+        """
+        작업 처리를 시작하며 현재 컨텍스트에 작업을 등록합니다. (to_thread 호출 전에 같은 태스크에서 호출)
+        """
+        job = JobContext(job_id=job_id, deadline=deadline)
+        self._active[job_id] = job
+        _current_job.set(job)
+        return job
+
+    def finish(self, job_id: str) -> None:
+        self._active.pop(job_id, None)
+        _current_job.set(None)
+
+    def cancel(self, job_id: str) -> None:
+        job = self._active.get(job_id)
+        if job is not None:
+            job.cancelled.set()
+
+    async def listen(self, client: redis.Redis) -> None:
+        """
+        취소 채널을 구독하며 처리 중인 작업에 취소를 반영합니다. (연결이 끊기면 다시 구독)
+        """
+        while True:
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(CANCEL_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.cancel(message["data"])
+            except redis.ConnectionError:
+                default_logger.warning("cancellation channel disconnected, resubscribing")
+                await asyncio.sleep(1)
@@ -8,3 +8,66 @@ class Config(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="allow")
 
     TIMEZONE: zoneinfo.ZoneInfo = field(default_factory=lambda: zoneinfo.ZoneInfo("Asia/Seoul"))
+
+    REDIS_URL: str = "redis://172.17.0.1:6379"
+    JOB_RESULT_TTL_SECONDS: int = 300
+    JOB_POLL_TIMEOUT_SECONDS: int = 5
+    # 이미지 공유 저장소: API 서버가 이미지를 sha256 이름의 파일로 쓰고 작업에는 참조만 넣습니다. (app 설정의 AI_BLOB_DIR과 같은 볼륨)
+    BLOB_DIR: str = "blobs"
+    BLOB_TTL_SECONDS: int = 60 * 60  # 마지막 사용 후 이 시간이 지난 파일은 유휴 워커가 정리
+    BLOB_PRUNE_INTERVAL_SECONDS: int = 10 * 60
+    # 큐에 있는 작업이 참조하는 파일을 지우지 않도록 BLOB_TTL_SECONDS를 이 값보다 작게 잡아도 이만큼은 보관합니다.
+    # (app 설정의 AI_REQUEST_DEADLINE_SECONDS + SPECULATIVE_RESULT_TTL_SECONDS, 즉 작업 마감까지의 최대 시간보다 길게 유지)
+    BLOB_MIN_AGE_SECONDS: int = 10 * 60
+    # 이 시간 안에 상태를 보고한 워커만 활성 워커로 집계됩니다. 워커는 작업 처리와 별개로 이 값의 1/3 간격으로 보고합니다.
+    # (app 설정의 WORKER_HEARTBEAT_TTL_SECONDS와 동일하게 유지)
+    WORKER_HEARTBEAT_TTL_SECONDS: int = 60
+    # 기동 시 작업별 합성 입력으로 모델을 미리 적재/추론한 뒤에 준비 상태(하트비트)를 게시
+    WORKER_WARMUP_ENABLED: bool = True
+    WORKER_BOOT_RECORD_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+    # 모델 샤드: 이 워커가 소비할 작업 종류 (비우면 전체). 워커는 이 작업들의 모델만 적재하므로
+    # 예) WORKER_TASKS='["cnn","ocr"]' 인 비전 워커와 '["embed","retrieve"]' 인 텍스트 워커를 따로 늘릴 수 있습니다.
+    WORKER_TASKS: list[str] = []
+    # 우선순위 레인별 가중치 (interactive: 사용자가 응답을 기다리는 요청, bulk: 야간 가이드 갱신/TTS 백필 등 일괄 작업,
+    # speculative: 업로드 시점 예측 분석). 큐 가중치 = 레인 가중치 × 작업 가중치
+    QUEUE_PRIORITY_WEIGHTS: dict[str, float] = {"interactive": 16, "bulk": 4, "speculative": 1}
+    QUEUE_TASK_WEIGHTS: dict[str, float] = {}
+
+    # 배포된 모델 버전 (API 서버의 추론 결과 캐시 키로 사용)
+    CNN_MODEL_VERSION: str = "pill-cnn-v1"
+    CNN_FAST_MODEL_VERSION: str = "pill-cnn-fast-v1"
+    OCR_MODEL_VERSION: str = "ocr-v1"
+    # OCR 엔진: "easyocr" (easyocr 패키지와 OCR_ENGINE_MODEL_DIR의 가중치가 있어야 함). 비워 두면 OCR 작업과
+    # 알약 각인 인식이 실패하며, 엔진을 적재하지 못한 워커는 warm-up에서 기동을 멈춥니다. (더미 결과를 내지 않음)
+    OCR_ENGINE: str = ""
+    OCR_LANGUAGES: list[str] = ["ko", "en"]
+    OCR_ENGINE_MODEL_DIR: str = "ai_worker/models/easyocr"
+
+    # 알약 인식 캐스케이드: 경량 모델의 top-1 신뢰도가 임계값 미만일 때만 대형 모델 + 각인 OCR로 승격
+    PILL_CASCADE_THRESHOLD: float = 0.60
+    PILL_LABELS_PATH: str = "ai_worker/models/pill_labels.json"
+    CNN_FAST_MODEL_PATH: str = "ai_worker/models/pill_mobilenet_v3_small.pt"
+    CNN_LARGE_MODEL_PATH: str = "ai_worker/models/pill_efficientnet_b0.pt"
+
+    # OCR 약품명 → 표준 제품명 정규화 (약품 마스터 CSV: name, code 열)
+    DRUG_MASTER_PATH: str = "ai_worker/data/drug_master.csv"
+    DRUG_MASTER_VERSION: str = "drug-master-v1"
+    DRUG_MATCH_MAX_DISTANCE: int = 2
+
+    # 다중 페이지 PDF OCR: 페이지를 프로세스 풀에서 병렬로 래스터화/인식하고 페이지별 부분 결과를 스트리밍
+    OCR_PAGE_WORKERS: int = 4
+    OCR_PDF_RENDER_DPI: int = 200
+    OCR_MAX_PDF_PAGES: int = 30
+
+    # 임베딩 (RAG)
+    EMBEDDING_MODEL_NAME: str = "jhgan/ko-sroberta-multitask"
+    EMBEDDING_MODEL_VERSION: str = "ko-sroberta-multitask-v1"
+    EMBEDDING_CACHE_DIR: str = "ai_worker/cache/embeddings"
+    EMBEDDING_ENCODE_BATCH_SIZE: int = 64
+    # 큐에 쌓인 embed 작업을 한 번의 encode 호출로 묶을 최대 작업 수
+    EMBEDDING_MAX_BATCH_JOBS: int = 32
+
+    # 약물 지식 검색 (IVF-Flat ANN 인덱스)
+    RETRIEVAL_INDEX_DIR: str = "ai_worker/indexes/drug_knowledge"
+    RETRIEVAL_NPROBE: int = 8
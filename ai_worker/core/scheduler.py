@@ -0,0 +1,39 @@
+class WeightedFairScheduler:
+    """
+    (작업 종류, 우선순위) 큐들 사이에서 다음 작업을 꺼낼 순서를 정하는 가중 공정 스케줄러입니다. (start-time fair queueing)
+
+    큐마다 가상 시간을 두고 작업을 하나 꺼낼 때마다 1/가중치만큼 진행시킵니다. 가상 시작 시간이 가장 이른 큐부터
+    나열한 키 목록을 그대로 BLPOP에 넘기면 Redis가 그 순서에서 비어 있지 않은 첫 큐를 골라 주므로,
+    Redis 왕복 한 번으로 "작업이 있는 큐 중 가상 시간이 가장 이른 큐"를 꺼낼 수 있습니다.
+    바쁜 큐들은 가중치 비율대로 처리량을 나눠 갖고, 비어 있는 큐의 몫은 다른 큐가 가져갑니다.
+    """
+
+    def __init__(self, weights: dict[str, float]):
+        if not weights or min(weights.values()) <= 0:
+            raise ValueError("queue weights must be positive")
+        self.weights = weights
+        self._finish = dict.fromkeys(weights, 0.0)
+        self._system_time = 0.0
+
+    def _start(self, queue: str) -> float:
+        # 한동안 비어 있던 큐는 현재 시스템 가상 시간에서 다시 시작하여, 쉬는 동안 쌓인 몫을 한꺼번에 쓰지 못하게 합니다.
+        return max(self._finish[queue], self._system_time)
+
+    def order(self) -> list[str]:
+        """
+        Returns:
+            list[str]: 가상 시작 시간 오름차순(같으면 가중치 내림차순) 큐 키 목록
+        """
+        return sorted(self.weights, key=lambda queue: (self._start(queue), -self.weights[queue]))
+
+    def charge(self, queue: str, jobs: int = 1) -> None:
+        """
+        큐에서 작업을 꺼냈음을 기록합니다.
+
+        Args:
+            queue (str): 작업을 꺼낸 큐 키
+            jobs (int): 한 번에 꺼낸 작업 수 (일괄 처리 시)
+        """
+        start = self._start(queue)
+        self._system_time = start
+        self._finish[queue] = start + jobs / self.weights[queue]
@@ -0,0 +1,68 @@
+import json
+import os
+import socket
+import time
+
+from redis.asyncio.client import Pipeline
+
+from ai_worker.core import config
+from ai_worker.schemas.jobs import SERVICE_TIME_KEY, WORKER_BOOT_KEY, WORKERS_KEY
+
+
+class WorkerStatus:
+    """
+    API 서버의 수용 제어(예상 대기 시간 계산)에 쓰이는 워커 상태를 관리합니다.
+
+    작업 종류별 작업당 처리 시간의 지수 이동 평균(ms)과, 작업 종류별 활성 워커 집합(ZSET, 점수 = 마지막 보고 시각)을
+    결과 게시 파이프라인에 함께 실어 보내므로 별도의 Redis 왕복이 생기지 않습니다.
+    """
+
+    def __init__(self, tasks: list[str], alpha: float = 0.2):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.tasks = tasks
+        self.alpha = alpha
+        self.service_ms: dict[str, float] = {}
+
+    def observe(self, task: str, elapsed_seconds: float, jobs: int) -> None:
+        """
+        작업 묶음 하나의 처리 시간을 반영합니다.
+
+        Args:
+            task (str): 작업 종류
+            elapsed_seconds (float): 묶음 전체 처리 시간(초)
+            jobs (int): 묶음의 작업 수
+        """
+        sample = elapsed_seconds * 1000 / jobs
+        previous = self.service_ms.get(task)
+        self.service_ms[task] = sample if previous is None else previous + self.alpha * (sample - previous)
+
+    def write(self, pipe: Pipeline) -> None:
+        """
+        처리 시간과 하트비트 갱신 명령을 파이프라인에 추가합니다. 보고가 끊긴 지 오래된 워커 항목은 함께 정리합니다.
+        """
+        now = time.time()
+        if self.service_ms:
+            pipe.hset(SERVICE_TIME_KEY, mapping={task: round(ms, 1) for task, ms in self.service_ms.items()})
+        for task in self.tasks:
+            workers_key = WORKERS_KEY.format(task=task)
+            pipe.zadd(workers_key, {self.worker_id: now})
+            pipe.zremrangebyscore(workers_key, 0, now - 10 * config.WORKER_HEARTBEAT_TTL_SECONDS)
+
+    def write_boot(
+        self, pipe: Pipeline, boot_seconds: float, import_ms: dict[str, float], warmup_ms: dict[str, float]
+    ) -> None:
+        """
+        기동 벤치마크(전체 기동 시간, 작업별 import/warm-up 시간)를 기록하는 명령을 파이프라인에 추가합니다.
+        """
+        record = {
+            "tasks": self.tasks,
+            "boot_ms": round(boot_seconds * 1000, 1),
+            "import_ms": import_ms,
+            "warmup_ms": warmup_ms,
+            "ready_at": time.time(),
+        }
+        pipe.set(
+            WORKER_BOOT_KEY.format(worker_id=self.worker_id),
+            json.dumps(record),
+            ex=config.WORKER_BOOT_RECORD_TTL_SECONDS,
+        )
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import redis.asyncio as redis
+
+from ai_worker.core import config, default_logger
+from ai_worker.core.blobs import prune_blobs
+from ai_worker.core.cancellation import CancellationRegistry, JobCancelledError
+from ai_worker.core.scheduler import WeightedFairScheduler
+from ai_worker.core.status import WorkerStatus
+from ai_worker.schemas.jobs import (
+    CANCEL_KEY,
+    JOB_QUEUE_KEY,
+    JOB_RESULT_KEY,
+    MODEL_VERSIONS_KEY,
+    PRIORITIES,
+    InferenceJob,
+    JobResult,
+)
+from ai_worker.tasks import TASK_MODULES, TaskRegistry, load_tasks, warm_up_tasks
+
+cancellations = CancellationRegistry()
+
+
+async def publish_results(client: redis.Redis, results: list[JobResult], status: WorkerStatus | None = None) -> None:
+    """
+    작업 결과(부분 결과 포함)를 각 작업의 결과 키에 한 번의 파이프라인으로 게시합니다.
+    status가 주어지면 워커 처리 시간/하트비트도 같은 파이프라인으로 보고합니다.
+    """
+    async with client.pipeline(transaction=False) as pipe:
+        for result in results:
+            result_key = JOB_RESULT_KEY.format(job_id=result.job_id)
+            pipe.rpush(result_key, result.model_dump_json())
+            pipe.expire(result_key, config.JOB_RESULT_TTL_SECONDS)
+        if status is not None:
+            status.write(pipe)
+        await pipe.execute()
+
+
+def partial_publisher(client: redis.Redis, job_id: str) -> Callable[[dict[str, Any]], None]:
+    """
+    처리 스레드에서 호출하면 이벤트 루프에서 부분 결과를 게시하고 게시가 끝날 때까지 기다리는 콜백을 만듭니다.
+    """
+    loop = asyncio.get_running_loop()
+
+    def publish(partial: dict[str, Any]) -> None:
+        result = JobResult(job_id=job_id, status="partial", result=partial)
+        asyncio.run_coroutine_threadsafe(publish_results(client, [result]), loop).result()
+
+    return publish
+
+
+async def run_job(client: redis.Redis, tasks: TaskRegistry, task: str, job: InferenceJob) -> dict[str, Any]:
+    # 처리 스레드의 작업 코드가 단계 사이에서 check_cancelled()로 취소/마감 여부를 확인할 수 있도록 컨텍스트를 등록합니다.
+    cancellations.start(job.job_id, job.deadline)
+    try:
+        if task in tasks.streaming:
+            return await asyncio.to_thread(tasks.handlers[task], job.payload, partial_publisher(client, job.job_id))
+        return await asyncio.to_thread(tasks.handlers[task], job.payload)
+    finally:
+        cancellations.finish(job.job_id)
+
+
+async def drop_abandoned(client: redis.Redis, jobs: list[InferenceJob]) -> list[InferenceJob]:
+    """
+    꺼낸 작업 중 마감 시각이 지났거나 취소된 작업을 처리하기 전에 걸러냅니다. (취소 키 확인은 한 번의 파이프라인)
+    """
+    now = time.time()
+    async with client.pipeline(transaction=False) as pipe:
+        for job in jobs:
+            pipe.exists(CANCEL_KEY.format(job_id=job.job_id))
+        cancelled = await pipe.execute()
+    live = [
+        job
+        for job, is_cancelled in zip(jobs, cancelled, strict=True)
+        if not is_cancelled and (job.deadline is None or job.deadline > now)
+    ]
+    if len(live) < len(jobs):
+        default_logger.info("dropped %d abandoned %s job(s)", len(jobs) - len(live), jobs[0].task)
+    return live
+
+
+async def handle_jobs(client: redis.Redis, tasks: TaskRegistry, task: str, jobs: list[InferenceJob]) -> list[JobResult]:
+    """
+    같은 종류의 작업 묶음을 처리합니다. 처리 함수는 스레드에서 실행하여 이벤트 루프가 막히지 않도록 합니다.
+    일괄 처리 함수가 있는 작업은 한 번에, 그 외에는 하나씩 처리하며, 스트리밍 작업은 부분 결과를 먼저 게시합니다.
+    """
+    if task not in tasks.handlers:
+        return [JobResult(job_id=job.job_id, status="error", error=f"unknown task: {task}") for job in jobs]
+    try:
+        if task in tasks.batch_handlers:
+            results = await asyncio.to_thread(tasks.batch_handlers[task], [job.payload for job in jobs])
+        else:
+            results = [await run_job(client, tasks, task, job) for job in jobs]
+    except JobCancelledError as err:
+        default_logger.info("%s job(s) stopped: %s", task, err)
+        return [JobResult(job_id=job.job_id, status="error", error=str(err)) for job in jobs]
+    except Exception as err:
+        default_logger.exception("%d %s job(s) failed", len(jobs), task)
+        return [JobResult(job_id=job.job_id, status="error", error=str(err)) for job in jobs]
+    return [
+        JobResult(job_id=job.job_id, status="success", result=result) for job, result in zip(jobs, results, strict=True)
+    ]
+
+
+def queue_weights(tasks: list[str]) -> dict[str, float]:
+    """
+    서빙할 작업 × 우선순위 레인 큐 키와 가중치(레인 가중치 × 작업 가중치)를 만듭니다.
+    """
+    return {
+        JOB_QUEUE_KEY.format(task=task, priority=priority): config.QUEUE_PRIORITY_WEIGHTS[priority]
+        * config.QUEUE_TASK_WEIGHTS.get(task, 1)
+        for task in tasks
+        for priority in PRIORITIES
+    }
+
+
+async def heartbeat(client: redis.Redis, status: WorkerStatus) -> None:
+    """
+    작업 처리와 별개로 WORKER_HEARTBEAT_TTL_SECONDS의 1/3 간격으로 하트비트를 보냅니다.
+    작업은 처리 스레드에서 돌기 때문에 TTL보다 긴 작업(예: 큰 PDF)을 처리하는 동안에도 활성 워커로 집계됩니다.
+    """
+    while True:
+        await asyncio.sleep(config.WORKER_HEARTBEAT_TTL_SECONDS / 3)
+        try:
+            await publish_results(client, [], status)
+        except redis.RedisError:
+            default_logger.exception("worker heartbeat failed")
+
+
+async def advertise_ready(
+    client: redis.Redis, tasks: TaskRegistry, status: WorkerStatus, boot_seconds: float, warmup_ms: dict[str, float]
+) -> None:
+    """
+    모델 버전, 기동 기록, 첫 하트비트를 한 번의 파이프라인으로 게시합니다.
+    하트비트가 올라간 뒤부터 API 서버의 수용 제어가 이 워커를 활성 워커로 집계합니다.
+    """
+    async with client.pipeline(transaction=False) as pipe:
+        # API 서버의 추론 결과 캐시는 이 값이 바뀌면 이전 버전 항목을 무효화합니다. (샤드마다 자신이 맡은 작업만 게시)
+        if tasks.model_versions:
+            pipe.hset(MODEL_VERSIONS_KEY, mapping=tasks.model_versions)
+        status.write_boot(pipe, boot_seconds, tasks.import_ms, warmup_ms)
+        status.write(pipe)
+        await pipe.execute()
+
+
+async def serve() -> None:
+    """
+    맡은 작업의 모듈만 import하고 합성 입력으로 모델을 미리 추론한 뒤 준비 상태를 게시하고,
+    작업 큐들을 가중 공정 순서로 소비하며 결과를 결과 키에 게시합니다.
+    """
+    started = time.perf_counter()
+    tasks = load_tasks(config.WORKER_TASKS or list(TASK_MODULES))
+    warmup_ms = await asyncio.to_thread(warm_up_tasks, tasks) if config.WORKER_WARMUP_ENABLED else {}
+    client = redis.from_url(config.REDIS_URL, decode_responses=True)
+    scheduler = WeightedFairScheduler(queue_weights(list(tasks.handlers)))
+    status = WorkerStatus(list(tasks.handlers))
+    # 태스크가 가비지 컬렉션되지 않도록 serve가 끝날 때까지 참조를 유지합니다.
+    _listener = asyncio.create_task(cancellations.listen(client))
+    await advertise_ready(client, tasks, status, time.perf_counter() - started, warmup_ms)
+    _heartbeat = asyncio.create_task(heartbeat(client, status))
+    default_logger.info(
+        "worker ready: tasks=%s versions=%s import_ms=%s warmup_ms=%s",
+        list(tasks.handlers),
+        tasks.model_versions,
+        tasks.import_ms,
+        warmup_ms,
+    )
+
+    pruned_at = time.monotonic()
+    while True:
+        item = await client.blpop(scheduler.order(), timeout=config.JOB_POLL_TIMEOUT_SECONDS)
+        if item is None:
+            if time.monotonic() - pruned_at >= config.BLOB_PRUNE_INTERVAL_SECONDS:
+                pruned_at = time.monotonic()
+                removed = await asyncio.to_thread(prune_blobs, config.BLOB_TTL_SECONDS)
+                if removed:
+                    default_logger.info("pruned %d expired image blob(s)", removed)
+            continue
+        queue, raw = item
+        jobs = [InferenceJob.model_validate_json(raw)]
+        # 일괄 처리 가능한 작업이면 같은 큐에 이미 쌓여 있는 작업을 함께 꺼냅니다.
+        if jobs[0].task in tasks.batch_handlers:
+            more = await client.lpop(queue, tasks.batch_limits[jobs[0].task] - 1) or []
+            jobs.extend(InferenceJob.model_validate_json(raw) for raw in more)
+        jobs = await drop_abandoned(client, jobs)
+        if not jobs:
+            continue
+        scheduler.charge(queue, len(jobs))
+
+        started = time.perf_counter()
+        results = await handle_jobs(client, tasks, jobs[0].task, jobs)
+        status.observe(jobs[0].task, time.perf_counter() - started, len(jobs))
+        await publish_results(client, results, status)
+
+
+if __name__ == "__main__":
+    asyncio.run(serve())
@@ -0,0 +1,48 @@
+"""
+약물/질환 지식 코퍼스로 검색 인덱스를 오프라인 구축합니다.
+
+코퍼스는 JSONL 형식이며 각 줄은 {"id": str, "text": str, "family": str | null} 입니다.
+(family: 성분 계열, 예: "NSAIDs", "ACE 억제제" — 필터 검색에 사용)
+
+    uv run python -m ai_worker.retrieval.build_index --corpus data/drug_corpus.jsonl
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+from ai_worker.core import config
+from ai_worker.retrieval.ivf_index import build_ivf_index
+from ai_worker.tasks.embedding import get_embedding_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the drug-knowledge IVF-Flat index")
+    parser.add_argument("--corpus", type=Path, required=True)
+    parser.add_argument("--out", type=Path, default=Path(config.RETRIEVAL_INDEX_DIR))
+    parser.add_argument("--nlist", type=int, default=None)
+    args = parser.parse_args()
+
+    with args.corpus.open(encoding="utf-8") as f:
+        documents = [json.loads(line) for line in f if line.strip()]
+
+    texts = [document["text"] for document in documents]
+    vectors = get_embedding_service().embed(texts)
+    index = build_ivf_index(
+        args.out,
+        vectors,
+        doc_ids=[str(document["id"]) for document in documents],
+        texts=texts,
+        families=[document.get("family") for document in documents],
+        nlist=args.nlist,
+        extra_meta={
+            "embedding_model": config.EMBEDDING_MODEL_NAME,
+            "version": f"{config.EMBEDDING_MODEL_VERSION}:{datetime.now(config.TIMEZONE):%Y%m%d%H%M%S}",
+        },
+    )
+    print(f"built {len(index)} passages into {index.meta['nlist']} lists at {args.out} (version={index.version})")
+
+
+if __name__ == "__main__":
+    main()
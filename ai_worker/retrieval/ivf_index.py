@@ -0,0 +1,186 @@
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# 인덱스 디렉토리 구성 (모두 .npy, 검색 시 mmap_mode="r"로 열어 워커 프로세스 간 페이지 캐시를 공유)
+#   centroids.npy     (nlist, dim) float32  IVF 군집 중심
+#   offsets.npy       (nlist + 1,) int64    군집 c의 행 범위 = [offsets[c], offsets[c + 1])
+#   vectors.npy       (N, dim) float16      군집 순서로 정렬된 정규화 벡터
+#   families.npy      (N,) int32            행별 성분 계열 ID (-1: 없음)
+#   text_offsets.npy  (N + 1,) int64        texts.bin 내 행별 UTF-8 문단 범위
+#   texts.bin                               문단 원문
+#   meta.json                               dim, nlist, family 목록, 문서 ID, 임베딩 모델 정보
+
+
+@dataclass
+class SearchHit:
+    doc_id: str
+    text: str
+    family: str | None
+    score: float
+
+
+class IVFFlatIndex:
+    """
+    코사인 유사도(정규화 벡터 내적) 기반 IVF-Flat 근사 최근접 이웃 인덱스입니다.
+    질의와 가까운 nprobe개 군집만 스캔하므로 전체 스캔 대비 비교 횟수가 nprobe/nlist 수준으로 줄어듭니다.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.meta = json.loads((self.directory / "meta.json").read_text(encoding="utf-8"))
+        self.centroids = np.load(self.directory / "centroids.npy")
+        self.offsets = np.load(self.directory / "offsets.npy")
+        self.vectors = np.load(self.directory / "vectors.npy", mmap_mode="r")
+        self.families = np.load(self.directory / "families.npy", mmap_mode="r")
+        self.text_offsets = np.load(self.directory / "text_offsets.npy", mmap_mode="r")
+        self.texts = np.memmap(self.directory / "texts.bin", dtype=np.uint8, mode="r")
+        self.family_ids = {name: index for index, name in enumerate(self.meta["families"])}
+        self.doc_ids: list[str] = self.meta["doc_ids"]
+
+    @property
+    def version(self) -> str:
+        return self.meta.get("version", "unversioned")
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def search(
+        self, query: np.ndarray, k: int = 5, nprobe: int = 8, families: list[str] | None = None
+    ) -> list[SearchHit]:
+        """
+        Args:
+            query (np.ndarray): (dim,) 정규화된 질의 벡터
+            k (int): 반환할 결과 수
+            nprobe (int): 스캔할 군집 수
+            families (list[str] | None): 지정 시 해당 성분 계열 문단만 검색
+
+        Returns:
+            list[SearchHit]: 유사도 내림차순 결과
+        """
+        query = np.asarray(query, dtype=np.float32)
+        allowed = None
+        if families is not None:
+            allowed = np.array([self.family_ids[name] for name in families if name in self.family_ids], dtype=np.int32)
+            if allowed.size == 0:
+                return []
+
+        order = np.argsort(self.centroids @ query)[::-1]
+        rows, scores = self._scan(query, order[:nprobe], allowed)
+        # 필터가 좁으면 후보가 k개 미만일 수 있으므로 다음 군집들로 범위를 넓힙니다.
+        probed = nprobe
+        while allowed is not None and len(rows) < k and probed < len(order):
+            more_rows, more_scores = self._scan(query, order[probed : probed * 2], allowed)
+            rows, scores = np.concatenate([rows, more_rows]), np.concatenate([scores, more_scores])
+            probed *= 2
+        return self._top_hits(rows, scores, k)
+
+    def exact_search(self, query: np.ndarray, k: int = 5, families: list[str] | None = None) -> list[SearchHit]:
+        """
+        전체 벡터를 스캔하는 정확 검색입니다. (recall 측정 기준)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        if families is None:
+            return self._top_hits(np.arange(len(self.vectors)), self.vectors.astype(np.float32) @ query, k)
+        allowed = [self.family_ids[name] for name in families if name in self.family_ids]
+        rows = np.flatnonzero(np.isin(self.families, allowed))
+        return self._top_hits(rows, self.vectors[rows].astype(np.float32) @ query, k)
+
+    def _scan(
+        self, query: np.ndarray, clusters: np.ndarray, allowed: np.ndarray | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if len(clusters) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        rows = np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1]) for c in clusters])
+        if allowed is not None:
+            rows = rows[np.isin(self.families[rows], allowed)]
+        scores = self.vectors[rows].astype(np.float32) @ query
+        return rows, scores
+
+    def _top_hits(self, rows: np.ndarray, scores: np.ndarray, k: int) -> list[SearchHit]:
+        if len(rows) > k:
+            top = np.argpartition(scores, -k)[-k:]
+            rows, scores = rows[top], scores[top]
+        ranked = np.argsort(scores)[::-1]
+        return [self._hit(int(rows[i]), float(scores[i])) for i in ranked]
+
+    def _hit(self, row: int, score: float) -> SearchHit:
+        start, end = int(self.text_offsets[row]), int(self.text_offsets[row + 1])
+        family_id = int(self.families[row])
+        return SearchHit(
+            doc_id=self.doc_ids[row],
+            text=bytes(self.texts[start:end]).decode("utf-8"),
+            family=self.meta["families"][family_id] if family_id >= 0 else None,
+            score=round(score, 4),
+        )
+
+
+def build_ivf_index(
+    directory: str | Path,
+    vectors: np.ndarray,
+    doc_ids: list[str],
+    texts: list[str],
+    families: list[str | None],
+    nlist: int | None = None,
+    extra_meta: dict | None = None,
+) -> IVFFlatIndex:
+    """
+    정규화된 벡터로 IVF-Flat 인덱스를 오프라인 구축하여 디렉토리에 기록합니다.
+
+    Args:
+        directory (str | Path): 출력 디렉토리
+        vectors (np.ndarray): (N, dim) 정규화 벡터
+        doc_ids (list[str]): 행별 문서 ID
+        texts (list[str]): 행별 문단 원문
+        families (list[str | None]): 행별 성분 계열 (필터 검색용)
+        nlist (int | None): 군집 수 (생략 시 4·sqrt(N))
+        extra_meta (dict | None): meta.json에 함께 기록할 정보 (임베딩 모델 등)
+
+    Returns:
+        IVFFlatIndex: mmap으로 다시 연 인덱스
+    """
+    # 구축(오프라인) 경로에서만 필요하므로 검색 워커가 scikit-learn을 불러오지 않도록 지역 import 합니다.
+    from sklearn.cluster import MiniBatchKMeans
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    vectors32 = np.asarray(vectors, dtype=np.float32)
+    nlist = min(nlist or max(1, int(4 * np.sqrt(len(vectors32)))), len(vectors32))
+
+    kmeans = MiniBatchKMeans(n_clusters=nlist, batch_size=4096, n_init=3, random_state=0).fit(vectors32)
+    centroids = kmeans.cluster_centers_.astype(np.float32)
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True).clip(min=1e-12)
+    assignments = kmeans.labels_
+    order = np.argsort(assignments, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=nlist))]).astype(np.int64)
+
+    family_names = sorted({family for family in families if family})
+    family_ids = {name: index for index, name in enumerate(family_names)}
+    family_column = np.array(
+        [family_ids.get(families[row], -1) if families[row] else -1 for row in order], dtype=np.int32
+    )
+
+    encoded = [texts[row].encode("utf-8") for row in order]
+    text_offsets = np.concatenate([[0], np.cumsum([len(text) for text in encoded])]).astype(np.int64)
+
+    np.save(directory / "centroids.npy", centroids)
+    np.save(directory / "offsets.npy", offsets)
+    np.save(directory / "vectors.npy", vectors32[order].astype(np.float16))
+    np.save(directory / "families.npy", family_column)
+    np.save(directory / "text_offsets.npy", text_offsets)
+    (directory / "texts.bin").write_bytes(b"".join(encoded))
+
+    meta = {
+        "dim": int(vectors32.shape[1]),
+        "nlist": nlist,
+        "families": family_names,
+        "doc_ids": [doc_ids[row] for row in order],
+        **(extra_meta or {}),
+    }
+    tmp = directory / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, directory / "meta.json")
+    return IVFFlatIndex(directory)
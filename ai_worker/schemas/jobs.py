@@ -0,0 +1,35 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+# app/services/inference.py 및 app/services/inference_cache.py와 동일하게 유지해야 하는 키
+# 작업 종류 × 우선순위 레인마다 별도의 큐를 둡니다.
+JOB_QUEUE_KEY = "ai:jobs:{task}:{priority}"
+PRIORITIES = ("interactive", "bulk", "speculative")
+JOB_RESULT_KEY = "ai:results:{job_id}"
+MODEL_VERSIONS_KEY = "ai:model_versions"
+# 수용 제어용 워커 상태: 작업 종류별 작업당 처리 시간(ms) 해시와 활성 워커 ZSET (점수 = 마지막 보고 시각)
+SERVICE_TIME_KEY = "ai:service_ms"
+WORKERS_KEY = "ai:workers:{task}"
+# 워커 기동 기록: 작업별 import 시간, warm-up(첫 추론) 시간, 준비 완료 시각
+WORKER_BOOT_KEY = "ai:worker_boot:{worker_id}"
+# 작업 취소: 취소 키(대기 중인 작업은 꺼낼 때 확인)와 취소 채널(처리 중인 작업에 즉시 전달)
+CANCEL_KEY = "ai:cancel:{job_id}"
+CANCEL_CHANNEL = "ai:cancel"
+
+
+class InferenceJob(BaseModel):
+    job_id: str = Field(..., description="작업 ID (결과 키 생성에 사용)")
+    task: str = Field(..., description="작업 종류 (cnn, ocr 등)")
+    payload: dict[str, Any] = Field(default_factory=dict, description="작업 입력 데이터")
+    deadline: float | None = Field(
+        None, description="마감 시각 (unix epoch 초). 지나면 결과를 기다리는 쪽이 없으므로 처리하지 않음"
+    )
+
+
+class JobResult(BaseModel):
+    job_id: str
+    # partial: 다중 페이지 문서 등에서 최종 결과 전에 같은 결과 키로 먼저 게시되는 부분 결과
+    status: Literal["partial", "success", "error"]
+    result: dict[str, Any] | None = None
+    error: str | None = None
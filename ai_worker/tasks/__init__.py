@@ -0,0 +1,83 @@
+import importlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# 작업 종류별 처리 모듈. 모듈은 run(payload)을 제공하며, 선택적으로
+#   run_batch(payloads) + BATCH_LIMIT: 큐에 쌓인 여러 작업을 한 번에 처리
+#   STREAMING = True: run(payload, on_partial)로 처리 중 부분 결과를 내보냄
+#   MODEL_VERSION: API 서버 추론 결과 캐시 키로 게시할 모델 버전
+#   warm_up(): 모델을 적재하고 합성 입력으로 한 번 추론해 첫 요청의 지연을 없앰
+# 을 정의합니다. 워커는 자신이 맡은 작업(WORKER_TASKS)의 모듈만 import하므로 다른 샤드의 프레임워크(torch,
+# sentence-transformers 등)와 모델은 적재하지 않습니다.
+TASK_MODULES: dict[str, str] = {
+    "cnn": "ai_worker.tasks.cnn",
+    "ocr": "ai_worker.tasks.ocr",
+    "embed": "ai_worker.tasks.embedding",
+    "retrieve": "ai_worker.tasks.retrieval",
+}
+
+
+@dataclass
+class TaskRegistry:
+    handlers: dict[str, Callable[..., dict[str, Any]]] = field(default_factory=dict)
+    batch_handlers: dict[str, Callable[[list[dict[str, Any]]], list[dict[str, Any]]]] = field(default_factory=dict)
+    batch_limits: dict[str, int] = field(default_factory=dict)
+    streaming: set[str] = field(default_factory=set)
+    model_versions: dict[str, str] = field(default_factory=dict)
+    warm_ups: dict[str, Callable[[], None]] = field(default_factory=dict)
+    import_ms: dict[str, float] = field(
+        default_factory=dict
+    )  # 작업 모듈 import 시간 (앞선 작업과 공유하는 의존성 제외)
+
+
+def load_tasks(tasks: list[str]) -> TaskRegistry:
+    """
+    이 워커가 서빙할 작업의 처리 모듈만 import하여 처리 함수와 모델 버전을 모읍니다.
+
+    Args:
+        tasks (list[str]): 서빙할 작업 종류 (TASK_MODULES의 키)
+
+    Returns:
+        TaskRegistry: 작업별 처리 함수, 일괄 처리 함수/한도, 스트리밍 여부, 모델 버전
+
+    Raises:
+        ValueError: 알 수 없는 작업 종류가 포함된 경우
+    """
+    unknown = set(tasks) - TASK_MODULES.keys()
+    if unknown:
+        raise ValueError(f"unknown worker tasks: {sorted(unknown)}")
+
+    registry = TaskRegistry()
+    for task in tasks:
+        started = time.perf_counter()
+        module = importlib.import_module(TASK_MODULES[task])
+        registry.import_ms[task] = round((time.perf_counter() - started) * 1000, 1)
+        registry.handlers[task] = module.run
+        if hasattr(module, "run_batch"):
+            registry.batch_handlers[task] = module.run_batch
+            registry.batch_limits[task] = module.BATCH_LIMIT
+        if getattr(module, "STREAMING", False):
+            registry.streaming.add(task)
+        if hasattr(module, "MODEL_VERSION"):
+            registry.model_versions[task] = module.MODEL_VERSION
+        if hasattr(module, "warm_up"):
+            registry.warm_ups[task] = module.warm_up
+    return registry
+
+
+def warm_up_tasks(registry: TaskRegistry) -> dict[str, float]:
+    """
+    (처리 스레드) 작업별 warm_up을 실행합니다. 모델 적재와 첫 추론(가중치 페이지 인, 커널/스레드 풀 초기화)이
+    사용자 요청이 아닌 기동 시점에 일어나도록, 워커는 이 함수가 끝난 뒤에 준비 상태를 게시합니다.
+
+    Returns:
+        dict[str, float]: 작업별 warm-up 시간(ms)
+    """
+    elapsed: dict[str, float] = {}
+    for task, warm_up in registry.warm_ups.items():
+        started = time.perf_counter()
+        warm_up()
+        elapsed[task] = round((time.perf_counter() - started) * 1000, 1)
+    return elapsed
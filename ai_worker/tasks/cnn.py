@@ -0,0 +1,45 @@
+import io
+from typing import Any
+
+from PIL import Image
+
+from ai_worker.core import config
+from ai_worker.core.blobs import open_image
+from ai_worker.tasks.ocr import get_ocr_engine
+from ai_worker.tasks.pill_cascade import get_pill_cascade, preprocess
+
+# 캐스케이드 결과는 두 모델과 승격 임계값에 모두 의존하므로 셋을 합쳐 하나의 버전으로 게시합니다.
+MODEL_VERSION = f"{config.CNN_FAST_MODEL_VERSION}+{config.CNN_MODEL_VERSION}@{config.PILL_CASCADE_THRESHOLD}"
+
+
+def run(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    알약 이미지를 경량→대형 캐스케이드로 분류하여 상위 후보와 신뢰도를 반환합니다.
+
+    Args:
+        payload (dict): blob(공유 저장소 참조) 또는 image_b64(이미지 base64), image_sha256,
+            mode(classify면 승격해도 각인 OCR을 생략, 각인 OCR 작업을 따로 요청하는 복합 분석용)
+
+    Returns:
+        dict: model_version, stage(응답한 단계), candidates(pill_name/confidence/medication_info),
+              imprint_text(승격 시 각인 OCR 결과), timings_ms
+    """
+    with open_image(payload) as image:
+        return {
+            "model_version": MODEL_VERSION,
+            **get_pill_cascade().run(image.stream(), imprint=payload.get("mode") != "classify"),
+        }
+
+
+def warm_up() -> None:
+    """
+    두 모델과 승격 경로의 각인 OCR 엔진을 적재하고 합성 이미지로 경량/대형 모델을 한 번씩 실행합니다.
+    (승격 경로의 첫 요청도 느려지지 않도록, OCR 엔진을 적재할 수 없으면 기동을 멈춤)
+    """
+    buffer = io.BytesIO()
+    Image.new("RGB", (224, 224), (200, 200, 200)).save(buffer, format="PNG")
+    cascade = get_pill_cascade()
+    tensor = preprocess(buffer.getvalue())
+    cascade.fast.predict(tensor)
+    cascade.large.predict(tensor)
+    get_ocr_engine()
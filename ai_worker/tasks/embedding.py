@@ -0,0 +1,104 @@
+import base64
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from ai_worker.core import config
+from ai_worker.tasks.embedding_cache import EmbeddingCache, text_key
+
+MODEL_VERSION = config.EMBEDDING_MODEL_VERSION
+# 큐에 쌓인 embed 작업을 한 번의 encode 호출로 묶을 최대 작업 수
+BATCH_LIMIT = config.EMBEDDING_MAX_BATCH_JOBS
+
+
+class EmbeddingService:
+    """
+    약품 설명, 가이드 문단, 대화 턴 등의 텍스트를 정규화 임베딩(float16)으로 변환합니다.
+    요청된 텍스트는 중복 제거 후 캐시에 없는 것만 한 번의 encode 호출로 계산하며,
+    결과는 mmap 디스크 캐시에 저장되어 재시작 후에도 같은 문단을 다시 인코딩하지 않습니다.
+    """
+
+    def __init__(self, model: SentenceTransformer, cache: EmbeddingCache):
+        self.model = model
+        self.cache = cache
+        self.dim = cache.dim
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록 (중복 허용)
+
+        Returns:
+            np.ndarray: (len(texts), dim) float16 행렬 (L2 정규화됨)
+        """
+        keys = [text_key(text) for text in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in found}
+        if missing:
+            encoded = self.model.encode(
+                list(missing.values()),
+                batch_size=config.EMBEDDING_ENCODE_BATCH_SIZE,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+            ).astype(np.float16)
+            self.cache.put_many(list(missing), encoded)
+            found.update(zip(missing, encoded, strict=True))
+
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float16)
+        return np.stack([found[key] for key in keys])
+
+
+@lru_cache(maxsize=1)
+def get_embedding_service() -> EmbeddingService:
+    """
+    프로세스당 한 번만 모델과 캐시를 적재합니다. 캐시는 모델 이름별 디렉토리로 분리됩니다.
+    """
+    model = SentenceTransformer(config.EMBEDDING_MODEL_NAME, device="cpu")
+    cache_dir = Path(config.EMBEDDING_CACHE_DIR) / re.sub(r"[^\w.-]", "_", config.EMBEDDING_MODEL_NAME)
+    return EmbeddingService(model, EmbeddingCache(cache_dir, model.get_sentence_embedding_dimension()))
+
+
+def encode_vectors(vectors: np.ndarray) -> dict[str, Any]:
+    return {
+        "dtype": "float16",
+        "shape": list(vectors.shape),
+        "vectors_b64": base64.b64encode(np.ascontiguousarray(vectors, dtype="<f2").tobytes()).decode(),
+    }
+
+
+def run_batch(payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    여러 embed 작업의 텍스트를 모아 한 번에 임베딩한 뒤 작업별로 나누어 반환합니다.
+
+    Args:
+        payloads (list[dict]): 작업별 입력 (texts: list[str])
+
+    Returns:
+        list[dict]: 작업별 model_version, dtype, shape, vectors_b64 (little-endian float16)
+    """
+    texts = [text for payload in payloads for text in payload["texts"]]
+    vectors = get_embedding_service().embed(texts)
+
+    results, offset = [], 0
+    for payload in payloads:
+        size = len(payload["texts"])
+        results.append({"model_version": MODEL_VERSION, **encode_vectors(vectors[offset : offset + size])})
+        offset += size
+    return results
+
+
+def run(payload: dict[str, Any]) -> dict[str, Any]:
+    return run_batch([payload])[0]
+
+
+def warm_up() -> None:
+    """
+    모델을 적재하고 한 번 인코딩합니다. (디스크 캐시에 남지 않도록 모델을 직접 호출)
+    """
+    get_embedding_service().model.encode(["복약 안내 워밍업"], normalize_embeddings=True)
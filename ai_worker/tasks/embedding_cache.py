@@ -0,0 +1,148 @@
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+KEY_BYTES = 16  # blake2b-128 텍스트 해시
+_GROWTH_ROWS = 4096
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=KEY_BYTES).digest()
+
+
+class EmbeddingCache:
+    """
+    텍스트 해시 → float16 임베딩 벡터를 보관하는 메모리 매핑(mmap) 기반 디스크 캐시입니다.
+
+    디렉토리 구성:
+        vectors.f16  (capacity, dim) float16 행렬
+        keys.bin     (capacity, 16) 텍스트 해시
+        meta.json    dim, count(확정된 행 수)
+
+        .lock        추가 기록용 프로세스 간 잠금 파일 (flock)
+
+    벡터와 키를 먼저 기록·flush한 뒤 meta.json의 count를 원자적으로 갱신하므로,
+    중간에 프로세스가 종료되어도 확정되지 않은 행만 버려지고 캐시는 일관성을 유지합니다.
+    같은 디렉토리를 여러 워커 프로세스(embed/retrieve 샤드, 복제본)가 함께 쓰므로 추가 기록은 flock으로 직렬화하고,
+    조회에서 못 찾은 키가 있으면 meta.json을 다시 읽어 다른 프로세스가 확정한 행을 반영합니다.
+    """
+
+    def __init__(self, directory: str | Path, dim: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self._lock = threading.Lock()
+
+        self.count = 0
+        self._rows: dict[bytes, int] = {}
+        self._meta_mtime: tuple[int, int] | None = None
+        with self._exclusive():
+            self._open(_GROWTH_ROWS)
+            self._refresh()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """
+        캐시에 있는 키의 벡터만 반환합니다. 반환 벡터는 mmap 영역의 복사본입니다.
+        """
+        with self._lock:
+            if any(key not in self._rows for key in keys):
+                self._refresh()
+            rows = {key: self._rows[key] for key in keys if key in self._rows}
+            if not rows:
+                return {}
+            vectors = self._vectors[list(rows.values())]
+        return dict(zip(rows, vectors, strict=True))
+
+    def put_many(self, keys: list[bytes], vectors: np.ndarray) -> None:
+        """
+        새 벡터를 추가하고 디스크에 확정합니다. 이미 있는 키는 건너뜁니다.
+        """
+        with self._lock, self._exclusive():
+            self._refresh(force=True)
+            fresh = [(key, vector) for key, vector in zip(keys, vectors, strict=True) if key not in self._rows]
+            if not fresh:
+                return
+            start = self.count
+            end = start + len(fresh)
+            if end > len(self._keys):
+                self._open(max(end, len(self._keys) * 2))
+
+            self._keys[start:end] = np.frombuffer(b"".join(key for key, _ in fresh), dtype=np.uint8).reshape(
+                -1, KEY_BYTES
+            )
+            self._vectors[start:end] = np.stack([vector for _, vector in fresh]).astype(np.float16)
+            self._keys.flush()
+            self._vectors.flush()
+
+            self.count = end
+            self._write_meta()
+            for row, (key, _) in enumerate(fresh, start=start):
+                self._rows[key] = row
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        with open(self.directory / ".lock", "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _refresh(self, force: bool = False) -> None:
+        """
+        다른 프로세스가 확정한 행을 읽어 들입니다. force가 아니면 meta.json이 바뀌지 않았을 때 건너뜁니다.
+        (같은 시각에 두 번 갱신되어 건너뛰더라도 조회가 한 번 빗나갈 뿐이며, 추가 기록은 잠금 안에서 항상 다시 읽음)
+        """
+        try:
+            stat = os.stat(self.directory / "meta.json")
+        except FileNotFoundError:
+            return
+        mtime = (stat.st_mtime_ns, stat.st_ino)
+        if not force and mtime == self._meta_mtime:
+            return
+        meta = self._read_meta()
+        if meta is None:
+            return
+        if meta["dim"] != self.dim:
+            raise ValueError(f"embedding cache dim mismatch: {meta['dim']} != {self.dim} ({self.directory})")
+        count = meta["count"]
+        if count > len(self._keys):
+            self._open(count)
+        for row in range(self.count, count):
+            self._rows[bytes(self._keys[row])] = row
+        self.count = max(self.count, count)
+        self._meta_mtime = mtime
+
+    def _open(self, capacity: int) -> None:
+        for name, width in (("vectors.f16", self.dim * 2), ("keys.bin", KEY_BYTES)):
+            path = self.directory / name
+            with open(path, "ab") as f:
+                if f.tell() < capacity * width:
+                    f.truncate(capacity * width)
+        self._vectors = np.memmap(
+            self.directory / "vectors.f16", dtype=np.float16, mode="r+", shape=(capacity, self.dim)
+        )
+        self._keys = np.memmap(self.directory / "keys.bin", dtype=np.uint8, mode="r+", shape=(capacity, KEY_BYTES))
+
+    def _read_meta(self) -> dict | None:
+        try:
+            return json.loads((self.directory / "meta.json").read_text())
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self) -> None:
+        tmp = self.directory / "meta.json.tmp"
+        tmp.write_text(json.dumps({"dim": self.dim, "count": self.count}))
+        os.replace(tmp, self.directory / "meta.json")
+        stat = os.stat(self.directory / "meta.json")
+        self._meta_mtime = (stat.st_mtime_ns, stat.st_ino)
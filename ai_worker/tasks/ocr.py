@@ -0,0 +1,318 @@
+import io
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+import pypdfium2 as pdfium
+from PIL import Image
+
+from ai_worker.core import config, default_logger
+from ai_worker.core.blobs import ImageSource, open_image
+from ai_worker.core.cancellation import check_cancelled
+from ai_worker.text.drug_normalizer import DrugNormalizer
+from ai_worker.text.prescription_parser import PARSER_VERSION, parse_prescription
+
+# 파서나 약품 마스터가 바뀌면 같은 이미지라도 정규화 결과가 달라지므로 버전에 함께 포함합니다.
+MODEL_VERSION = f"{config.OCR_MODEL_VERSION}+{PARSER_VERSION}+{config.DRUG_MASTER_VERSION}"
+
+# PDF는 페이지가 끝날 때마다 부분 결과를 내보냅니다. (run(payload, on_page))
+STREAMING = True
+
+PDF_MAGIC = b"%PDF-"
+# 페이지 하나의 인식이 끝날 때마다 부분 결과를 받는 콜백 (워커 스레드에서 호출됨)
+PageCallback = Callable[[dict[str, Any]], None]
+# OCR 엔진이 돌려주는 글자 상자: (꼭짓점 좌표 [[x, y], ...], 텍스트, 신뢰도)
+TextBox = tuple[list[list[float]], str, float]
+
+
+@lru_cache(maxsize=1)
+def get_drug_normalizer() -> DrugNormalizer | None:
+    """
+    프로세스당 한 번 약품 마스터로 정규화 색인을 구축합니다. 마스터 파일이 없으면 정규화를 생략합니다.
+    """
+    path = Path(config.DRUG_MASTER_PATH)
+    if not path.exists():
+        default_logger.warning("drug master not found, skipping drug name normalization: %s", path)
+        return None
+    normalizer = DrugNormalizer.from_csv(path, max_distance=config.DRUG_MATCH_MAX_DISTANCE)
+    default_logger.info("drug normalizer loaded: entries=%d terms=%d", len(normalizer), normalizer.term_count)
+    return normalizer
+
+
+def standardize_drugs(drugs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    OCR로 읽은 약품명마다 가장 가까운 표준 제품명과 일치 점수를 덧붙입니다.
+    """
+    normalizer = get_drug_normalizer()
+    for drug in drugs:
+        match = normalizer.normalize(drug["drug_name"]) if normalizer else None
+        drug["standard_drug_name"] = match.name if match else None
+        drug["match_score"] = match.score if match else None
+    return drugs
+
+
+class OcrEngineUnavailableError(RuntimeError):
+    """
+    OCR 엔진이 설정되지 않았거나 적재할 수 없을 때 발생합니다.
+    """
+
+
+@lru_cache(maxsize=1)
+def get_ocr_engine() -> Any:
+    """
+    프로세스당 한 번 OCR_ENGINE에 지정된 엔진을 적재합니다. (PDF 페이지 풀의 자식 프로세스도 각자 적재)
+
+    Returns:
+        Any: readtext(image) → [(상자 꼭짓점 좌표, 텍스트, 신뢰도), ...]를 제공하는 엔진
+
+    Raises:
+        OcrEngineUnavailableError: 엔진이 설정되지 않았거나 패키지/가중치가 없는 경우
+    """
+    if config.OCR_ENGINE != "easyocr":
+        raise OcrEngineUnavailableError(f"OCR engine is not configured (OCR_ENGINE={config.OCR_ENGINE!r})")
+    try:
+        import easyocr
+    except ImportError as err:
+        raise OcrEngineUnavailableError("OCR_ENGINE=easyocr but the easyocr package is not installed") from err
+    try:
+        return easyocr.Reader(
+            config.OCR_LANGUAGES,
+            gpu=False,
+            model_storage_directory=config.OCR_ENGINE_MODEL_DIR,
+            download_enabled=False,
+        )
+    except FileNotFoundError as err:
+        raise OcrEngineUnavailableError(f"OCR model weights not found in {config.OCR_ENGINE_MODEL_DIR}") from err
+
+
+def read_boxes(image: bytes | BinaryIO | Image.Image) -> list[TextBox]:
+    """
+    이미지에서 글자 상자를 인식합니다.
+    """
+    engine = get_ocr_engine()
+    if isinstance(image, bytes):
+        image = Image.open(io.BytesIO(image))
+    elif not isinstance(image, Image.Image):
+        image.seek(0)  # 캐스케이드 승격 시에는 분류 전처리가 이미 읽은 스트림이 넘어옵니다.
+        image = Image.open(image)
+    return engine.readtext(np.asarray(image.convert("RGB")))
+
+
+def group_lines(boxes: list[TextBox]) -> list[str]:
+    """
+    글자 상자를 세로 위치로 줄 단위로 묶고, 줄 안에서는 왼쪽부터 이어 붙입니다.
+    세로 중심이 같은 줄 첫 상자와 두 상자 중 큰 높이의 절반 이내면 같은 줄로 봅니다. (표의 칸 사이는 공백 두 칸)
+    """
+    rows: list[tuple[float, float, list[tuple[float, str]]]] = []  # (세로 중심, 높이, [(왼쪽 x, 텍스트)])
+    for corners, text, _ in sorted(boxes, key=lambda box: min(y for _, y in box[0])):
+        top, bottom = min(y for _, y in corners), max(y for _, y in corners)
+        center, height, left = (top + bottom) / 2, bottom - top, min(x for x, _ in corners)
+        if rows and abs(center - rows[-1][0]) <= max(rows[-1][1], height) / 2:
+            rows[-1][2].append((left, text))
+        else:
+            rows.append((center, height, [(left, text)]))
+    return ["  ".join(text for _, text in sorted(cells)) for _, _, cells in rows]
+
+
+def _recognize(image: bytes | BinaryIO | Image.Image) -> tuple[list[str], float]:
+    boxes = read_boxes(image)
+    confidence = round(statistics.fmean(float(box[2]) for box in boxes), 4) if boxes else 0.0
+    return group_lines(boxes), confidence
+
+
+def recognize_imprint(image: bytes | BinaryIO) -> dict[str, Any]:
+    """
+    알약 표면의 각인(문자/숫자)을 인식합니다.
+
+    Args:
+        image (bytes | BinaryIO): 알약 이미지 바이너리 또는 스트림
+
+    Returns:
+        dict: raw_text(각인 원문, 줄은 공백으로 이음), confidence(상자 평균, 글자가 없으면 0)
+
+    Raises:
+        OcrEngineUnavailableError: OCR 엔진을 적재할 수 없는 경우
+    """
+    lines, confidence = _recognize(image)
+    return {"raw_text": " ".join(lines), "confidence": confidence}
+
+
+def recognize_text(image: bytes | BinaryIO | Image.Image) -> dict[str, Any]:
+    """
+    처방전 이미지의 전체 텍스트를 줄 단위로 인식합니다.
+
+    Args:
+        image (bytes | BinaryIO | Image.Image): 처방전 이미지 바이너리/스트림 또는 래스터화된 PDF 페이지
+
+    Returns:
+        dict: raw_text(줄바꿈으로 구분된 OCR 원문), confidence(상자 평균, 글자가 없으면 0)
+
+    Raises:
+        OcrEngineUnavailableError: OCR 엔진을 적재할 수 없는 경우
+    """
+    lines, confidence = _recognize(image)
+    return {"raw_text": "\n".join(lines), "confidence": confidence}
+
+
+def analyze_text(recognized: dict[str, Any]) -> dict[str, Any]:
+    """
+    OCR 원문을 처방 정보로 파싱하고 약품명을 표준 제품명으로 정규화합니다.
+    """
+    prescription = parse_prescription(recognized["raw_text"])
+    return {
+        **recognized,
+        "hospital_name": prescription.hospital_name,
+        "prescribed_date": prescription.prescribed_date,
+        "drugs": standardize_drugs([drug.to_dict() for drug in prescription.drugs]),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_page_pool() -> ProcessPoolExecutor:
+    """
+    PDF 페이지 래스터화/인식용 프로세스 풀을 프로세스당 한 번 생성합니다.
+    작업 처리 스레드가 도는 프로세스에서 fork하지 않도록 spawn 방식으로 자식 프로세스를 띄웁니다.
+    """
+    return ProcessPoolExecutor(max_workers=config.OCR_PAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+def recognize_page(path: str, index: int, scale: float) -> dict[str, Any]:
+    """
+    (자식 프로세스) PDF의 한 페이지를 래스터화하여 텍스트를 인식합니다.
+
+    Args:
+        path (str): PDF 파일 경로
+        index (int): 0부터 시작하는 페이지 번호
+        scale (float): 래스터화 배율 (DPI / 72)
+
+    Returns:
+        dict: page(1부터), raw_text, confidence, render_ms, ocr_ms
+    """
+    started = time.perf_counter()
+    document = pdfium.PdfDocument(path)
+    try:
+        image = document[index].render(scale=scale).to_pil()
+    finally:
+        document.close()
+    rendered = time.perf_counter()
+    recognized = recognize_text(image)
+    return {
+        "page": index + 1,
+        **recognized,
+        "render_ms": round((rendered - started) * 1000, 1),
+        "ocr_ms": round((time.perf_counter() - rendered) * 1000, 1),
+    }
+
+
+def recognize_document(path: str, on_page: PageCallback) -> dict[str, Any]:
+    """
+    다중 페이지 PDF를 페이지별로 프로세스 풀에서 병렬 인식합니다.
+    페이지가 끝나는 순서대로 파싱·정규화한 부분 결과를 on_page로 내보내고, 마지막에 페이지 순서대로 병합합니다.
+    자식 프로세스마다 PDF 바이트를 직렬화해 보내지 않도록 파일 경로만 넘깁니다.
+
+    Args:
+        path (str): PDF 파일 경로 (공유 저장소 파일 또는 인라인 페이로드를 쓴 임시 파일)
+        on_page (PageCallback): 페이지별 부분 결과 콜백
+
+    Returns:
+        dict: 병합된 raw_text, confidence(페이지 평균), 병원명/처방일(앞 페이지 우선), 약품 행, 페이지별 소요 시간
+
+    Raises:
+        ValueError: 페이지 수가 OCR_MAX_PDF_PAGES를 넘는 경우
+    """
+    started = time.perf_counter()
+    pdf = pdfium.PdfDocument(path)
+    page_count = len(pdf)
+    pdf.close()
+    if page_count > config.OCR_MAX_PDF_PAGES:
+        raise ValueError(f"PDF has {page_count} pages (max {config.OCR_MAX_PDF_PAGES})")
+
+    scale = config.OCR_PDF_RENDER_DPI / 72
+    futures = [get_page_pool().submit(recognize_page, path, index, scale) for index in range(page_count)]
+    pages: list[dict[str, Any]] = [{} for _ in range(page_count)]
+    try:
+        for future in as_completed(futures):
+            # 취소되면 아직 시작하지 않은 페이지는 finally에서 취소됩니다.
+            check_cancelled()
+            page = analyze_text(future.result())
+            pages[page["page"] - 1] = page
+            on_page({"page_count": page_count, **page})
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return {
+        "raw_text": "\n".join(page["raw_text"] for page in pages),
+        "confidence": round(statistics.fmean(page["confidence"] for page in pages), 4) if pages else 0.0,
+        "hospital_name": next((page["hospital_name"] for page in pages if page["hospital_name"]), None),
+        "prescribed_date": next((page["prescribed_date"] for page in pages if page["prescribed_date"]), None),
+        "drugs": [drug for page in pages for drug in page["drugs"]],
+        "page_count": page_count,
+        "pages": [
+            {
+                "page": page["page"],
+                "confidence": page["confidence"],
+                "drug_count": len(page["drugs"]),
+                "render_ms": page["render_ms"],
+                "ocr_ms": page["ocr_ms"],
+            }
+            for page in pages
+        ],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def run(payload: dict[str, Any], on_page: PageCallback | None = None) -> dict[str, Any]:
+    """
+    처방전/진료비 계산서(이미지 또는 PDF) 또는 알약 각인 이미지에서 텍스트를 추출합니다.
+
+    Args:
+        payload (dict): blob(공유 저장소 참조) 또는 image_b64(이미지/PDF base64), image_sha256,
+            mode(prescription/imprint)
+        on_page (PageCallback | None): PDF일 때 페이지별 부분 결과를 받을 콜백
+
+    Returns:
+        dict: model_version, raw_text, confidence 및 (처방전 모드일 때) 표준 약품명이 붙은 처방 정보,
+            (PDF일 때) page_count와 페이지별 소요 시간
+    """
+    with open_image(payload) as image:
+        if payload.get("mode") == "imprint":
+            return {"model_version": MODEL_VERSION, **recognize_imprint(image.stream())}
+        if image.data[: len(PDF_MAGIC)] == PDF_MAGIC:
+            return {"model_version": MODEL_VERSION, **run_document(image, on_page or (lambda page: None))}
+        recognized = recognize_text(image.stream())
+    check_cancelled()
+    return {"model_version": MODEL_VERSION, **analyze_text(recognized)}
+
+
+def run_document(image: ImageSource, on_page: PageCallback) -> dict[str, Any]:
+    if image.path is not None:
+        return recognize_document(image.path, on_page)
+    # 인라인 페이로드는 자식 프로세스가 열 수 있도록 임시 파일로 씁니다.
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as file:
+        file.write(image.data)
+        file.flush()
+        return recognize_document(file.name, on_page)
+
+
+def _child_ready(_: int) -> int:
+    get_ocr_engine()
+    return os.getpid()
+
+
+def warm_up() -> None:
+    """
+    약품 마스터 색인을 구축하고 합성 이미지로 인식 → 파싱 → 정규화를 한 번 실행합니다.
+    PDF 페이지 풀의 자식 프로세스도 미리 띄워 이 모듈의 import와 OCR 엔진 적재를 끝내 둡니다.
+    OCR 엔진을 적재할 수 없으면 OcrEngineUnavailableError로 기동을 멈춥니다.
+    """
+    analyze_text(recognize_text(Image.new("RGB", (64, 64), "white")))
+    list(get_page_pool().map(_child_ready, range(config.OCR_PAGE_WORKERS)))
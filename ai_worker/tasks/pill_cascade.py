@@ -0,0 +1,143 @@
+import io
+import json
+import time
+from functools import lru_cache
+from typing import Any, BinaryIO
+
+import torch
+from PIL import Image
+from torchvision import models, transforms
+
+from ai_worker.core import config
+from ai_worker.core.cancellation import check_cancelled
+from ai_worker.tasks import ocr
+
+# ImageNet 사전학습 백본 기준 정규화 값
+_PREPROCESS = transforms.Compose(
+    [
+        transforms.Resize(256),
+        transforms.CenterCrop(224),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+    ]
+)
+
+
+def preprocess(image: bytes | BinaryIO) -> torch.Tensor:
+    """
+    이미지 바이트(또는 매핑된 파일 스트림)를 디코딩하여 (3, 224, 224) 입력 텐서로 변환합니다.
+    """
+    decoded = Image.open(io.BytesIO(image) if isinstance(image, bytes) else image).convert("RGB")
+    return _PREPROCESS(decoded)
+
+
+class PillClassifier:
+    """
+    알약 외형 분류 모델과 클래스 라벨(약품명/설명)을 묶은 추론 래퍼입니다.
+    """
+
+    def __init__(self, model: torch.nn.Module, labels: list[dict[str, str]]):
+        self.model = model.eval()
+        self.labels = labels
+
+    @torch.inference_mode()
+    def predict(self, tensor: torch.Tensor, top_k: int = 3) -> list[dict[str, Any]]:
+        """
+        상위 top_k개 후보를 신뢰도 내림차순으로 반환합니다.
+
+        Args:
+            tensor (torch.Tensor): preprocess()로 만든 입력 텐서
+            top_k (int): 반환할 후보 수
+
+        Returns:
+            list[dict]: pill_name, confidence, medication_info, imprint(등록 각인)
+        """
+        probs = self.model(tensor.unsqueeze(0)).softmax(dim=-1)[0]
+        confidences, indices = probs.topk(min(top_k, probs.numel()))
+        return [
+            {
+                "pill_name": self.labels[index]["pill_name"],
+                "confidence": round(float(confidence), 4),
+                "medication_info": self.labels[index].get("medication_info", ""),
+                "imprint": self.labels[index].get("imprint", ""),
+            }
+            for confidence, index in zip(confidences.tolist(), indices.tolist(), strict=True)
+        ]
+
+
+class PillCascade:
+    """
+    경량 모델이 먼저 답하고, top-1 신뢰도가 임계값 미만인 입력만 대형 모델과 각인 OCR로 승격하는 2단계 분류기입니다.
+    """
+
+    def __init__(self, fast: PillClassifier, large: PillClassifier, threshold: float):
+        self.fast = fast
+        self.large = large
+        self.threshold = threshold
+
+    def run(self, image: bytes | BinaryIO, imprint: bool = True) -> dict[str, Any]:
+        """
+        캐스케이드 추론을 수행합니다.
+
+        Args:
+            image (bytes | BinaryIO): 알약 이미지 바이너리 또는 스트림
+            imprint (bool): 승격 시 각인 OCR도 실행할지 여부 (호출 쪽이 각인 OCR을 따로 요청하면 False)
+
+        Returns:
+            dict: stage(fast/escalated), candidates, imprint_text(승격 시), timings_ms
+        """
+        started = time.perf_counter()
+        tensor = preprocess(image)
+        check_cancelled()
+        candidates = self.fast.predict(tensor)
+        timings = {"fast_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+        if candidates[0]["confidence"] >= self.threshold:
+            return {"stage": "fast", "candidates": candidates, "imprint_text": None, "timings_ms": timings}
+
+        # 대형 모델 + 각인 OCR은 가장 비싼 단계이므로 기다리는 쪽이 없으면 승격하지 않습니다.
+        check_cancelled()
+        escalated_at = time.perf_counter()
+        candidates = self.large.predict(tensor)
+        imprint_text = ocr.recognize_imprint(image)["raw_text"] if imprint else None
+        timings["escalated_ms"] = round((time.perf_counter() - escalated_at) * 1000, 2)
+        return {
+            "stage": "escalated",
+            "candidates": candidates,
+            "imprint_text": imprint_text,
+            "timings_ms": timings,
+        }
+
+
+def _load_labels() -> list[dict[str, str]]:
+    with open(config.PILL_LABELS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_fast_classifier() -> PillClassifier:
+    """
+    MobileNetV3-Small 기반 경량 모델을 불러와 Linear 레이어를 int8 동적 양자화합니다.
+    """
+    labels = _load_labels()
+    model = models.mobilenet_v3_small(num_classes=len(labels))
+    model.load_state_dict(torch.load(config.CNN_FAST_MODEL_PATH, map_location="cpu", weights_only=True))
+    model = torch.ao.quantization.quantize_dynamic(model.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+    return PillClassifier(model, labels)
+
+
+def load_large_classifier() -> PillClassifier:
+    """
+    EfficientNet-B0 기반 대형(2단계) 모델을 불러옵니다.
+    """
+    labels = _load_labels()
+    model = models.efficientnet_b0(num_classes=len(labels))
+    model.load_state_dict(torch.load(config.CNN_LARGE_MODEL_PATH, map_location="cpu", weights_only=True))
+    return PillClassifier(model, labels)
+
+
+@lru_cache(maxsize=1)
+def get_pill_cascade() -> PillCascade:
+    """
+    프로세스당 한 번만 모델을 적재하여 캐스케이드 인스턴스를 반환합니다.
+    """
+    return PillCascade(load_fast_classifier(), load_large_classifier(), config.PILL_CASCADE_THRESHOLD)
@@ -0,0 +1,41 @@
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from ai_worker.core import config
+from ai_worker.retrieval.ivf_index import IVFFlatIndex
+from ai_worker.tasks.embedding import get_embedding_service
+
+
+@lru_cache(maxsize=1)
+def get_index() -> IVFFlatIndex:
+    """
+    프로세스당 한 번 인덱스를 mmap으로 엽니다. 벡터/문단은 페이지 캐시를 통해 워커 프로세스 간에 공유됩니다.
+    """
+    return IVFFlatIndex(config.RETRIEVAL_INDEX_DIR)
+
+
+def run(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    질의와 관련된 약물/질환 지식 문단을 검색합니다.
+
+    Args:
+        payload (dict): query(질의 텍스트), k(결과 수, 기본 5), families(성분 계열 필터, 선택)
+
+    Returns:
+        dict: model_version(인덱스 버전), hits(doc_id/text/family/score)
+    """
+    index = get_index()
+    query = get_embedding_service().embed([payload["query"]])[0]
+    hits = index.search(query, k=payload.get("k", 5), nprobe=config.RETRIEVAL_NPROBE, families=payload.get("families"))
+    return {"model_version": index.version, "hits": [asdict(hit) for hit in hits]}
+
+
+def warm_up() -> None:
+    """
+    인덱스를 열고 합성 질의로 한 번 검색해 중심점과 자주 쓰이는 목록 페이지를 메모리에 올립니다.
+    """
+    query = get_embedding_service().model.encode(["복약 안내 워밍업"], normalize_embeddings=True)[0]
+    get_index().search(np.asarray(query, dtype=np.float16), k=1, nprobe=config.RETRIEVAL_NPROBE)
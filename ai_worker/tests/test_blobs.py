@@ -0,0 +1,64 @@
+import os
+import time
+
+import pytest
+
+from ai_worker.core import blobs, config
+
+
+@pytest.fixture
+def blob_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "BLOB_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "BLOB_MIN_AGE_SECONDS", 600)
+    return tmp_path
+
+
+def make_blob(root, name: str, age_seconds: float):
+    path = root / name[:2] / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"image")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestPruneBlobs:
+    def test_removes_only_expired_blobs(self, blob_dir):
+        old = make_blob(blob_dir, "aa11", 7200)
+        recent = make_blob(blob_dir, "bb22", 60)
+
+        assert blobs.prune_blobs(3600) == 1
+
+        assert not old.exists()
+        assert recent.exists()
+
+    def test_keeps_blobs_that_queued_jobs_may_still_read(self, blob_dir):
+        queued = make_blob(blob_dir, "aa11", 300)
+
+        assert blobs.prune_blobs(60) == 0
+
+        assert queued.exists()
+
+    def test_restores_blob_reused_between_check_and_delete(self, blob_dir, monkeypatch):
+        reused = make_blob(blob_dir, "aa11", 7200)
+        rename = os.rename
+
+        def rename_after_reuse(src, dst):
+            os.utime(src)  # API 서버가 같은 이미지를 다시 넘김
+            rename(src, dst)
+
+        monkeypatch.setattr(blobs.os, "rename", rename_after_reuse)
+
+        assert blobs.prune_blobs(3600) == 0
+
+        assert reused.read_bytes() == b"image"
+        assert [path.name for path in reused.parent.iterdir()] == ["aa11"]
+
+    def test_removes_abandoned_temp_files(self, blob_dir):
+        abandoned = make_blob(blob_dir, "aa11.0f0f.tmp", 7200)
+        writing = make_blob(blob_dir, "bb22.1e1e.tmp", 1)
+
+        blobs.prune_blobs(3600)
+
+        assert not abandoned.exists()
+        assert writing.exists()
@@ -0,0 +1,85 @@
+import pytest
+
+from ai_worker.text.drug_normalizer import (
+    DrugEntry,
+    DrugNormalizer,
+    bounded_distance,
+    normalize_name,
+    parse_strength,
+    strip_strength,
+)
+
+
+@pytest.fixture
+def normalizer() -> DrugNormalizer:
+    return DrugNormalizer(
+        [
+            DrugEntry("타이레놀정500밀리그램(아세트아미노펜)", "T500"),
+            DrugEntry("타이레놀정160밀리그램", "T160"),
+            DrugEntry("아모디핀정5밀리그램", "A5"),
+            DrugEntry("노바스크정", "N"),
+            DrugEntry("부루펜시럽100밀리그램/5밀리리터", "B"),
+        ]
+    )
+
+
+class TestNormalizeName:
+    def test_unifies_units_and_drops_brackets_and_spaces(self):
+        assert normalize_name("타이레놀정 500밀리그람(아세트아미노펜)") == "타이레놀정500mg"
+        assert normalize_name("아모디핀정 5㎎") == "아모디핀정5mg"
+
+    def test_tolerates_ocr_typos_in_korean_units(self):
+        assert normalize_name("타이레놀정500밀리그랍") == "타이레놀정500mg"
+
+    def test_strength_is_split_from_the_name(self):
+        assert strip_strength("아모디핀정10mg") == "아모디핀정"
+        assert parse_strength("아모디핀정10mg") == ((10.0, "mg"),)
+        assert parse_strength("노바스크정") == ()
+
+
+class TestBoundedDistance:
+    @pytest.mark.parametrize(
+        ("left", "right", "expected"),
+        [("abc", "abc", 0), ("abc", "abd", 1), ("abcd", "abdc", 1), ("abc", "a", 2), ("abcdef", "ghijkl", 3)],
+    )
+    def test_osa_distance_capped_at_max_plus_one(self, left: str, right: str, expected: int):
+        assert bounded_distance(left, right, 2) == min(expected, 3)
+
+
+class TestDrugNormalizer:
+    def test_exact_name_with_strength(self, normalizer: DrugNormalizer):
+        match = normalizer.normalize("타이레놀정 500mg")
+
+        assert match is not None
+        assert (match.code, match.score) == ("T500", 1.0)
+
+    def test_ocr_typo_in_name_still_matches_same_strength(self, normalizer: DrugNormalizer):
+        match = normalizer.normalize("타이래놀정160mg")
+
+        assert match is not None
+        assert match.code == "T160"
+        assert 0 < match.score < 1
+
+    def test_different_strength_is_never_matched(self, normalizer: DrugNormalizer):
+        assert normalizer.normalize("아모디핀정 10mg") is None
+        assert normalizer.lookup("아모디핀정 10mg") == []
+        assert normalizer.normalize("타이레놀정 650mg") is None
+
+    def test_strength_query_falls_back_to_product_without_strength(self, normalizer: DrugNormalizer):
+        match = normalizer.normalize("노바스크정 5mg")
+
+        assert match is not None
+        assert match.code == "N"
+
+    def test_name_without_strength_matches_any_strength(self, normalizer: DrugNormalizer):
+        assert {match.code for match in normalizer.lookup("타이레놀정")} == {"T500", "T160"}
+
+    def test_multi_unit_strength_is_compared_as_a_whole(self, normalizer: DrugNormalizer):
+        match = normalizer.normalize("부루펜시럽 100mg/5ml")
+        assert match is not None
+        assert match.code == "B"
+        assert normalizer.normalize("부루펜시럽 100mg/10ml") is None
+
+    def test_index_lookup_agrees_with_linear_scan(self, normalizer: DrugNormalizer):
+        for query in ("타이래놀정500mg", "아모디핀정5mg", "노바스그정", "아모디핀정 10mg"):
+            assert normalizer.lookup(query) == normalizer.linear_lookup(query)
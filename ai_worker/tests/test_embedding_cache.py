@@ -0,0 +1,57 @@
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+from ai_worker.tasks.embedding_cache import EmbeddingCache, text_key
+
+DIM = 8
+
+
+def vector_for(text: str) -> np.ndarray:
+    return np.full(DIM, len(text) % 97, dtype=np.float32)
+
+
+def fill(directory: str, prefix: str, total: int) -> None:
+    cache = EmbeddingCache(directory, DIM)
+    for start in range(0, total, 10):
+        texts = [f"{prefix}-{index}" for index in range(start, start + 10)]
+        cache.put_many([text_key(text) for text in texts], np.stack([vector_for(text) for text in texts]))
+
+
+class TestEmbeddingCache:
+    def test_put_and_get_survive_reopen(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, DIM)
+        keys = [text_key("아세트아미노펜"), text_key("이부프로펜")]
+        cache.put_many(keys, np.stack([vector_for("아세트아미노펜"), vector_for("이부프로펜")]))
+        cache.put_many(keys[:1], np.stack([vector_for("중복")]))
+
+        reopened = EmbeddingCache(tmp_path, DIM)
+        found = reopened.get_many([*keys, text_key("없음")])
+
+        assert len(reopened) == 2
+        assert set(found) == set(keys)
+        np.testing.assert_array_equal(found[keys[1]], vector_for("이부프로펜").astype(np.float16))
+
+    def test_sees_rows_written_by_another_instance(self, tmp_path: Path):
+        reader = EmbeddingCache(tmp_path, DIM)
+        writer = EmbeddingCache(tmp_path, DIM)
+        writer.put_many([text_key("로사르탄")], np.stack([vector_for("로사르탄")]))
+
+        assert text_key("로사르탄") in reader.get_many([text_key("로사르탄")])
+
+    def test_concurrent_writers_do_not_overwrite_rows(self, tmp_path: Path):
+        context = multiprocessing.get_context("spawn")
+        writers = [context.Process(target=fill, args=(str(tmp_path), prefix, 300)) for prefix in ("a", "b", "c")]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        cache = EmbeddingCache(tmp_path, DIM)
+        texts = [f"{prefix}-{index}" for prefix in ("a", "b", "c") for index in range(300)]
+        found = cache.get_many([text_key(text) for text in texts])
+
+        assert len(cache) == len(texts)
+        for text in texts:
+            np.testing.assert_array_equal(found[text_key(text)], vector_for(text).astype(np.float16))
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ai_worker.retrieval.ivf_index import IVFFlatIndex, build_ivf_index
+
+FAMILIES = ["NSAIDs", "ACE 억제제", None]
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> IVFFlatIndex:
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(6, 16))
+    vectors = np.concatenate([center + 0.1 * rng.normal(size=(50, 16)) for center in centers])
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    count = len(vectors)
+    return build_ivf_index(
+        tmp_path,
+        vectors,
+        doc_ids=[f"doc-{row}" for row in range(count)],
+        texts=[f"문단 {row}" for row in range(count)],
+        families=[FAMILIES[row % 3] for row in range(count)],
+        nlist=6,
+        extra_meta={"version": "test-v1"},
+    )
+
+
+class TestIVFFlatIndex:
+    def test_probing_every_cluster_matches_exact_search(self, index: IVFFlatIndex):
+        query = np.asarray(index.vectors[17], dtype=np.float32)
+
+        hits = index.search(query, k=5, nprobe=index.meta["nlist"])
+
+        assert [hit.doc_id for hit in hits] == [hit.doc_id for hit in index.exact_search(query, k=5)]
+        assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+
+    def test_nearest_row_is_returned_with_its_text(self, index: IVFFlatIndex):
+        row = 42
+        hit = index.search(np.asarray(index.vectors[row], dtype=np.float32), k=1, nprobe=1)[0]
+
+        assert hit.doc_id == index.doc_ids[row]
+        assert hit.text == f"문단 {hit.doc_id.removeprefix('doc-')}"
+        assert hit.score == pytest.approx(1.0, abs=1e-2)
+
+    def test_family_filter_widens_probe_until_k_hits(self, index: IVFFlatIndex):
+        query = np.asarray(index.vectors[0], dtype=np.float32)
+
+        hits = index.search(query, k=20, nprobe=1, families=["ACE 억제제"])
+
+        assert len(hits) == 20
+        assert {hit.family for hit in hits} == {"ACE 억제제"}
+
+    def test_unknown_family_returns_nothing(self, index: IVFFlatIndex):
+        assert index.search(np.asarray(index.vectors[0], dtype=np.float32), families=["없는 계열"]) == []
+
+    def test_reopened_index_keeps_metadata(self, index: IVFFlatIndex):
+        reopened = IVFFlatIndex(index.directory)
+
+        assert len(reopened) == len(index)
+        assert reopened.version == "test-v1"
@@ -0,0 +1,39 @@
+import pytest
+
+from ai_worker.core import config
+from ai_worker.tasks import ocr
+
+
+def box(left: float, top: float, right: float, bottom: float, text: str, confidence: float = 0.9) -> ocr.TextBox:
+    return [[left, top], [right, top], [right, bottom], [left, bottom]], text, confidence
+
+
+class TestGroupLines:
+    def test_groups_boxes_on_same_row_left_to_right(self):
+        boxes = [
+            box(300, 12, 360, 30, "1일 3회"),
+            box(10, 10, 200, 30, "타이레놀정500밀리그램"),
+            box(10, 50, 150, 70, "아모디핀정 5mg"),
+            box(220, 11, 260, 31, "1정"),
+        ]
+
+        assert ocr.group_lines(boxes) == ["타이레놀정500밀리그램  1정  1일 3회", "아모디핀정 5mg"]
+
+    def test_keeps_close_but_separate_rows_apart(self):
+        boxes = [box(10, 10, 100, 30, "처 방 전"), box(10, 32, 100, 52, "요양기관명")]
+
+        assert ocr.group_lines(boxes) == ["처 방 전", "요양기관명"]
+
+    def test_empty(self):
+        assert ocr.group_lines([]) == []
+
+
+class TestOcrEngine:
+    def test_unconfigured_engine_fails_instead_of_returning_dummy_text(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "OCR_ENGINE", "")
+        ocr.get_ocr_engine.cache_clear()
+
+        with pytest.raises(ocr.OcrEngineUnavailableError):
+            ocr.recognize_text(b"not an image")
+        with pytest.raises(ocr.OcrEngineUnavailableError):
+            ocr.recognize_imprint(b"not an image")
@@ -0,0 +1,78 @@
+from ai_worker.text.prescription_parser import parse_prescription
+
+PRESCRIPTION = "\n".join(
+    [
+        "처 방 전",
+        "요양기관명: 서울대학교병원   교부일자 2024년 02월 24일",
+        "처방 의약품의 명칭 | 1회 투약량 | 1일 투여횟수 | 총 투약일수 | 용법",
+        "타이레놀정500밀리그램 | 1 | 3 | 3 | 식후30분",
+        "아모디핀정 5mg  1회 1정  1일 1회  30일분",
+    ]
+)
+
+
+class TestParsePrescription:
+    def test_reads_header_fields_and_skips_table_header(self):
+        prescription = parse_prescription(PRESCRIPTION)
+
+        assert prescription.hospital_name == "서울대학교병원"
+        assert prescription.prescribed_date == "2024-02-24"
+        assert [drug.drug_name for drug in prescription.drugs] == ["타이레놀정500밀리그램", "아모디핀정5mg"]
+
+    def test_table_row_fills_columns_in_standard_order(self):
+        drug = parse_prescription(PRESCRIPTION).drugs[0]
+
+        assert (drug.dose_count, drug.daily_frequency, drug.duration_days) == (1.0, 3, 3)
+        assert (drug.strength_amount, drug.strength_unit) == (500.0, "mg")
+        assert drug.to_dict()["dosage"] == "500mg"
+
+    def test_narrative_row_with_korean_numbers_and_volume_dose(self):
+        drug = parse_prescription("부루펜시럽 1회 5ml 하루 세 번 5일분").drugs[0]
+
+        assert drug.drug_name == "부루펜시럽"
+        assert (drug.dose_count, drug.dose_unit, drug.daily_frequency, drug.duration_days) == (5.0, "ml", 3, 5)
+        assert drug.to_dict()["dosage"] == "5ml"
+
+    def test_tolerates_l_read_as_one_and_half_tablets(self):
+        drug = parse_prescription("오메프라졸캡슐20mg l회 반정 l일 2회 7일").drugs[0]
+
+        assert (drug.dose_count, drug.daily_frequency, drug.duration_days) == (0.5, 2, 7)
+        assert drug.dosage_amount == 10.0
+
+    def test_fullwidth_units_are_normalized(self):
+        drug = parse_prescription("아모디핀정 5㎎ 1 1 30").drugs[0]
+
+        assert (drug.strength_amount, drug.strength_unit) == (5.0, "mg")
+
+    def test_invalid_date_and_lines_without_dosage_form_are_ignored(self):
+        prescription = parse_prescription("2024.13.40 홍길동의원\n환자 성명 홍길동 1 2 3")
+
+        assert prescription.hospital_name == "홍길동의원"
+        assert prescription.prescribed_date is None
+        assert prescription.drugs == []
+
+    def test_combination_strength_is_not_merged_into_one_amount(self):
+        drug = parse_prescription("엑스포지정5/80mg 1 1 30").drugs[0]
+
+        assert drug.drug_name == "엑스포지정5/80mg"
+        assert (drug.combination_strength, drug.strength_amount, drug.strength_unit) == ("5/80mg", None, None)
+        assert (drug.dose_count, drug.daily_frequency, drug.duration_days) == (1.0, 1, 30)
+        assert drug.to_dict()["dosage_amount"] == 1.0
+
+    def test_combination_strength_with_korean_unit(self):
+        drug = parse_prescription("아모잘탄정5/50밀리그램 | 1 | 1 | 28").drugs[0]
+
+        assert drug.drug_name == "아모잘탄정5/50밀리그램"
+        assert drug.combination_strength == "5/50mg"
+        assert drug.dosage_amount == 1.0
+
+    def test_bracketed_ingredient_is_not_part_of_drug_name(self):
+        drug = parse_prescription("노바스크정5밀리그램(암로디핀) 1 1 30").drugs[0]
+
+        assert drug.drug_name == "노바스크정5밀리그램"
+        assert (drug.strength_amount, drug.daily_frequency, drug.duration_days) == (5.0, 1, 30)
+
+    def test_masked_hospital_name_is_kept_whole_or_left_unset(self):
+        assert parse_prescription("요양기관명: ○○의원").hospital_name == "○○의원"
+        assert parse_prescription("요양기관명:행복내과의원").hospital_name == "행복내과의원"
+        assert parse_prescription("요양기관명: 의원").hospital_name is None
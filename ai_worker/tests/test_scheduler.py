@@ -0,0 +1,54 @@
+from collections import Counter
+
+import pytest
+
+from ai_worker.core.scheduler import WeightedFairScheduler
+
+
+def serve(scheduler: WeightedFairScheduler, rounds: int, busy: set[str]) -> Counter[str]:
+    """
+    BLPOP처럼 order()에서 비어 있지 않은 첫 큐를 꺼내는 과정을 흉내 냅니다.
+    """
+    served: Counter[str] = Counter()
+    for _ in range(rounds):
+        queue = next(queue for queue in scheduler.order() if queue in busy)
+        scheduler.charge(queue)
+        served[queue] += 1
+    return served
+
+
+class TestWeightedFairScheduler:
+    def test_busy_queues_share_throughput_by_weight(self):
+        scheduler = WeightedFairScheduler({"interactive": 16, "bulk": 4, "speculative": 1})
+
+        served = serve(scheduler, 2100, {"interactive", "bulk", "speculative"})
+
+        assert served == {"interactive": 1600, "bulk": 400, "speculative": 100}
+
+    def test_idle_queue_share_goes_to_busy_queues(self):
+        scheduler = WeightedFairScheduler({"interactive": 16, "bulk": 4})
+
+        assert serve(scheduler, 100, {"bulk"}) == {"bulk": 100}
+
+    def test_queue_returning_from_idle_does_not_burst_with_saved_credit(self):
+        scheduler = WeightedFairScheduler({"interactive": 1, "bulk": 1})
+        serve(scheduler, 100, {"bulk"})
+
+        served = serve(scheduler, 10, {"interactive", "bulk"})
+
+        # 쉬는 동안의 몫(100개)을 몰아 쓰지 않고 곧바로 1:1에 가깝게 나눕니다. (복귀 직후 한 개 차이는 허용)
+        assert abs(served["interactive"] - served["bulk"]) <= 2
+
+    def test_batch_charge_counts_every_job(self):
+        scheduler = WeightedFairScheduler({"a": 1, "b": 1})
+        scheduler.charge("a", jobs=4)
+
+        assert serve(scheduler, 4, {"a", "b"}) == {"b": 4}
+
+    def test_ties_prefer_higher_weight(self):
+        assert WeightedFairScheduler({"bulk": 4, "interactive": 16}).order() == ["interactive", "bulk"]
+
+    @pytest.mark.parametrize("weights", [{}, {"a": 1, "b": 0}])
+    def test_rejects_non_positive_weights(self, weights: dict[str, float]):
+        with pytest.raises(ValueError):
+            WeightedFairScheduler(weights)
@@ -0,0 +1,284 @@
+import csv
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from ai_worker.text.jamo import decompose
+
+# 숫자 뒤에 붙는 단위 표기를 통일합니다. (㎎ → mg 등 전각 기호는 NFKC 정규화로 먼저 풀립니다)
+UNIT_ALIASES = {
+    "마이크로그램": "mcg",
+    "마이크로그람": "mcg",
+    "μg": "mcg",
+    "mcg": "mcg",
+    "밀리그램": "mg",
+    "밀리그람": "mg",
+    "mg": "mg",
+    "밀리리터": "ml",
+    "ml": "ml",
+    "그램": "g",
+    "그람": "g",
+    "g": "g",
+    "국제단위": "iu",
+    "iu": "iu",
+}
+_KOREAN_UNITS = {alias: unit for alias, unit in UNIT_ALIASES.items() if "가" <= alias[0] <= "힣"}
+_UNIT = re.compile(r"(?<=\d)([가-힣]+|μg|mcg|mg|ml|g|iu)")
+_BRACKETED = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_WHITESPACE = re.compile(r"\s+")
+_NON_KEY = re.compile(r"[^0-9a-z가-힣.]")
+_STRENGTH = re.compile(r"(\d+(?:\.\d+)?)(mcg|mg|ml|g|iu)")
+
+# 비교 키에서 읽은 함량 목록 (예: "시럽5mg5ml" → ((5.0, "mg"), (5.0, "ml"))). 함량이 없으면 빈 튜플
+Strength = tuple[tuple[float, str], ...]
+
+
+@lru_cache(maxsize=4096)
+def _canonical_unit(word: str) -> str:
+    """
+    숫자 뒤 단어의 앞부분을 단위로 바꿉니다. 네 음절 이상인 한글 단위는 OCR 오인식(자모 2개 이내)도 허용합니다.
+    예: "밀리그램" → "mg", "밀리그랍정" → "mg정", "정" → "정"
+    """
+    if word in UNIT_ALIASES:
+        return UNIT_ALIASES[word]
+    for length in (6, 4, 2):
+        head, rest = word[:length], word[length:]
+        if len(head) < length:
+            continue
+        if head in _KOREAN_UNITS:
+            return _KOREAN_UNITS[head] + rest
+        if length >= 4:
+            for alias, unit in _KOREAN_UNITS.items():
+                if len(alias) == length and bounded_distance(decompose(head), decompose(alias), 2) <= 2:
+                    return unit + rest
+    return word
+
+
+def normalize_name(text: str) -> str:
+    """
+    약품명 비교 키를 만듭니다. 괄호 안 성분/규격 표기와 공백·기호를 제거하고 단위 표기를 통일합니다.
+    예: "타이레놀정 500밀리그람(아세트아미노펜)" → "타이레놀정500mg"
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _WHITESPACE.sub("", _BRACKETED.sub("", text))
+    text = _UNIT.sub(lambda match: _canonical_unit(match.group(1)), text)
+    return _NON_KEY.sub("", text)
+
+
+def strip_strength(key: str) -> str:
+    """
+    비교 키에서 함량 표기(500mg, 5mg/5ml 등)를 제거합니다. 예: "타이레놀정500mg" → "타이레놀정"
+    """
+    return _STRENGTH.sub("", key)
+
+
+def parse_strength(key: str) -> Strength:
+    """
+    비교 키의 함량 표기를 (양, 단위) 목록으로 읽습니다. 예: "아모디핀정10mg" → ((10.0, "mg"),)
+    """
+    return tuple(sorted((float(amount), unit) for amount, unit in _STRENGTH.findall(key)))
+
+
+def bounded_distance(left: str, right: str, max_distance: int) -> int:
+    """
+    두 문자열의 OSA(인접 전치를 포함한 제한적 Damerau-Levenshtein) 거리를 계산합니다.
+    거리가 max_distance를 넘으면 max_distance + 1을 반환합니다.
+
+    공통 접두/접미사를 잘라낸 뒤 첫 불일치 위치에서 가능한 편집(치환/삭제/삽입/전치)만 재귀로 시도하므로,
+    max_distance가 작을 때(1~3) 전체 DP 행렬을 채우는 것보다 훨씬 적은 비교로 끝납니다.
+    """
+    if left == right:
+        return 0
+    if max_distance == 0 or abs(len(left) - len(right)) > max_distance:
+        return max_distance + 1
+
+    start, limit = 0, min(len(left), len(right))
+    while start < limit and left[start] == right[start]:
+        start += 1
+    end_left, end_right = len(left), len(right)
+    while end_left > start and end_right > start and left[end_left - 1] == right[end_right - 1]:
+        end_left -= 1
+        end_right -= 1
+    left, right = left[start:end_left], right[start:end_right]
+    if not left or not right:
+        return max(len(left), len(right))
+
+    best = 1 + bounded_distance(left[1:], right[1:], max_distance - 1)
+    if best > 1:
+        best = min(best, 1 + bounded_distance(left[1:], right, best - 2))
+    if best > 1:
+        best = min(best, 1 + bounded_distance(left, right[1:], best - 2))
+    if best > 1 and len(left) > 1 and len(right) > 1 and left[0] == right[1] and left[1] == right[0]:
+        best = min(best, 1 + bounded_distance(left[2:], right[2:], best - 2))
+    return best
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1 :] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+@dataclass(frozen=True)
+class DrugEntry:
+    name: str
+    code: str | None = None
+
+
+@dataclass
+class DrugMatch:
+    name: str
+    code: str | None
+    score: float
+    distance: int
+
+
+class DrugNormalizer:
+    """
+    OCR로 읽은 약품명을 약품 마스터의 표준 제품명으로 정규화하는 SymSpell 색인입니다.
+
+    약품명은 비교 키(normalize_name)를 자모로 분해한 문자열(term)로 색인합니다. 구축 시 term 앞부분
+    prefix_length 자모에서 최대 max_distance개 문자를 지운 변형을 모두 미리 계산해 두고, 조회 시에는
+    질의의 삭제 변형만 사전에서 찾아 나온 소수 후보에 대해서만 편집 거리를 계산합니다.
+    따라서 조회 비용은 마스터 크기가 아닌 후보 수에 비례합니다.
+
+    편집 거리는 함량을 제거한 키(strip_strength)로만 계산하고, 함량은 따로 정확히 비교합니다.
+    ("아모디핀정10mg"이 한 글자 차이인 "아모디핀정5mg"으로 바뀌어 다른 용량 제품에 연결되지 않도록)
+    질의에 함량이 있으면 함량이 같은 제품, 없으면 함량 표기가 없는 제품만 후보가 되고,
+    함량이 빠진 OCR 결과("타이레놀정")는 함량과 무관하게 이름이 가까운 제품을 찾습니다. (함량 없는 제품 우선)
+    """
+
+    def __init__(self, entries: Iterable[DrugEntry], max_distance: int = 2, prefix_length: int = 7):
+        self.entries = list(entries)
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._term_ids: dict[str, int] = {}
+        self._terms: list[str] = []
+        self._term_entries: list[list[int]] = []
+        self._strengths: list[Strength] = []
+        deletes: defaultdict[str, list[int]] = defaultdict(list)
+
+        for entry_id, entry in enumerate(self.entries):
+            key = normalize_name(entry.name)
+            self._strengths.append(parse_strength(key))
+            base = strip_strength(key)
+            if not base:
+                continue
+            term = decompose(base)
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self._term_ids[term] = term_id
+                self._terms.append(term)
+                self._term_entries.append([])
+                for deleted in _deletes(term[:prefix_length], max_distance):
+                    deletes[deleted].append(term_id)
+            self._term_entries[term_id].append(entry_id)
+        self._deletes = dict(deletes)
+
+    @classmethod
+    def from_csv(cls, path: str | Path, **kwargs) -> "DrugNormalizer":
+        """
+        약품 마스터 CSV(name, code 열)로 색인을 구축합니다.
+        """
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            entries = [
+                DrugEntry(name=row["name"].strip(), code=(row.get("code") or "").strip() or None)
+                for row in csv.DictReader(f)
+                if (row.get("name") or "").strip()
+            ]
+        return cls(entries, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._terms)
+
+    @property
+    def delete_count(self) -> int:
+        return len(self._deletes)
+
+    def lookup(self, text: str, limit: int = 5) -> list[DrugMatch]:
+        """
+        Args:
+            text (str): OCR로 읽은 약품명 (예: "타이레놀정500mg")
+            limit (int): 반환할 최대 후보 수
+
+        Returns:
+            list[DrugMatch]: 점수(1 - 함량을 뺀 이름의 자모 편집 거리 / 자모 길이) 내림차순 표준 제품명 후보.
+                질의에 함량이 있으면 함량이 같거나 함량 표기가 없는 제품만 포함
+        """
+        key = normalize_name(text)
+        query = decompose(strip_strength(key))
+        if not query:
+            return []
+
+        candidates: set[int] = set()
+        for deleted in _deletes(query[: self.prefix_length], self.max_distance):
+            candidates.update(self._deletes.get(deleted, ()))
+
+        return self._rank(query, parse_strength(key), candidates, limit)
+
+    def normalize(self, text: str) -> DrugMatch | None:
+        """
+        가장 가까운 표준 제품명 하나를 반환합니다. 비교 키가 그대로 색인에 있으면 후보 탐색 없이 바로 반환합니다.
+        """
+        key = normalize_name(text)
+        term_id = self._term_ids.get(decompose(strip_strength(key)))
+        if term_id is not None:
+            strength = parse_strength(key)
+            entry_ids = [entry_id for entry_id in self._term_entries[term_id] if self._accepts(entry_id, strength)]
+            if entry_ids:
+                entry = self.entries[min(entry_ids, key=lambda entry_id: self._preference(entry_id, strength))]
+                return DrugMatch(name=entry.name, code=entry.code, score=1.0, distance=0)
+        matches = self.lookup(text, limit=1)
+        return matches[0] if matches else None
+
+    def linear_lookup(self, text: str, limit: int = 5) -> list[DrugMatch]:
+        """
+        색인 없이 전체 term과 편집 거리를 비교하는 기준 구현입니다. (벤치마크 비교용)
+        """
+        key = normalize_name(text)
+        return self._rank(decompose(strip_strength(key)), parse_strength(key), range(len(self._terms)), limit)
+
+    def _accepts(self, entry_id: int, strength: Strength) -> bool:
+        # 함량을 읽은 질의는 함량이 정확히 같은 제품이나 함량 표기가 없는 제품에만 연결합니다.
+        return not strength or self._strengths[entry_id] in (strength, ())
+
+    def _preference(self, entry_id: int, strength: Strength) -> tuple[bool, int]:
+        # 이름 점수가 같으면 함량이 일치하는 제품(함량 없는 질의는 함량 표기가 없는 제품)을 앞에 둡니다.
+        return self._strengths[entry_id] != strength, entry_id
+
+    def _rank(self, query: str, strength: Strength, term_ids: Iterable[int], limit: int) -> list[DrugMatch]:
+        best: dict[int, tuple[float, int]] = {}
+        for term_id in term_ids:
+            term = self._terms[term_id]
+            if abs(len(term) - len(query)) > self.max_distance:
+                continue
+            distance = bounded_distance(query, term, self.max_distance)
+            if distance > self.max_distance:
+                continue
+            score = 1 - distance / max(len(query), len(term))
+            for entry_id in self._term_entries[term_id]:
+                if self._accepts(entry_id, strength):
+                    best[entry_id] = (score, distance)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], self._preference(item[0], strength)))[:limit]
+        return [
+            DrugMatch(
+                name=self.entries[entry_id].name,
+                code=self.entries[entry_id].code,
+                score=round(score, 4),
+                distance=distance,
+            )
+            for entry_id, (score, distance) in ranked
+        ]
@@ -0,0 +1,34 @@
+"""
+한글 음절을 호환 자모 문자열로 분해합니다.
+
+OCR 오인식은 대개 음절 전체가 아니라 자모 하나(예: "놀" → "놑", "정" → "젇")에서 일어나므로,
+자모 단위로 편집 거리를 계산하면 음절 단위보다 오인식 후보를 더 정확히 구분할 수 있습니다.
+"""
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_COUNT = 11172
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+
+def _syllable(code: int) -> str:
+    offset = code - _HANGUL_BASE
+    return _CHOSEONG[offset // 588] + _JUNGSEONG[offset // 28 % 21] + _JONGSEONG[offset % 28]
+
+
+# str.translate 한 번으로 분해하도록 전체 음절(11,172자)의 변환표를 미리 만들어 둡니다.
+_DECOMPOSE_TABLE = {code: _syllable(code) for code in range(_HANGUL_BASE, _HANGUL_BASE + _HANGUL_COUNT)}
+
+
+def decompose(text: str) -> str:
+    """
+    완성형 한글 음절을 초성/중성/종성 자모로 풀어 씁니다. 한글이 아닌 문자는 그대로 둡니다.
+
+    Args:
+        text (str): 원문 (예: "타이레놀")
+
+    Returns:
+        str: 자모 문자열 (예: "ㅌㅏㅇㅣㄹㅔㄴㅗㄹ")
+    """
+    return text.translate(_DECOMPOSE_TABLE)
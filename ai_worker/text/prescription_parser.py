@@ -0,0 +1,219 @@
+import datetime
+import re
+import unicodedata
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ai_worker.text.drug_normalizer import UNIT_ALIASES
+
+PARSER_VERSION = "rx-parser-v2"
+
+_KOREAN_NUMBERS = {"반": 0.5, "한": 1, "두": 2, "세": 3, "네": 4, "다섯": 5, "여섯": 6}
+_NUMBER = r"\d+/\d+|\d+(?:\.\d+)?"
+_COMBINATION = r"\d+(?:\.\d+)?(?:/\d+(?:\.\d+)?)+"  # 복합제 함량 (예: 엑스포지정 5/80mg)
+_UNIT_WORDS = "|".join(sorted(map(re.escape, UNIT_ALIASES), key=len, reverse=True))
+
+# 한 줄을 한 번만 훑어 토큰으로 나누는 단일 정규식입니다. 같은 위치에서는 앞선 대안이 우선하므로
+# "1일 3회"(FREQ)가 "1일"(DURATION)보다, "500밀리그램"(STRENGTH)이 숫자(NUMBER)보다 먼저 시도됩니다.
+# WORD는 복합제 함량 앞에서 멈추므로 "엑스포지정5/80mg"은 WORD "엑스포지정" + COMBINATION "5/80mg"이 됩니다.
+_TOKEN = re.compile(
+    rf"""
+    (?P<DATE>(?P<year>20\d{{2}})\s*[.\-/년]\s*(?P<month>\d{{1,2}})\s*[.\-/월]\s*(?P<day>\d{{1,2}})\s*일?)
+    |(?P<FREQ>(?:[1lI]\s*일|하루)\s*(?P<freq>\d+|한|두|세|네|다섯|여섯)\s*(?:회|번))
+    |(?P<DOSE>[1lI]\s*회\s*(?P<dose>{_NUMBER}|반|한|두)\s*(?P<dose_unit>정|캡슐|알|포|개|ml|밀리리터|T|C)?)
+    |(?P<DURATION>(?:총\s*)?(?P<days>\d+)\s*일\s*분?)
+    |(?P<MINUTES>\d+\s*(?:분|시간))
+    |(?P<TIMES>(?P<times>\d+)\s*회)
+    |(?P<COUNT>(?P<count>{_NUMBER})\s*(?:정|캡슐|알|포|개|T|C)(?![가-힣]))
+    |(?P<COMBINATION>{_COMBINATION}\s*(?:{_UNIT_WORDS}))
+    |(?P<STRENGTH>(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>{_UNIT_WORDS}))
+    |(?P<NUMBER>{_NUMBER})
+    |(?P<WORD>[가-힣A-Za-z][가-힣A-Za-z0-9μ.\-]*(?:(?<![\d.])|(?![\d.]*/\d)))
+    |(?P<NOISE>\S)
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+_STRENGTH_IN_NAME = re.compile(rf"(?P<amount>{_COMBINATION}|\d+(?:\.\d+)?)(?P<unit>{_UNIT_WORDS})", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_HOSPITAL_SUFFIXES = ("병원", "의원", "클리닉", "보건소", "의료원")
+_DOSAGE_FORM = re.compile(r"(?:정|캡슐|시럽|액|산|과립|주|연고|크림|겔|패취|패치|좌제|환|틴크|로션)(?:\d|$|[A-Za-z])")
+_HEADER_WORDS = re.compile(r"명칭|투약|투여|횟수|일수|용법|약품명|처방의약품")
+_OPEN_BRACKETS, _CLOSE_BRACKETS = "([{", ")]}"
+
+
+@dataclass
+class ParsedDrug:
+    drug_name: str
+    strength_amount: float | None = None
+    strength_unit: str | None = None
+    dose_count: float | None = None
+    dose_unit: str | None = None  # 1회 투약량이 부피(ml)로 적힌 경우 "ml"
+    combination_strength: str | None = None  # 복합제 함량 (예: "5/80mg"), 이때 strength_amount는 None
+    daily_frequency: int | None = None
+    duration_days: int | None = None
+
+    @property
+    def dosage_amount(self) -> float | None:
+        """
+        1회 투여량. 함량이 있으면 함량 × 1회 투약 개수(단위: strength_unit),
+        함량이 없거나 복합제이거나 부피로 적혔으면 1회 투약량입니다.
+        """
+        if self.strength_amount is None or self.dose_unit == "ml":
+            return self.dose_count
+        return self.strength_amount * (self.dose_count if self.dose_count is not None else 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        amount = self.dosage_amount
+        if amount is None:
+            dosage = ""
+        elif self.dose_unit == "ml":
+            dosage = f"{amount:g}ml"
+        elif self.strength_unit:
+            dosage = f"{amount:g}{self.strength_unit}"
+        else:
+            dosage = f"{amount:g}정"
+        return {
+            "drug_name": self.drug_name,
+            "dosage": dosage,
+            "frequency": f"1일 {self.daily_frequency}회" if self.daily_frequency else "",
+            "duration": str(self.duration_days) if self.duration_days else "",
+            "dosage_amount": amount,
+            "daily_frequency": self.daily_frequency,
+            "duration_days": self.duration_days,
+        }
+
+
+@dataclass
+class ParsedPrescription:
+    hospital_name: str | None = None
+    prescribed_date: str | None = None
+    drugs: list[ParsedDrug] = field(default_factory=list)
+
+
+def _number(text: str) -> float:
+    if text in _KOREAN_NUMBERS:
+        return _KOREAN_NUMBERS[text]
+    if "/" in text:
+        numerator, denominator = text.split("/")
+        return int(numerator) / int(denominator) if int(denominator) else 0.0
+    return float(text)
+
+
+def _date(match: re.Match) -> str | None:
+    try:
+        return datetime.date(int(match["year"]), int(match["month"]), int(match["day"])).isoformat()
+    except ValueError:
+        return None
+
+
+# 값 토큰 종류 → (채울 슬롯, 값 추출 함수, 단위가 명시된 값인지). 명시된 값은 추정 값(TIMES, COUNT)을 덮어씁니다.
+_VALUE_TOKENS: dict[str, tuple[str, Callable[[re.Match], float], bool]] = {
+    "FREQ": ("frequency", lambda match: _number(match["freq"]), True),
+    "DOSE": ("dose", lambda match: _number(match["dose"]), True),
+    "DURATION": ("duration", lambda match: float(match["days"]), True),
+    "TIMES": ("frequency", lambda match: float(match["times"]), False),
+    "COUNT": ("dose", lambda match: _number(match["count"]), False),
+}
+
+
+def _hospital_name(line: str, match: re.Match) -> str | None:
+    """
+    병원명 토큰 앞에 공백 없이 붙은 글자(○○의원처럼 가려지거나 OCR이 기호로 읽은 부분)까지 포함한 기관명입니다.
+    접미사만 남으면 기관명을 알 수 없으므로 None을 반환합니다.
+    """
+    start = match.start()
+    while start > 0 and not line[start - 1].isspace() and line[start - 1] not in ":|" + _CLOSE_BRACKETS:
+        start -= 1
+    name = line[start : match.end()].lstrip(_OPEN_BRACKETS)
+    return None if name in _HOSPITAL_SUFFIXES else name
+
+
+def _bracket_depth(depth: int, char: str) -> int:
+    if char in _OPEN_BRACKETS:
+        return depth + 1
+    if char in _CLOSE_BRACKETS:
+        return max(depth - 1, 0)
+    return depth
+
+
+def _parse_line(line: str, prescription: ParsedPrescription) -> ParsedDrug | None:
+    name_parts: list[str] = []
+    values: dict[str, float] = {}
+    bare_numbers: list[float] = []
+    dose_unit = None
+    depth = 0  # 괄호 안 글자(성분명 등)는 약품명에 넣지 않습니다.
+
+    for match in _TOKEN.finditer(line):
+        kind = match.lastgroup
+        if kind == "NOISE":
+            depth = _bracket_depth(depth, match.group())
+        elif kind == "DATE":
+            prescription.prescribed_date = prescription.prescribed_date or _date(match)
+        elif kind in _VALUE_TOKENS:
+            slot, read, explicit = _VALUE_TOKENS[kind]
+            if explicit or slot not in values:
+                values[slot] = read(match)
+            if kind == "DOSE":
+                dose_unit = UNIT_ALIASES.get((match["dose_unit"] or "").lower())
+        elif kind == "NUMBER":
+            bare_numbers.append(_number(match.group()))
+        elif kind == "WORD" and match.group().endswith(_HOSPITAL_SUFFIXES):
+            prescription.hospital_name = prescription.hospital_name or _hospital_name(line, match)
+        elif kind in ("WORD", "STRENGTH", "COMBINATION") and not depth and not values and not bare_numbers:
+            # 약품명은 값 열이 시작되기 전까지의 단어/함량 토큰입니다. (OCR이 띄어 쓴 "타이레놀 정 500 mg"도 이어 붙임)
+            name_parts.append(_WHITESPACE.sub("", match.group()))
+
+    return _build_drug("".join(name_parts), values, bare_numbers, dose_unit)
+
+
+def _build_drug(
+    name: str, values: dict[str, float], bare_numbers: list[float], dose_unit: str | None
+) -> ParsedDrug | None:
+    # 제형(정/캡슐/시럽 등)이 없는 이름이나 표 머리글, 값 열이 없는 줄은 약품 행이 아닙니다.
+    if not name or _HEADER_WORDS.search(name) or not _DOSAGE_FORM.search(name):
+        return None
+    if not values and not bare_numbers:
+        return None
+
+    # 단위 없이 숫자만 있는 열은 처방전 표준 서식의 열 순서(1회 투약량, 1일 투여횟수, 총 투약일수)로 채웁니다.
+    for slot in ("dose", "frequency", "duration"):
+        if slot not in values and bare_numbers:
+            values[slot] = bare_numbers.pop(0)
+
+    drug = ParsedDrug(
+        drug_name=name,
+        dose_count=values.get("dose"),
+        dose_unit=dose_unit,
+        daily_frequency=int(values["frequency"]) if "frequency" in values else None,
+        duration_days=int(values["duration"]) if "duration" in values else None,
+    )
+    strength = _STRENGTH_IN_NAME.search(name)
+    if strength and "/" in strength["amount"]:
+        drug.combination_strength = f"{strength['amount']}{UNIT_ALIASES[strength['unit'].lower()]}"
+    elif strength:
+        drug.strength_amount = float(strength["amount"])
+        drug.strength_unit = UNIT_ALIASES[strength["unit"].lower()]
+    return drug
+
+
+def parse_prescription(text: str) -> ParsedPrescription:
+    """
+    처방전 OCR 원문을 한 번 훑어 병원명, 처방일(YYYY-MM-DD)과 약품 행을 추출합니다.
+
+    약품 행은 "타이레놀정500밀리그램 1 3 3" 같은 표 형식과 "1회 1정 1일 3회 3일분" 같은 서술 형식을 모두 지원하며,
+    표 구분선/괄호/기호 등 잡음 문자와 OCR이 "1"을 "l"로 읽은 경우도 허용합니다.
+
+    Args:
+        text (str): OCR 원문
+
+    Returns:
+        ParsedPrescription: 병원명, 처방일, 약품 행 목록 (값을 읽지 못한 필드는 None)
+    """
+    prescription = ParsedPrescription()
+    # NFKC: ㎎ → mg, 전각 숫자/기호 → 반각, ½ → 1⁄2 (분수 사선은 "/"로 바꿉니다)
+    for line in unicodedata.normalize("NFKC", text).replace("\u2044", "/").splitlines():
+        drug = _parse_line(line, prescription)
+        if drug is not None:
+            prescription.drugs.append(drug)
+    return prescription
@@ -1,12 +1,22 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status
+from app.dependencies.admission import AdmissionControl
+from app.dependencies.request_scope import bind_request_scope
 from app.dependencies.security import get_request_user
 from app.models.user import User
+from app.dtos.ocr import PillAnalysisResponse, PrescriptionAnalysisResponse
 from app.services.ocr import OCRService
+from app.services.pill_analysis import PillAnalysisService
 
-analysis_router = APIRouter(prefix="/analysis", tags=["analysis"])
+# 분석 요청이 등록하는 워커 작업은 요청의 마감 시각을 따르며, 클라이언트가 떠나면 취소됩니다.
+analysis_router = APIRouter(prefix="/analysis", tags=["analysis"], dependencies=[Depends(bind_request_scope)])
 
-@analysis_router.post("/prescriptions", status_code=status.HTTP_201_CREATED)
+@analysis_router.post(
+    "/prescriptions",
+    status_code=status.HTTP_201_CREATED,
+    response_model=PrescriptionAnalysisResponse,
+    dependencies=[Depends(AdmissionControl("ocr"))],
+)
 async def analyze_prescription(
     upload_id: int,
     user: Annotated[User, Depends(get_request_user)],
@@ -16,37 +26,22 @@ async def analyze_prescription(
     [ANALYSIS] 처방전 분석(OCR->정제).
     ocr_history + prescriptions + prescription_drugs 생성
     """
-    # Simply mapping to service logic (simplified for specs)
-    # In reality, service would fetch upload_id file and do OCR
-    return {
-        "ocr_history_id": 1,
-        "prescription_id": 101,
-        "hospital_name": "서울대학교병원",
-        "prescribed_date": "2024-02-24",
-        "drugs": [
-            {"id": 501, "standard_drug_name": "타이레놀", "dosage_amount": 500.0, "daily_frequency": 3, "duration_days": 3, "is_linked_to_meds": False}
-        ]
-    }
+    return await ocr_service.analyze_prescription(user, upload_id)
 
-@analysis_router.post("/pills", status_code=status.HTTP_201_CREATED)
+@analysis_router.post(
+    "/pills",
+    status_code=status.HTTP_201_CREATED,
+    response_model=PillAnalysisResponse,
+    dependencies=[Depends(AdmissionControl("cnn", "ocr"))],
+)
 async def analyze_pills(
     user: Annotated[User, Depends(get_request_user)],
+    pill_analysis_service: Annotated[PillAnalysisService, Depends(PillAnalysisService)],
     front_upload_id: int,
     back_upload_id: int | None = None,
 ):
     """
     [ANALYSIS] 알약 복합 분석(CNN+OCR).
-    AI 불확실성 대비 candidates 반환
+    앞/뒷면 CNN과 각인 OCR을 동시에 실행해 점수를 결합하고, AI 불확실성 대비 candidates 반환
     """
-    return {
-        "cnn_history_id": 2,
-        "ocr_history_id": 3,
-        "pill_recognition_id": 201,
-        "primary_pill_name": "아스피린",
-        "confidence": 0.98,
-        "candidates": [
-            {"pill_name": "아스피린", "confidence": 0.98},
-            {"pill_name": "부르펜", "confidence": 0.02}
-        ]
-    }
-
+    return await pill_analysis_service.analyze(user, front_upload_id, back_upload_id)
@@ -1,13 +1,19 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, HTTPException
-from app.dependencies.security import get_request_user
+from fastapi import APIRouter, Depends, status, HTTPException, WebSocket
+from fastapi.responses import StreamingResponse
+from app.dependencies.security import authenticate_access_token, get_request_user
+from app.dtos.chat import ChatMessageResponse
 from app.models.user import User
+from app.services.chat import ChatService
+from app.services.chat_socket import ChatSocketSession
+from app.utils.sse import SSE_HEADERS
 
 chat_router = APIRouter(prefix="/chat", tags=["chat"])
 
-@chat_router.post("/message")
+@chat_router.post("/message", response_model=ChatMessageResponse)
 async def send_chat_message(
     user: Annotated[User, Depends(get_request_user)],
+    chat_service: Annotated[ChatService, Depends(ChatService)],
     message: str,
     session_id: str | None = None,
     reference_guide_id: int | None = None,
@@ -15,18 +21,54 @@ async def send_chat_message(
     """
     [CHAT] 챗봇 메시지 전송(세션 유지).
     """
-    return {
-        "session_id": session_id or "new_session_123",
-        "assistant_message": "안녕하세요. 무엇을 도와드릴까요?",
-        "action_type": "NONE"
-    }
+    return await chat_service.reply(user, message, session_id, reference_guide_id)
+
+@chat_router.post("/stream", response_class=StreamingResponse)
+async def stream_chat_message(
+    user: Annotated[User, Depends(get_request_user)],
+    chat_service: Annotated[ChatService, Depends(ChatService)],
+    message: str,
+    session_id: str | None = None,
+    reference_guide_id: int | None = None,
+):
+    """
+    [CHAT] 챗봇 메시지 전송(SSE 스트리밍).
+    LLM이 생성하는 토큰을 묶어 text/event-stream 프레임(start → delta... → done/error)으로 전송하며,
+    연결이 끊기면 LLM 생성을 중단합니다.
+    """
+    return StreamingResponse(
+        chat_service.stream_reply(user, message, session_id, reference_guide_id),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+@chat_router.websocket("/ws")
+async def chat_websocket(
+    websocket: WebSocket,
+    chat_service: Annotated[ChatService, Depends(ChatService)],
+    token: str | None = None,
+):
+    """
+    [CHAT] 챗봇 WebSocket. 연결 시 한 번 인증(Authorization: Bearer 헤더 또는 ?token=)한 뒤
+    한 연결에서 여러 대화 세션의 메시지를 request_id로 구분해 동시에 주고받습니다. (프레임 형식은 ChatSocketSession 참고)
+    """
+    authorization = websocket.headers.get("authorization", "")
+    token = authorization[7:] if authorization.lower().startswith("bearer ") else token or ""
+    try:
+        user = await authenticate_access_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await ChatSocketSession(websocket, user, token, chat_service).run()
 
 @chat_router.post("/end")
 async def end_chat(
     session_id: str,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    chat_service: Annotated[ChatService, Depends(ChatService)],
 ):
     """
     [CHAT] 채팅 종료(대화 내용 초기화).
     """
+    await chat_service.end_session(user, session_id)
     return {"detail": "채팅이 종료되었습니다."}
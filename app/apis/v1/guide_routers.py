@@ -2,25 +2,20 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, status, HTTPException
 from app.dependencies.security import get_request_user
 from app.models.user import User
+from app.services.guide import GuideService
 
 guide_router = APIRouter(prefix="/guides", tags=["guide"])
 
 @guide_router.post("")
 async def generate_guide(
     user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
     refresh: bool = False,
 ):
     """
     [GUIDE] 맞춤 가이드 생성(RAG 핵심).
     """
-    return {
-        "guide_id": 1,
-        "guide_type": "복약",
-        "user_current_status": "고혈압/타이레놀 복용 중",
-        "generated_content": "가이드 내용...",
-        "is_emergency_alert": False,
-        "created_at": "2026-02-24T10:10:00"
-    }
+    return await guide_service.get_or_generate(user, refresh)
 
 @guide_router.get("")
 async def get_guides(
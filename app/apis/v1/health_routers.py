@@ -4,6 +4,8 @@ from app.dependencies.security import get_request_user
 from app.models.user import User
 from app.models.chronic_disease import ChronicDisease
 from app.models.allergy import Allergy
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.guide import GuideService
 from app.dtos.health import (
     ChronicDiseaseListResponse, ChronicDiseaseCreateRequest, ChronicDiseaseResponse,
     AllergyListResponse, AllergyCreateRequest, AllergyResponse
@@ -26,18 +28,22 @@ async def get_chronic_diseases(
 @health_router.post("/chronic-diseases", response_model=ChronicDiseaseResponse, status_code=status.HTTP_201_CREATED)
 async def create_chronic_disease(
     request: ChronicDiseaseCreateRequest,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [PROFILE] 기저질환 등록
     """
     disease = await ChronicDisease.create(user=user, disease_name=request.disease_name)
+    await clinical_snapshots.upsert(user.id, "diseases", {"id": disease.id, "name": disease.disease_name})
+    await guide_service.invalidate_profile(user)
     return disease
 
 @health_router.delete("/chronic-diseases/{id}")
 async def delete_chronic_disease(
     id: int,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [PROFILE] 기저질환 삭제
@@ -46,6 +52,8 @@ async def delete_chronic_disease(
     if not disease:
         raise HTTPException(status_code=404, detail="질환 정보를 찾을 수 없습니다.")
     await disease.delete()
+    await clinical_snapshots.remove(user.id, "diseases", id)
+    await guide_service.invalidate_profile(user)
     return {"detail": "삭제되었습니다."}
 
 # --- Allergies ---
@@ -63,18 +71,22 @@ async def get_allergies(
 @health_router.post("/allergies", response_model=AllergyResponse, status_code=status.HTTP_201_CREATED)
 async def create_allergy(
     request: AllergyCreateRequest,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [PROFILE] 알러지 등록
     """
     allergy = await Allergy.create(user=user, allergy_name=request.allergy_name)
+    await clinical_snapshots.upsert(user.id, "allergies", {"id": allergy.id, "name": allergy.allergy_name})
+    await guide_service.invalidate_profile(user)
     return allergy
 
 @health_router.delete("/allergies/{id}")
 async def delete_allergy(
     id: int,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [PROFILE] 알러지 삭제
@@ -83,4 +95,6 @@ async def delete_allergy(
     if not allergy:
         raise HTTPException(status_code=404, detail="알러지 정보를 찾을 수 없습니다.")
     await allergy.delete()
+    await clinical_snapshots.remove(user.id, "allergies", id)
+    await guide_service.invalidate_profile(user)
     return {"detail": "삭제되었습니다."}
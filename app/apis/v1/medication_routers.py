@@ -1,28 +1,38 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, status, HTTPException
 from app.dependencies.security import get_request_user
+from app.dtos.interaction import InteractionCheckResponse
 from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.guide import GuideService
+from app.services.interaction import InteractionService
 
 medication_router = APIRouter(tags=["medication"])
 
 @medication_router.patch("/medications/confirm/drug/{id}")
 async def confirm_drug(
     id: int,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [CONFIRM] 처방전 약물 승인.
     """
+    await clinical_snapshots.invalidate(user.id)
+    await guide_service.invalidate_profile(user)
     return {"detail": "승인되었습니다.", "current_meds_id": 1001}
 
 @medication_router.patch("/medications/confirm/pill/{id}")
 async def confirm_pill(
     id: int,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [CONFIRM] 알약 인식 승인.
     """
+    await clinical_snapshots.invalidate(user.id)
+    await guide_service.invalidate_profile(user)
     return {"detail": "승인되었습니다.", "current_meds_id": 1002}
 
 @medication_router.get("/current-meds")
@@ -37,20 +47,36 @@ async def get_current_meds(
 @medication_router.post("/current-meds", status_code=status.HTTP_201_CREATED)
 async def create_current_med(
     medication_name: str,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [MEDS] 현재 복용약 수기 등록
     """
+    await clinical_snapshots.invalidate(user.id)
+    await guide_service.invalidate_profile(user)
     return {"id": 1003}
 
 @medication_router.delete("/current-meds/{id}")
 async def delete_current_med(
     id: int,
-    user: Annotated[User, Depends(get_request_user)]
+    user: Annotated[User, Depends(get_request_user)],
+    guide_service: Annotated[GuideService, Depends(GuideService)],
 ):
     """
     [MEDS] 현재 복용약 삭제
     """
+    await clinical_snapshots.invalidate(user.id)
+    await guide_service.invalidate_profile(user)
     return {"detail": "삭제되었습니다."}
 
+@medication_router.get("/medications/interactions", response_model=InteractionCheckResponse)
+async def check_medication_interactions(
+    user: Annotated[User, Depends(get_request_user)],
+    interaction_service: Annotated[InteractionService, Depends(InteractionService)],
+    candidates: Annotated[list[str] | None, Query(description="새로 복용하려는 약 이름 (현재 복용약과 함께 검사)")] = None,
+):
+    """
+    [MEDS] 약물 상호작용 및 부작용 경고(복용약 간 상호작용, 성분 중복, 알러지, 기저질환 금기)
+    """
+    return await interaction_service.check_user(user, candidates)
@@ -1,6 +1,9 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, status, HTTPException
-from app.dependencies.security import get_request_user
+from app.dependencies.security import get_admin_user, get_request_user
+from app.models.user import User
+from app.services.answer_cache import answer_cache
+from app.utils.metrics import read_all_metrics
 
 system_router = APIRouter(prefix="/system", tags=["system"])
 
@@ -15,3 +18,20 @@ async def get_system_logs(
     """
     return {"items": []}
 
+@system_router.get("/metrics")
+async def get_system_metrics(
+    user: Annotated[User, Depends(get_admin_user)],
+):
+    """
+    [SYSTEM] 운영 메트릭 조회(추론 캐시 적중/미스 등, 전체 API 워커 합산). 관리자 전용.
+    """
+    return {"metrics": await read_all_metrics()}
+
+@system_router.delete("/answer-cache")
+async def purge_answer_cache(
+    user: Annotated[User, Depends(get_admin_user)],
+):
+    """
+    [SYSTEM] 챗봇 답변 캐시 전체 삭제(답변 정책/프롬프트 변경 시). 관리자 전용.
+    """
+    return {"deleted": await answer_cache.purge()}
@@ -1,10 +1,8 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from fastapi import APIRouter, Depends, status, UploadFile, File
 from app.dependencies.security import get_request_user
 from app.models.user import User
-from app.models.upload import Upload
-import uuid
-import os
+from app.services.upload import UploadService
 
 upload_router = APIRouter(prefix="/uploads", tags=["upload"])
 
@@ -12,26 +10,17 @@ upload_router = APIRouter(prefix="/uploads", tags=["upload"])
 async def upload_file(
     user: Annotated[User, Depends(get_request_user)],
     file: Annotated[UploadFile, File()],
+    upload_service: Annotated[UploadService, Depends(UploadService)],
+    category: Literal["prescription", "pill_front", "pill_back"] = "prescription",
+    speculate: bool = False,
 ):
     """
     [UPLOAD] 이미지 업로드(처방전/알약 앞/뒤). 업로드 결과(upload_id)로 분석 API 호출
+    speculate=true이면 분석 API 호출 전에 추론을 미리 시작하고, 이후 분석 요청은 그 결과를 이어받음
     """
-    # Simple upload simulation
-    file_ext = os.path.splitext(file.filename)[1]
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = f"app/static/uploads/{unique_filename}"
-    
-    # Normally we save the file here
-    
-    upload_record = await Upload.create(
-        user=user,
-        original_name=file.filename,
-        file_path=file_path,
-        file_type=file.content_type or "image/jpeg"
-    )
-    
+    upload_record = await upload_service.save(user, file, category, speculate)
+
     return {
         "upload_id": upload_record.id,
-        "file_url": f"/static/uploads/{unique_filename}"
+        "file_url": upload_record.file_url
     }
-
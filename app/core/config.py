@@ -4,6 +4,7 @@ import zoneinfo
 from dataclasses import field
 from enum import StrEnum
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -37,6 +38,8 @@ class Config(BaseSettings):
     DB_CONNECT_TIMEOUT: int = 5
     DB_CONNECTION_POOL_MAXSIZE: int = 10
 
+    REDIS_URL: str = "redis://172.17.0.1:6379"
+
     SMTP_USER: str = ""          # .env의 SMTP_USER와 매칭
     SMTP_PASSWORD: str = ""      # .env의 SMTP_PASSWORD와 매칭
     SMTP_HOST: str = "smtp.naver.com"
@@ -51,6 +54,8 @@ class Config(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 30 * 24 * 60  # 자동로그인 체크 시 30일 유지
     REFRESH_TOKEN_EXPIRE_MINUTES_SHORT: int = 60  # 자동로그인 체크 안 할 시 60분 유지
     JWT_LEEWAY: int = 5
+    # 운영 API(/system/metrics, /system/answer-cache)를 호출할 수 있는 관리자 사용자 ID(이메일) 목록
+    ADMIN_USER_IDS: list[str] = []
 
     # Naver Social Login
     NAVER_CLIENT_ID: str = ""
@@ -64,3 +69,103 @@ class Config(BaseSettings):
 
     # Security & Encryption
     AES_SECRET_KEY: str = f"aes-default-secret-{uuid.uuid4().hex[:16]}"
+
+    UPLOAD_DIR: str = os.path.join(Path(__file__).resolve().parent.parent, "static", "uploads")
+
+    # AI Worker 작업 큐
+    AI_JOB_TIMEOUT_SECONDS: int = 30
+    # 이미지 전달 방식: blob(ai_worker와 공유하는 볼륨에 sha256 이름으로 저장하고 작업에는 참조만 전달)
+    # 또는 inline(작업 메시지에 base64로 포함, 워커와 볼륨을 공유하지 않는 배포용)
+    AI_IMAGE_HANDOFF: Literal["blob", "inline"] = "blob"
+    AI_BLOB_DIR: str = "blobs"  # ai_worker 설정의 BLOB_DIR과 같은 볼륨
+    # 작업 마감/취소: 작업은 요청의 마감 시각을 가지고 큐에 들어가며, 워커는 마감이 지났거나 취소된 작업을 처리하지 않음
+    AI_REQUEST_DEADLINE_SECONDS: int = 120  # 요청 밖에서 등록하는 작업은 등록 시점 기준
+    AI_DISCONNECT_POLL_SECONDS: float = 1.0  # 결과 대기 중 클라이언트 연결 끊김을 확인하는 간격
+    AI_CANCEL_TTL_SECONDS: int = 300
+
+    # 추론 결과 캐시 (프로세스 내 LRU + Redis)
+    INFERENCE_CACHE_LOCAL_SIZE: int = 1024
+    INFERENCE_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    INFERENCE_MODEL_VERSION_REFRESH_SECONDS: int = 10
+    # 업로드 시점 예측 분석 (POST /uploads?speculate=true). 분석 요청이 가져가지 않은 작업은 TTL 후 만료
+    SPECULATIVE_ANALYSIS_ENABLED: bool = True
+    SPECULATIVE_RESULT_TTL_SECONDS: int = 120
+
+    # LLM 백엔드 (OpenAI 호환 Chat Completions API, 개발 시 scripts/llm_standin.py)
+    LLM_BASE_URL: str = "http://localhost:9000/v1"
+    LLM_API_KEY: str = ""
+    LLM_MODEL: str = "gpt-4o-mini"
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    # 챗봇: 스트리밍 응답은 작은 토큰을 시간/크기 예산 안에서 한 SSE 프레임으로 묶어 전송
+    CHAT_SYSTEM_PROMPT: str = (
+        "당신은 복약 관리 서비스의 건강 상담 챗봇입니다. 의학적 진단을 대신하지 않으며, "
+        "위험 신호가 있으면 전문가 상담이나 응급실 방문을 권합니다. 한국어로 간결하게 답합니다."
+    )
+    GUIDE_SYSTEM_PROMPT: str = (
+        "당신은 복약 관리 서비스의 건강 가이드 작성자입니다. 사용자의 기저질환, 알러지, 복용 중인 약을 바탕으로 "
+        "복약 주의사항과 생활 습관 가이드를 한국어로 작성합니다. 의학적 진단을 대신하지 않으며 위험 신호가 있으면 전문가 상담을 권합니다."
+    )
+    CHAT_STREAM_FLUSH_MS: int = 50
+    CHAT_STREAM_FLUSH_CHARS: int = 48
+    # 대화 맥락: 세션별 최근 메시지 N개는 원문, 그 이전은 누적 요약으로 Redis에 보관
+    CHAT_CONTEXT_WINDOW_MESSAGES: int = 12
+    CHAT_CONTEXT_TTL_SECONDS: int = 60 * 60 * 24
+    # 대화 메시지 write-behind 저장: Redis 스트림에 적재 후 최대 CHAT_WRITE_FLUSH_MS마다 최대 CHAT_WRITE_BATCH_SIZE턴씩 한 번에 INSERT
+    CHAT_WRITE_BEHIND_ENABLED: bool = True
+    CHAT_WRITE_BATCH_SIZE: int = 200
+    CHAT_WRITE_FLUSH_MS: int = 200
+    CHAT_WRITE_CLAIM_IDLE_MS: int = 30_000
+    # 챗봇 WebSocket (/chat/ws): 연결당 동시 요청 수, 하트비트 주기, 진행 중인 요청이 없을 때의 유휴 종료 시간
+    CHAT_WS_MAX_INFLIGHT: int = 4
+    CHAT_WS_MAX_CONNECTIONS_PER_USER: int = 5
+    CHAT_WS_PING_SECONDS: float = 20.0
+    CHAT_WS_IDLE_TIMEOUT_SECONDS: int = 300
+    CHAT_WS_OUTBOX_SIZE: int = 256
+    # 같은 입력의 LLM/가이드 생성이 동시에 요청되면 한 번만 실행 (리더 락 TTL, 재시도 요청을 위한 결과 보관 시간, 리더 생존 확인 주기)
+    SINGLE_FLIGHT_LOCK_TTL_SECONDS: int = 15
+    SINGLE_FLIGHT_RESULT_TTL_SECONDS: int = 30
+    SINGLE_FLIGHT_POLL_SECONDS: float = 1.0
+    # 가이드 캐시: 건강 프로필 지문이 같으면 저장된 가이드 재사용, 프로필 변경 시 GUIDE_REGENERATE_DELAY_SECONDS 뒤 백그라운드 재생성
+    GUIDE_CACHE_TTL_SECONDS: int = 30 * 24 * 60 * 60
+    GUIDE_FINGERPRINT_TTL_SECONDS: int = 60 * 60
+    GUIDE_REGENERATE_DELAY_SECONDS: float = 3.0
+    # 사용자 임상 정보 스냅샷 (가이드/챗봇 맥락): 최근 처방/알약 인식 개수, 미사용 시 만료 (만료 후 조회 시 DB에서 재구성)
+    CLINICAL_SNAPSHOT_RECENT_PRESCRIPTIONS: int = 3
+    CLINICAL_SNAPSHOT_RECENT_PILLS: int = 5
+    CLINICAL_SNAPSHOT_TTL_SECONDS: int = 30 * 24 * 60 * 60
+
+    # 수용 제어: 워커 큐 길이 × 작업당 처리 시간 / 활성 워커 수로 예상 대기 시간을 계산해 SLO 초과 시 429 + Retry-After
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_WAIT_SLO_SECONDS: float = 10.0
+    ADMISSION_REFRESH_SECONDS: float = 1.0
+    ADMISSION_DEFAULT_SERVICE_SECONDS: float = 1.0  # 워커가 아직 처리 시간을 보고하지 않은 작업의 추정치
+    ADMISSION_MAX_RETRY_AFTER_SECONDS: int = 60
+    WORKER_HEARTBEAT_TTL_SECONDS: int = 60  # ai_worker 설정과 동일하게 유지
+    METRICS_FLUSH_INTERVAL_SECONDS: int = 5
+
+    # 약물 상호작용/알러지/기저질환 금기 데이터셋
+    INTERACTION_DATA_PATH: str = os.path.join(Path(__file__).resolve().parent.parent, "data", "drug_interactions.json")
+    # 응급 증상 사전 (챗봇 응급 안내, 가이드 긴급 주의 표시)
+    EMERGENCY_LEXICON_PATH: str = os.path.join(
+        Path(__file__).resolve().parent.parent, "data", "emergency_symptoms.json"
+    )
+    # 챗봇 질문 유형 분류 모델 (scripts/train_intent_classifier.py로 학습), 확신도가 낮으면 LLM으로 분류
+    INTENT_MODEL_PATH: str = os.path.join(Path(__file__).resolve().parent.parent, "data", "intent_model.json")
+    INTENT_CONFIDENCE_THRESHOLD: float = 0.5
+    # 챗봇 의미 기반 답변 캐시: 질문 임베딩의 코사인 유사도가 임계값 이상이면 저장된 답변 재사용 (세션 첫 질문, 개인화되지 않는 질문만)
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_QUESTION_TYPES: tuple[str, ...] = ("복약", "일반")
+    ANSWER_CACHE_SIMILARITY: float = 0.92
+    ANSWER_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    ANSWER_CACHE_MAX_ENTRIES: int = 20_000
+    ANSWER_CACHE_EMBED_TIMEOUT_SECONDS: float = 0.5
+    ANSWER_CACHE_LSH_TABLES: int = 4
+    ANSWER_CACHE_LSH_BITS: int = 10
+    ANSWER_CACHE_LSH_SEED: int = 20261019
+    ANSWER_CACHE_BUCKET_CANDIDATES: int = 32
+    # LSH 버킷 하나에 남겨 둘 최근 항목 수 (조회는 앞의 BUCKET_CANDIDATES개만 사용)
+    ANSWER_CACHE_BUCKET_MAX_ENTRIES: int = 256
+
+    # 알약 복합 분석 (CNN + 각인 OCR 결합)
+    PILL_CONFIDENCE_THRESHOLD: float = 0.60
+    PILL_IMPRINT_WEIGHT: float = 0.3
@@ -0,0 +1,106 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `pill_recognitions` MODIFY COLUMN `back_upload_id` INT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `pill_recognitions` MODIFY COLUMN `back_upload_id` INT NOT NULL;"""
+
+
+MODELS_STATE = (
+    "eJztXWtznDgW/Std/uRUeWcbDG56vzmOM+MZP1KOszs16y1KSGqHCg1eoJO4ZvLfV1fijc"
+    "DQD5tm9SVpA1ctDrR07rlXV38eLANCveinUxq6+PPBPyZ/HvhoSdmHypmjyQF6fMyPw4EY"
+    "OR6/FOXXOFEcIhyzowvkRZQdIjTCofsYu4HPjvorz4ODAWYXuv5Dfmjlu/9dUTsOHmj8mY"
+    "bsxL//ww67PqHfaZT++fjFXrjUI6WuugS+mx+346dHfuzCj9/zC+HbHBsH3mrp5xc/PsWf"
+    "Az+72vVjOPpAfRqimELzcbiC7kPvkvtM70j0NL9EdLFgQ+gCrby4cLuOnR87sO3rmzv74/"
+    "mdbR/0AAgHPoDLuhrxu3+ALvxN14yZYR2fGBa7hHczOzL7Ib46B0YYcniu7w5+8PMoRuIK"
+    "jnEO6lcaRtClGrJnn1Eoh7ZgUsGXdbyKb4pmG8DpgRzh/K16CYiX6LvtUf8hhp+GbpotgP"
+    "7z9Pbsl9PbQ3bVG/jKgP0MxK/jOjmli3OAeo4y/Kh6IJxcPkJ0tem0A7rsqkZ0+bkyuuwb"
+    "Yyp+2mWEf/14cy1HuGBSQZm4OJ78NfHcqDZW7AHaLeACGNDyMor+6xUxPbw6/b0K99nlzV"
+    "sOThDFDyFvhTfwlkEPA/TiS2E0gQMOwl++oZDYtTOBHjRdWz+11JfVI8hHDxxIuGO4v2TK"
+    "+hTx6aM2lfHjrRPZil0RdZrHDu5XWNPw/cqhhsE+6wj+nZnWhP03RewEPkFzODSfskMIYz"
+    "hvaeZE/McM8YIdcuYzDOfJdAp/gCExTYt91ucGO+EgBH8czyxoywI7HfPT1PjpoPLkB9Gp"
+    "ex96cazBZZZ5BE2bC2hnNiPsM55b4pjJvoicHFvwL3x2DA2+VHTdwfyrsWWJiyb80GICHR"
+    "G3pvGbMqFN6CdccEzmhdvFrAdkSnB2O+SY8hs5sfi/8xqUW2YgzaO4lIKsOYjvgoMcSF6X"
+    "i3eTQ/g4g6eDTP5icVixtYArNQu/qb6PLzzuN3MZ38Vf+OceD6loM8L51ugCu9GMulGbbH"
+    "sDPF5w9S7g6s3g6jVwH1EUfQvCXsNM0WaEIGu61WXk0K3mkQPOVXBmKFHbXy0dwRU6Y12x"
+    "GyPeWhe4tWa0tSrYjD66hJFtO6QPLnwxdHAN8J9rZ4wPw+jyMIzmh2FUH4Yb2TENl5GNGK"
+    "2nkoHmbRB4FPkNlKZuXUHdYea7gj078rKO09ubm8uS4/T24q4C+Kert+fsQfDnwC5yYyFO"
+    "JepLCf3H0P2K8NPa+Nft1RPo9wSWKPxCY9aVtZ+BrAX1FJ55Cj1kg4Jw5iE23EieUGL3/r"
+    "db6vGJQPIMUm0b2tjDqeBH+ualRw+E21dWFj2Phg8u3RgjaOZprCjhzyi2lzSK0MOmSDF+"
+    "El+JlsaLVhgwv9gmbkRRtDlgvLV3orHRYrYKQ+CmS0o2xUu0dCWmlTFi5bkLaj+sGJnfEK"
+    "rLy6tL1tbP0NRYwXoM88Y3hOtDoanRwuV6HnMQcfDgu9uAjDV3m7c2VtRWj16ANh24PvFG"
+    "xgpRgEP7sxvFQbgx2bo5u/2FtzRevuX72wLr7Pp6hGDtMjAq/B1Zkk/qCLXk+GT+VqfYaC"
+    "V8BMFGHqTDmm6kwUZimjiLPCJ6PIXPU41HlkTEb2GKGB8P9Rk8lOfgXUdQ96TrEGclujPP"
+    "I7g8GEoMiJlC6BU6vsC179chJMpuiUfwDKMWGOXfj2Zwx+TExCKY+/c0MJsfkgdZEQ/c4j"
+    "nRdh1eVQleGyZ4kXD1YPcN2pWMRqir7ybJC8ZOO3ZlUN+xow25XiWrajISAxhO/ZSe3zPU"
+    "W0C+u7g652riU6ImwoHDk0bARXyvmI8EBnd/1PVdNmm5XyXP4DlVN7d7QS03HWr2SsotuQ"
+    "4RDe1+iTEFkxGOLVtLdakJ5mXQ64i/D0LqPvi/0SeO+wXrJPKx7I2upMrtGd5NrJodDtG3"
+    "jFgU3zN27+yOqXiJz04/np2+Oz/40SUCsSU3hnNv5cj0d2RSzJr8mQKmz7g1iUf61Nm7YZ"
+    "SW026esIg1zoiRluUwlgi3M3XgYpOSnJDXXIwka7HkNjCqbWYOBbOHJok1zak2dzscyySb"
+    "ejx7fDvgBZWdLZ33f2ZC/48xb4BYBs+MJVnPEpeNTHk3j2fTNLWRaEkvcO7/8BtzDH3nGa"
+    "PKpdnQpYkg0IIk+f7vErosh7dg1kSz0w97OEIfhBSRG997Osj0uDbq/fHu9OpDiQK+O707"
+    "hzN6iZWnR2vMPGtk8q+Lu18m8Ofkj5vrcxlL59cBVYeRdxUHth98sxEpvJfp0RS1KqdnN7"
+    "tww+U6yRolU5Wl0YPai1mz1xBWNHl+INuHn9UWxrIWIo9SSXZDJj+2HJcqlS++V325/G4p"
+    "qsibkbLTLKWmjZgW0nc2ktyF1oxn+jTXrQWjmwEJw3Ms1G2+ZIdRpdfS11+zn0AjE+larH"
+    "AxiGC2hORqty6OcZndYdwyV8D5MiZ2M5q4sXy1kmC4pTMIO5w605z64hmo8ck9l6ipAMix"
+    "MM5IaRE/RUoHMpC3kVLxS37qLbVX7ZQi1m3Rr9Idle44ULKyge64S65SzFyV8JVKYmszZ6"
+    "kl067HW/CJwWd6NtPCDDqdTfKAtdCVjmGmhmXDk2wxKg9rpxxBzOGWbmYx7h3Sl+F0N1l6"
+    "Dac0bsMXeCe8Ie9FxrgQOcGpPOYYWhL458uzhX6mL8wmFoThawSLSYkLnvGmeTKCjEzVyZ"
+    "pYGc4Y0fRllmQrLrOxwBZBhZee02vZSs2w3XhMGHi9+GJ6/Qjx3f566mU+n1XyMej3hjGi"
+    "YDIKiNt04PPf70pSYa0iTCYDX95c/5xeXi0TU0vAEIxnDam2YKiE2h5CLQ4pYLJGTKRsqc"
+    "Ii+xQWCemChpQ5WmItTT+hXm68lmSf9HUwT3wr5EgJDUpoeO05e3OhoWW42AK6PZffDWyc"
+    "6AqyfKQclrBTWmEr1Xaqa3Db5J366t/NFoOY5rEQEbjkYOUyR7akgp+ZY1ElzjrMJIeTqc"
+    "XteYE5R1+AdKBRrrYYC+3Nq60R2Ys7uvdPL7oINhLdB/pcyfIq35ms7t4U81CeWe3jnEK/"
+    "RF3A2XEe4lJ5V4NkPi1LScSI0H81ScVOcSIV4lLMc5B473uIK6+dIWNBpcoaLQyoUstjI/"
+    "bDZnweI0JiWWaag50HbERas8gawXMtX11aSkFhM/08zZvefbBroH3nkS885zEvnS+JnZYz"
+    "v+GPE22atcYYmMb7rE2y5ooBOKI5nK7MjISApd3M42SThES18KaMI7GGTA4UP69ZgGpSnV"
+    "nyFBS9GRa9YT93FydFJXsyHInpCKff3ayaJYSyGSIMJGmwLVlTJasxYr31WBhjLGFsg5Qv"
+    "DxI0BHVLVm0Bgj2EvAViEPgVHVd0fBAv6L7S8ZJALCHkVQG5mZJ73tKulI17npWfXuSKXY"
+    "GsJYlMucbFRSpCIR0b8eInXCorrTdMEr1FMyBcNSU/AWFmtNfaNkvf43vhrL0oMgrZM0mO"
+    "S5hz8QaK6mKSdofoMYiYdDrP1wuIlap5WRt+5pkFpyr5bPA0XERZOEA9Ztqy1QgnW7PLXG"
+    "s2T7WmXF5MtQ42gcYrSY2D5kSpBvNRQP/SSVMZPHbjXmbND0JqrB7DerlrdElDhhIU2Pdo"
+    "KHkOz+WwSRpQuWwql03lsrXmsinfWvnW4/OtyxsQvOjGA3uSbLXT+lFX7BZc9hl5p1FE4w"
+    "OJAlG95KhNhFhmF9sIru4cHCSaQdJQENGdPJ3GwXyDy6r3nTmv7LzBPWGzkjtT1ADS+k1p"
+    "yVco44oxIuIP7hUTaF4znB0nTI3yPrl8QQtd1mfJrqv5oj5nYd2n6/wKAci7u4/8GiMvpp"
+    "ukSc1mqfbx6faSazZC8jjJMYFUKx58NZVwsRfCRRSsQsyeB7/5HkSmajdCNrN98SIBrdeL"
+    "XLJR1YlkFZ9gWuutvZWtRvj6bj8YKyBbhV5/nBOjEcJsanqXYULTm8cJODeYHepL++1IyG"
+    "d1P55m5lnbBGjDhHxsCoaVcpq0EFMltyoLz5QyrMRCfqgKun0GOfg+i0qkhBd6ItMSzzwq"
+    "9WaSszwRlUuibieE8+GFJbmpnFDyJLVsY4e8fILKkx/MrNlMBD8H0aMbMy+xbxpZzXCtQX"
+    "5grv8L5JAlw6NDSe/8JonphklOA4Nf5TgNQ4etb7fWz3kp2WzHedn7QVhp20PQtmGzoC3u"
+    "TPmONTciyCUKd3UgqGN349O7gP3T9S1de+fFVx0COr+lxaGvw3u6NaeNv4rPOG7p69rNeb"
+    "OzH0snD67u25jc6Sju5ZbI4ojv6AC14LLlN7BJXJZOBxXjdr1eesDd5Sq+WGo8w/Oj6uIl"
+    "hxrcVuwkIVw1EbqAGn/yjjRvqFfar68CymHx5XmTQYQ1SyUoDodZtLl3MBoTGGfW2lpPbj"
+    "1C5rwTT48EEP+20TJYyZLk3rOJouHtrllWIF+A6bjcu5tPby/PJx9uz88uPl7cXJeTfvjJ"
+    "cjLW7fnpZRVv5HpP9iKk7GZ9/NRjNJFYqupS9YgLWYVi3SBBTxIS3Qxv1U6BWwfXjWzP9b"
+    "9QdmWQrebul85Zt1fZnD2yOUvctxcbkViqkO3zusdjJaa0of5RDVHtGdhdPUzJyzakdXQf"
+    "XM+7pTh48N3GWGLlkqNWj5RdbIf51R0d0rPr69Q7ujm77RBiw9YsK/ktPCRYoAUnCC/9ZI"
+    "GTlu6oXsz60iHrK6lrXtydMN39b2dO7PhukTu+si/Lt5FPAqZlx1vT4eLiBvNlhxmJ76FW"
+    "FqF0jsm8YQ1eqefKxR3EJHLU4uLyAaKvZ1syUg5tx9AlgEba5uzmhV8y21Hg/grrvpSf8L"
+    "qrvnw/3Z65n5tQN1ReggTfAIfr4Vs3VPiqIuGvlDcB3pS9TvJE3XArctkIOGAO7iIM/Hgt"
+    "dCWWKkFFJai8eIX7AhfYArJn19e/5I2NFN86fXoe5gIl2ALMN2e344e5zqI2lxflI3f9ia"
+    "hcouKTkMxVz7/xBfrwcvgOimx0hbdOtHadr/XxKYrp8jKQJmrlJ4/a9PCIX2Z7QY/ULI3n"
+    "L1EjXQt8+uEiV1LFemUdmYWFH3xxMmxyLtdIExGX66JE44umxZpgrvRCLhJfHVLYQlysG0"
+    "GELyXpnau1T/0HDTvZfZ3MRfYY7K4ODfBMLrHZqrgjg/BjSfXlE1EGOl0ybhwuI9hjQ5R6"
+    "TqvaqQpxw2PORy3qNHp07UfE3MwatC1rJws2I3S3d6JNL9nrHvTSNHKLEWKsdVM0WgSN2t"
+    "6vNHpk30jtZZ/Un4qV0uNUFbFeUI+rithA1nontF7CQXPC30xABWPe5cru4rLjvAZNKdHg"
+    "sJ6sflRPzkdiR/t0w4w3O1hGMJ6748kXhTo+wErBZuoY1Z7mlPY+LXosck+cueDkvAQR0Q"
+    "yc7iUnOiOtFlRYjNAMWg3m5GvVevNBTm7NfHjherRvLZGizQi52tZKiZQiJIBZ3+I4JaMR"
+    "Ir392jiYQfEgFZebUS7ajBDk7dfPUgT5/4UgqzQFVWZ3D0JkWylFkMfZXLphSYJRxiUbwu"
+    "UbgzXKWHm/2sRdl+CksKZhw37FMdaIGw4V3VoWNI8dorQM88ao1RfEjBU4EdNWyHX6QffQ"
+    "9ApTgETXK08QzdpeJV2mk74nqSqdSEb1CtuYzA0RGD1kXXojQrWGkLHupcUQyzUICwUHt7"
+    "6x8D7eB9fssr7c5wVLpmLtl3mf7A6c3BE2DcS/UlSD5GVPsPQmCwpbemNZ9JpMMV9CNcsK"
+    "pKdBdEmtERWjHrwmB9w2pt97beRUtBmFr/Xi63j8BQ0p86LsJY0RPJs6/L9+vLlueLWl1l"
+    "WBw8Xx5K+Jxwb0vZ0YZc8DYGl/HlXoj8rqBDRQfR5KZGoef0YsMg2juuVrP2C1wmgE0l1D"
+    "zm9/8W7trOphTBnbqNFYfZuVJvoimqi02Mf6Ul9/dWBf0N/pXmQFhVSiJZT102YtobLCqc"
+    "sW6DV31xCuqWPmmSClwiMncFmyb7jMgS954DsTD/al43w/iKzl+6ycZyG5JhEQ8mZ4Uj03"
+    "SZOQ6vVZyJR3cAYZS8leY2kivs6TfyyennOMjcOzwF+4BByXQrqSymkfIp1r1gv4j93+Ss"
+    "NIGjVoSbmuGo5vz4gdZD94KIp6F7gpWylK3W3RPs6GJwnha67XWjZbs1jr0OBuQXcb1VqB"
+    "PDI/Hrpcg7pZ9ypbKb1L6V1K71J6l9K7Xh9SpXcNRhw4UnrXC4Cq9K791rt+/A8ffK5E"
+)
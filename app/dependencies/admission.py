@@ -0,0 +1,54 @@
+import math
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+
+from app.core import config
+from app.services.admission import AdmissionController, admission_controller
+from app.utils.metrics import get_metrics_recorder
+
+
+@dataclass
+class Admission:
+    estimated_wait_seconds: float
+
+
+class AdmissionControl:
+    """
+    워커 백로그로 인한 예상 대기 시간이 SLO를 넘으면 요청을 큐에 더 쌓지 않고 거절하는 종속성입니다.
+
+    거절 시 429와 함께 큐가 SLO 수준까지 줄어드는 데 걸리는 예상 시간을 Retry-After로 돌려줍니다.
+
+    사용 예:
+        dependencies=[Depends(AdmissionControl("cnn", "ocr"))]
+    """
+
+    def __init__(self, *tasks: str, controller: AdmissionController | None = None):
+        self.tasks = tasks
+        self.controller = controller or admission_controller
+        self.metrics = get_metrics_recorder("admission")
+
+    async def __call__(self) -> Admission:
+        if not config.ADMISSION_CONTROL_ENABLED:
+            return Admission(estimated_wait_seconds=0.0)
+
+        # 여러 작업을 동시에 요청하는 엔드포인트는 가장 밀린 큐가 응답 시간을 결정합니다.
+        worst = max(await self.controller.estimate(self.tasks), key=lambda estimate: estimate.wait_seconds)
+        wait = worst.wait_seconds
+        if wait <= config.ADMISSION_WAIT_SLO_SECONDS:
+            self.metrics.incr("admitted")
+            await self.metrics.maybe_flush()
+            return Admission(estimated_wait_seconds=wait)
+
+        self.metrics.incr(f"rejected_{worst.task}")
+        await self.metrics.maybe_flush()
+        retry_after = (
+            config.ADMISSION_MAX_RETRY_AFTER_SECONDS
+            if math.isinf(wait)
+            else min(config.ADMISSION_MAX_RETRY_AFTER_SECONDS, math.ceil(wait - config.ADMISSION_WAIT_SLO_SECONDS))
+        )
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="AI 분석 요청이 많아 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(max(1, retry_after))},
+        )
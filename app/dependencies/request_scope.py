@@ -0,0 +1,28 @@
+import time
+from typing import Annotated
+
+from fastapi import Header, Request
+
+from app.core import config
+from app.utils.request_scope import RequestScope, current_request_scope
+
+
+async def bind_request_scope(
+    request: Request,
+    x_request_timeout: Annotated[float | None, Header(description="클라이언트가 응답을 기다릴 최대 시간(초)")] = None,
+) -> RequestScope:
+    """
+    요청의 마감 시각과 연결 끊김 확인 함수를 현재 컨텍스트에 등록하는 종속성입니다.
+    이 요청에서 등록하는 워커 작업은 같은 마감 시각을 가지며, 클라이언트가 떠나면 작업 취소가 게시됩니다.
+
+    마감 시각은 AI_REQUEST_DEADLINE_SECONDS 이내에서 클라이언트가 X-Request-Timeout 헤더로 줄일 수 있습니다.
+
+    사용 예:
+        APIRouter(prefix="/analysis", dependencies=[Depends(bind_request_scope)])
+    """
+    budget: float = config.AI_REQUEST_DEADLINE_SECONDS
+    if x_request_timeout is not None and x_request_timeout > 0:
+        budget = min(budget, x_request_timeout)
+    scope = RequestScope(deadline=time.time() + budget, is_disconnected=request.is_disconnected)
+    current_request_scope.set(scope)
+    return scope
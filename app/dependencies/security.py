@@ -26,6 +26,40 @@ async def get_request_user(token: Annotated[str, Depends(oauth2_scheme)]) -> Use
     Returns:
         User: 인증에 성공한 사용자 환경 정보
         
+    Raises:
+        HTTPException: 토큰이 유효하지 않거나 세션이 만료된 경우 401 에러 발생
+    """
+    return await authenticate_access_token(token)
+
+
+async def get_admin_user(user: Annotated[User, Depends(get_request_user)]) -> User:
+    """
+    인증된 사용자가 관리자(ADMIN_USER_IDS)인지 확인하는 종속성 함수입니다.
+
+    Args:
+        user (User): 인증된 사용자
+
+    Returns:
+        User: 관리자 사용자
+
+    Raises:
+        HTTPException: 관리자가 아닌 경우 403 에러 발생
+    """
+    if user.id not in config.ADMIN_USER_IDS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다.")
+    return user
+
+
+async def authenticate_access_token(token: str) -> User:
+    """
+    액세스 토큰을 검증하고 사용자를 반환합니다. (HTTP 종속성과 WebSocket 연결 인증 공용)
+
+    Args:
+        token (str): 액세스 토큰
+
+    Returns:
+        User: 인증에 성공한 사용자
+
     Raises:
         HTTPException: 토큰이 유효하지 않거나 세션이 만료된 경우 401 에러 발생
     """
@@ -55,3 +89,10 @@ async def get_request_user(token: Annotated[str, Depends(oauth2_scheme)]) -> Use
         raise credentials_exception
 
     return user
+
+
+async def is_session_active(user_id: str, token: str) -> bool:
+    """
+    토큰이 여전히 사용자의 현재 세션 토큰인지 확인합니다. (로그아웃/중복 로그인 시 False, Redis 조회 1회)
+    """
+    return await redis_client.get(f"session:{user_id}") == token
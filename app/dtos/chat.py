@@ -21,6 +21,12 @@ class ChatResponse(BaseModel):
     reply: str = Field(..., description="챗봇(LLM)의 실시간 응답 내용")
     multimodal_assets: list[dict] | None = Field(None, description="생성된 카드뉴스/이미지/음성(TTS) 등 에셋 정보")
 
+class ChatMessageResponse(BaseModel):
+    session_id: str = Field(..., description="대화 세션 ID")
+    assistant_message: str = Field(..., description="챗봇 응답")
+    question_type: str = Field(..., description="질문 분류 (복약/증상/일반/시스템)")
+    action_type: str = Field(..., description="후속 동작 (NONE/EMERGENCY)")
+
 class ChatSessionResponse(BaseModel):
     session_id: str
     last_message: str
@@ -0,0 +1,21 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class InteractionWarning(BaseModel):
+    kind: Literal["interaction", "duplicate", "allergy", "disease"] = Field(
+        ..., description="경고 종류 (약물 상호작용, 성분 중복, 알러지, 기저질환 금기)"
+    )
+    severity: Literal["contraindicated", "major", "moderate", "minor"] = Field(..., description="위험도")
+    medications: list[str] = Field(..., description="관련 복용약 이름")
+    subject: str = Field(..., description="원인 성분/계열, 알러지 또는 질환명")
+    message: str = Field(..., description="사용자 안내 문구")
+
+
+class InteractionCheckResponse(BaseModel):
+    warnings: list[InteractionWarning] = Field(default_factory=list, description="위험도 내림차순 경고 목록")
+    unrecognized_medications: list[str] = Field(
+        default_factory=list, description="성분 정보를 찾지 못해 검사에서 제외된 약 이름"
+    )
+    dataset_version: str = Field(..., description="상호작용 데이터셋 버전")
@@ -10,6 +10,18 @@ class DrugInfo(BaseModel):
     dosage: str = Field(..., description="1회 복용량 (mg/ml 등 정규화)")
     frequency: str = Field(..., description="1일 복용 횟수")
     duration: str = Field(..., description="복용 기간 (일)")
+    dosage_amount: float | None = Field(None, description="1회 투여량 수치 (함량 × 1회 투약 개수)")
+    daily_frequency: int | None = Field(None, description="1일 투여 횟수")
+    duration_days: int | None = Field(None, description="총 투약 일수")
+    standard_drug_name: str | None = Field(None, description="약품 마스터 기준 표준 제품명 (정규화 실패 시 None)")
+    match_score: float | None = Field(None, description="OCR 약품명과 표준 제품명의 자모 편집 거리 기반 일치 점수 (0~1)")
+
+class OCRPageInfo(BaseModel):
+    page: int = Field(..., description="페이지 번호 (1부터)")
+    confidence: float = Field(..., description="페이지 OCR 신뢰도")
+    drug_count: int = Field(0, description="페이지에서 추출된 약품 행 수")
+    render_ms: float = Field(..., description="PDF 페이지 래스터화 소요 시간 (ms)")
+    ocr_ms: float = Field(..., description="페이지 텍스트 인식 소요 시간 (ms)")
 
 class OCRExtractResponse(BaseModel):
     hospital_name: str | None = Field(None, description="병원명")
@@ -17,8 +29,26 @@ class OCRExtractResponse(BaseModel):
     drugs: list[DrugInfo] = Field(default_factory=list, description="추출된 약품 상세 정보")
     extracted_text: str = Field(..., description="전체 텍스트 본문")
     confidence: float = Field(..., description="OCR 전체 신뢰도")
+    model_version: str | None = Field(None, description="OCR 결과를 만든 모델 버전")
+    pages: list[OCRPageInfo] = Field(default_factory=list, description="PDF일 때 페이지별 신뢰도와 소요 시간")
+    elapsed_ms: float | None = Field(None, description="PDF 전체 페이지 병렬 인식 소요 시간 (ms)")
     multimodal_assets: list[dict] | None = Field(None, description="카드뉴스/음성 등 변환 에셋")
 
+class PrescriptionDrugResponse(BaseModel):
+    id: int
+    standard_drug_name: str
+    dosage_amount: float | None = None
+    daily_frequency: int | None = None
+    duration_days: int | None = None
+    is_linked_to_meds: bool = False
+
+class PrescriptionAnalysisResponse(BaseModel):
+    ocr_history_id: int
+    prescription_id: int
+    hospital_name: str | None = None
+    prescribed_date: str | None = Field(None, description="처방일 (YYYY-MM-DD)")
+    drugs: list[PrescriptionDrugResponse] = Field(default_factory=list, description="처방전에서 추출·정규화된 약품 행")
+
 class PillCandidate(BaseModel):
     pill_name: str
     confidence: float
@@ -28,8 +58,26 @@ class PillAnalyzeResponse(BaseModel):
     candidates: list[PillCandidate] = Field(..., description="CNN 분석 상위 3개 후보")
     top_candidate: PillCandidate = Field(..., description="가장 신뢰도 높은 약품")
     suggestion: str | None = Field(None, description="신뢰도가 낮을 경우(60% 미만) 안내 문구")
+    answered_by: str | None = Field(None, description="응답한 캐스케이드 단계 (fast: 경량 모델, escalated: 대형 모델+각인 OCR)")
+    imprint_text: str | None = Field(None, description="승격 시 인식된 알약 각인 문자")
     multimodal_assets: list[dict] | None = Field(None, description="이미지/음성 등 변환 에셋")
 
+class PillCandidateScore(BaseModel):
+    pill_name: str
+    confidence: float = Field(..., description="CNN(앞/뒷면 평균)과 각인 OCR 일치도를 결합한 점수")
+    medication_info: str = ""
+
+class PillAnalysisResponse(BaseModel):
+    cnn_history_id: int
+    ocr_history_id: int
+    pill_recognition_id: int
+    primary_pill_name: str
+    confidence: float
+    candidates: list[PillCandidateScore] = Field(..., description="결합 점수로 재정렬된 상위 3개 후보")
+    answered_by: str | None = Field(None, description="앞면 CNN 캐스케이드 응답 단계 (fast/escalated)")
+    early_stopped: bool = Field(False, description="앞면만으로 신뢰도 기준을 넘어 뒷면 분석을 생략했는지 여부")
+    suggestion: str | None = Field(None, description="신뢰도가 낮을 경우(60% 미만) 안내 문구")
+
 class OCRVerificationRequest(BaseModel):
     hospital_name: str | None = None
     prescribed_date: str | None = None # YYYY-MM-DD
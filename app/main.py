@@ -6,6 +6,8 @@ from fastapi.templating import Jinja2Templates
 from app.apis.v1 import api_v1_router
 from app.db.databases import initialize_tortoise
 from app.core.logger import logging
+from app.services.chat_connections import chat_connections
+from app.services.chat_writer import chat_writer
 
 app = FastAPI(
     default_response_class=ORJSONResponse, docs_url="/api/docs", redoc_url="/api/redoc", openapi_url="/api/openapi.json"
@@ -13,6 +15,24 @@ app = FastAPI(
 initialize_tortoise(app)
 
 
+@app.on_event("startup")
+async def start_chat_tasks():
+    """
+    대화 메시지 write-behind 저장 태스크와 챗봇 WebSocket 이벤트 수신 태스크를 시작합니다.
+    """
+    chat_writer.start()
+    chat_connections.start()
+
+
+@app.on_event("shutdown")
+async def stop_chat_tasks():
+    """
+    저장 대기 중인 대화 메시지를 모두 저장합니다. (Tortoise 연결은 이 핸들러가 끝난 뒤 닫힙니다)
+    """
+    await chat_connections.stop()
+    await chat_writer.stop()
+
+
 # Tortoise-ORM의 SQL 로그를 활성화
 logging.basicConfig(level=logging.DEBUG)
 logging.getLogger("tortoise.db_client").setLevel(logging.DEBUG)
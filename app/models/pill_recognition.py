@@ -19,7 +19,7 @@ class PillRecognition(models.Model):
     
     # 앞/뒷면 사진 매칭
     front_upload = fields.OneToOneField("models.Upload", related_name="pill_front_asset")
-    back_upload = fields.OneToOneField("models.Upload", related_name="pill_back_asset")
+    back_upload = fields.OneToOneField("models.Upload", related_name="pill_back_asset", null=True) # 뒷면은 선택
 
     class Meta:
         table = "pill_recognitions"
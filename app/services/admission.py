@@ -0,0 +1,81 @@
+import math
+import time
+from dataclasses import dataclass
+
+from app.core import config
+from app.services.inference import JOB_QUEUE_KEY
+from app.utils.common import redis_client
+
+# ai_worker/schemas/jobs.py와 동일하게 유지해야 하는 워커 상태 키
+SERVICE_TIME_KEY = "ai:service_ms"
+WORKERS_KEY = "ai:workers:{task}"
+
+
+@dataclass
+class QueueEstimate:
+    task: str
+    depth: int  # interactive 레인에서 대기 중인 작업 수
+    workers: int  # 최근 WORKER_HEARTBEAT_TTL_SECONDS 안에 상태를 보고한 워커 수
+    service_seconds: float  # 작업당 최근 처리 시간
+
+    @property
+    def wait_seconds(self) -> float:
+        """
+        지금 작업을 넣으면 처리가 시작되기까지의 예상 대기 시간(초). 대기 작업이 있는데 워커가 없으면 무한대입니다.
+        """
+        if self.depth == 0:
+            return 0.0
+        if self.workers == 0:
+            return math.inf
+        return self.depth * self.service_seconds / self.workers
+
+
+class AdmissionController:
+    """
+    워커 큐 길이와 최근 처리 시간으로 작업 종류별 예상 대기 시간을 계산합니다.
+    요청마다 Redis를 조회하지 않도록 작업 종류별 추정치를 refresh_seconds 동안 재사용합니다.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._estimates: dict[str, tuple[float, QueueEstimate]] = {}
+
+    async def estimate(self, tasks: tuple[str, ...]) -> list[QueueEstimate]:
+        """
+        Args:
+            tasks (tuple[str, ...]): 요청이 사용할 워커 작업 종류
+
+        Returns:
+            list[QueueEstimate]: 작업 종류별 큐 길이, 활성 워커 수, 처리 시간
+        """
+        now = time.monotonic()
+        stale = [
+            task
+            for task in tasks
+            if task not in self._estimates or now - self._estimates[task][0] >= self.refresh_seconds
+        ]
+        if stale:
+            alive_since = time.time() - config.WORKER_HEARTBEAT_TTL_SECONDS
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for task in stale:
+                    pipe.llen(JOB_QUEUE_KEY.format(task=task, priority="interactive"))
+                    pipe.zcount(WORKERS_KEY.format(task=task), alive_since, "+inf")
+                    pipe.hget(SERVICE_TIME_KEY, task)
+                replies = await pipe.execute()
+            for index, task in enumerate(stale):
+                depth, workers, service_ms = replies[index * 3 : index * 3 + 3]
+                self._estimates[task] = (
+                    now,
+                    QueueEstimate(
+                        task=task,
+                        depth=depth,
+                        workers=workers,
+                        service_seconds=(
+                            float(service_ms) / 1000 if service_ms else config.ADMISSION_DEFAULT_SERVICE_SECONDS
+                        ),
+                    ),
+                )
+        return [self._estimates[task][1] for task in tasks]
+
+
+admission_controller = AdmissionController(refresh_seconds=config.ADMISSION_REFRESH_SECONDS)
@@ -0,0 +1,290 @@
+import base64
+import hashlib
+import operator
+import random
+import struct
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+
+from fastapi import HTTPException
+
+from app.core import config
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.emergency import normalize_symptom_text
+from app.services.inference import InferenceClient
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+
+# 임베딩 모델 버전별 네임스페이스 (모델이 바뀌면 이전 항목은 조회되지 않고 TTL로 사라집니다)
+ANSWER_ENTRY_KEY = "chat:answers:{version}:entry:{entry_id}"  # HASH question/answer/vector/signatures
+ANSWER_EXACT_KEY = "chat:answers:{version}:exact:{digest}"  # 정규화된 질문이 같은 항목 ID (임베딩 생략)
+ANSWER_BUCKET_KEY = "chat:answers:{version}:bucket:{table}:{signature}"  # ZSET 항목 ID (점수: 저장 시각)
+ANSWER_LRU_KEY = "chat:answers:{version}:lru"  # ZSET 항목 ID (점수: 마지막 사용 시각)
+ANSWER_CACHE_PATTERN = "chat:answers:*"
+ANSWER_VERSION_KEY = "chat:answers:version"  # 마지막으로 본 임베딩 모델 버전 (완전 일치 조회용)
+
+# "제가 먹는 약", "지난번에 말한" 처럼 사용자 상황이나 앞선 대화를 전제로 한 질문은 답변이 개인화되므로 캐시하지 않습니다.
+PERSONAL_MARKERS = (
+    "제가",
+    "저는",
+    "저도",
+    "내가",
+    "나는",
+    "우리",
+    "먹고있는",
+    "복용중인",
+    "먹는중",
+    "그약",
+    "그거",
+    "아까",
+    "지난번",
+)
+
+
+@lru_cache(maxsize=4)
+def _hyperplanes(dim: int) -> tuple[tuple[tuple[float, ...], ...], ...]:
+    """
+    LSH 테이블별 무작위 초평면입니다. 모든 API 프로세스가 같은 버킷을 쓰도록 고정 시드로 만듭니다.
+    """
+    rng = random.Random(config.ANSWER_CACHE_LSH_SEED)
+    return tuple(
+        tuple(tuple(rng.gauss(0.0, 1.0) for _ in range(dim)) for _ in range(config.ANSWER_CACHE_LSH_BITS))
+        for _ in range(config.ANSWER_CACHE_LSH_TABLES)
+    )
+
+
+def _decode_vector(vector_b64: str) -> tuple[float, ...]:
+    raw = base64.b64decode(vector_b64)
+    return struct.unpack(f"<{len(raw) // 2}e", raw)
+
+
+def _dot(left: tuple[float, ...], right: tuple[float, ...]) -> float:
+    return sum(map(operator.mul, left, right))
+
+
+@dataclass
+class AnswerProbe:
+    question: str  # 정규화된 질문
+    version: str | None = None  # 임베딩 모델 버전
+    vector_b64: str | None = None  # 워커가 반환한 float16 벡터 (정규화됨)
+    signatures: tuple[int, ...] = ()
+
+
+class SemanticAnswerCache:
+    """
+    자주 묻는 일반 질문의 챗봇 답변을 질문 임베딩 기준으로 재사용하는 의미 기반 캐시입니다.
+
+    질문은 워커의 embed 작업으로 임베딩하고, 무작위 초평면 LSH(테이블 ANSWER_CACHE_LSH_TABLES개 × ANSWER_CACHE_LSH_BITS비트)로
+    버킷을 정해 같은 버킷의 최근 항목과만 코사인 유사도를 비교합니다. 유사도가 ANSWER_CACHE_SIMILARITY 이상이면 캐시 적중입니다.
+    정규화된 질문이 완전히 같으면 임베딩 없이 바로 적중합니다.
+
+    항목은 ANSWER_CACHE_TTL_SECONDS 후 만료되고(답변 내용이 낡지 않도록 적중해도 연장하지 않음),
+    ANSWER_CACHE_MAX_ENTRIES를 넘으면 가장 오래 사용되지 않은 항목부터 지웁니다. (LRU)
+    LSH 버킷에서도 지운 항목과 TTL이 지난 항목을 빼고, 버킷마다 최근 ANSWER_CACHE_BUCKET_MAX_ENTRIES개만 남겨
+    인기 있는 버킷이 저장할 때마다 TTL이 연장되며 끝없이 커지지 않게 합니다.
+    """
+
+    def __init__(self):
+        self.inference = InferenceClient()
+        self.metrics = get_metrics_recorder("chat_answer_cache")
+
+    async def is_cacheable(self, user: User, message: str, question_type: str) -> bool:
+        """
+        답변이 사용자 프로필이나 앞선 대화와 무관한 질문인지 판단합니다.
+        일반(건강 상식) 질문은 누구에게나 같은 답을 주고, 복약 질문은 알러지/기저질환/복용약이 하나도 없는 사용자에게만 공유합니다.
+        (등록된 프로필이 있으면 같은 질문이라도 금기/상호작용에 따라 답이 달라질 수 있으므로)
+
+        Args:
+            user (User): 요청 사용자
+            message (str): 사용자 메시지
+            question_type (str): 질문 유형
+
+        Returns:
+            bool: 캐시 조회/저장 대상 여부
+        """
+        if question_type not in config.ANSWER_CACHE_QUESTION_TYPES:
+            return False
+        normalized = normalize_symptom_text(message)
+        if any(marker in normalized for marker in PERSONAL_MARKERS):
+            return False
+        if question_type != "복약":
+            return True
+        return not (await clinical_snapshots.get(user)).has_profile
+
+    async def lookup(self, message: str) -> tuple[str | None, AnswerProbe | None]:
+        """
+        비슷한 질문의 캐시된 답변을 찾습니다.
+
+        Args:
+            message (str): 사용자 메시지
+
+        Returns:
+            tuple: (캐시된 답변 또는 None, 미적중 시 store에 넘길 조회 정보 — 임베딩 실패 시 None)
+        """
+        probe = AnswerProbe(question=normalize_symptom_text(message))
+        answer = await self._lookup_exact(probe.question)
+        if answer is None:
+            vector = await self._embed(probe)
+            if vector is None:
+                self.metrics.incr("skipped")
+                await self.metrics.maybe_flush()
+                return None, None
+            answer = await self._lookup_similar(probe, vector)
+
+        self.metrics.incr("hit" if answer is not None else "miss")
+        await self.metrics.maybe_flush()
+        return answer, probe
+
+    async def store(self, probe: AnswerProbe, answer: str) -> None:
+        """
+        미적중 질문의 답변을 저장하고, 용량을 넘으면 가장 오래 사용되지 않은 항목을 지웁니다.
+
+        Args:
+            probe (AnswerProbe): lookup이 반환한 조회 정보
+            answer (str): LLM이 생성한 답변
+        """
+        if probe.version is None or probe.vector_b64 is None:  # 임베딩하지 못한 질문은 저장하지 않습니다.
+            return
+        version, entry_id, now = probe.version, uuid.uuid4().hex, time.time()
+        ttl = config.ANSWER_CACHE_TTL_SECONDS
+        lru_key = ANSWER_LRU_KEY.format(version=version)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            entry_key = ANSWER_ENTRY_KEY.format(version=version, entry_id=entry_id)
+            pipe.hset(
+                entry_key,
+                mapping={
+                    "question": probe.question,
+                    "answer": answer,
+                    "vector": probe.vector_b64,
+                    "signatures": ",".join(map(str, probe.signatures)),
+                },
+            )
+            pipe.expire(entry_key, ttl)
+            digest = hashlib.sha256(probe.question.encode()).hexdigest()
+            pipe.set(ANSWER_EXACT_KEY.format(version=version, digest=digest), entry_id, ex=ttl)
+            for table, signature in enumerate(probe.signatures):
+                bucket_key = ANSWER_BUCKET_KEY.format(version=version, table=table, signature=signature)
+                pipe.zadd(bucket_key, {entry_id: now})
+                pipe.zremrangebyscore(bucket_key, "-inf", now - ttl)
+                pipe.zremrangebyrank(bucket_key, 0, -config.ANSWER_CACHE_BUCKET_MAX_ENTRIES - 1)
+                pipe.expire(bucket_key, ttl)
+            pipe.zadd(lru_key, {entry_id: now})
+            pipe.set(ANSWER_VERSION_KEY, version)
+            pipe.zcard(lru_key)
+            size = (await pipe.execute())[-1]
+
+        overflow = size - config.ANSWER_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            evicted = [entry_id for entry_id, _ in await redis_client.zpopmin(lru_key, overflow)]
+            await self._evict(version, evicted)
+            self.metrics.incr("evicted", len(evicted))
+        self.metrics.incr("stored")
+        await self.metrics.maybe_flush()
+
+    async def purge(self) -> int:
+        """
+        캐시 항목을 모두 삭제합니다. (답변 정책/프롬프트 변경 시 관리자용)
+
+        Returns:
+            int: 삭제한 키 수
+        """
+        deleted, batch = 0, []
+        async for key in redis_client.scan_iter(match=ANSWER_CACHE_PATTERN, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += await redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await redis_client.unlink(*batch)
+        self.metrics.incr("purged", deleted)
+        await self.metrics.flush()
+        return deleted
+
+    @staticmethod
+    async def _evict(version: str, entry_ids: list[str]) -> None:
+        """
+        항목을 지우고 항목이 들어 있던 LSH 버킷에서도 뺍니다.
+        """
+        entry_keys = [ANSWER_ENTRY_KEY.format(version=version, entry_id=entry_id) for entry_id in entry_ids]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for entry_key in entry_keys:
+                pipe.hget(entry_key, "signatures")
+            signatures = await pipe.execute()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for entry_id, joined in zip(entry_ids, signatures, strict=True):
+                for table, signature in enumerate(joined.split(",") if joined else ()):
+                    pipe.zrem(ANSWER_BUCKET_KEY.format(version=version, table=table, signature=signature), entry_id)
+            pipe.delete(*entry_keys)
+            await pipe.execute()
+
+    async def _lookup_exact(self, question: str) -> str | None:
+        version = await redis_client.get(ANSWER_VERSION_KEY)
+        if version is None:
+            return None
+        digest = hashlib.sha256(question.encode()).hexdigest()
+        entry_id = await redis_client.get(ANSWER_EXACT_KEY.format(version=version, digest=digest))
+        if entry_id is None:
+            return None
+        answer = await redis_client.hget(ANSWER_ENTRY_KEY.format(version=version, entry_id=entry_id), "answer")
+        if answer is not None:
+            await redis_client.zadd(ANSWER_LRU_KEY.format(version=version), {entry_id: time.time()}, xx=True)
+        return answer
+
+    async def _embed(self, probe: AnswerProbe) -> tuple[float, ...] | None:
+        """
+        워커로 질문을 임베딩하고 디코딩한 벡터를 반환합니다.
+        워커가 밀려 ANSWER_CACHE_EMBED_TIMEOUT_SECONDS 안에 답하지 않으면 None을 반환해 캐시를 건너뜁니다.
+        """
+        try:
+            job_id = await self.inference.submit("embed", {"texts": [probe.question]})
+            result = await self.inference.wait(job_id, timeout=config.ANSWER_CACHE_EMBED_TIMEOUT_SECONDS)
+        except HTTPException:
+            return None
+        probe.version = result["model_version"]
+        probe.vector_b64 = result["vectors_b64"]
+        vector = _decode_vector(result["vectors_b64"])
+        probe.signatures = tuple(
+            sum(1 << bit for bit, plane in enumerate(planes) if _dot(plane, vector) >= 0)
+            for planes in _hyperplanes(len(vector))
+        )
+        return vector
+
+    async def _lookup_similar(self, probe: AnswerProbe, vector: tuple[float, ...]) -> str | None:
+        version, limit = probe.version, config.ANSWER_CACHE_BUCKET_CANDIDATES
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for table, signature in enumerate(probe.signatures):
+                pipe.zrevrange(
+                    ANSWER_BUCKET_KEY.format(version=version, table=table, signature=signature), 0, limit - 1
+                )
+            candidates = list(dict.fromkeys(entry_id for ids in await pipe.execute() for entry_id in ids))
+        if not candidates:
+            return None
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for entry_id in candidates:
+                pipe.hmget(ANSWER_ENTRY_KEY.format(version=version, entry_id=entry_id), "vector", "answer")
+            entries = await pipe.execute()
+
+        best_id, best_answer, best_score = None, None, config.ANSWER_CACHE_SIMILARITY
+        expired: list[str] = []
+        for entry_id, (vector_b64, answer) in zip(candidates, entries, strict=True):
+            if vector_b64 is None:  # 만료/제거된 항목
+                expired.append(entry_id)
+                continue
+            score = _dot(vector, _decode_vector(vector_b64))
+            if score >= best_score:
+                best_id, best_answer, best_score = entry_id, answer, score
+        async with redis_client.pipeline(transaction=False) as pipe:
+            if expired:  # TTL로 사라진 항목은 버킷에서도 뺍니다.
+                for table, signature in enumerate(probe.signatures):
+                    pipe.zrem(ANSWER_BUCKET_KEY.format(version=version, table=table, signature=signature), *expired)
+            if best_id is not None:
+                pipe.zadd(ANSWER_LRU_KEY.format(version=version), {best_id: time.time()}, xx=True)
+            await pipe.execute()
+        return best_answer
+
+
+answer_cache = SemanticAnswerCache()
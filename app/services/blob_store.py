@@ -0,0 +1,48 @@
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import Any
+
+from app.core import config
+
+
+class BlobStore:
+    """
+    ai_worker와 공유하는 볼륨에 이미지를 sha256 이름의 파일로 저장하는 콘텐츠 주소 저장소입니다.
+    워커 작업에는 이미지 대신 저장소 참조(sha256, 상대 경로, 크기)만 넣으므로 큐 메시지가 작고,
+    워커는 파일을 mmap으로 열어 디코딩합니다. 같은 이미지는 한 번만 기록됩니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    async def put(self, data: bytes, sha256: str) -> dict[str, Any]:
+        """
+        Args:
+            data (bytes): 이미지/PDF 바이너리
+            sha256 (str): data의 sha256 hex
+
+        Returns:
+            dict: 작업 페이로드에 넣을 저장소 참조 (sha256, path, size)
+        """
+        relative = f"{sha256[:2]}/{sha256}"
+        await asyncio.to_thread(self._write, self.root / relative, data)
+        return {"sha256": sha256, "path": relative, "size": len(data)}
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        try:
+            # 워커의 정리 작업이 최근에 쓰인 이미지를 지우지 않도록 수정 시각만 갱신합니다.
+            os.utime(path)
+            return
+        except FileNotFoundError:
+            pass  # 처음 보는 이미지이거나 워커가 방금 정리한 파일이면 새로 기록
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 워커가 기록 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 원자적으로 이름을 바꿉니다.
+        temp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        temp.write_bytes(data)
+        os.replace(temp, path)
+
+
+blob_store = BlobStore(config.AI_BLOB_DIR)
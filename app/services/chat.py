@@ -1,60 +1,295 @@
-from app.dtos.chat import ChatRequest, ChatResponse
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from typing import Any
+
+from fastapi import HTTPException
+
+from app.core import config
+from app.dtos.chat import ChatMessageResponse
+from app.models.user import User
+from app.services.answer_cache import answer_cache
+from app.services.chat_connections import chat_connections
+from app.services.chat_context import ChatContextStore
+from app.services.chat_writer import chat_writer
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.emergency import SymptomScan, get_emergency_detector, normalize_symptom_text
+from app.services.intent import INTENT_LABELS, get_intent_classifier
+from app.services.llm import LLMClient
+from app.utils.metrics import get_metrics_recorder
+from app.utils.sse import coalesce, sse_frame
+
+EMERGENCY_REPLY = "{category} 증상이 의심됩니다. 즉시 가까운 응급실을 방문하시거나 119에 연락하시기 바랍니다."
+
+INTENT_PROMPT = (
+    "사용자 질문을 다음 중 하나로 분류하고 분류명만 답하세요: 복약(약 복용/상호작용), 증상(몸 상태), "
+    "일반(건강 상식), 시스템(앱 사용법/계정/알람/업로드)"
+)
+# 시스템(앱 사용법) 질문 중 정형화된 안내는 LLM 없이 템플릿으로 답합니다. (키워드는 공백 없이 정규화된 메시지와 비교)
+SYSTEM_REPLIES = (
+    (
+        ("비밀번호",),
+        "비밀번호는 마이페이지의 정보 수정에서 변경할 수 있습니다. 비밀번호를 잊으셨다면 로그인 화면의 "
+        "'아이디/비밀번호 찾기'에서 이메일 인증 후 다시 설정해 주세요.",
+    ),
+    (
+        ("아이디",),
+        "아이디(이메일)는 로그인 화면의 '아이디/비밀번호 찾기'에서 가입 시 등록한 정보로 확인할 수 있습니다.",
+    ),
+    (
+        ("알람", "알림"),
+        "복약 알람은 복용 중인 약 화면에서 약별로 시간을 설정하거나 수정할 수 있고, 지난 알람은 알람 기록에서 확인할 수 있습니다.",
+    ),
+    (
+        ("처방전",),
+        "처방전 사진을 올리면 약 이름과 용법이 자동으로 인식됩니다. 인식 결과는 확인 화면에서 수정한 뒤 복용 중인 약으로 등록할 수 있습니다.",
+    ),
+    (
+        ("알약",),
+        "알약 앞·뒷면 사진을 올리면 모양과 각인으로 약을 찾아 드립니다. 결과가 다르면 확인 화면에서 후보 중 직접 선택해 주세요.",
+    ),
+    (
+        ("로그인", "카카오", "네이버"),
+        "이메일 계정 또는 카카오·네이버 계정으로 로그인할 수 있습니다. 로그인이 되지 않으면 '아이디/비밀번호 찾기'를 이용해 주세요.",
+    ),
+)
+
+# 복약/증상 질문은 사용자 건강 정보(기저질환, 알러지, 복용약, 최근 처방)를 프롬프트에 함께 넣습니다.
+PROFILE_QUESTION_TYPES = ("복약", "증상")
+
+# 응답 중단 시 저장 작업이 요청 태스크와 함께 취소되지 않도록 참조를 보관합니다.
+_background_tasks: set[asyncio.Task] = set()
 
 
 class ChatService:
+    """
+    LLM 백엔드의 생성 토큰을 받아 챗봇 응답을 만드는 서비스 클래스입니다.
+    대화 이력은 응답이 끝난 뒤 사용자/챗봇 메시지를 한 턴으로 묶어 write-behind 저장기에 넘깁니다. (토큰마다 DB에 쓰지 않음)
+    프롬프트 맥락은 MySQL 이력 대신 Redis 세션 맥락(최근 메시지 + 누적 요약)에서 조립합니다.
+    """
+
+    def __init__(self):
+        self.llm = LLMClient()
+        self.context = ChatContextStore(self.llm)
+        self.detector = get_emergency_detector()
+        self.classifier = get_intent_classifier()
+        self.intent_metrics = get_metrics_recorder("chat_intent")
+
     # ==========================================
     # [추가된 기능] 필수 2: 실시간 챗봇
     # ==========================================
-    async def process_chat(self, request: ChatRequest) -> ChatResponse:
+    async def reply(
+        self, user: User, message: str, session_id: str | None = None, reference_guide_id: int | None = None
+    ) -> ChatMessageResponse:
         """
-        사용자의 질문에 대해 LLM 또는 규칙 기반 챗봇의 응답을 생성합니다.
-        질문 의도를 분류하고 응급 상황을 감지하는 로직을 포함합니다.
-        
+        사용자의 질문에 대한 챗봇 응답 전체를 생성합니다.
+
         Args:
-            request (ChatRequest): 메시지 내역 및 세션 정보
-            
+            user (User): 요청 사용자
+            message (str): 사용자 메시지
+            session_id (str | None): 대화 세션 ID (없으면 신규 생성)
+            reference_guide_id (int | None): 질문 시 참고한 가이드 ID
+
         Returns:
-            ChatResponse: 질문 분류, 위험도, 답변 및 멀티모달 에셋 링크
-        """
-        # TODO: 이전 대화 기록(request.messages)을 포함하여 LLM 또는 규칙 기반 챗봇 질의응답 처리
-        # 1. 사용자 질문 의도 파악 (질문 분류: 복약/증상/일반/시스템)
-        # 2. 응급 키워드 감지 (호흡곤란, 흉통 등)
-        # 3. LLM 응답 생성 반환
-        recent_msg = request.messages[-1].content if request.messages else ""
-        
-        # dummy classification & risk detection
-        q_type = "일반"
-        r_level = "Normal"
-        if "숨" in recent_msg or "가슴" in recent_msg:
-            q_type = "증상"
-            r_level = "Emergency"
-            dummy_reply = "호흡곤란이나 흉통이 느껴지신다면 즉시 가까운 응급실을 방문하시거나 119에 연락하시기 바랍니다."
-        else:
-            dummy_reply = f"챗봇 응답입니다. (받은 마지막 메시지: {recent_msg})"
-
-        return ChatResponse(
-            session_id=request.session_id or "new_dummy_session",
-            question_type=q_type,
-            risk_level=r_level,
-            reply=dummy_reply,
-            multimodal_assets=[]
+            ChatMessageResponse: 세션 ID, 챗봇 응답, 후속 동작(NONE/EMERGENCY)
+
+        Raises:
+            HTTPException: LLM 백엔드 오류(502)
+        """
+        session_id = session_id or uuid.uuid4().hex
+        symptoms = self.detector.scan(message)
+        question_type = await self._classify(message, symptoms)
+        tokens = self._reply_tokens(user, session_id, message, symptoms, question_type)
+        reply = "".join([token async for token in tokens])
+        await self._persist(user, session_id, message, reply, reference_guide_id)
+        await self._remember(user, session_id, message, reply)
+        return ChatMessageResponse(
+            session_id=session_id,
+            assistant_message=reply,
+            question_type=question_type,
+            action_type="EMERGENCY" if symptoms.is_emergency else "NONE",
         )
 
-    async def stream_chat(self, request: ChatRequest):
+    async def stream_reply(
+        self, user: User, message: str, session_id: str | None = None, reference_guide_id: int | None = None
+    ) -> AsyncIterator[bytes]:
         """
-        챗봇의 응답을 토큰 단위로 실시간 스트리밍(SSE)하여 제공합니다.
-        
+        챗봇 응답을 LLM이 생성하는 대로 SSE 프레임으로 내보냅니다. (프레임 내용은 stream_events 참고)
+
         Args:
-            request (ChatRequest): 메시지 내역 및 세션 정보
-            
+            user (User): 요청 사용자
+            message (str): 사용자 메시지
+            session_id (str | None): 대화 세션 ID (없으면 신규 생성)
+            reference_guide_id (int | None): 질문 시 참고한 가이드 ID
+
         Yields:
-            str: SSE 형식의 JSON 데이터 문자열
-        """
-        import asyncio
-        import json
-        
-        full_text = "이것은 실시간 스트리밍 응답 샘플입니다. 토큰 단위로 데이터가 전송됩니다."
-        for word in full_text.split():
-            yield f"data: {json.dumps({'text': word + ' '})}\n\n"
-            await asyncio.sleep(0.1)
-        yield "data: [DONE]\n\n"
+            bytes: SSE 프레임
+        """
+        events = self.stream_events(user, message, session_id, reference_guide_id)
+        async with aclosing(events):
+            async for event in events:
+                yield sse_frame(event)
+
+    async def stream_events(
+        self, user: User, message: str, session_id: str | None = None, reference_guide_id: int | None = None
+    ) -> AsyncGenerator[dict[str, Any]]:
+        """
+        챗봇 응답을 LLM이 생성하는 대로 이벤트로 내보냅니다. (SSE, WebSocket 전송 공용)
+        작은 토큰은 CHAT_STREAM_FLUSH_MS/CHAT_STREAM_FLUSH_CHARS 예산 안에서 한 이벤트로 묶으며,
+        소비하는 쪽이 반복을 중단하면(연결 끊김, 요청 취소) LLM 업스트림 연결도 닫혀 생성이 멈춥니다.
+
+        이벤트:
+            {"type": "start", "session_id", "question_type", "action_type"}
+            {"type": "delta", "text"}  (여러 번)
+            {"type": "done"} 또는 {"type": "error", "detail"}
+
+        Args:
+            user (User): 요청 사용자
+            message (str): 사용자 메시지
+            session_id (str | None): 대화 세션 ID (없으면 신규 생성)
+            reference_guide_id (int | None): 질문 시 참고한 가이드 ID
+
+        Yields:
+            dict: 응답 이벤트
+        """
+        session_id = session_id or uuid.uuid4().hex
+        symptoms = self.detector.scan(message)
+        question_type = await self._classify(message, symptoms)
+        yield {
+            "type": "start",
+            "session_id": session_id,
+            "question_type": question_type,
+            "action_type": "EMERGENCY" if symptoms.is_emergency else "NONE",
+        }
+
+        chunks: list[str] = []
+        completed = False
+        try:
+            tokens = self._reply_tokens(user, session_id, message, symptoms, question_type)
+            frames = coalesce(
+                tokens, max_delay=config.CHAT_STREAM_FLUSH_MS / 1000, max_chars=config.CHAT_STREAM_FLUSH_CHARS
+            )
+            # 중간에 반복을 멈춰도 묶음 생성기와 업스트림 연결이 즉시 정리되도록 명시적으로 닫습니다.
+            async with aclosing(frames):
+                async for text in frames:
+                    chunks.append(text)
+                    yield {"type": "delta", "text": text}
+            completed = True
+        except HTTPException as err:
+            yield {"type": "error", "detail": err.detail}
+            return
+        finally:
+            if not completed:
+                # 응답이 중단되면 질문만 기록합니다. 이 시점의 요청 태스크는 취소 중이므로 별도 태스크로 저장합니다.
+                task = asyncio.create_task(self._persist(user, session_id, message, None, reference_guide_id))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+
+        reply = "".join(chunks)
+        await self._persist(user, session_id, message, reply, reference_guide_id)
+        await self._remember(user, session_id, message, reply)
+        yield {"type": "done"}
+
+    async def end_session(self, user: User, session_id: str) -> None:
+        """
+        대화 세션을 종료하고 Redis의 세션 맥락(최근 메시지, 요약)을 삭제합니다. 저장된 대화 이력은 유지되지만,
+        같은 세션 ID로 다시 메시지를 보내면 이전 대화 없이 새 맥락으로 시작합니다.
+        사용자의 WebSocket 연결(다른 API 워커 포함)에도 종료를 알려 해당 세션의 응답 생성을 멈춥니다.
+
+        Args:
+            user (User): 요청 사용자
+            session_id (str): 대화 세션 ID
+        """
+        await self.context.clear(user.id, session_id)
+        await chat_connections.publish(user.id, {"type": "ended", "session_id": session_id})
+
+    async def _classify(self, message: str, symptoms: SymptomScan) -> str:
+        """
+        질문 유형(복약/증상/일반/시스템)을 정합니다. 로컬 분류기의 확신도가 INTENT_CONFIDENCE_THRESHOLD 이상이면
+        그대로 쓰고, 낮을 때만 LLM에 분류를 맡깁니다.
+        """
+        if symptoms.is_emergency:
+            return "증상"
+        prediction = self.classifier.predict(message) if self.classifier else None
+        if prediction is not None and prediction.confidence >= config.INTENT_CONFIDENCE_THRESHOLD:
+            self.intent_metrics.incr("local")
+            await self.intent_metrics.maybe_flush()
+            return prediction.label
+
+        self.intent_metrics.incr("llm")
+        await self.intent_metrics.maybe_flush()
+        try:
+            answer = await self.llm.complete(
+                [{"role": "system", "content": INTENT_PROMPT}, {"role": "user", "content": message}],
+                max_tokens=4,
+                temperature=0,
+            )
+        except HTTPException:
+            answer = ""
+        label = next((label for label in INTENT_LABELS if label in answer), None)
+        return label or (prediction.label if prediction is not None else "일반")
+
+    async def _reply_tokens(
+        self, user: User, session_id: str, message: str, symptoms: SymptomScan, question_type: str
+    ) -> AsyncIterator[str]:
+        if symptoms.is_emergency:
+            # 응급 상황 안내는 LLM 생성 결과에 맡기지 않고 고정 문구로 즉시 응답합니다.
+            yield EMERGENCY_REPLY.format(category=symptoms.categories[0])
+            return
+        if question_type == "시스템":
+            normalized = normalize_symptom_text(message)
+            template = next(
+                (reply for keywords, reply in SYSTEM_REPLIES if any(k in normalized for k in keywords)), None
+            )
+            if template is not None:
+                self.intent_metrics.incr("template")
+                yield template
+                return
+        context = await self.context.load(user.id, session_id)
+        probe = None
+        # 앞선 대화가 있으면 같은 문장이라도 맥락에 따라 답이 달라지므로 세션의 첫 질문만 캐시를 사용합니다.
+        if (
+            config.ANSWER_CACHE_ENABLED
+            and not context.summary
+            and not context.messages
+            and await answer_cache.is_cacheable(user, message, question_type)
+        ):
+            cached, probe = await answer_cache.lookup(message)
+            if cached is not None:
+                yield cached
+                return
+
+        messages = [{"role": "system", "content": config.CHAT_SYSTEM_PROMPT}]
+        if question_type in PROFILE_QUESTION_TYPES:
+            profile = await clinical_snapshots.get_context(user)
+            messages.append({"role": "system", "content": f"사용자 건강 정보:\n{profile}"})
+        if context.summary:
+            messages.append({"role": "system", "content": f"이전 대화 요약: {context.summary}"})
+        messages += context.messages
+        messages.append({"role": "user", "content": message})
+        chunks: list[str] = []
+        async for token in self.llm.stream(messages):
+            chunks.append(token)
+            yield token
+        # 응답이 끝까지 생성된 경우에만 저장합니다. (중단되면 이 지점에 도달하지 않음)
+        if probe is not None:
+            await answer_cache.store(probe, "".join(chunks))
+
+    async def _remember(self, user: User, session_id: str, message: str, reply: str) -> None:
+        await self.context.append(
+            user.id, session_id, [{"role": "user", "content": message}, {"role": "assistant", "content": reply}]
+        )
+
+    @staticmethod
+    async def _persist(
+        user: User, session_id: str, message: str, reply: str | None, reference_guide_id: int | None
+    ) -> None:
+        """
+        사용자 메시지와 챗봇 응답을 write-behind 저장기에 한 턴으로 넘깁니다. 응답이 없으면(중단) 사용자 메시지만 저장합니다.
+        """
+        row = {"user_id": user.id, "session_id": session_id, "reference_guide_id": reference_guide_id}
+        rows = [{**row, "role": "user", "message": message}]
+        if reply is not None:
+            rows.append({**row, "role": "assistant", "message": reply})
+        await chat_writer.enqueue(rows)
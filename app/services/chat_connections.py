@@ -0,0 +1,161 @@
+import asyncio
+import math
+import os
+import socket
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from app.core import config, default_logger
+from app.utils.common import redis_client
+
+CHAT_CONNECTIONS_KEY = "chat:ws:user:{user_id}"  # HASH 연결 ID → "{worker_id}|{만료 시각}"
+CHAT_DELIVER_CHANNEL = "chat:ws:deliver:{worker_id}"  # 워커별 이벤트 전달 채널 (pub/sub)
+
+Deliver = Callable[[dict[str, Any]], None]
+
+
+class ChatConnectionRegistry:
+    """
+    챗봇 WebSocket 연결을 Redis에 등록해 여러 API 워커에 흩어진 한 사용자의 연결을 찾고 이벤트를 전달하는 레지스트리입니다.
+
+    사용자별 해시에 연결 ID → 연결을 가진 워커와 만료 시각을 기록하고, 하트비트마다 만료 시각을 연장합니다.
+    (워커가 비정상 종료해 지우지 못한 연결은 만료 시각이 지나면 무시/정리됩니다)
+    다른 워커의 연결로 보내는 이벤트는 워커별 pub/sub 채널로 보내고, 각 워커의 수신 태스크가 자기 연결에 넘깁니다.
+    """
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._local: dict[str, Deliver] = {}
+        self._listener: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """
+        이 워커로 온 이벤트를 받는 pub/sub 수신 태스크를 시작합니다.
+        """
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """
+        수신 태스크를 멈춥니다. (연결 등록 해제는 각 연결이 닫히면서 합니다)
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def register(self, user_id: str, conn_id: str, deliver: Deliver) -> bool:
+        """
+        연결을 등록합니다. 만료된 항목을 정리한 뒤 사용자당 연결 수가 CHAT_WS_MAX_CONNECTIONS_PER_USER를 넘으면 등록하지 않습니다.
+
+        Args:
+            user_id (str): 사용자 ID
+            conn_id (str): 연결 ID
+            deliver (Callable): 이 연결로 온 이벤트를 넘겨받는 함수 (블로킹하지 않아야 함)
+
+        Returns:
+            bool: 등록 여부
+        """
+        key = CHAT_CONNECTIONS_KEY.format(user_id=user_id)
+        now = time.time()
+        expired = [
+            other for other, value in (await redis_client.hgetall(key)).items() if float(value.rpartition("|")[2]) < now
+        ]
+        async with redis_client.pipeline(transaction=True) as pipe:
+            if expired:
+                pipe.hdel(key, *expired)
+            pipe.hset(key, conn_id, self._entry(now))
+            pipe.expire(key, self._ttl())
+            pipe.hlen(key)
+            count = (await pipe.execute())[-1]
+        if count > config.CHAT_WS_MAX_CONNECTIONS_PER_USER:
+            await redis_client.hdel(key, conn_id)
+            return False
+        self._local[conn_id] = deliver
+        return True
+
+    async def refresh(self, user_id: str, conn_id: str) -> None:
+        """
+        하트비트마다 연결의 만료 시각을 연장합니다.
+        """
+        key = CHAT_CONNECTIONS_KEY.format(user_id=user_id)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(key, conn_id, self._entry(time.time()))
+            pipe.expire(key, self._ttl())
+            await pipe.execute()
+
+    async def unregister(self, user_id: str, conn_id: str) -> None:
+        self._local.pop(conn_id, None)
+        await redis_client.hdel(CHAT_CONNECTIONS_KEY.format(user_id=user_id), conn_id)
+
+    async def publish(self, user_id: str, event: dict[str, Any]) -> int:
+        """
+        사용자의 모든 WebSocket 연결에 이벤트를 보냅니다. (예: 다른 기기/탭에서 대화 세션을 종료한 경우)
+
+        Args:
+            user_id (str): 사용자 ID
+            event (dict): 보낼 이벤트
+
+        Returns:
+            int: 이벤트를 보낸 연결 수
+        """
+        now, targets = time.time(), defaultdict(list)
+        for conn_id, value in (await redis_client.hgetall(CHAT_CONNECTIONS_KEY.format(user_id=user_id))).items():
+            worker_id, _, expires = value.rpartition("|")
+            if float(expires) >= now:
+                targets[worker_id].append(conn_id)
+
+        local = targets.pop(self.worker_id, [])
+        for conn_id in local:
+            self._deliver(conn_id, event)
+        if targets:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for worker_id, conn_ids in targets.items():
+                    pipe.publish(
+                        CHAT_DELIVER_CHANNEL.format(worker_id=worker_id),
+                        orjson.dumps({"conn_ids": conn_ids, "event": event}),
+                    )
+                await pipe.execute()
+        return len(local) + sum(len(conn_ids) for conn_ids in targets.values())
+
+    def _deliver(self, conn_id: str, event: dict[str, Any]) -> None:
+        deliver = self._local.get(conn_id)
+        if deliver is not None:
+            deliver(event)
+
+    async def _listen(self) -> None:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(CHAT_DELIVER_CHANNEL.format(worker_id=self.worker_id))
+        try:
+            while True:
+                try:
+                    message = await pubsub.get_message(timeout=1.0)
+                except Exception:  # Redis 재연결 대기
+                    default_logger.exception("chat connection listener failed")
+                    await asyncio.sleep(1.0)
+                    continue
+                if message is None:
+                    continue
+                body = orjson.loads(message["data"])
+                for conn_id in body["conn_ids"]:
+                    self._deliver(conn_id, body["event"])
+        finally:
+            await pubsub.aclose()
+
+    def _entry(self, now: float) -> str:
+        return f"{self.worker_id}|{now + self._ttl():.0f}"
+
+    @staticmethod
+    def _ttl() -> int:
+        # 하트비트 두 번을 놓치면 만료
+        return math.ceil(config.CHAT_WS_PING_SECONDS * 3)
+
+
+chat_connections = ChatConnectionRegistry()
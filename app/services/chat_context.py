@@ -0,0 +1,178 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+
+import orjson
+
+from app.core import config, default_logger
+from app.models.chat_message import ChatMessage
+from app.services.chat_writer import chat_writer
+from app.services.llm import LLMClient
+from app.utils.common import redis_client
+
+# 세션 대화 맥락: 최근 메시지(최대 CHAT_CONTEXT_WINDOW_MESSAGES개, 원문), 창에서 밀려나 아직 요약되지 않은 메시지, 누적 요약
+CONTEXT_TURNS_KEY = "chat:ctx:{user_id}:{session_id}:turns"
+CONTEXT_PENDING_KEY = "chat:ctx:{user_id}:{session_id}:pending"
+CONTEXT_SUMMARY_KEY = "chat:ctx:{user_id}:{session_id}:summary"
+CONTEXT_SUMMARY_LOCK_KEY = "chat:ctx:{user_id}:{session_id}:summarizing"
+# 종료된 세션 표시. 종료 뒤 같은 세션에 메시지가 오면 MySQL의 이전 대화로 맥락을 다시 채우지 않고 새로 시작합니다.
+CONTEXT_ENDED_KEY = "chat:ctx:{user_id}:{session_id}:ended"
+
+SUMMARY_PROMPT = (
+    "다음은 건강 상담 챗봇과 사용자의 이전 대화 요약과 그 뒤에 이어진 대화입니다. "
+    "증상, 복용 약, 알레르기, 챗봇이 안내한 주의사항 등 이후 상담에 필요한 사실만 남겨 한국어로 10문장 이내로 다시 요약하세요."
+)
+
+# 요약 작업이 요청 태스크와 함께 정리되지 않도록 참조를 보관합니다.
+_background_tasks: set[asyncio.Task] = set()
+
+
+@dataclass
+class ChatContext:
+    summary: str | None = None
+    messages: list[dict[str, str]] = field(default_factory=list)  # role/content (요약되지 않은 메시지 + 최근 메시지)
+
+
+class ChatContextStore:
+    """
+    세션별 대화 맥락을 Redis에 보관합니다. 최근 메시지는 원문으로 최대 CHAT_CONTEXT_WINDOW_MESSAGES개만 유지하고,
+    창에서 밀려난 메시지는 백그라운드에서 LLM으로 누적 요약에 합칩니다.
+    대화가 길어져도 매 턴의 맥락 조회는 한 번의 파이프라인(요약 + 고정 길이 목록)이며 MySQL을 읽지 않습니다.
+    """
+
+    def __init__(self, llm: LLMClient | None = None):
+        self.llm = llm or LLMClient()
+
+    @staticmethod
+    def _keys(user_id: str, session_id: str) -> tuple[str, str, str]:
+        return (
+            CONTEXT_TURNS_KEY.format(user_id=user_id, session_id=session_id),
+            CONTEXT_PENDING_KEY.format(user_id=user_id, session_id=session_id),
+            CONTEXT_SUMMARY_KEY.format(user_id=user_id, session_id=session_id),
+        )
+
+    async def load(self, user_id: str, session_id: str) -> ChatContext:
+        """
+        프롬프트에 넣을 대화 맥락을 조회합니다. Redis에 맥락이 없는 기존 세션(만료 등)은 MySQL의 최근 메시지로 한 번 채우며,
+        종료(clear)한 세션은 채우지 않고 빈 맥락으로 다시 시작합니다.
+
+        Args:
+            user_id (str): 사용자 ID (이메일)
+            session_id (str): 대화 세션 ID
+
+        Returns:
+            ChatContext: 누적 요약과 요약되지 않은 메시지 + 최근 메시지
+        """
+        turns_key, pending_key, summary_key = self._keys(user_id, session_id)
+        window = config.CHAT_CONTEXT_WINDOW_MESSAGES
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(summary_key)
+            pipe.lrange(pending_key, -window, -1)
+            pipe.lrange(turns_key, 0, -1)
+            pipe.exists(CONTEXT_ENDED_KEY.format(user_id=user_id, session_id=session_id))
+            summary, pending, turns, ended = await pipe.execute()
+
+        if summary is None and not pending and not turns:
+            return ChatContext() if ended else ChatContext(messages=await self._seed(user_id, session_id))
+        return ChatContext(summary=summary, messages=[orjson.loads(raw) for raw in pending + turns])
+
+    async def append(self, user_id: str, session_id: str, messages: list[dict[str, str]]) -> None:
+        """
+        완료된 턴의 메시지를 추가합니다. 창을 넘친 오래된 메시지는 요약 대기 목록으로 옮기고 백그라운드 요약을 시작합니다.
+
+        Args:
+            user_id (str): 사용자 ID (이메일)
+            session_id (str): 대화 세션 ID
+            messages (list[dict]): role/content 메시지 (사용자 질문, 챗봇 응답)
+        """
+        turns_key, pending_key, _ = self._keys(user_id, session_id)
+        window = config.CHAT_CONTEXT_WINDOW_MESSAGES
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.rpush(turns_key, *(orjson.dumps(message) for message in messages))
+            pipe.lrange(turns_key, 0, -(window + 1))
+            pipe.ltrim(turns_key, -window, -1)
+            pipe.expire(turns_key, config.CHAT_CONTEXT_TTL_SECONDS)
+            # 종료 표시는 이어진 대화가 남아 있는 동안 유지합니다. (대화가 먼저 만료되면 이전 대화로 다시 채워지므로)
+            pipe.expire(
+                CONTEXT_ENDED_KEY.format(user_id=user_id, session_id=session_id), config.CHAT_CONTEXT_TTL_SECONDS
+            )
+            _, evicted, _, _, _ = await pipe.execute()
+
+        if evicted:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.rpush(pending_key, *evicted)
+                pipe.expire(pending_key, config.CHAT_CONTEXT_TTL_SECONDS)
+                await pipe.execute()
+            task = asyncio.create_task(self.summarize(user_id, session_id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    async def summarize(self, user_id: str, session_id: str) -> None:
+        """
+        요약 대기 목록을 기존 요약에 합칩니다. 세션당 한 번에 하나의 요약만 실행되며(Redis 잠금),
+        실행 중에 밀려난 메시지는 다음 요약에서 함께 처리됩니다. 실패하면 대기 목록을 그대로 두어 다음 턴에 다시 시도합니다.
+        """
+        _, pending_key, summary_key = self._keys(user_id, session_id)
+        lock_key = CONTEXT_SUMMARY_LOCK_KEY.format(user_id=user_id, session_id=session_id)
+        token = uuid.uuid4().hex
+        if not await redis_client.set(lock_key, token, nx=True, ex=int(config.LLM_TIMEOUT_SECONDS * 2)):
+            return
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(summary_key)
+                pipe.lrange(pending_key, 0, -1)
+                summary, pending = await pipe.execute()
+            if not pending:
+                return
+
+            transcript = "\n".join(f"{message['role']}: {message['content']}" for message in map(orjson.loads, pending))
+            new_summary = await self.llm.complete(
+                [
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {"role": "user", "content": f"[이전 요약]\n{summary or '(없음)'}\n\n[이어진 대화]\n{transcript}"},
+                ]
+            )
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(summary_key, new_summary, ex=config.CHAT_CONTEXT_TTL_SECONDS)
+                pipe.ltrim(pending_key, len(pending), -1)
+                await pipe.execute()
+        except Exception:
+            default_logger.exception("chat context summary failed for %s/%s", user_id, session_id)
+        finally:
+            # 요약이 잠금 만료보다 오래 걸렸으면 다른 요약이 잡은 잠금이므로 지우지 않습니다.
+            if await redis_client.get(lock_key) == token:
+                await redis_client.delete(lock_key)
+
+    async def clear(self, user_id: str, session_id: str) -> None:
+        """
+        세션 맥락(최근 메시지, 요약 대기 목록, 요약)을 삭제하고 종료 표시를 남깁니다.
+        """
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(*self._keys(user_id, session_id))
+            pipe.set(
+                CONTEXT_ENDED_KEY.format(user_id=user_id, session_id=session_id), 1, ex=config.CHAT_CONTEXT_TTL_SECONDS
+            )
+            await pipe.execute()
+
+    async def _seed(self, user_id: str, session_id: str) -> list[dict[str, str]]:
+        window = config.CHAT_CONTEXT_WINDOW_MESSAGES
+        # 아직 저장되지 않은 메시지를 먼저 읽습니다. 두 조회 사이에 저장된 메시지는 양쪽에 모두 보이므로 DB 쪽을 기준으로 제외합니다.
+        buffered = [(row["role"], row["message"]) for row in await chat_writer.buffered(user_id, session_id)]
+        recent = (
+            await ChatMessage.filter(user_id=user_id, session_id=session_id, is_deleted=False)
+            .order_by("-id")
+            .limit(window)
+            .values_list("role", "message")
+        )
+        stored = list(reversed(recent))
+        overlap = next(
+            (size for size in range(min(len(stored), len(buffered)), 0, -1) if stored[-size:] == buffered[:size]), 0
+        )
+        messages = [{"role": role, "content": content} for role, content in (stored + buffered[overlap:])[-window:]]
+        if messages:
+            turns_key, _, _ = self._keys(user_id, session_id)
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.rpush(turns_key, *(orjson.dumps(message) for message in messages))
+                pipe.expire(turns_key, config.CHAT_CONTEXT_TTL_SECONDS)
+                await pipe.execute()
+        return messages
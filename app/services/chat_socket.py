@@ -0,0 +1,198 @@
+import asyncio
+import time
+import uuid
+from contextlib import aclosing
+from typing import Any
+
+import orjson
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
+
+from app.core import config
+from app.dependencies.security import is_session_active
+from app.models.user import User
+from app.services.chat import ChatService
+from app.services.chat_connections import chat_connections
+from app.utils.metrics import get_metrics_recorder
+
+
+class ChatSocketSession:
+    """
+    인증된 WebSocket 연결 하나에서 여러 대화 세션의 챗봇 요청을 동시에 처리하는 연결 핸들러입니다.
+
+    클라이언트 → 서버 (JSON):
+        {"type": "message", "request_id", "message", "session_id"?, "reference_guide_id"?}
+        {"type": "cancel", "request_id"}
+        {"type": "end", "session_id"}
+        {"type": "ping"} / {"type": "pong"}
+
+    서버 → 클라이언트: 응답 이벤트(start/delta/done/error, ChatService.stream_events)에 request_id를 붙여 보내고,
+    그 밖에 ready, cancelled, ended, ping/pong, error(요청 거절)를 보냅니다.
+
+    요청마다 별도 태스크에서 생성하며(연결당 최대 CHAT_WS_MAX_INFLIGHT개, 세션당 1개), 모든 프레임은 한 송신 태스크가
+    제한된 큐에서 꺼내 보냅니다. (클라이언트가 느리면 큐가 차서 생성도 함께 늦춰짐)
+    CHAT_WS_PING_SECONDS마다 ping을 보내며 로그인 세션이 유효한지 다시 확인하고, 응답이 없거나 진행 중인 요청 없이
+    CHAT_WS_IDLE_TIMEOUT_SECONDS가 지나면 연결을 닫습니다.
+    """
+
+    def __init__(self, websocket: WebSocket, user: User, token: str, chat_service: ChatService):
+        self.websocket = websocket
+        self.user = user
+        self.token = token
+        self.chat_service = chat_service
+        self.conn_id = uuid.uuid4().hex
+        self.metrics = get_metrics_recorder("chat_websocket")
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=config.CHAT_WS_OUTBOX_SIZE)
+        self._requests: dict[str, tuple[str | None, asyncio.Task]] = {}  # request_id → (session_id, 태스크)
+        self._last_seen = self._last_active = time.monotonic()
+
+    async def run(self) -> None:
+        """
+        연결을 수락하고 닫힐 때까지 처리합니다. 닫힐 때 진행 중인 요청은 모두 취소합니다.
+        """
+        await self.websocket.accept()
+        if not await chat_connections.register(self.user.id, self.conn_id, self._on_event):
+            await self.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="too many connections")
+            return
+        self.metrics.incr("connected")
+
+        await self._outbox.put(
+            {"type": "ready", "connection_id": self.conn_id, "heartbeat_seconds": config.CHAT_WS_PING_SECONDS}
+        )
+        tasks = [
+            asyncio.create_task(self._receive()),
+            asyncio.create_task(self._send()),
+            asyncio.create_task(self._heartbeat()),
+        ]
+        close_code: int | None = status.WS_1000_NORMAL_CLOSURE
+        reason = ""
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            result = done.pop().result()
+            if result is not None:
+                close_code, reason = result
+        except (WebSocketDisconnect, OSError):  # 클라이언트가 연결을 끊음
+            close_code = None
+        finally:
+            pending = [*tasks, *(task for _, task in self._requests.values())]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await chat_connections.unregister(self.user.id, self.conn_id)
+            self.metrics.incr("disconnected")
+            await self.metrics.maybe_flush()
+
+        if close_code is not None:
+            try:
+                await self.websocket.close(code=close_code, reason=reason)
+            except RuntimeError:  # 이미 닫힌 연결
+                pass
+
+    async def _receive(self) -> tuple[int, str]:
+        while True:
+            message = await self.websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE), message.get("reason"))
+            # 바이너리 프레임은 receive_text()에서 KeyError가 되어 1011로 끊기므로 직접 걸러 1003으로 닫습니다.
+            if message.get("text") is None:
+                return status.WS_1003_UNSUPPORTED_DATA, "binary frames are not supported"
+            try:
+                frame = orjson.loads(message["text"])
+            except orjson.JSONDecodeError:
+                return status.WS_1003_UNSUPPORTED_DATA, "invalid json"
+            self._last_seen = time.monotonic()
+            await self._handle(frame)
+
+    async def _handle(self, frame: Any) -> None:
+        kind = frame.get("type") if isinstance(frame, dict) else None
+        if kind == "message":
+            self._last_active = self._last_seen
+            self._start_request(frame)
+        elif kind == "cancel":
+            request = self._requests.get(frame.get("request_id"))
+            if request is not None:
+                request[1].cancel()
+        elif kind == "end":
+            self._last_active = self._last_seen
+            await self._end_session(frame.get("session_id"))
+        elif kind == "ping":
+            await self._outbox.put({"type": "pong"})
+        elif kind != "pong":
+            await self._outbox.put({"type": "error", "detail": "알 수 없는 요청입니다."})
+
+    async def _send(self) -> None:
+        while True:
+            await self.websocket.send_text(orjson.dumps(await self._outbox.get()).decode())
+
+    async def _heartbeat(self) -> tuple[int, str]:
+        """
+        주기적으로 ping을 보내고 연결 상태를 확인합니다. 연결을 닫아야 하면 (종료 코드, 사유)를 반환합니다.
+        """
+        interval = config.CHAT_WS_PING_SECONDS
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            if now - self._last_seen > interval * 2:
+                return status.WS_1001_GOING_AWAY, "heartbeat timeout"
+            if not self._requests and now - self._last_active > config.CHAT_WS_IDLE_TIMEOUT_SECONDS:
+                self.metrics.incr("idle_closed")
+                return status.WS_1000_NORMAL_CLOSURE, "idle timeout"
+            # 로그아웃/다른 기기 로그인으로 세션 토큰이 바뀌면 연결도 끊습니다.
+            if not await is_session_active(self.user.id, self.token):
+                return status.WS_1008_POLICY_VIOLATION, "session expired"
+            await chat_connections.refresh(self.user.id, self.conn_id)
+            await self._outbox.put({"type": "ping"})
+
+    def _start_request(self, frame: dict[str, Any]) -> None:
+        request_id, session_id, message = frame.get("request_id"), frame.get("session_id"), frame.get("message")
+        if not isinstance(request_id, str) or not isinstance(message, str) or not message.strip():
+            self._reject(request_id, "request_id와 message가 필요합니다.")
+        elif request_id in self._requests:
+            self._reject(request_id, "이미 처리 중인 요청 ID입니다.")
+        elif len(self._requests) >= config.CHAT_WS_MAX_INFLIGHT:
+            self._reject(request_id, "동시에 처리할 수 있는 요청 수를 초과했습니다.")
+        elif session_id is not None and any(active == session_id for active, _ in self._requests.values()):
+            self._reject(request_id, "이 대화 세션은 이전 응답을 생성 중입니다.")
+        else:
+            task = asyncio.create_task(self._answer(request_id, session_id, message, frame.get("reference_guide_id")))
+            self._requests[request_id] = (session_id, task)
+            self.metrics.incr("requests")
+
+    def _reject(self, request_id: Any, detail: str) -> None:
+        self.metrics.incr("rejected")
+        self._on_event({"type": "error", "request_id": request_id, "detail": detail})
+
+    async def _answer(self, request_id: str, session_id: str | None, message: str, guide_id: int | None) -> None:
+        events = self.chat_service.stream_events(self.user, message, session_id, guide_id)
+        try:
+            async with aclosing(events):
+                async for event in events:
+                    if event["type"] == "start":
+                        self._requests[request_id] = (event["session_id"], self._requests[request_id][1])
+                    await self._outbox.put({**event, "request_id": request_id})
+        except HTTPException as err:  # 질문 유형 분류 등 첫 이벤트 전 실패
+            await self._outbox.put({"type": "error", "request_id": request_id, "detail": err.detail})
+        except asyncio.CancelledError:
+            self._on_event({"type": "cancelled", "request_id": request_id})
+            raise
+        finally:
+            self._requests.pop(request_id, None)
+
+    async def _end_session(self, session_id: Any) -> None:
+        if not isinstance(session_id, str):
+            await self._outbox.put({"type": "error", "detail": "session_id가 필요합니다."})
+            return
+        # 이 연결을 포함해 사용자의 모든 연결에 ended 이벤트가 전달되고, 진행 중인 요청은 _on_event에서 취소됩니다.
+        await self.chat_service.end_session(self.user, session_id)
+
+    def _on_event(self, event: dict[str, Any]) -> None:
+        """
+        레지스트리로 전달된 이벤트와 태스크 밖에서 만든 프레임을 송신 큐에 넣습니다. (큐가 가득 차면 버림)
+        """
+        if event.get("type") == "ended":
+            for session_id, task in list(self._requests.values()):
+                if session_id == event["session_id"]:
+                    task.cancel()
+        try:
+            self._outbox.put_nowait(event)
+        except asyncio.QueueFull:
+            self.metrics.incr("dropped")
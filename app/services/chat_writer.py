@@ -0,0 +1,238 @@
+import asyncio
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Any
+
+import orjson
+from redis.exceptions import ResponseError
+from tortoise.exceptions import IntegrityError, ValidationError
+from tortoise.transactions import in_transaction
+
+from app.core import config, default_logger
+from app.models.chat_message import ChatMessage
+from app.models.llm_life_guide import LLMLifeGuide
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+
+# 아직 MySQL에 반영되지 않은 대화 메시지. 엔트리 하나가 한 턴(사용자 질문 + 챗봇 응답)이며, 반영이 끝나면 XACK + XDEL로 지웁니다.
+CHAT_WRITE_STREAM = "chat:messages:pending"
+CHAT_WRITE_GROUP = "chat-writer"
+# 다시 저장해도 실패하는 엔트리(삭제된 사용자 등 데이터 오류)를 원래 값과 오류 내용으로 옮겨 두는 스트림
+CHAT_WRITE_DEAD_LETTER_STREAM = "chat:messages:dead"
+# 다시 시도해도 결과가 같은 데이터 오류 (orjson.JSONDecodeError 포함). DB 연결 오류 등 일시적인 실패는 엔트리를 남겨 두고 다시 시도합니다.
+_ROW_ERRORS = (IntegrityError, ValidationError, KeyError, TypeError, ValueError)
+
+
+class ChatMessageWriter:
+    """
+    대화 메시지를 요청 경로에서 Redis 스트림에 적재하고, 백그라운드 태스크가 모아서 여러 행을 한 번의 INSERT로 저장하는
+    write-behind 저장기입니다. 요청은 XADD 한 번만 기다리므로 응답 지연에 DB 쓰기 시간이 더해지지 않고,
+    피크 시간에도 INSERT 횟수가 배치 단위로 줄어듭니다.
+
+    스트림은 소비자 그룹으로 읽으므로 API 프로세스가 여럿이어도 각 엔트리는 한 프로세스만 저장합니다.
+    저장 후 XACK 전에 프로세스가 죽으면 다른 프로세스가 CHAT_WRITE_CLAIM_IDLE_MS 뒤 가져가 다시 저장합니다.
+    (최소 한 번 저장: 이 경우에 한해 중복 행이 생길 수 있습니다)
+    배치 INSERT가 데이터 오류로 실패하면 엔트리별로 다시 저장하고, 그래도 실패하는 엔트리는 dead-letter 스트림으로 옮겨
+    한 엔트리 때문에 배치 전체가 계속 재시도되지 않게 합니다.
+    종료 시에는 스트림에 남은 엔트리를 모두 저장한 뒤 멈춥니다.
+    """
+
+    def __init__(self):
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.metrics = get_metrics_recorder("chat_write_behind")
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def enqueue(self, rows: list[dict[str, Any]]) -> None:
+        """
+        한 턴의 메시지를 저장 대기 스트림에 추가합니다. write-behind가 꺼져 있으면 바로 저장합니다.
+
+        참고 가이드 ID가 해당 사용자의 가이드가 아니면(삭제되었거나 잘못된 값) 참조 없이 저장합니다.
+
+        Args:
+            rows (list[dict]): user_id, session_id, role, message, reference_guide_id 값
+        """
+        created_at = datetime.now().astimezone().isoformat()
+        rows = [{**row, "created_at": created_at} for row in await self._check_guide_refs(rows)]
+        if not config.CHAT_WRITE_BEHIND_ENABLED:
+            await self._insert(rows)
+            return
+        await redis_client.xadd(CHAT_WRITE_STREAM, {"rows": orjson.dumps(rows)})
+
+    async def buffered(self, user_id: str, session_id: str) -> list[dict[str, Any]]:
+        """
+        아직 저장되지 않은 세션 메시지를 적재 순서대로 반환합니다. 이력 조회 시 MySQL 결과 뒤에 이어 붙여 사용합니다.
+        스트림에는 저장 전 엔트리만 남아 있으므로 조회 비용은 저장 지연 동안 쌓인 양에 비례합니다.
+
+        Args:
+            user_id (str): 사용자 ID (이메일)
+            session_id (str): 대화 세션 ID
+
+        Returns:
+            list[dict]: role/message 등 메시지 값
+        """
+        entries = await redis_client.xrange(CHAT_WRITE_STREAM)
+        return [
+            row
+            for _, fields in entries
+            for row in orjson.loads(fields["rows"])
+            if row["user_id"] == user_id and row["session_id"] == session_id
+        ]
+
+    def start(self) -> None:
+        """
+        백그라운드 저장 태스크를 시작합니다. (애플리케이션 시작 시 호출)
+        """
+        if config.CHAT_WRITE_BEHIND_ENABLED and self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        스트림에 남은 메시지를 모두 저장한 뒤 백그라운드 태스크를 멈춥니다. (애플리케이션 종료 시, DB 연결을 닫기 전에 호출)
+        """
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self.metrics.flush()
+
+    async def _run(self) -> None:
+        group_ready = False
+        next_claim = 0.0
+        while True:
+            stopping = self._stopping.is_set()
+            try:
+                # 기동 시 Redis가 내려가 있어도 태스크가 끝나지 않도록 소비자 그룹 생성도 재시도 루프 안에서 합니다.
+                if not group_ready:
+                    await self._ensure_group()
+                    group_ready = True
+                if time.monotonic() >= next_claim:
+                    next_claim = time.monotonic() + config.CHAT_WRITE_CLAIM_IDLE_MS / 1000
+                    await self._flush(await self._claim_stale())
+                # 종료 중에는 기다리지 않고 남은 엔트리만 읽어 비워지면 멈춥니다.
+                response = await redis_client.xreadgroup(
+                    CHAT_WRITE_GROUP,
+                    self.consumer,
+                    {CHAT_WRITE_STREAM: ">"},
+                    count=config.CHAT_WRITE_BATCH_SIZE,
+                    block=None if stopping else config.CHAT_WRITE_FLUSH_MS,
+                )
+                entries = response[0][1] if response else []
+                await self._flush(entries)
+            except Exception as err:
+                # 저장에 실패한 엔트리는 확인(XACK)되지 않은 채 남아 있다가 CHAT_WRITE_CLAIM_IDLE_MS 뒤 다시 저장됩니다.
+                default_logger.exception("chat write-behind flush failed")
+                if isinstance(err, ResponseError) and "NOGROUP" in str(err):
+                    group_ready = False  # 스트림이 지워졌으면 그룹부터 다시 만듭니다.
+                if stopping:
+                    return
+                await asyncio.sleep(1)
+                continue
+            if stopping and not entries:
+                return
+
+    async def _ensure_group(self) -> None:
+        try:
+            await redis_client.xgroup_create(CHAT_WRITE_STREAM, CHAT_WRITE_GROUP, id="0", mkstream=True)
+        except ResponseError as err:
+            if "BUSYGROUP" not in str(err):
+                raise
+
+    async def _claim_stale(self) -> list[tuple[str, dict[str, str]]]:
+        """
+        다른(또는 이전) 프로세스가 읽고 저장을 끝내지 못한 엔트리를 가져옵니다.
+        """
+        _, entries, *_ = await redis_client.xautoclaim(
+            CHAT_WRITE_STREAM,
+            CHAT_WRITE_GROUP,
+            self.consumer,
+            min_idle_time=config.CHAT_WRITE_CLAIM_IDLE_MS,
+            start_id="0-0",
+            count=config.CHAT_WRITE_BATCH_SIZE,
+        )
+        return [entry for entry in entries if entry[1]]
+
+    async def _flush(self, entries: list[tuple[str, dict[str, str]]]) -> None:
+        if not entries:
+            return
+        try:
+            rows = [row for _, fields in entries for row in orjson.loads(fields["rows"])]
+            await self._insert(rows)
+        except _ROW_ERRORS:
+            default_logger.warning("chat write-behind batch of %d entries failed, retrying one by one", len(entries))
+            rows = await self._flush_each(entries)
+        entry_ids = [entry_id for entry_id, _ in entries]
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.xack(CHAT_WRITE_STREAM, CHAT_WRITE_GROUP, *entry_ids)
+            pipe.xdel(CHAT_WRITE_STREAM, *entry_ids)
+            await pipe.execute()
+        self.metrics.incr("batches")
+        self.metrics.incr("rows", len(rows))
+        await self.metrics.maybe_flush()
+
+    async def _flush_each(self, entries: list[tuple[str, dict[str, str]]]) -> list[dict[str, Any]]:
+        """
+        엔트리를 하나씩 저장하고, 데이터 오류로 실패한 엔트리는 dead-letter 스트림에 옮깁니다.
+        (DB 연결 오류 등 다른 예외는 그대로 올려 배치 전체를 다음에 다시 시도)
+
+        Returns:
+            list[dict]: 저장된 행
+        """
+        saved: list[dict[str, Any]] = []
+        for entry_id, fields in entries:
+            try:
+                rows = orjson.loads(fields["rows"])
+                await self._insert(rows)
+            except _ROW_ERRORS as err:
+                default_logger.error("chat write-behind entry %s moved to dead-letter stream: %r", entry_id, err)
+                await redis_client.xadd(
+                    CHAT_WRITE_DEAD_LETTER_STREAM, {**fields, "entry_id": entry_id, "error": repr(err)}
+                )
+                self.metrics.incr("dead_lettered")
+                continue
+            saved.extend(rows)
+        return saved
+
+    @staticmethod
+    async def _check_guide_refs(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        reference_guide_id가 해당 사용자의 가이드로 존재하지 않는 행은 참조를 비웁니다. (외래 키 오류로 저장이 실패하지 않도록)
+        """
+        requested = {
+            (row["user_id"], guide_id) for row in rows if type(guide_id := row.get("reference_guide_id")) is int
+        }
+        found: set[tuple[str, int]] = set()
+        if requested:
+            guides = await LLMLifeGuide.filter(id__in=[guide_id for _, guide_id in requested]).values_list(
+                "user_id", "id"
+            )
+            found = set(guides) & requested
+        checked = []
+        for row in rows:
+            guide_id = row.get("reference_guide_id")
+            checked.append({**row, "reference_guide_id": guide_id if (row["user_id"], guide_id) in found else None})
+        return checked
+
+    @staticmethod
+    async def _insert(rows: list[dict[str, Any]]) -> None:
+        async with in_transaction():
+            await ChatMessage.bulk_create(
+                [
+                    ChatMessage(
+                        user_id=row["user_id"],
+                        session_id=row["session_id"],
+                        role=row["role"],
+                        message=row["message"],
+                        reference_guide_id=row["reference_guide_id"],
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                    )
+                    for row in rows
+                ]
+            )
+
+
+chat_writer = ChatMessageWriter()
@@ -0,0 +1,357 @@
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import Any
+
+import orjson
+
+from app.core import config
+from app.models.allergy import Allergy
+from app.models.chronic_disease import ChronicDisease
+from app.models.current_med import CurrentMed
+from app.models.pill_recognition import PillRecognition
+from app.models.prescription import Prescription
+from app.models.prescription_drug import PrescriptionDrug
+from app.models.user import User
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+
+CLINICAL_SNAPSHOT_KEY = "clinical:snapshot:{user_id}"  # HASH 섹션별 JSON + 미리 렌더링한 context
+# 쓰기 경로가 스냅샷을 고치거나 지울 때마다 올리는 세대 번호. DB를 읽는 동안 세대가 바뀐 재구성 결과는 저장하지 않습니다.
+CLINICAL_SNAPSHOT_GENERATION_KEY = "clinical:snapshot:{user_id}:generation"
+# 스냅샷 형식이 바뀌면 올립니다. 버전이 다른 스냅샷은 읽을 때 다시 만듭니다.
+SNAPSHOT_VERSION = 1
+SECTIONS = ("diseases", "allergies", "meds", "prescriptions", "pills")
+
+
+def demographics(resident_registration_number: str) -> str:
+    """
+    주민번호 앞 7자리로 연령대와 성별을 구합니다. (예: "30대 남성", 형식이 맞지 않으면 빈 문자열)
+    """
+    birth, _, rest = resident_registration_number.partition("-")
+    if len(birth) != 6 or not birth.isdigit() or not rest[:1].isdigit():
+        return ""
+    code = int(rest[0])
+    century = {0: 1800, 9: 1800, 1: 1900, 2: 1900, 5: 1900, 6: 1900}.get(code, 2000)
+    age = date.today().year - (century + int(birth[:2]))
+    return f"{age // 10 * 10}대 {'남성' if code % 2 else '여성'}"
+
+
+def _names(items: list[dict[str, Any]]) -> list[str]:
+    return sorted(item["name"] for item in items)
+
+
+def _recent_first(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(items, key=lambda item: (item.get("date") or "", item["id"]), reverse=True)
+
+
+@dataclass
+class ClinicalSnapshot:
+    """
+    사용자 한 명의 임상 정보 요약입니다. 섹션 항목은 모두 {"id", "name", ...} 형태입니다.
+    """
+
+    user_id: str
+    demographics: str = ""
+    diseases: list[dict[str, Any]] = field(default_factory=list)
+    allergies: list[dict[str, Any]] = field(default_factory=list)
+    meds: list[dict[str, Any]] = field(default_factory=list)
+    prescriptions: list[dict[str, Any]] = field(default_factory=list)  # 최근 처방 (drugs: 약품명 목록)
+    pills: list[dict[str, Any]] = field(default_factory=list)  # 최근 알약 인식 결과
+
+    @property
+    def disease_names(self) -> list[str]:
+        return _names(self.diseases)
+
+    @property
+    def allergy_names(self) -> list[str]:
+        return _names(self.allergies)
+
+    @property
+    def med_names(self) -> list[str]:
+        return _names(self.meds)
+
+    @property
+    def has_profile(self) -> bool:
+        """
+        알러지/기저질환/복용약 중 하나라도 등록되어 있는지 여부
+        """
+        return bool(self.diseases or self.allergies or self.meds)
+
+    def render(self) -> str:
+        """
+        LLM 프롬프트에 그대로 넣을 수 있는 사용자 건강 정보 요약문을 만듭니다.
+        """
+        lines = [f"연령대/성별: {self.demographics}"] if self.demographics else []
+        lines += [
+            f"기저질환: {', '.join(self.disease_names) or '없음'}",
+            f"알러지: {', '.join(self.allergy_names) or '없음'}",
+            f"복용 중인 약: {', '.join(self.med_names) or '없음'}",
+        ]
+        for prescription in self.prescriptions:
+            where = " ".join(filter(None, [prescription.get("date"), prescription.get("hospital")])) or "처방"
+            lines.append(f"최근 처방({where}): {', '.join(prescription['drugs']) or '약품 정보 없음'}")
+        if self.pills:
+            lines.append(f"최근 알약 인식: {', '.join(pill['name'] for pill in self.pills)}")
+        return "\n".join(lines)
+
+
+class ClinicalSnapshotStore:
+    """
+    가이드/챗봇 맥락에 필요한 사용자 임상 정보(기저질환, 알러지, 복용약, 최근 처방과 알약 인식)를
+    Redis 해시 하나에 미리 모아 두는 물리화된 스냅샷 저장소입니다. 맥락 조립은 HGETALL 한 번으로 끝납니다.
+
+    스냅샷이 없으면(첫 조회, 만료, 형식 버전 변경) 읽을 때 DB에서 다시 만들고, 쓰기 경로는 바뀐 항목만 반영합니다.
+    (WATCH 트랜잭션으로 동시에 같은 사용자 스냅샷을 고쳐도 덮어쓰지 않음. 스냅샷이 없으면 반영하지 않고 다음 조회 때 만듦)
+    쓰기 경로는 스냅샷이 없어도 세대 번호를 올리고, 재구성은 DB를 읽기 전의 세대가 그대로일 때만 저장합니다.
+    그래서 재구성이 DB를 읽은 뒤에 들어온 변경이 빠진 스냅샷이 저장되어 TTL 동안 남는 일이 없습니다.
+    스냅샷과 DB가 어긋났는지는 check로 확인합니다. (scripts/clinical_snapshot.py)
+    """
+
+    def __init__(self):
+        self.metrics = get_metrics_recorder("clinical_snapshot")
+
+    async def get(self, user: User) -> ClinicalSnapshot:
+        """
+        사용자의 스냅샷을 읽습니다. 없으면 DB에서 만들어 저장합니다.
+
+        Args:
+            user (User): 사용자
+
+        Returns:
+            ClinicalSnapshot: 임상 정보 스냅샷
+        """
+        raw = await redis_client.hgetall(CLINICAL_SNAPSHOT_KEY.format(user_id=user.id))
+        snapshot = self._decode(user.id, raw)
+        if snapshot is None:
+            self.metrics.incr("miss")
+            snapshot = await self.rebuild(user)
+        else:
+            self.metrics.incr("hit")
+        await self.metrics.maybe_flush()
+        return snapshot
+
+    async def get_context(self, user: User) -> str:
+        """
+        미리 렌더링된 건강 정보 요약문을 읽습니다. (챗봇 프롬프트용)
+        """
+        context = await redis_client.hget(CLINICAL_SNAPSHOT_KEY.format(user_id=user.id), "context")
+        return context if context is not None else (await self.get(user)).render()
+
+    async def build(self, user: User) -> ClinicalSnapshot:
+        """
+        DB에서 스냅샷을 새로 만듭니다. (저장하지 않음)
+        """
+        diseases, allergies, meds, prescriptions, pills = await asyncio.gather(
+            ChronicDisease.filter(user=user).values("id", "disease_name"),
+            Allergy.filter(user=user).values("id", "allergy_name"),
+            CurrentMed.filter(user=user).values("id", "medication_name", "start_date"),
+            Prescription.filter(user=user)
+            .order_by("-prescribed_date", "-id")
+            .limit(config.CLINICAL_SNAPSHOT_RECENT_PRESCRIPTIONS)
+            .values("id", "hospital_name", "prescribed_date"),
+            PillRecognition.filter(user=user)
+            .order_by("-id")
+            .limit(config.CLINICAL_SNAPSHOT_RECENT_PILLS)
+            .values("id", "pill_name", "is_linked_to_meds"),
+        )
+        drugs: dict[int, list[str]] = {prescription["id"]: [] for prescription in prescriptions}
+        if drugs:
+            for drug in (
+                await PrescriptionDrug.filter(prescription_id__in=list(drugs))
+                .order_by("id")
+                .values("prescription_id", "standard_drug_name")
+            ):
+                drugs[drug["prescription_id"]].append(drug["standard_drug_name"])
+
+        return ClinicalSnapshot(
+            user_id=user.id,
+            demographics=demographics(user.resident_registration_number),
+            diseases=[{"id": row["id"], "name": row["disease_name"]} for row in diseases],
+            allergies=[{"id": row["id"], "name": row["allergy_name"]} for row in allergies],
+            meds=[self.med_item(row["id"], row["medication_name"], row["start_date"]) for row in meds],
+            prescriptions=[
+                self.prescription_item(row["id"], row["hospital_name"], row["prescribed_date"], drugs[row["id"]])
+                for row in prescriptions
+            ],
+            pills=[{"id": row["id"], "name": row["pill_name"], "linked": row["is_linked_to_meds"]} for row in pills],
+        )
+
+    async def rebuild(self, user: User) -> ClinicalSnapshot:
+        """
+        DB에서 스냅샷을 새로 만들어 통째로 교체합니다. (조회 시 없을 때, 일괄 재구성, 불일치 복구)
+
+        Args:
+            user (User): 사용자
+
+        Returns:
+            ClinicalSnapshot: 새로 만든 스냅샷
+        """
+        key = CLINICAL_SNAPSHOT_KEY.format(user_id=user.id)
+        generation_key = CLINICAL_SNAPSHOT_GENERATION_KEY.format(user_id=user.id)
+        generation = await redis_client.get(generation_key)
+        snapshot = await self.build(user)
+
+        async def store(pipe) -> bool:
+            # DB를 읽는 동안 쓰기 경로가 지나갔으면 이 스냅샷에는 그 변경이 빠졌을 수 있으므로 저장하지 않습니다.
+            if await pipe.get(generation_key) != generation:
+                return False
+            pipe.multi()
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._encode(snapshot))
+            pipe.expire(key, config.CLINICAL_SNAPSHOT_TTL_SECONDS)
+            return True
+
+        stored = await redis_client.transaction(store, generation_key, value_from_callable=True)
+        self.metrics.incr("rebuilt" if stored else "rebuild_raced")
+        return snapshot
+
+    async def upsert(self, user_id: str, section: str, item: dict[str, Any]) -> None:
+        """
+        섹션의 항목을 추가하거나 같은 ID의 항목을 교체합니다. 최근 처방/알약 인식은 최신순으로 정렬해 개수를 유지합니다.
+
+        Args:
+            user_id (str): 사용자 ID
+            section (str): SECTIONS 중 하나
+            item (dict): {"id", "name", ...} 항목 (med_item/prescription_item 등으로 생성)
+        """
+
+        def apply(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            items = [*(other for other in items if other["id"] != item["id"]), item]
+            if section == "prescriptions":
+                return _recent_first(items)[: config.CLINICAL_SNAPSHOT_RECENT_PRESCRIPTIONS]
+            if section == "pills":
+                return sorted(items, key=lambda other: other["id"], reverse=True)[
+                    : config.CLINICAL_SNAPSHOT_RECENT_PILLS
+                ]
+            return items
+
+        await self._update(user_id, section, apply)
+
+    async def remove(self, user_id: str, section: str, item_id: int) -> None:
+        """
+        섹션에서 항목을 지웁니다.
+
+        Args:
+            user_id (str): 사용자 ID
+            section (str): SECTIONS 중 하나
+            item_id (int): 지울 항목 ID
+        """
+        await self._update(user_id, section, lambda items: [item for item in items if item["id"] != item_id])
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        스냅샷을 지웁니다. 다음 조회 때 DB에서 다시 만듭니다. (항목 단위로 반영하기 어려운 변경용)
+        """
+        async with redis_client.pipeline(transaction=True) as pipe:
+            self._advance_generation(pipe, user_id)
+            pipe.delete(CLINICAL_SNAPSHOT_KEY.format(user_id=user_id))
+            await pipe.execute()
+
+    async def check(self, user: User, repair: bool = False) -> list[str]:
+        """
+        저장된 스냅샷을 DB 기준으로 새로 만든 것과 비교합니다. (스냅샷이 없으면 비교하지 않음)
+
+        Args:
+            user (User): 사용자
+            repair (bool): 어긋난 섹션이 있으면 스냅샷을 다시 만들지 여부
+
+        Returns:
+            list[str]: 어긋난 섹션 이름 (형식 버전이 다르면 "version")
+        """
+        raw = await redis_client.hgetall(CLINICAL_SNAPSHOT_KEY.format(user_id=user.id))
+        if not raw:
+            return []
+        stored = self._decode(user.id, raw)
+        expected = await self.build(user)
+        if stored is None:
+            drift = ["version"]
+        else:
+            drift = [
+                name
+                for name in ("demographics", *SECTIONS)
+                if self._canonical(getattr(stored, name)) != self._canonical(getattr(expected, name))
+            ]
+            if raw.get("context") != expected.render() and not drift:
+                drift.append("context")
+        if drift:
+            self.metrics.incr("drift")
+            if repair:
+                await self.rebuild(user)
+        return drift
+
+    @staticmethod
+    def med_item(med_id: int, name: str, start_date: date | None) -> dict[str, Any]:
+        return {"id": med_id, "name": name, "since": start_date.isoformat() if start_date else None}
+
+    @staticmethod
+    def prescription_item(
+        prescription_id: int, hospital: str | None, prescribed_date: date | None, drugs: list[str]
+    ) -> dict[str, Any]:
+        return {
+            "id": prescription_id,
+            "hospital": hospital,
+            "date": prescribed_date.isoformat() if prescribed_date else None,
+            "drugs": drugs,
+        }
+
+    async def _update(
+        self, user_id: str, section: str, apply: Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+    ) -> None:
+        if section not in SECTIONS:
+            raise ValueError(f"unknown snapshot section: {section}")
+        key = CLINICAL_SNAPSHOT_KEY.format(user_id=user_id)
+
+        async def update(pipe) -> None:
+            snapshot = self._decode(user_id, await pipe.hgetall(key))
+            pipe.multi()
+            self._advance_generation(pipe, user_id)
+            # 스냅샷이 없으면 다음 조회 때 DB에서 만듭니다. (세대가 바뀌었으므로 진행 중인 재구성도 저장되지 않음)
+            if snapshot is None:
+                return
+            setattr(snapshot, section, apply(getattr(snapshot, section)))
+            pipe.hset(key, mapping={section: orjson.dumps(getattr(snapshot, section)), "context": snapshot.render()})
+            pipe.expire(key, config.CLINICAL_SNAPSHOT_TTL_SECONDS)
+
+        await redis_client.transaction(update, key)
+        self.metrics.incr(f"{section}_updated")
+        await self.metrics.maybe_flush()
+
+    @staticmethod
+    def _advance_generation(pipe, user_id: str) -> None:
+        generation_key = CLINICAL_SNAPSHOT_GENERATION_KEY.format(user_id=user_id)
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, config.CLINICAL_SNAPSHOT_TTL_SECONDS)
+
+    @staticmethod
+    def _encode(snapshot: ClinicalSnapshot) -> dict[str, Any]:
+        fields = asdict(snapshot)
+        return {
+            "version": SNAPSHOT_VERSION,
+            "built_at": time.time(),
+            "demographics": snapshot.demographics,
+            "context": snapshot.render(),
+            **{section: orjson.dumps(fields[section]) for section in SECTIONS},
+        }
+
+    @staticmethod
+    def _decode(user_id: str, raw: dict[str, str]) -> ClinicalSnapshot | None:
+        if not raw or raw.get("version") != str(SNAPSHOT_VERSION):
+            return None
+        return ClinicalSnapshot(
+            user_id=user_id,
+            demographics=raw.get("demographics", ""),
+            **{section: orjson.loads(raw.get(section, "[]")) for section in SECTIONS},
+        )
+
+    @staticmethod
+    def _canonical(value: Any) -> Any:
+        # 목록 순서가 의미 없는 섹션(기저질환/알러지/복용약)도 함께 비교하도록 ID 순으로 맞춥니다.
+        if isinstance(value, list):
+            return sorted(value, key=lambda item: item["id"])
+        return value
+
+
+clinical_snapshots = ClinicalSnapshotStore()
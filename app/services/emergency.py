@@ -0,0 +1,164 @@
+import json
+import re
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from app.core import config
+
+# 호환용 자모(ㄱ, ㅏ 등)로 따로 입력된 글자를 음절로 합치기 위한 표
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_JAMO_RUN = re.compile(r"[ㄱ-ㅣ]{2,}")
+_NON_TEXT = re.compile(r"[^0-9a-z가-힣]")
+
+
+def _compose_jamo(text: str) -> str:
+    """
+    "ㅅㅜㅁ이 차요"처럼 자모 단위로 입력된 구간을 음절("숨")로 합칩니다. (초성 + 중성 [+ 종성])
+    """
+    result: list[str] = []
+    index, length = 0, len(text)
+    while index < length:
+        char = text[index]
+        nxt = text[index + 1] if index + 1 < length else ""
+        if char in _CHOSEONG and nxt and nxt in _JUNGSEONG:
+            code = (_CHOSEONG.index(char) * 21 + _JUNGSEONG.index(nxt)) * 28
+            index += 2
+            # 뒤따르는 자음은 다음 글자의 초성(자음 + 모음)이 아닐 때만 받침으로 붙입니다.
+            final = text[index] if index < length else ""
+            after = text[index + 1] if index + 1 < length else ""
+            if final and final in _JONGSEONG[1:] and not (after and after in _JUNGSEONG):
+                code += _JONGSEONG.index(final)
+                index += 1
+            result.append(chr(0xAC00 + code))
+            continue
+        result.append(char)
+        index += 1
+    return "".join(result)
+
+
+def normalize_symptom_text(text: str) -> str:
+    """
+    증상 검사용 정규화: 분리 입력된 자모를 음절로 합치고, 유니코드 호환 문자(전각 등)와 대소문자를 통일한 뒤
+    한글 음절/영문/숫자 외의 문자(공백, 문장부호, "ㅠㅠ" 같은 단독 자모)를 제거합니다.
+    띄어쓰기가 달라도("숨이 차요", "숨이차요") 같은 문자열이 됩니다.
+    """
+    text = _JAMO_RUN.sub(lambda run: _compose_jamo(run.group()), unicodedata.normalize("NFC", text))
+    return _NON_TEXT.sub("", unicodedata.normalize("NFKC", text).lower())
+
+
+@dataclass
+class SymptomMatch:
+    category: str
+    severity: str
+    term: str
+
+
+@dataclass
+class SymptomScan:
+    severity: str | None = None  # 가장 높은 위험도 (없으면 None)
+    categories: list[str] = field(default_factory=list)  # 위험도 순
+    matches: list[SymptomMatch] = field(default_factory=list)
+
+    @property
+    def is_emergency(self) -> bool:
+        return self.severity == "emergency"
+
+
+class EmergencyDetector:
+    """
+    증상 사전 전체를 Aho–Corasick 오토마톤 하나로 컴파일해 정규화된 문장을 한 번만 훑어 모든 증상 표현을 찾는 검출기입니다.
+    검사 비용은 사전 크기와 무관하게 문장 길이에 비례하며, 사전의 오타/변형 표현도 같은 오토마톤에 들어갑니다.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.version: str = data.get("version", "unversioned")
+        self._severity_rank = {severity: rank for rank, severity in enumerate(data["severities"])}
+
+        self._patterns: list[SymptomMatch] = []
+        for category, info in data["categories"].items():
+            if info["severity"] not in self._severity_rank:
+                raise ValueError(f"category {category} has unknown severity: {info['severity']}")
+            for term in (*info["terms"], *info.get("variants", [])):
+                self._patterns.append(SymptomMatch(category, info["severity"], term))
+
+        # 상태 0이 루트. 상태별 전이, 실패 링크, 그 상태에서 끝나는 패턴(실패 링크 쪽 출력 포함)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        for pattern_id, pattern in enumerate(self._patterns):
+            self._insert(normalize_symptom_text(pattern.term), pattern_id)
+        self._link()
+
+    @classmethod
+    def from_file(cls, path: str) -> "EmergencyDetector":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _insert(self, key: str, pattern_id: int) -> None:
+        if not key:
+            raise ValueError(f"empty symptom term: {self._patterns[pattern_id].term!r}")
+        state = 0
+        for char in key:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append(pattern_id)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+                queue.append(child)
+
+    def scan(self, text: str) -> SymptomScan:
+        """
+        문장에서 증상 표현을 찾습니다.
+
+        Args:
+            text (str): 사용자 메시지 또는 생성된 가이드 문구
+
+        Returns:
+            SymptomScan: 가장 높은 위험도, 걸린 분류(위험도 순), 일치한 사전 표현
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found: dict[int, None] = {}
+        state = 0
+        for char in normalize_symptom_text(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                found[pattern_id] = None
+
+        if not found:
+            return SymptomScan()
+        matches = sorted(
+            (self._patterns[pattern_id] for pattern_id in found), key=lambda match: self._severity_rank[match.severity]
+        )
+        return SymptomScan(
+            severity=matches[0].severity,
+            categories=list(dict.fromkeys(match.category for match in matches)),
+            matches=matches,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_emergency_detector() -> EmergencyDetector:
+    """
+    프로세스당 한 번 증상 사전을 적재해 오토마톤을 만듭니다.
+    """
+    return EmergencyDetector.from_file(config.EMERGENCY_LEXICON_PATH)
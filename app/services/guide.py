@@ -1,34 +1,227 @@
+import asyncio
+from typing import Any
+
+import orjson
+
+from app.core import config, default_logger
 from app.dtos.guide import GuideRequest, GuideResponse
+from app.models.llm_life_guide import LLMLifeGuide
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.emergency import get_emergency_detector
+from app.services.llm import LLMClient
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+from app.utils.single_flight import SingleFlight, flight_digest
+
+GUIDE_CACHE_KEY = "guide:cache:{user_id}"  # HASH fingerprint/guide(JSON): 마지막 가이드와 생성 당시 프로필 지문
+GUIDE_FINGERPRINT_KEY = "guide:fingerprint:{user_id}"  # 현재 건강 프로필 지문 (프로필이 바뀌면 삭제)
+
+# 가이드 생성 버튼 연타, 모바일 재시도, 여러 탭에서 같은 프로필로 동시에 요청해도 한 번만 생성/저장합니다.
+guide_flights = SingleFlight("guide")
+# 프로필 변경 후 재생성 대기 중인 사용자 ID (대기 중 연속 수정은 한 번의 재생성으로 묶음)와 태스크 참조
+_pending_regenerations: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
 
 
 class GuideService:
+    def __init__(self):
+        self.detector = get_emergency_detector()
+        self.llm = LLMClient()
+        self.metrics = get_metrics_recorder("guide_cache")
+
+    def is_emergency_alert(self, text: str) -> bool:
+        """
+        가이드 문구에 응급 증상 표현이 포함되어 있는지 검사합니다. (LLMLifeGuide.is_emergency_alert)
+
+        Args:
+            text (str): 생성된 가이드 문구 또는 사용자 현재 상태
+
+        Returns:
+            bool: 응급 수준 증상 포함 여부
+        """
+        return self.detector.scan(text).is_emergency
+
+    async def get_or_generate(self, user: User, refresh: bool = False) -> dict[str, Any]:
+        """
+        사용자의 가이드를 반환합니다.
+        건강 프로필(기저질환/알러지/복용약/연령대·성별) 지문이 마지막 가이드를 만들 때와 같으면 저장된 가이드를 바로 반환하고,
+        프로필이 바뀌었으면 기존 가이드를 is_stale로 표시해 반환하면서 재생성을 백그라운드로 예약합니다.
+        가이드가 아직 없거나 refresh면 요청 안에서 생성하며, 같은 프로필의 생성 요청이 동시에 들어오면 한 번만 생성합니다. (SingleFlight)
+
+        Args:
+            user (User): 요청 사용자
+            refresh (bool): 프로필 변경과 무관하게 지금 다시 생성할지 여부
+
+        Returns:
+            dict: 가이드 정보 (guide_id, guide_type, user_current_status, generated_content, is_emergency_alert,
+                created_at, refreshed, is_stale)
+        """
+        if refresh:
+            return {**await self._generate(await self.build_request(user)), "refreshed": True, "is_stale": False}
+
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(GUIDE_FINGERPRINT_KEY.format(user_id=user.id))
+            pipe.hmget(GUIDE_CACHE_KEY.format(user_id=user.id), "fingerprint", "guide")
+            fingerprint, (cached_fingerprint, cached_guide) = await pipe.execute()
+        if fingerprint is None:
+            fingerprint = await self._remember_fingerprint(user.id, await self.build_request(user))
+
+        if cached_guide is not None and cached_fingerprint == fingerprint:
+            self.metrics.incr("hit")
+            await self.metrics.maybe_flush()
+            return {**orjson.loads(cached_guide), "refreshed": False, "is_stale": False}
+
+        if cached_guide is not None:
+            guide = orjson.loads(cached_guide)
+        else:
+            latest = await LLMLifeGuide.filter(user=user).order_by("-created_at").first()
+            guide = self._serialize(latest) if latest is not None else None
+        if guide is None:  # 첫 가이드는 돌려줄 것이 없으므로 바로 생성
+            self.metrics.incr("generated")
+            return {**await self._generate(await self.build_request(user)), "refreshed": True, "is_stale": False}
+
+        self.metrics.incr("stale")
+        await self.metrics.maybe_flush()
+        self.schedule_regeneration(user)
+        return {**guide, "refreshed": False, "is_stale": True}
+
+    async def invalidate_profile(self, user: User) -> None:
+        """
+        건강 프로필(기저질환/알러지/복용약)이 바뀌었을 때 호출합니다. 프로필 지문을 지우고 가이드 재생성을 백그라운드로 예약합니다.
+
+        Args:
+            user (User): 프로필이 바뀐 사용자
+        """
+        await redis_client.delete(GUIDE_FINGERPRINT_KEY.format(user_id=user.id))
+        self.schedule_regeneration(user)
+
+    def schedule_regeneration(self, user: User) -> None:
+        """
+        GUIDE_REGENERATE_DELAY_SECONDS 뒤에 현재 프로필로 가이드를 다시 만듭니다. 이미 대기 중인 재생성이 있으면 그것에 맡깁니다.
+        (여러 API 워커에서 예약돼도 프로필이 같으면 SingleFlight로 한 번만 생성)
+        """
+        if user.id in _pending_regenerations:
+            return
+        _pending_regenerations.add(user.id)
+        task = asyncio.create_task(self._regenerate(user))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _regenerate(self, user: User) -> None:
+        try:
+            await asyncio.sleep(config.GUIDE_REGENERATE_DELAY_SECONDS)
+        finally:
+            _pending_regenerations.discard(user.id)  # 생성 중에 들어온 프로필 변경은 새 재생성으로 예약
+        try:
+            request = await self.build_request(user)
+            fingerprint = await self._remember_fingerprint(user.id, request)
+            cache_key = GUIDE_CACHE_KEY.format(user_id=user.id)
+            cached_fingerprint = await redis_client.hget(cache_key, "fingerprint")
+            if cached_fingerprint == fingerprint:
+                return
+            # 가이드를 한 번도 만들지 않은 사용자는 요청할 때 생성합니다.
+            if cached_fingerprint is None and not await LLMLifeGuide.exists(user=user):
+                return
+            await self._generate(request)
+            self.metrics.incr("regenerated")
+            await self.metrics.maybe_flush()
+        except Exception:
+            default_logger.exception("guide regeneration failed for %s", user.id)
+
+    async def build_request(self, user: User) -> GuideRequest:
+        """
+        사용자의 기저질환/알러지/복용약과 연령대·성별로 가이드 생성 요청을 만듭니다. (요청 내용의 해시가 프로필 지문)
+        """
+        snapshot = await clinical_snapshots.get(user)
+        records = f"기저질환: {', '.join(snapshot.disease_names) or '없음'} / 알러지: {', '.join(snapshot.allergy_names) or '없음'}"
+        return GuideRequest(
+            user_id=user.id,
+            medical_records=f"{snapshot.demographics} / {records}" if snapshot.demographics else records,
+            medication_info=", ".join(snapshot.med_names) or "없음",
+        )
+
+    async def _remember_fingerprint(self, user_id: str, request: GuideRequest) -> str:
+        fingerprint = flight_digest(request.model_dump())
+        await redis_client.set(
+            GUIDE_FINGERPRINT_KEY.format(user_id=user_id), fingerprint, ex=config.GUIDE_FINGERPRINT_TTL_SECONDS
+        )
+        return fingerprint
+
+    async def _generate(self, request: GuideRequest) -> dict[str, Any]:
+        return await guide_flights.run(
+            request.model_dump(), lambda: self._generate_and_cache(request), timeout=config.LLM_TIMEOUT_SECONDS
+        )
+
+    async def _generate_and_cache(self, request: GuideRequest) -> dict[str, Any]:
+        guide = self._serialize(await self._create(request))
+        cache_key = GUIDE_CACHE_KEY.format(user_id=request.user_id)
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                cache_key, mapping={"fingerprint": flight_digest(request.model_dump()), "guide": orjson.dumps(guide)}
+            )
+            pipe.expire(cache_key, config.GUIDE_CACHE_TTL_SECONDS)
+            await pipe.execute()
+        return guide
+
+    async def _create(self, request: GuideRequest) -> LLMLifeGuide:
+        """
+        LLM으로 가이드를 생성해 저장합니다.
+        """
+        guide_text = await self.llm.complete(
+            [
+                {"role": "system", "content": config.GUIDE_SYSTEM_PROMPT},
+                {"role": "user", "content": f"{request.medical_records}\n복용 중인 약: {request.medication_info}"},
+            ]
+        )
+        emergency = self.is_emergency_alert(f"{request.medical_records}\n{guide_text}")
+        return await LLMLifeGuide.create(
+            user_id=request.user_id,
+            guide_type="응급" if emergency else "복약",
+            user_current_status=f"{request.medical_records} / 복용약: {request.medication_info}",
+            generated_content=guide_text,
+            is_emergency_alert=emergency,
+        )
+
+    @staticmethod
+    def _serialize(guide: LLMLifeGuide) -> dict[str, Any]:
+        return {
+            "guide_id": guide.id,
+            "guide_type": guide.guide_type,
+            "user_current_status": guide.user_current_status,
+            "generated_content": guide.generated_content,
+            "is_emergency_alert": guide.is_emergency_alert,
+            "created_at": guide.created_at.isoformat(),
+        }
+
     # ==========================================
     # [추가된 기능] 필수 1: LLM 기반 안내 가이드 생성
     # ==========================================
     async def generate_guide(self, request: GuideRequest) -> GuideResponse:
         """
-        사용자의 진료/복약 상세 정보를 결합하여 맞춤형 건강 가이드를 생성합니다.
+        사용자의 진료/복약 상세 정보를 결합하여 맞춤형 건강 가이드를 생성하고 저장합니다.
         멀티모달 에셋 생성을 위한 기본 메타데이터를 포함합니다.
-        
+
         Args:
             request (GuideRequest): 사용자 ID 및 의료 정보 (진료 기록, 복약 정보 등)
-            
+
         Returns:
             GuideResponse: 생성된 가이드 텍스트, 분류, 위험도 및 구조화된 요약 정보
+
+        Raises:
+            HTTPException: LLM 백엔드 연결 실패 또는 오류 응답(502)
         """
-        # TODO: LLM 연동 또는 ai_worker 통신 로직 구현 (진료 기록 + 복약 정보 결합)
-        # 1. request.medical_records와 request.medication_info를 바탕으로 프롬프트 생성
-        # 2. AI 모델 기반 응답 생성
-        dummy_text = f"사용자 {request.user_id}님을 위한 맞춤형 복약 및 생활습관 가이드입니다. (더미 데이터)"
+        guide = await self._create(request)
+        scan = self.detector.scan(f"{request.medical_records}\n{guide.generated_content}")
         return GuideResponse(
-            id=999,
-            guide_type="복약",
-            risk_level="Low",
-            guide_text=dummy_text,
+            id=guide.id,
+            guide_type=guide.guide_type,
+            risk_level="Emergency" if scan.is_emergency else "Medium" if scan.severity else "Low",
+            guide_text=guide.generated_content,
             structured_content={
-                "profile_summary": "30대 남성, 기저 질환 없음",
-                "ocr_summary": "감기약 (항생제/소염제)",
-                "warnings": ["부작용 주의", "술 금지"]
+                "profile_summary": request.medical_records,
+                "ocr_summary": request.medication_info,
+                "warnings": scan.categories,
             },
             multimodal_assets=[]
         )
@@ -0,0 +1,287 @@
+import asyncio
+import base64
+import hashlib
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
+
+import orjson
+from fastapi import HTTPException, status
+
+from app.core import config
+from app.services.blob_store import BlobStore, blob_store
+from app.services.inference_cache import InferenceResultCache, inference_result_cache
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+from app.utils.request_scope import current_request_scope
+
+# ai_worker/schemas/jobs.py와 동일하게 유지해야 하는 큐/결과 키
+JOB_QUEUE_KEY = "ai:jobs:{task}:{priority}"
+# 우선순위 레인: interactive(사용자가 응답을 기다리는 요청), bulk(야간 가이드 갱신/TTS 백필 등 일괄 작업),
+# speculative(업로드 시점 예측 분석). 워커는 레인별 가중치에 따라 공정하게 나눠 소비합니다.
+Priority = Literal["interactive", "bulk", "speculative"]
+JOB_RESULT_KEY = "ai:results:{job_id}"
+# 업로드 시점에 미리 시작한 예측 분석 작업 (원본 작업 JSON). 분석 요청이 가져가지 않으면 만료됩니다.
+SPECULATIVE_JOB_KEY = "ai:speculative:{task}:{image_hash}"
+# 작업 취소: 취소 키(큐에서 대기 중인 작업은 워커가 꺼낼 때 확인)와 취소 채널(처리 중인 작업에 즉시 전달)
+CANCEL_KEY = "ai:cancel:{job_id}"
+CANCEL_CHANNEL = "ai:cancel"
+
+# 클라이언트가 응답을 받기 전에 연결을 끊은 경우 (nginx 관례)
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+# 워커가 최종 결과 전에 게시하는 부분 결과(예: PDF 페이지별 OCR 결과)를 받는 콜백
+PartialCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class InferenceClient:
+    """
+    Redis 작업 큐를 통해 ai_worker에 추론을 요청하고 결과를 기다리는 클라이언트입니다.
+    이미지 기반 작업은 큐에 넣기 전에 추론 결과 캐시와 업로드 시점에 시작된 예측 분석 작업을 먼저 확인합니다.
+    """
+
+    def __init__(self, cache: InferenceResultCache | None = None, blobs: BlobStore | None = None):
+        self.cache = cache or inference_result_cache
+        self.blobs = blobs or blob_store
+        self.metrics = get_metrics_recorder("speculative_analysis")
+        self.cancel_metrics = get_metrics_recorder("job_cancellation")
+
+    @staticmethod
+    def deadline() -> float:
+        """
+        지금 등록하는 작업의 마감 시각(unix epoch 초)입니다. 요청 안이면 요청의 마감 시각을 그대로 사용합니다.
+        """
+        scope = current_request_scope.get()
+        if scope is not None:
+            return scope.deadline
+        return time.time() + config.AI_REQUEST_DEADLINE_SECONDS
+
+    async def submit(
+        self, task: str, payload: dict[str, Any], priority: Priority = "interactive", deadline: float | None = None
+    ) -> str:
+        """
+        작업을 워커 큐에 등록합니다.
+
+        Args:
+            task (str): 워커 작업 종류 (cnn, ocr 등)
+            payload (dict): 작업 입력 데이터
+            priority (Priority): 우선순위 레인
+            deadline (float | None): 마감 시각 (unix epoch 초), 생략 시 deadline()
+
+        Returns:
+            str: 결과 조회에 사용할 작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        job = {"job_id": job_id, "task": task, "payload": payload, "deadline": deadline or self.deadline()}
+        await redis_client.rpush(JOB_QUEUE_KEY.format(task=task, priority=priority), orjson.dumps(job))
+        return job_id
+
+    async def cancel(self, job_id: str) -> None:
+        """
+        더 이상 결과를 기다리지 않는 작업의 취소를 게시합니다.
+        큐에서 대기 중인 작업은 워커가 꺼낼 때 취소 키를 보고 건너뛰고, 처리 중인 작업은 취소 채널을 받아 다음 단계 전에 중단합니다.
+        """
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(CANCEL_KEY.format(job_id=job_id), 1, ex=config.AI_CANCEL_TTL_SECONDS)
+            pipe.publish(CANCEL_CHANNEL, job_id)
+            await pipe.execute()
+
+    async def speculate(self, task: str, image_bytes: bytes, mode: str | None = None) -> bool:
+        """
+        곧 분석 요청이 올 것으로 예상되는 업로드 이미지를 speculative 레인으로 미리 추론합니다.
+        이후 같은 이미지에 대한 run_image_task는 새 작업을 만들지 않고 이 작업의 결과를 이어받습니다.
+
+        Args:
+            task (str): 워커 작업 종류 (cnn, ocr)
+            image_bytes (bytes): 업로드 이미지 바이너리
+            mode (str | None): 작업 세부 모드
+
+        Returns:
+            bool: 작업을 새로 등록했는지 여부 (이미 캐시에 있거나 진행 중이면 False)
+        """
+        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        cache_task = f"{task}:{mode}" if mode else task
+        model_version = await self.cache.current_model_version(task)
+        if model_version is not None and await self.cache.get(image_hash, cache_task, model_version) is not None:
+            return False
+
+        # 예측 작업은 분석 요청이 가져갈 때까지 기다려야 하므로 업로드 요청이 아닌 등록 기한 기준으로 마감 시각을 잡습니다.
+        job = orjson.dumps(
+            {
+                "job_id": uuid.uuid4().hex,
+                "task": task,
+                "payload": await self._image_payload(image_bytes, image_hash, mode),
+                "deadline": time.time() + config.SPECULATIVE_RESULT_TTL_SECONDS + config.AI_REQUEST_DEADLINE_SECONDS,
+            }
+        )
+        registered = await redis_client.set(
+            SPECULATIVE_JOB_KEY.format(task=cache_task, image_hash=image_hash),
+            job,
+            nx=True,
+            ex=config.SPECULATIVE_RESULT_TTL_SECONDS,
+        )
+        if not registered:
+            return False
+        await redis_client.rpush(JOB_QUEUE_KEY.format(task=task, priority="speculative"), job)
+        self.metrics.incr("started")
+        await self.metrics.maybe_flush()
+        return True
+
+    async def _claim_speculative(self, task: str, cache_task: str, image_hash: str) -> str | None:
+        """
+        같은 이미지의 예측 분석 작업이 있으면 가져오고 작업 ID를 반환합니다. (GETDEL이므로 한 요청만 가져감)
+        아직 speculative 레인에서 대기 중이라면 interactive 레인 맨 앞으로 옮겨 사용자 요청과 같은 우선순위로 처리되게 합니다.
+        """
+        job = await redis_client.getdel(SPECULATIVE_JOB_KEY.format(task=cache_task, image_hash=image_hash))
+        if job is None:
+            return None
+        if await redis_client.lrem(JOB_QUEUE_KEY.format(task=task, priority="speculative"), 1, job):
+            await redis_client.lpush(JOB_QUEUE_KEY.format(task=task, priority="interactive"), job)
+            self.metrics.incr("promoted")
+        self.metrics.incr("claimed")
+        return orjson.loads(job)["job_id"]
+
+    async def wait(
+        self, job_id: str, timeout: float | None = None, on_partial: PartialCallback | None = None
+    ) -> dict[str, Any]:
+        """
+        워커가 결과를 게시할 때까지 대기합니다.
+        부분 결과가 도착하면 on_partial로 넘기고 대기 시간을 다시 시작하므로,
+        페이지가 많은 PDF처럼 오래 걸리는 작업도 진행이 멈추지 않는 한 시간 초과되지 않습니다.
+
+        결과를 받지 못하고 끝나는 경우(시간 초과, 요청 마감, 클라이언트 연결 끊김, 대기 태스크 취소)에는
+        작업 취소를 게시해 워커가 아무도 읽지 않을 결과를 계산하지 않게 합니다.
+
+        Args:
+            job_id (str): submit이 반환한 작업 ID
+            timeout (float | None): 결과(또는 다음 부분 결과)를 기다릴 최대 시간(초), 생략 시 AI_JOB_TIMEOUT_SECONDS
+            on_partial (PartialCallback | None): 부분 결과 콜백
+
+        Returns:
+            dict: 워커가 반환한 추론 결과
+
+        Raises:
+            HTTPException: 시간 초과(504), 클라이언트 연결 끊김(499) 또는 워커 처리 실패(502)
+        """
+        scope = current_request_scope.get()
+        idle_timeout = timeout or config.AI_JOB_TIMEOUT_SECONDS
+        idle_until = time.monotonic() + idle_timeout
+        try:
+            while True:
+                remaining = idle_until - time.monotonic()
+                if scope is not None:
+                    remaining = min(remaining, scope.remaining_seconds)
+                if remaining <= 0:
+                    await self._abandon(job_id, "timeout")
+                    raise HTTPException(
+                        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                        detail="AI 분석 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요.",
+                    )
+
+                # 요청 안에서는 짧게 나눠 기다리며 그 사이 클라이언트 연결이 끊겼는지 확인합니다. (BLPOP timeout 0은 무한 대기)
+                poll = min(remaining, config.AI_DISCONNECT_POLL_SECONDS) if scope is not None else remaining
+                item = await redis_client.blpop([JOB_RESULT_KEY.format(job_id=job_id)], timeout=max(poll, 0.01))
+                if item is None:
+                    if scope is not None and await scope.is_disconnected():
+                        await self._abandon(job_id, "disconnected")
+                        raise HTTPException(
+                            status_code=HTTP_499_CLIENT_CLOSED_REQUEST, detail="클라이언트 연결이 끊겼습니다."
+                        )
+                    continue
+
+                response = orjson.loads(item[1])
+                if response.get("status") != "partial":
+                    break
+                idle_until = time.monotonic() + idle_timeout
+                if on_partial is not None:
+                    await on_partial(response["result"])
+        except asyncio.CancelledError:
+            # 호출한 쪽이 대기를 그만둔 경우 (예: 알약 분석에서 먼저 끝난 작업이 나머지를 취소)
+            await asyncio.shield(self._abandon(job_id, "abandoned"))
+            raise
+
+        if response.get("status") != "success":
+            raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="AI 분석 중 오류가 발생했습니다.")
+        return response["result"]
+
+    async def _abandon(self, job_id: str, reason: str) -> None:
+        await self.cancel(job_id)
+        self.cancel_metrics.incr(reason)
+        await self.cancel_metrics.maybe_flush()
+
+    async def run(
+        self,
+        task: str,
+        payload: dict[str, Any],
+        on_partial: PartialCallback | None = None,
+        priority: Priority = "interactive",
+    ) -> dict[str, Any]:
+        """
+        작업을 등록하고 결과를 받을 때까지 기다립니다.
+        """
+        job_id = await self.submit(task, payload, priority)
+        return await self.wait(job_id, on_partial=on_partial)
+
+    async def run_image_task(
+        self, task: str, image_bytes: bytes, mode: str | None = None, on_partial: PartialCallback | None = None
+    ) -> dict[str, Any]:
+        """
+        이미지 추론을 캐시 우선으로 수행합니다.
+        (sha256(이미지), task[:mode], 현재 모델 버전) 키로 캐시를 조회하고, 미스일 때만 워커 큐에 작업을 넣습니다.
+
+        Args:
+            task (str): 워커 작업 종류 (cnn, ocr)
+            image_bytes (bytes): 분석할 이미지 바이너리
+            mode (str | None): 작업 세부 모드 (예: ocr의 prescription/imprint, cnn의 classify)
+            on_partial (PartialCallback | None): 부분 결과 콜백 (캐시 적중 시에는 호출되지 않음)
+
+        Returns:
+            dict: 추론 결과 (model_version 포함)
+
+        Raises:
+            HTTPException: 시간 초과(504) 또는 워커 처리 실패(502)
+        """
+        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        cache_task = f"{task}:{mode}" if mode else task
+
+        model_version = await self.cache.current_model_version(task)
+        if model_version is not None:
+            cached = await self.cache.get(image_hash, cache_task, model_version)
+            if cached is not None:
+                return cached
+
+        result = None
+        job_id = await self._claim_speculative(task, cache_task, image_hash)
+        if job_id is not None:
+            try:
+                result = await self.wait(job_id, on_partial=on_partial)
+            except HTTPException as err:
+                # 클라이언트가 떠났거나 요청 마감이 지났으면 다시 요청해도 읽을 쪽이 없습니다.
+                if err.status_code == HTTP_499_CLIENT_CLOSED_REQUEST or self.deadline() <= time.time():
+                    raise
+                # 예측 작업이 실패했거나 만료되었으면 처음부터 다시 요청합니다.
+                self.metrics.incr("failed")
+        await self.metrics.maybe_flush()
+        if result is None:
+            payload = await self._image_payload(image_bytes, image_hash, mode)
+            result = await self.run(task, payload, on_partial=on_partial)
+
+        # 롤링 배포 중에는 이전 버전 워커의 결과도 섞여 오므로 게시된 현재 버전으로 만든 결과만 저장합니다.
+        if result["model_version"] == await self.cache.current_model_version(task):
+            await self.cache.set(image_hash, cache_task, result["model_version"], result)
+        return result
+
+    async def _image_payload(self, image_bytes: bytes, image_hash: str, mode: str | None) -> dict[str, Any]:
+        """
+        작업 페이로드의 이미지 부분을 만듭니다. blob 방식이면 공유 저장소에 쓰고 참조만 넣어
+        base64(+33%) 인코딩과 Redis 메모리/네트워크 복사를 피합니다.
+        """
+        payload: dict[str, Any] = {"image_sha256": image_hash}
+        if config.AI_IMAGE_HANDOFF == "blob":
+            payload["blob"] = await self.blobs.put(image_bytes, image_hash)
+        else:
+            payload["image_b64"] = base64.b64encode(image_bytes).decode()
+        if mode:
+            payload["mode"] = mode
+        return payload
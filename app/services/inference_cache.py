@@ -0,0 +1,149 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+import msgpack
+
+from app.core import config
+from app.utils.common import redis_binary_client, redis_client
+from app.utils.metrics import get_metrics_recorder
+
+# ai_worker가 기동 시 자신이 서빙하는 모델 버전을 기록하는 해시 (ai_worker/schemas/jobs.py와 동일하게 유지)
+MODEL_VERSIONS_KEY = "ai:model_versions"
+CACHE_ENTRY_KEY = "ai:cache:{task}:{model_version}:{image_hash}"
+# 모델 버전별로 저장된 캐시 키 목록 (버전 교체 시 일괄 삭제용)
+CACHE_INDEX_KEY = "ai:cache-index:{task}:{model_version}"
+
+CacheKey = tuple[str, str, str]
+
+
+class InferenceResultCache:
+    """
+    (sha256(이미지), task, model_version)을 키로 하는 2단계 추론 결과 캐시입니다.
+    1단계는 프로세스 내 LRU, 2단계는 Redis(msgpack 직렬화)이며,
+    ai_worker가 새 모델 버전을 게시하면 이전 버전 항목은 조회 대상에서 빠지고 일괄 삭제됩니다.
+    """
+
+    def __init__(self, local_size: int, ttl_seconds: int, version_refresh_seconds: int):
+        self.local_size = local_size
+        self.ttl_seconds = ttl_seconds
+        self.version_refresh_seconds = version_refresh_seconds
+        self._local: OrderedDict[CacheKey, dict[str, Any]] = OrderedDict()
+        self._model_versions: dict[str, str] = {}
+        self._versions_loaded_at: float | None = None
+        self.metrics = get_metrics_recorder("inference_cache")
+
+    async def current_model_version(self, model_task: str) -> str | None:
+        """
+        ai_worker가 게시한 현재 모델 버전을 반환합니다.
+        Redis 조회는 version_refresh_seconds 간격으로만 수행합니다.
+
+        Args:
+            model_task (str): 워커 작업 종류 (cnn, ocr 등)
+
+        Returns:
+            str | None: 현재 모델 버전 (워커가 아직 게시하지 않았다면 None)
+        """
+        now = time.monotonic()
+        if self._versions_loaded_at is None or now - self._versions_loaded_at >= self.version_refresh_seconds:
+            self._versions_loaded_at = now
+            for task, version in (await redis_client.hgetall(MODEL_VERSIONS_KEY)).items():
+                await self.observe_model_version(task, version)
+        return self._model_versions.get(model_task)
+
+    async def observe_model_version(self, model_task: str, model_version: str) -> None:
+        """
+        ai_worker가 게시한(ai:model_versions) 모델 버전을 반영합니다. 게시 버전이 바뀌었다면 이전 버전의 캐시 항목을 무효화합니다.
+        롤링 배포 중에는 이전/새 버전 워커의 결과가 번갈아 오므로 개별 결과의 버전으로는 호출하지 않습니다.
+        (게시 값은 워커가 기동할 때만 바뀌므로 결과마다 버전이 뒤집히며 서로의 항목을 지우지 않음)
+
+        Args:
+            model_task (str): 워커 작업 종류
+            model_version (str): 게시된 모델 버전
+        """
+        previous = self._model_versions.get(model_task)
+        self._model_versions[model_task] = model_version
+        if previous is None or previous == model_version:
+            return
+
+        stale = [key for key in self._local if key[1].split(":")[0] == model_task and key[2] == previous]
+        for key in stale:
+            del self._local[key]
+
+        index_keys = [
+            key
+            async for key in redis_client.scan_iter(
+                match=CACHE_INDEX_KEY.format(task=f"{model_task}*", model_version=previous)
+            )
+        ]
+        for index_key in index_keys:
+            entry_keys = await redis_client.smembers(index_key)
+            if entry_keys:
+                await redis_client.unlink(*entry_keys)
+            await redis_client.unlink(index_key)
+        self.metrics.incr("invalidated_versions")
+
+    async def get(self, image_hash: str, task: str, model_version: str) -> dict[str, Any] | None:
+        """
+        로컬 LRU → Redis 순서로 캐시된 추론 결과를 조회합니다.
+
+        Args:
+            image_hash (str): 이미지 바이트의 sha256 hex
+            task (str): 캐시 구분용 작업 이름 (예: cnn, ocr:imprint)
+            model_version (str): 모델 버전
+
+        Returns:
+            dict | None: 캐시된 추론 결과 (없으면 None)
+        """
+        key = (image_hash, task, model_version)
+        if key in self._local:
+            self._local.move_to_end(key)
+            self.metrics.incr("hit_local")
+            await self.metrics.maybe_flush()
+            return self._local[key]
+
+        packed = await redis_binary_client.get(
+            CACHE_ENTRY_KEY.format(task=task, model_version=model_version, image_hash=image_hash)
+        )
+        if packed is None:
+            self.metrics.incr("miss")
+            await self.metrics.maybe_flush()
+            return None
+
+        result = msgpack.unpackb(packed)
+        self._remember(key, result)
+        self.metrics.incr("hit_redis")
+        await self.metrics.maybe_flush()
+        return result
+
+    async def set(self, image_hash: str, task: str, model_version: str, result: dict[str, Any]) -> None:
+        """
+        추론 결과를 로컬 LRU와 Redis에 저장합니다.
+
+        Args:
+            image_hash (str): 이미지 바이트의 sha256 hex
+            task (str): 캐시 구분용 작업 이름
+            model_version (str): 결과를 만든 모델 버전
+            result (dict): 워커가 반환한 추론 결과
+        """
+        self._remember((image_hash, task, model_version), result)
+        entry_key = CACHE_ENTRY_KEY.format(task=task, model_version=model_version, image_hash=image_hash)
+        index_key = CACHE_INDEX_KEY.format(task=task, model_version=model_version)
+        async with redis_binary_client.pipeline(transaction=False) as pipe:
+            pipe.setex(entry_key, self.ttl_seconds, msgpack.packb(result, use_bin_type=True))
+            pipe.sadd(index_key, entry_key)
+            pipe.expire(index_key, self.ttl_seconds)
+            await pipe.execute()
+
+    def _remember(self, key: CacheKey, result: dict[str, Any]) -> None:
+        self._local[key] = result
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+
+inference_result_cache = InferenceResultCache(
+    local_size=config.INFERENCE_CACHE_LOCAL_SIZE,
+    ttl_seconds=config.INFERENCE_CACHE_TTL_SECONDS,
+    version_refresh_seconds=config.INFERENCE_MODEL_VERSION_REFRESH_SECONDS,
+)
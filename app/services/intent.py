@@ -0,0 +1,99 @@
+import json
+import math
+import os
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from app.core import config
+
+INTENT_LABELS = ("복약", "증상", "일반", "시스템")
+
+
+@lru_cache(maxsize=65536)
+def _slot(ngram: str, n_features: int) -> tuple[int, float]:
+    digest = zlib.crc32(ngram.encode())
+    return digest % n_features, -1.0 if digest & 0x80000000 else 1.0
+
+
+def intent_features(text: str, n_features: int, ngram_range: tuple[int, int] = (1, 3)) -> dict[int, float]:
+    """
+    어절 경계를 포함한 문자 n-gram을 CRC32로 해싱한 L2 정규화 특징 벡터(희소)를 만듭니다.
+    학습 스크립트(scripts/train_intent_classifier.py)와 추론이 같은 함수를 사용합니다.
+    해시 최상위 비트로 부호를 번갈아 주어 충돌한 특징끼리 서로 상쇄되도록 합니다. (sklearn HashingVectorizer의 alternate_sign과 같은 방식)
+
+    Args:
+        text (str): 사용자 메시지
+        n_features (int): 해시 공간 크기
+        ngram_range (tuple[int, int]): 문자 n-gram 최소/최대 길이
+
+    Returns:
+        dict[int, float]: 특징 인덱스 → 값
+    """
+    features: dict[int, float] = {}
+    low, high = ngram_range
+    for word in unicodedata.normalize("NFKC", text).lower().split():
+        padded = f" {word} "
+        for size in range(low, high + 1):
+            for start in range(len(padded) - size + 1):
+                index, sign = _slot(padded[start : start + size], n_features)
+                features[index] = features.get(index, 0.0) + sign
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    return {index: value / norm for index, value in features.items() if value} if norm else {}
+
+
+@dataclass
+class IntentPrediction:
+    label: str
+    confidence: float
+
+
+class IntentClassifier:
+    """
+    해시 문자 n-gram + 선형 모델(다항 로지스틱 회귀)로 챗봇 질문 유형을 분류하는 분류기입니다.
+    학습은 scikit-learn으로 오프라인에서 하고(scripts/train_intent_classifier.py), 앱은 내보낸 가중치 중
+    0이 아닌 특징만 읽어 메시지의 특징 수만큼 곱셈-덧셈으로 점수를 계산하므로 수십 마이크로초 안에 끝납니다.
+    """
+
+    def __init__(self, model: dict[str, Any]):
+        self.version: str = model.get("version", "unversioned")
+        self.labels: list[str] = model["labels"]
+        self.n_features: int = model["n_features"]
+        self.ngram_range: tuple[int, int] = tuple(model["ngram_range"])
+        self._intercept: list[float] = model["intercept"]
+        self._weights: dict[int, list[float]] = {int(index): weights for index, weights in model["weights"].items()}
+
+    @classmethod
+    def from_file(cls, path: str) -> "IntentClassifier":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def predict(self, text: str) -> IntentPrediction:
+        """
+        Args:
+            text (str): 사용자 메시지
+
+        Returns:
+            IntentPrediction: 가장 점수가 높은 질문 유형과 확률(softmax)
+        """
+        scores = list(self._intercept)
+        for index, value in intent_features(text, self.n_features, self.ngram_range).items():
+            weights = self._weights.get(index)
+            if weights is not None:
+                for label_index, weight in enumerate(weights):
+                    scores[label_index] += value * weight
+        best = max(range(len(scores)), key=scores.__getitem__)
+        total = sum(math.exp(score - scores[best]) for score in scores)
+        return IntentPrediction(label=self.labels[best], confidence=1.0 / total)
+
+
+@lru_cache(maxsize=1)
+def get_intent_classifier() -> IntentClassifier | None:
+    """
+    프로세스당 한 번 질문 유형 분류 모델을 적재합니다. 모델 파일이 없으면 None (LLM 분류만 사용)
+    """
+    if not os.path.exists(config.INTENT_MODEL_PATH):
+        return None
+    return IntentClassifier.from_file(config.INTENT_MODEL_PATH)
@@ -0,0 +1,302 @@
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from app.core import config
+from app.dtos.interaction import InteractionCheckResponse, InteractionWarning
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+
+SEVERITY_ORDER = {"contraindicated": 0, "major": 1, "moderate": 2, "minor": 3}
+
+_BRACKETED = re.compile(r"\(([^)]*)\)|\[([^\]]*)\]")
+_STRENGTH = re.compile(r"\d+(?:\.\d+)?(?:밀리그[램람]|마이크로그[램람]|밀리리터|그[램람]|mg|mcg|μg|ml|g)")
+_NON_KEY = re.compile(r"[^0-9a-z가-힣]")
+
+
+def _key(name: str) -> str:
+    return _NON_KEY.sub("", unicodedata.normalize("NFKC", name).lower())
+
+
+def _bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass
+class _ResolvedMed:
+    name: str
+    concepts: int  # 성분 + 소속 계열 비트
+    ingredients: int  # 성분 비트만 (성분 중복 검사용)
+    conflicts: int  # 이 약과 상호작용하는 개념 비트
+
+
+class InteractionEngine:
+    """
+    약물 상호작용/알러지/기저질환 금기를 메모리에서 검사하는 엔진입니다.
+
+    성분과 계열(NSAID, 스타틴 등)을 하나의 개념 공간에 두고 각각 정수 비트 하나를 배정합니다.
+    적재 시 성분마다 "자신 + 소속 계열" 비트와 "상호작용 상대" 비트를 미리 OR해 두므로,
+    검사는 복용약마다 누적 비트와의 AND 몇 번(O(복용약 수))으로 끝나고, 실제로 걸린 경우에만
+    어떤 규칙인지 찾아 경고 문구를 만듭니다.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.version: str = data.get("version", "unversioned")
+        self._concepts: dict[str, int] = {}
+        self._concept_names: list[str] = []
+
+        self._ingredient_concepts: dict[str, int] = {}
+        self._aliases: dict[str, str] = {}
+        for ingredient, info in data["ingredients"].items():
+            mask = self._bit(ingredient)
+            for class_name in info.get("classes", []):
+                mask |= self._bit(class_name)
+            self._ingredient_concepts[ingredient] = mask
+            for alias in (ingredient, *info.get("aliases", [])):
+                self._aliases[_key(alias)] = ingredient
+
+        self._products: dict[str, list[str]] = {}
+        for product, ingredients in data.get("products", {}).items():
+            unknown = set(ingredients) - self._ingredient_concepts.keys()
+            if unknown:
+                raise ValueError(f"product {product} references unknown ingredients: {sorted(unknown)}")
+            self._products[_key(product)] = ingredients
+            self._products.setdefault(_key(_STRENGTH.sub("", product)), ingredients)
+
+        # 개념별 상호작용 상대 비트와 (개념, 개념) 쌍별 규칙
+        conflicts: defaultdict[int, int] = defaultdict(int)
+        self._rules: dict[tuple[int, int], dict[str, Any]] = {}
+        for rule in data.get("interactions", []):
+            left, right = self._index(rule["a"]), self._index(rule["b"])
+            conflicts[left] |= 1 << right
+            conflicts[right] |= 1 << left
+            self._rules[(min(left, right), max(left, right))] = rule
+        self._ingredient_conflicts = {
+            ingredient: self._union(conflicts.get(index, 0) for index in _bits(mask))
+            for ingredient, mask in self._ingredient_concepts.items()
+        }
+
+        self._allergies = {
+            _key(name): self._union(self._bit(target) for target in targets)
+            for name, targets in data.get("allergies", {}).items()
+        }
+        self._diseases: dict[str, list[tuple[int, dict[str, Any]]]] = {
+            _key(name): [(self._bit(rule["target"]), rule) for rule in rules]
+            for name, rules in data.get("diseases", {}).items()
+        }
+
+    @classmethod
+    def from_file(cls, path: str) -> "InteractionEngine":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _index(self, name: str) -> int:
+        if name not in self._concepts:
+            self._concepts[name] = len(self._concept_names)
+            self._concept_names.append(name)
+        return self._concepts[name]
+
+    def _bit(self, name: str) -> int:
+        return 1 << self._index(name)
+
+    @staticmethod
+    def _union(masks: Iterator[int]) -> int:
+        result = 0
+        for mask in masks:
+            result |= mask
+        return result
+
+    def _ingredients_of(self, name: str) -> list[str]:
+        """
+        약 이름을 성분 목록으로 해석합니다. 제품명 → 성분명/별칭 → 괄호 안 성분 표기 → 함량을 뺀 제품명 순으로 찾습니다.
+        """
+        key = _key(name)
+        if key in self._products:
+            return self._products[key]
+        if key in self._aliases:
+            return [self._aliases[key]]
+        bracketed = [
+            self._aliases[_key(part)]
+            for match in _BRACKETED.finditer(name)
+            for part in re.split(r"[,/+·]", match.group(1) or match.group(2))
+            if _key(part) in self._aliases
+        ]
+        if bracketed:
+            return bracketed
+        base = _key(_STRENGTH.sub("", _BRACKETED.sub("", unicodedata.normalize("NFKC", name).lower())))
+        if base in self._products:
+            return self._products[base]
+        return [self._aliases[base]] if base in self._aliases else []
+
+    def _resolve(self, name: str) -> _ResolvedMed | None:
+        ingredients = self._ingredients_of(name)
+        if not ingredients:
+            return None
+        return _ResolvedMed(
+            name=name,
+            concepts=self._union(self._ingredient_concepts[ingredient] for ingredient in ingredients),
+            ingredients=self._union(self._bit(ingredient) for ingredient in ingredients),
+            conflicts=self._union(self._ingredient_conflicts[ingredient] for ingredient in ingredients),
+        )
+
+    def check(self, medications: list[str], allergies: list[str], diseases: list[str]) -> InteractionCheckResponse:
+        """
+        Args:
+            medications (list[str]): 복용약(및 복용 예정 약) 이름
+            allergies (list[str]): 알러지 성분/계열 이름
+            diseases (list[str]): 기저질환 이름
+
+        Returns:
+            InteractionCheckResponse: 위험도 내림차순 경고와 해석하지 못한 약 이름
+        """
+        resolved: list[_ResolvedMed] = []
+        unrecognized: list[str] = []
+        for name in dict.fromkeys(medications):
+            med = self._resolve(name)
+            if med is None:
+                unrecognized.append(name)
+            else:
+                resolved.append(med)
+
+        warnings = self._pair_warnings(resolved)
+        warnings += self._allergy_warnings(resolved, allergies)
+        warnings += self._disease_warnings(resolved, diseases)
+        warnings.sort(key=lambda warning: SEVERITY_ORDER[warning.severity])
+        return InteractionCheckResponse(
+            warnings=warnings, unrecognized_medications=unrecognized, dataset_version=self.version
+        )
+
+    def _pair_warnings(self, meds: list[_ResolvedMed]) -> list[InteractionWarning]:
+        warnings: list[InteractionWarning] = []
+        seen_concepts = seen_ingredients = 0
+        for index, med in enumerate(meds):
+            # 누적 비트와 겹칠 때만 이전 약들과 짝을 지어 상세 규칙을 찾습니다.
+            if med.conflicts & seen_concepts:
+                for other in meds[:index]:
+                    if med.conflicts & other.concepts:
+                        warnings += self._interaction_details(other, med)
+            if med.ingredients & seen_ingredients:
+                for other in meds[:index]:
+                    for ingredient in _bits(med.ingredients & other.ingredients):
+                        warnings.append(
+                            InteractionWarning(
+                                kind="duplicate",
+                                severity="moderate",
+                                medications=[other.name, med.name],
+                                subject=self._concept_names[ingredient],
+                                message="같은 성분이 중복되어 과량 복용 위험이 있습니다.",
+                            )
+                        )
+            seen_concepts |= med.concepts
+            seen_ingredients |= med.ingredients
+        return warnings
+
+    def _interaction_details(self, first: _ResolvedMed, second: _ResolvedMed) -> list[InteractionWarning]:
+        rules: dict[tuple[int, int], dict[str, Any]] = {}
+        for left in _bits(first.concepts):
+            for right in _bits(second.concepts):
+                pair = (min(left, right), max(left, right))
+                if pair in self._rules:
+                    rules[pair] = self._rules[pair]
+        return [
+            InteractionWarning(
+                kind="interaction",
+                severity=rule["severity"],
+                medications=[first.name, second.name],
+                subject=f"{rule['a']} + {rule['b']}",
+                message=rule["message"],
+            )
+            for rule in rules.values()
+        ]
+
+    def _allergy_warnings(self, meds: list[_ResolvedMed], allergies: list[str]) -> list[InteractionWarning]:
+        warnings: list[InteractionWarning] = []
+        masks = {name: self._allergy_mask(name) for name in dict.fromkeys(allergies)}
+        combined = self._union(iter(masks.values()))
+        for med in meds:
+            if not med.concepts & combined:
+                continue
+            for allergy, mask in masks.items():
+                if med.concepts & mask:
+                    warnings.append(
+                        InteractionWarning(
+                            kind="allergy",
+                            severity="contraindicated",
+                            medications=[med.name],
+                            subject=allergy,
+                            message=f"{allergy} 알러지가 등록되어 있습니다. 복용 전 반드시 의사·약사와 상담하세요.",
+                        )
+                    )
+        return warnings
+
+    def _allergy_mask(self, name: str) -> int:
+        key = _key(name)
+        if key in self._allergies:
+            return self._allergies[key]
+        # 데이터셋에 없는 알러지는 같은 이름의 성분/계열 자체로 간주합니다.
+        ingredient = self._aliases.get(key)
+        if ingredient is not None:
+            return self._bit(ingredient)
+        return self._bit(name) if name in self._concepts else 0
+
+    def _disease_warnings(self, meds: list[_ResolvedMed], diseases: list[str]) -> list[InteractionWarning]:
+        warnings: list[InteractionWarning] = []
+        for disease in dict.fromkeys(diseases):
+            rules = self._diseases.get(_key(disease), [])
+            combined = self._union(bit for bit, _ in rules)
+            for med in meds:
+                if not med.concepts & combined:
+                    continue
+                warnings += [
+                    InteractionWarning(
+                        kind="disease",
+                        severity=rule["severity"],
+                        medications=[med.name],
+                        subject=disease,
+                        message=rule["message"],
+                    )
+                    for bit, rule in rules
+                    if med.concepts & bit
+                ]
+        return warnings
+
+
+@lru_cache(maxsize=1)
+def get_interaction_engine() -> InteractionEngine:
+    """
+    프로세스당 한 번 상호작용 데이터셋을 적재합니다.
+    """
+    return InteractionEngine.from_file(config.INTERACTION_DATA_PATH)
+
+
+class InteractionService:
+    """
+    사용자의 복용약, 알러지, 기저질환을 조회하여 상호작용 엔진으로 검사하는 서비스 클래스입니다.
+    """
+
+    def __init__(self):
+        self.engine = get_interaction_engine()
+
+    async def check_user(self, user: User, candidates: list[str] | None = None) -> InteractionCheckResponse:
+        """
+        사용자의 현재 복용약 전체(및 복용 예정 약)에 대한 상호작용·알러지·기저질환 경고를 계산합니다.
+
+        Args:
+            user (User): 요청 사용자
+            candidates (list[str] | None): 새로 복용하려는 약 이름 (현재 복용약과 함께 검사)
+
+        Returns:
+            InteractionCheckResponse: 경고 목록
+        """
+        snapshot = await clinical_snapshots.get(user)
+        return self.engine.check(
+            [*snapshot.med_names, *(candidates or [])], snapshot.allergy_names, snapshot.disease_names
+        )
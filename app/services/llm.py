@@ -0,0 +1,98 @@
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Any
+
+import httpx
+import orjson
+from fastapi import HTTPException, status
+
+from app.core import config
+from app.utils.single_flight import SingleFlight
+
+
+@lru_cache(maxsize=1)
+def get_llm_http_client() -> httpx.AsyncClient:
+    """
+    LLM 백엔드 연결을 요청 간에 재사용하도록 프로세스당 하나의 HTTP 클라이언트를 만듭니다.
+    """
+    headers = {"Authorization": f"Bearer {config.LLM_API_KEY}"} if config.LLM_API_KEY else {}
+    return httpx.AsyncClient(
+        base_url=config.LLM_BASE_URL,
+        headers=headers,
+        timeout=httpx.Timeout(config.LLM_TIMEOUT_SECONDS, connect=5.0),
+    )
+
+
+class LLMClient:
+    """
+    OpenAI 호환 Chat Completions API(/chat/completions, stream=true)에서 생성 토큰을 도착하는 대로 받아오는 클라이언트입니다.
+    vLLM, Ollama 등 OpenAI 호환 서버나 개발용 대역 서버(scripts/llm_standin.py)를 LLM_BASE_URL로 지정해 사용합니다.
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        self.client = client or get_llm_http_client()
+
+    async def stream(self, messages: list[dict[str, str]], **options: Any) -> AsyncIterator[str]:
+        """
+        응답 토큰(델타 텍스트)을 생성되는 순서대로 내보냅니다.
+        소비하는 쪽이 반복을 중단하면(클라이언트 연결 끊김 등) 업스트림 연결을 닫아 LLM 서버가 생성을 멈추게 합니다.
+
+        Args:
+            messages (list[dict]): role/content 메시지 목록 (system 프롬프트 포함)
+            **options: temperature, max_tokens 등 생성 옵션
+
+        Yields:
+            str: 델타 텍스트
+
+        Raises:
+            HTTPException: LLM 백엔드 연결 실패 또는 오류 응답(502)
+        """
+        body = {"model": config.LLM_MODEL, "messages": messages, "stream": True, **options}
+        try:
+            async with self.client.stream("POST", "/chat/completions", content=orjson.dumps(body)) as response:
+                if response.status_code != status.HTTP_200_OK:
+                    await response.aread()
+                    raise HTTPException(
+                        status_code=status.HTTP_502_BAD_GATEWAY, detail="챗봇 응답 생성 중 오류가 발생했습니다."
+                    )
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    choices = orjson.loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+        except httpx.HTTPError as err:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY, detail="챗봇 서버에 연결할 수 없습니다."
+            ) from err
+
+    async def complete(self, messages: list[dict[str, str]], **options: Any) -> str:
+        """
+        응답 전체를 하나의 문자열로 받습니다. (대화 요약, 가이드 생성 등 스트리밍이 필요 없는 호출용)
+
+        Args:
+            messages (list[dict]): role/content 메시지 목록 (system 프롬프트 포함)
+            **options: temperature, max_tokens 등 생성 옵션
+
+        Returns:
+            str: 응답 텍스트
+
+        Raises:
+            HTTPException: LLM 백엔드 연결 실패 또는 오류 응답(502)
+        """
+        # 같은 프롬프트/옵션의 요청이 동시에 오면(여러 탭, 재시도) 한 번만 생성하고 결과를 나눠 받습니다.
+        return await llm_flights.run(
+            {"model": config.LLM_MODEL, "messages": messages, "options": options},
+            lambda: self._complete(messages, **options),
+            timeout=config.LLM_TIMEOUT_SECONDS,
+        )
+
+    async def _complete(self, messages: list[dict[str, str]], **options: Any) -> str:
+        return "".join([token async for token in self.stream(messages, **options)])
+
+
+llm_flights = SingleFlight("llm")
@@ -1,39 +1,140 @@
+import datetime
+
+from tortoise.transactions import in_transaction
+
+from app.core import config
 from app.dtos.ocr import (
-    OCRExtractResponse, PillAnalyzeResponse, DrugInfo, 
-    PillCandidate
+    OCRExtractResponse, OCRPageInfo, PillAnalyzeResponse, DrugInfo, 
+    PillCandidate, PrescriptionAnalysisResponse, PrescriptionDrugResponse
 )
+from app.models.ocr_history import OCRHistory
+from app.models.prescription import Prescription
+from app.models.prescription_drug import PrescriptionDrug
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.inference import InferenceClient, PartialCallback
+from app.services.upload import UploadService
 
 
 class OCRService:
+    def __init__(self):
+        self.inference = InferenceClient()
+        self.uploads = UploadService()
+
     # ==========================================
     # [추가된 기능] 필수 3: OCR 기반 의료정보 인식
     # ==========================================
-    async def extract_text_from_image(self, image_bytes: bytes) -> OCRExtractResponse:
+    async def extract_text_from_image(
+        self, image_bytes: bytes, on_page: PartialCallback | None = None
+    ) -> OCRExtractResponse:
         """
         처방전 및 진료비 계산서 이미지에서 의료 텍스트를 추출하고 정규화합니다.
         병원명, 처방일자, 개별 약품명 및 복약 정보를 구조화하여 반환합니다.
+        다중 페이지 PDF는 워커가 페이지별로 병렬 인식하며, 페이지가 끝날 때마다 on_page로 부분 결과를 받을 수 있습니다.
         
         Args:
             image_bytes (bytes): 분석할 이미지 또는 PDF 바이너리 데이터
+            on_page (PartialCallback | None): PDF 페이지별 부분 결과(page, page_count, raw_text, drugs 등) 콜백
             
         Returns:
             OCRExtractResponse: 정규화된 의료 정보 및 추출된 약품 상세 리스트
         """
-        # 1. 이미지/PDF에서 텍스트 자동 추출 (더미 로직)
-        # 2. 정규화 처리 (mg/ml, YYYY-MM-DD)
-        dummy_drugs = [
-            DrugInfo(drug_name="타이레놀정500mg", dosage="500mg", frequency="1일 3회", duration="3"),
-            DrugInfo(drug_name="아모디핀정", dosage="5mg", frequency="1일 1회", duration="30")
-        ]
+        # 1. 이미지/PDF에서 텍스트 자동 추출 (ai_worker, 동일 이미지+모델 버전은 캐시 재사용)
+        # 2. 정규화 처리 (mg/ml, YYYY-MM-DD): 워커가 OCR 원문을 약품 행으로 파싱하고 표준 약품명을 매칭
+        result = await self.inference.run_image_task("ocr", image_bytes, mode="prescription", on_partial=on_page)
         return OCRExtractResponse(
-            hospital_name="서울대학교병원",
-            prescribed_date="2024-02-24",
-            drugs=dummy_drugs,
-            extracted_text="[처방전] 서울대학교병원 ... 타이레놀정 500밀리그램 ...",
-            confidence=0.98,
+            hospital_name=result.get("hospital_name"),
+            prescribed_date=result.get("prescribed_date"),
+            drugs=[DrugInfo(**drug) for drug in result.get("drugs", [])],
+            extracted_text=result["raw_text"],
+            confidence=result["confidence"],
+            model_version=result.get("model_version"),
+            pages=[OCRPageInfo(**page) for page in result.get("pages", [])],
+            elapsed_ms=result.get("elapsed_ms"),
             multimodal_assets=[]
         )
 
+    async def analyze_prescription(self, user: User, upload_id: int) -> PrescriptionAnalysisResponse:
+        """
+        업로드된 처방전을 OCR로 분석하여 OCR 이력, 처방전 및 처방 약품 행을 저장합니다.
+        같은 업로드를 다시 분석하면 기존 처방전의 약품 행을 새 결과로 교체합니다.
+
+        Args:
+            user (User): 요청 사용자
+            upload_id (int): 처방전 업로드 ID
+
+        Returns:
+            PrescriptionAnalysisResponse: 저장된 이력/처방전 ID와 정규화된 약품 행
+        """
+        upload = await self.uploads.get_user_upload(user, upload_id)
+        extracted = await self.extract_text_from_image(await self.uploads.read_bytes(upload))
+        prescribed_date = (
+            datetime.date.fromisoformat(extracted.prescribed_date) if extracted.prescribed_date else None
+        )
+
+        async with in_transaction():
+            ocr_history = await OCRHistory.create(
+                raw_text=extracted.extracted_text,
+                inference_metadata={
+                    "confidence": extracted.confidence,
+                    "model_version": extracted.model_version,
+                    "page_count": len(extracted.pages) or 1,
+                    "pages": [page.model_dump() for page in extracted.pages],
+                    "elapsed_ms": extracted.elapsed_ms,
+                },
+                upload=upload,
+                user=user,
+            )
+            prescription = await Prescription.get_or_none(upload=upload)
+            if prescription is None:
+                prescription = await Prescription.create(
+                    hospital_name=extracted.hospital_name, prescribed_date=prescribed_date, user=user, upload=upload
+                )
+            else:
+                await prescription.update_from_dict(
+                    {"hospital_name": extracted.hospital_name, "prescribed_date": prescribed_date}
+                ).save()
+                await PrescriptionDrug.filter(prescription=prescription).delete()
+
+            drugs = [
+                await PrescriptionDrug.create(
+                    standard_drug_name=drug.standard_drug_name or drug.drug_name,
+                    dosage_amount=drug.dosage_amount,
+                    daily_frequency=drug.daily_frequency,
+                    duration_days=drug.duration_days,
+                    prescription=prescription,
+                )
+                for drug in extracted.drugs
+            ]
+        await clinical_snapshots.upsert(
+            user.id,
+            "prescriptions",
+            clinical_snapshots.prescription_item(
+                prescription.id,
+                prescription.hospital_name,
+                prescription.prescribed_date,
+                [drug.standard_drug_name for drug in drugs],
+            ),
+        )
+
+        return PrescriptionAnalysisResponse(
+            ocr_history_id=ocr_history.id,
+            prescription_id=prescription.id,
+            hospital_name=prescription.hospital_name,
+            prescribed_date=extracted.prescribed_date,
+            drugs=[
+                PrescriptionDrugResponse(
+                    id=drug.id,
+                    standard_drug_name=drug.standard_drug_name,
+                    dosage_amount=drug.dosage_amount,
+                    daily_frequency=drug.daily_frequency,
+                    duration_days=drug.duration_days,
+                    is_linked_to_meds=drug.is_linked_to_meds,
+                )
+                for drug in drugs
+            ],
+        )
+
     # ==========================================
     # [추가된 기능] 선택 2: 이미지 분류 기반 복약 분석 (CNN)
     # ==========================================
@@ -48,22 +149,22 @@ class OCRService:
         Returns:
             PillAnalyzeResponse: 식별된 후보군 리스트와 최적 후보 정보
         """
-        # 1. CNN Transfer Learning 모델 기반 인식 (더미)
+        # 1. CNN Transfer Learning 모델 기반 인식 (ai_worker, 동일 이미지+모델 버전은 캐시 재사용)
+        #    워커는 경량 모델로 먼저 답하고, 신뢰도가 낮은 입력만 대형 모델 + 각인 OCR로 승격합니다.
         # 2. 상위 3개 후보 추출 및 신뢰도 판단
-        candidates = [
-            PillCandidate(pill_name="타이레놀정500mg", confidence=0.85, medication_info="진통제"),
-            PillCandidate(pill_name="에어탈정", confidence=0.10, medication_info="소염제"),
-            PillCandidate(pill_name="노바스크정", confidence=0.03, medication_info="혈압약")
-        ]
+        result = await self.inference.run_image_task("cnn", image_bytes)
+        candidates = [PillCandidate(**candidate) for candidate in result["candidates"][:3]]
         
         top = candidates[0]
         suggestion = None
-        if top.confidence < 0.60:
+        if top.confidence < config.PILL_CONFIDENCE_THRESHOLD:
             suggestion = "약품 인식 신뢰도가 낮습니다. 직접 입력하시거나 다시 촬영해 주세요."
 
         return PillAnalyzeResponse(
             candidates=candidates,
             top_candidate=top,
             suggestion=suggestion,
+            answered_by=result.get("stage"),
+            imprint_text=result.get("imprint_text"),
             multimodal_assets=[]
         )
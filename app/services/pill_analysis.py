@@ -0,0 +1,207 @@
+import asyncio
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any
+
+from tortoise.transactions import in_transaction
+
+from app.core import config
+from app.dtos.ocr import PillAnalysisResponse, PillCandidateScore
+from app.models.cnn_history import CNNHistory
+from app.models.ocr_history import OCRHistory
+from app.models.pill_recognition import PillRecognition
+from app.models.upload import Upload
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+from app.services.inference import InferenceClient
+from app.services.upload import UploadService
+
+Branch = tuple[str, str]  # (face, kind) 예: ("front", "cnn")
+FRONT_BRANCHES: set[Branch] = {("front", "cnn"), ("front", "ocr")}
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z가-힣]")
+
+
+def imprint_similarity(ocr_text: str, imprint: str | None) -> float:
+    """
+    OCR로 읽은 각인과 후보 약품의 등록 각인 간 유사도(0~1)를 계산합니다.
+    대소문자/공백/기호 차이는 무시합니다.
+    """
+    if not ocr_text or not imprint:
+        return 0.0
+    left, right = _NON_ALNUM.sub("", ocr_text.upper()), _NON_ALNUM.sub("", imprint.upper())
+    if not left or not right:
+        return 0.0
+    return SequenceMatcher(None, left, right).ratio()
+
+
+def fuse_candidates(cnn_results: list[dict[str, Any]], imprint_texts: list[str]) -> list[PillCandidateScore]:
+    """
+    앞/뒷면 CNN 후보 점수를 평균한 뒤, 각인 OCR 결과와의 일치도를 가중 결합하여 재정렬합니다.
+
+    Args:
+        cnn_results (list[dict]): 면별 워커 CNN 결과 (candidates 포함)
+        imprint_texts (list[str]): 면별 각인 OCR 원문
+
+    Returns:
+        list[PillCandidateScore]: 결합 점수 내림차순 후보 목록
+    """
+    scores: defaultdict[str, float] = defaultdict(float)
+    details: dict[str, dict[str, Any]] = {}
+    for result in cnn_results:
+        for candidate in result["candidates"]:
+            scores[candidate["pill_name"]] += candidate["confidence"] / len(cnn_results)
+            details.setdefault(candidate["pill_name"], candidate)
+
+    imprint = " ".join(text for text in imprint_texts if text)
+    weight = config.PILL_IMPRINT_WEIGHT if imprint else 0.0
+    fused = [
+        PillCandidateScore(
+            pill_name=name,
+            confidence=round(
+                (1 - weight) * score + weight * imprint_similarity(imprint, details[name].get("imprint")), 4
+            ),
+            medication_info=details[name].get("medication_info", ""),
+        )
+        for name, score in scores.items()
+    ]
+    return sorted(fused, key=lambda candidate: candidate.confidence, reverse=True)
+
+
+class PillAnalysisService:
+    """
+    알약 앞/뒷면에 대해 CNN과 각인 OCR을 동시에 실행하고 점수를 결합하는 복합 분석 서비스입니다.
+    네 갈래 추론을 한꺼번에 워커에 보내므로 전체 지연 시간은 합이 아닌 가장 느린 갈래에 수렴하며,
+    앞면만으로 신뢰도 기준을 넘으면 남은 뒷면 분석은 기다리지 않고 취소합니다.
+    """
+
+    def __init__(self):
+        self.inference = InferenceClient()
+        self.uploads = UploadService()
+
+    async def analyze(self, user: User, front_upload_id: int, back_upload_id: int | None) -> PillAnalysisResponse:
+        """
+        알약 복합 분석을 수행하고 CNN/OCR 이력 및 최종 인식 결과를 저장합니다.
+
+        Args:
+            user (User): 요청 사용자
+            front_upload_id (int): 앞면 업로드 ID
+            back_upload_id (int | None): 뒷면 업로드 ID (선택)
+
+        Returns:
+            PillAnalysisResponse: 저장된 이력 ID, 재정렬된 후보 및 조기 종료 여부
+        """
+        front = await self.uploads.get_user_upload(user, front_upload_id)
+        back = await self.uploads.get_user_upload(user, back_upload_id) if back_upload_id else None
+        faces = {"front": front} if back is None else {"front": front, "back": back}
+        images = dict(
+            zip(faces, await asyncio.gather(*(self.uploads.read_bytes(u) for u in faces.values())), strict=True)
+        )
+
+        results, early_stopped = await self._run_branches(images)
+        candidates = self._fuse(results, faces=["front"] if early_stopped else list(faces))
+        return await self._save(user, faces, results, candidates, early_stopped)
+
+    async def _run_branches(self, images: dict[str, bytes]) -> tuple[dict[Branch, dict[str, Any]], bool]:
+        tasks: dict[asyncio.Task, Branch] = {}
+        for face, image_bytes in images.items():
+            # 각인은 아래 ocr 갈래가 읽으므로 CNN 캐스케이드가 승격해도 각인 OCR을 다시 돌리지 않게 합니다.
+            cnn = self.inference.run_image_task("cnn", image_bytes, mode="classify")
+            imprint = self.inference.run_image_task("ocr", image_bytes, mode="imprint")
+            tasks[asyncio.create_task(cnn)] = (face, "cnn")
+            tasks[asyncio.create_task(imprint)] = (face, "ocr")
+
+        results: dict[Branch, dict[str, Any]] = {}
+        pending = set(tasks)
+        early_stopped = False
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[tasks[task]] = task.result()
+
+                if pending and FRONT_BRANCHES <= results.keys():
+                    front_top = self._fuse(results, faces=["front"])[0]
+                    if front_top.confidence >= config.PILL_CONFIDENCE_THRESHOLD:
+                        early_stopped = True
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return results, early_stopped
+
+    @staticmethod
+    def _fuse(results: dict[Branch, dict[str, Any]], faces: list[str]) -> list[PillCandidateScore]:
+        return fuse_candidates(
+            [results[(face, "cnn")] for face in faces],
+            [results[(face, "ocr")]["raw_text"] for face in faces],
+        )
+
+    async def _save(
+        self,
+        user: User,
+        faces: dict[str, Upload],
+        results: dict[Branch, dict[str, Any]],
+        candidates: list[PillCandidateScore],
+        early_stopped: bool,
+    ) -> PillAnalysisResponse:
+        top = candidates[0]
+        async with in_transaction():
+            cnn_histories: dict[str, CNNHistory] = {}
+            ocr_histories: dict[str, OCRHistory] = {}
+            for face, upload in faces.items():
+                if (face, "cnn") in results:
+                    cnn = results[(face, "cnn")]
+                    cnn_histories[face] = await CNNHistory.create(
+                        model_version=cnn["model_version"],
+                        class_name=cnn["candidates"][0]["pill_name"],
+                        confidence=cnn["candidates"][0]["confidence"],
+                        raw_result=cnn,
+                        upload=upload,
+                        user=user,
+                    )
+                if (face, "ocr") in results:
+                    ocr = results[(face, "ocr")]
+                    ocr_histories[face] = await OCRHistory.create(
+                        raw_text=ocr["raw_text"],
+                        inference_metadata={"model_version": ocr["model_version"], "confidence": ocr["confidence"]},
+                        upload=upload,
+                        user=user,
+                    )
+
+            recognition_fields: dict[str, Any] = {
+                "pill_name": top.pill_name,
+                "pill_description": top.medication_info,
+                "user": user,
+                "cnn_history": cnn_histories["front"],
+                "ocr_history": ocr_histories["front"],
+                "back_upload": faces.get("back"),
+            }
+            recognition = await PillRecognition.get_or_none(front_upload=faces["front"])
+            if recognition is None:
+                recognition = await PillRecognition.create(front_upload=faces["front"], **recognition_fields)
+            else:
+                await recognition.update_from_dict(recognition_fields).save()
+        await clinical_snapshots.upsert(
+            user.id,
+            "pills",
+            {"id": recognition.id, "name": recognition.pill_name, "linked": recognition.is_linked_to_meds},
+        )
+
+        return PillAnalysisResponse(
+            cnn_history_id=cnn_histories["front"].id,
+            ocr_history_id=ocr_histories["front"].id,
+            pill_recognition_id=recognition.id,
+            primary_pill_name=top.pill_name,
+            confidence=top.confidence,
+            candidates=candidates[:3],
+            answered_by=results[("front", "cnn")].get("stage"),
+            early_stopped=early_stopped,
+            suggestion=(
+                "약품 인식 신뢰도가 낮습니다. 직접 입력하시거나 다시 촬영해 주세요."
+                if top.confidence < config.PILL_CONFIDENCE_THRESHOLD
+                else None
+            ),
+        )
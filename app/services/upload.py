@@ -0,0 +1,86 @@
+import asyncio
+import os
+import uuid
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile, status
+
+from app.core import config
+from app.models.upload import Upload
+from app.models.user import User
+from app.services.inference import InferenceClient
+
+# 업로드 분류별로 뒤이어 호출될 분석 API가 요청하는 워커 작업 (task, mode)
+SPECULATIVE_TASKS: dict[str, list[tuple[str, str | None]]] = {
+    "prescription": [("ocr", "prescription")],
+    "pill_front": [("cnn", "classify"), ("ocr", "imprint")],
+    "pill_back": [("cnn", "classify"), ("ocr", "imprint")],
+}
+
+
+class UploadService:
+    """
+    업로드 원본 파일(처방전, 알약 앞/뒷면 사진)의 저장과 조회를 담당하는 서비스 클래스입니다.
+    파일은 UPLOAD_DIR에 저장되며 /static/uploads 경로로 제공됩니다.
+    """
+
+    def __init__(self):
+        self.inference = InferenceClient()
+
+    async def save(self, user: User, file: UploadFile, category: str, speculate: bool = False) -> Upload:
+        """
+        업로드 파일을 디스크에 저장하고 업로드 레코드를 생성합니다.
+        speculate가 켜져 있으면 분석 API 호출을 기다리지 않고 분류에 맞는 추론을 낮은 우선순위로 미리 시작합니다.
+
+        Args:
+            user (User): 업로드한 사용자
+            file (UploadFile): 업로드 파일
+            category (str): 분류 (prescription, pill_front, pill_back)
+            speculate (bool): 업로드 시점 예측 분석 여부
+
+        Returns:
+            Upload: 생성된 업로드 레코드
+        """
+        file_ext = os.path.splitext(file.filename or "")[1].lower()
+        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        content = await file.read()
+        await asyncio.to_thread(self._write, Path(config.UPLOAD_DIR) / unique_filename, content)
+
+        upload = await Upload.create(
+            user=user,
+            file_url=f"/static/uploads/{unique_filename}",
+            file_type=file_ext.lstrip(".") or "jpg",
+            category=category,
+        )
+        if speculate and config.SPECULATIVE_ANALYSIS_ENABLED:
+            await asyncio.gather(
+                *(self.inference.speculate(task, content, mode) for task, mode in SPECULATIVE_TASKS.get(category, []))
+            )
+        return upload
+
+    async def get_user_upload(self, user: User, upload_id: int) -> Upload:
+        """
+        사용자 본인의 업로드 레코드를 조회합니다.
+
+        Raises:
+            HTTPException: 업로드가 없거나 다른 사용자의 업로드인 경우 404
+        """
+        upload = await Upload.get_or_none(id=upload_id, user=user)
+        if upload is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드 파일을 찾을 수 없습니다.")
+        return upload
+
+    async def read_bytes(self, upload: Upload) -> bytes:
+        """
+        업로드 원본 파일의 바이너리를 읽어옵니다.
+        """
+        return await asyncio.to_thread(self.file_path(upload).read_bytes)
+
+    @staticmethod
+    def file_path(upload: Upload) -> Path:
+        return Path(config.UPLOAD_DIR) / os.path.basename(upload.file_url)
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
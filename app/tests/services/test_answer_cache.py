@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import config
+from app.dependencies.security import get_admin_user
+from app.services import answer_cache as answer_cache_module
+from app.services.answer_cache import AnswerProbe, SemanticAnswerCache
+from app.utils import metrics as metrics_module
+
+
+class RecordingPipeline:
+    def __init__(self, redis: "RecordingRedis"):
+        self.redis = redis
+        self.commands: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, *args))
+
+    async def execute(self):
+        self.redis.commands.extend(self.commands)
+        return [self.redis.reply(command) for command in self.commands]
+
+
+class RecordingRedis:
+    """
+    명령을 기록하고 zcard/hget/zpopmin에만 정해 둔 값을 돌려주는 Redis 대역입니다.
+    """
+
+    def __init__(self, size: int, signatures: dict[str, str]):
+        self.size = size
+        self.signatures = signatures
+        self.commands: list[tuple] = []
+
+    def pipeline(self, transaction=True):
+        return RecordingPipeline(self)
+
+    def reply(self, command: tuple):
+        if command[0] == "zcard":
+            return self.size
+        if command[0] == "hget":
+            return self.signatures.get(command[1].rsplit(":", 1)[-1])
+        return None
+
+    async def zpopmin(self, key, count):
+        return [(entry_id, 0.0) for entry_id in list(self.signatures)[:count]]
+
+
+@pytest.fixture
+def cache(monkeypatch) -> SemanticAnswerCache:
+    monkeypatch.setattr(metrics_module, "redis_client", RecordingRedis(0, {}))
+    return SemanticAnswerCache()
+
+
+def use_redis(monkeypatch, redis: RecordingRedis) -> RecordingRedis:
+    monkeypatch.setattr(answer_cache_module, "redis_client", redis)
+    return redis
+
+
+PROBE = AnswerProbe(question="타이레놀하루최대용량", version="v1", vector_b64="AAA=", signatures=(5, 9))
+
+
+class TestAnswerCacheStore:
+    async def test_prunes_expired_and_overflowing_bucket_members(self, cache, monkeypatch):
+        monkeypatch.setattr(config, "ANSWER_CACHE_BUCKET_MAX_ENTRIES", 100)
+        redis = use_redis(monkeypatch, RecordingRedis(size=1, signatures={}))
+
+        await cache.store(PROBE, "하루 4g을 넘기지 마세요.")
+
+        for table, signature in enumerate(PROBE.signatures):
+            bucket = f"chat:answers:v1:bucket:{table}:{signature}"
+            commands = [command for command in redis.commands if command[1] == bucket]
+            assert [command[0] for command in commands] == ["zadd", "zremrangebyscore", "zremrangebyrank", "expire"]
+            (stored_at,) = commands[0][2].values()
+            assert commands[1][2:] == ("-inf", stored_at - config.ANSWER_CACHE_TTL_SECONDS)
+            assert commands[2][2:] == (0, -101)
+
+    async def test_evicted_entries_leave_their_buckets(self, cache, monkeypatch):
+        monkeypatch.setattr(config, "ANSWER_CACHE_MAX_ENTRIES", 2)
+        redis = use_redis(monkeypatch, RecordingRedis(size=3, signatures={"old": "7,11"}))
+
+        await cache.store(PROBE, "하루 4g을 넘기지 마세요.")
+
+        removed = [command[1:] for command in redis.commands if command[0] == "zrem"]
+        assert removed == [("chat:answers:v1:bucket:0:7", "old"), ("chat:answers:v1:bucket:1:11", "old")]
+        assert ("delete", "chat:answers:v1:entry:old") in redis.commands
+
+
+class TestAdminOnlyEndpoints:
+    async def test_non_admin_is_forbidden(self, monkeypatch):
+        monkeypatch.setattr(config, "ADMIN_USER_IDS", ["admin@example.com"])
+
+        with pytest.raises(HTTPException) as err:
+            await get_admin_user(SimpleNamespace(id="user@example.com"))
+
+        assert err.value.status_code == 403
+
+    async def test_admin_passes(self, monkeypatch):
+        monkeypatch.setattr(config, "ADMIN_USER_IDS", ["admin@example.com"])
+        admin = SimpleNamespace(id="admin@example.com")
+
+        assert await get_admin_user(admin) is admin
@@ -0,0 +1,48 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import pytest
+
+from app.services import blob_store as blob_store_module
+from app.services.blob_store import BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path))
+
+
+def put(store: BlobStore, data: bytes) -> dict:
+    return asyncio.run(store.put(data, hashlib.sha256(data).hexdigest()))
+
+
+class TestBlobStore:
+    def test_writes_content_addressed_file(self, store, tmp_path):
+        reference = put(store, b"image")
+
+        assert (tmp_path / reference["path"]).read_bytes() == b"image"
+        assert reference["size"] == 5
+
+    def test_reuse_refreshes_mtime(self, store, tmp_path):
+        reference = put(store, b"image")
+        path = tmp_path / reference["path"]
+        os.utime(path, (time.time() - 3600, time.time() - 3600))
+
+        put(store, b"image")
+
+        assert time.time() - path.stat().st_mtime < 60
+
+    def test_rewrites_blob_pruned_during_reuse(self, store, tmp_path, monkeypatch):
+        reference = put(store, b"image")
+        path = tmp_path / reference["path"]
+
+        def pruned_before_utime(target, *args):
+            os.unlink(target)  # 워커의 정리 작업이 먼저 지움
+            raise FileNotFoundError(target)
+
+        monkeypatch.setattr(blob_store_module.os, "utime", pruned_before_utime)
+
+        assert put(store, b"image") == reference
+        assert path.read_bytes() == b"image"
@@ -0,0 +1,268 @@
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.core import config
+from app.services import chat_context as chat_context_module
+from app.services.chat_context import ChatContextStore
+
+TURNS_KEY = "chat:ctx:a@example.com:s1:turns"
+PENDING_KEY = "chat:ctx:a@example.com:s1:pending"
+SUMMARY_KEY = "chat:ctx:a@example.com:s1:summary"
+LOCK_KEY = "chat:ctx:a@example.com:s1:summarizing"
+
+
+def _range(items: list, start: int, stop: int) -> list:
+    size = len(items)
+    start = max(size + start, 0) if start < 0 else start
+    stop = size + stop if stop < 0 else stop
+    return items[start : stop + 1]
+
+
+def _text(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.queued: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.queued]
+
+
+class FakeRedis:
+    """
+    맥락 저장소가 쓰는 문자열/목록 명령만 흉내 내는 Redis 대역입니다. (decode_responses=True처럼 문자열을 돌려줌, TTL은 무시)
+    """
+
+    def __init__(self):
+        self.values: dict[str, object] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self._get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        return self._set(key, value, nx=nx, ex=ex)
+
+    async def delete(self, *keys):
+        return self._delete(*keys)
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = _text(value)
+        return True
+
+    def _delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    def _exists(self, key):
+        return int(key in self.values)
+
+    def _expire(self, key, seconds):
+        return key in self.values
+
+    def _rpush(self, key, *values):
+        items = self.values.setdefault(key, [])
+        items.extend(map(_text, values))
+        return len(items)
+
+    def _lrange(self, key, start, stop):
+        return _range(self.values.get(key, []), start, stop)
+
+    def _ltrim(self, key, start, stop):
+        kept = _range(self.values.get(key, []), start, stop)
+        if kept:
+            self.values[key] = kept
+        else:
+            self.values.pop(key, None)
+        return True
+
+
+class FakeLLM:
+    def __init__(self, reply: str = "새 요약", during=None):
+        self.reply = reply
+        self.during = during  # 요약 생성 중에 끼어드는 동작 (동시 실행 흉내)
+        self.prompts: list[list[dict[str, str]]] = []
+
+    async def complete(self, messages):
+        self.prompts.append(messages)
+        if self.during is not None:
+            await self.during()
+        return self.reply
+
+
+class FakeQuery:
+    def __init__(self, rows: list[tuple[str, str]]):
+        self.rows = rows  # 오래된 것부터
+
+    def order_by(self, *fields):
+        return self
+
+    def limit(self, count):
+        self.count = count
+        return self
+
+    async def values_list(self, *fields):
+        return list(reversed(self.rows))[: self.count]
+
+
+def _message(role: str, content: str) -> dict[str, str]:
+    return {"role": role, "content": content}
+
+
+def _stored(redis: FakeRedis, key: str) -> list[dict[str, str]]:
+    return [orjson.loads(raw) for raw in redis.values.get(key, [])]
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(chat_context_module, "redis_client", fake)
+    monkeypatch.setattr(config, "CHAT_CONTEXT_WINDOW_MESSAGES", 2)
+    return fake
+
+
+def _history(monkeypatch, stored: list[tuple[str, str]], buffered: list[tuple[str, str]]) -> list[dict]:
+    calls: list[dict] = []
+
+    def filter_messages(**filters):
+        calls.append(filters)
+        return FakeQuery(stored)
+
+    async def buffered_rows(user_id, session_id):
+        return [{"role": role, "message": message} for role, message in buffered]
+
+    monkeypatch.setattr(chat_context_module, "ChatMessage", SimpleNamespace(filter=filter_messages))
+    monkeypatch.setattr(chat_context_module, "chat_writer", SimpleNamespace(buffered=buffered_rows))
+    return calls
+
+
+async def _drain_summaries():
+    await asyncio.gather(*list(chat_context_module._background_tasks))
+
+
+class TestWindow:
+    async def test_messages_pushed_out_of_the_window_wait_for_summary(self, redis):
+        store = ChatContextStore(llm=FakeLLM())
+        store.summarize = lambda user_id, session_id: asyncio.sleep(0)
+
+        await store.append("a@example.com", "s1", [_message("user", "q1"), _message("assistant", "a1")])
+        await store.append("a@example.com", "s1", [_message("user", "q2"), _message("assistant", "a2")])
+
+        assert _stored(redis, TURNS_KEY) == [_message("user", "q2"), _message("assistant", "a2")]
+        assert _stored(redis, PENDING_KEY) == [_message("user", "q1"), _message("assistant", "a1")]
+        context = await store.load("a@example.com", "s1")
+        assert context.summary is None
+        assert [message["content"] for message in context.messages] == ["q1", "a1", "q2", "a2"]
+        await _drain_summaries()
+
+
+class TestSummarize:
+    async def test_merges_pending_into_summary_and_keeps_messages_evicted_meanwhile(self, redis):
+        redis.values[SUMMARY_KEY] = "이전 요약"
+        redis._rpush(PENDING_KEY, *(orjson.dumps(m) for m in [_message("user", "q1"), _message("assistant", "a1")]))
+
+        async def evict_more():
+            redis._rpush(PENDING_KEY, orjson.dumps(_message("user", "q2")))
+
+        llm = FakeLLM(during=evict_more)
+        await ChatContextStore(llm=llm).summarize("a@example.com", "s1")
+
+        prompt = llm.prompts[0][1]["content"]
+        assert "이전 요약" in prompt and "user: q1\nassistant: a1" in prompt
+        assert "q2" not in prompt
+        assert redis.values[SUMMARY_KEY] == "새 요약"
+        assert _stored(redis, PENDING_KEY) == [_message("user", "q2")]
+        assert LOCK_KEY not in redis.values
+
+    async def test_failed_summary_keeps_pending_messages(self, redis):
+        redis._rpush(PENDING_KEY, orjson.dumps(_message("user", "q1")))
+
+        async def fail():
+            raise RuntimeError("llm down")
+
+        await ChatContextStore(llm=FakeLLM(during=fail)).summarize("a@example.com", "s1")
+
+        assert SUMMARY_KEY not in redis.values
+        assert _stored(redis, PENDING_KEY) == [_message("user", "q1")]
+        assert LOCK_KEY not in redis.values
+
+    async def test_does_not_release_a_lock_taken_over_after_expiry(self, redis):
+        redis._rpush(PENDING_KEY, orjson.dumps(_message("user", "q1")))
+
+        async def lock_expires_and_is_retaken():
+            redis.values[LOCK_KEY] = "other-summarizer"
+
+        await ChatContextStore(llm=FakeLLM(during=lock_expires_and_is_retaken)).summarize("a@example.com", "s1")
+
+        assert redis.values[LOCK_KEY] == "other-summarizer"
+
+    async def test_skips_while_another_summary_holds_the_lock(self, redis):
+        redis.values[LOCK_KEY] = "other-summarizer"
+        redis._rpush(PENDING_KEY, orjson.dumps(_message("user", "q1")))
+        llm = FakeLLM()
+
+        await ChatContextStore(llm=llm).summarize("a@example.com", "s1")
+
+        assert llm.prompts == []
+        assert redis.values[LOCK_KEY] == "other-summarizer"
+
+
+class TestSeed:
+    async def test_seeds_from_stored_and_buffered_rows_without_duplicates(self, redis, monkeypatch):
+        monkeypatch.setattr(config, "CHAT_CONTEXT_WINDOW_MESSAGES", 4)
+        # 버퍼를 읽은 뒤 q2가 MySQL에 저장되어 양쪽에 모두 보이는 경우
+        _history(
+            monkeypatch,
+            stored=[("user", "q1"), ("assistant", "a1"), ("user", "q2")],
+            buffered=[("user", "q2"), ("assistant", "a2")],
+        )
+
+        context = await ChatContextStore(llm=FakeLLM()).load("a@example.com", "s1")
+
+        assert [message["content"] for message in context.messages] == ["q1", "a1", "q2", "a2"]
+        assert _stored(redis, TURNS_KEY) == context.messages
+
+    async def test_seed_keeps_only_the_latest_window(self, redis, monkeypatch):
+        _history(monkeypatch, stored=[("user", "q1"), ("assistant", "a1")], buffered=[("user", "q2")])
+
+        context = await ChatContextStore(llm=FakeLLM()).load("a@example.com", "s1")
+
+        assert [message["content"] for message in context.messages] == ["a1", "q2"]
+
+
+class TestClear:
+    async def test_ended_session_starts_fresh_instead_of_reseeding(self, redis, monkeypatch):
+        calls = _history(monkeypatch, stored=[("user", "q1"), ("assistant", "a1")], buffered=[])
+        store = ChatContextStore(llm=FakeLLM())
+        redis.values[SUMMARY_KEY] = "이전 요약"
+        await store.append("a@example.com", "s1", [_message("user", "q1"), _message("assistant", "a1")])
+
+        await store.clear("a@example.com", "s1")
+        context = await store.load("a@example.com", "s1")
+
+        assert (context.summary, context.messages) == (None, [])
+        assert calls == []
+        await store.append("a@example.com", "s1", [_message("user", "q2"), _message("assistant", "a2")])
+        context = await store.load("a@example.com", "s1")
+        assert [message["content"] for message in context.messages] == ["q2", "a2"]
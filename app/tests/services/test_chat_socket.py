@@ -0,0 +1,47 @@
+import pytest
+from fastapi import WebSocketDisconnect, status
+
+from app.services.chat_socket import ChatSocketSession
+
+
+class FakeWebSocket:
+    def __init__(self, *messages: dict):
+        self.messages = list(messages)
+
+    async def receive(self) -> dict:
+        return self.messages.pop(0)
+
+
+def text(data: str) -> dict:
+    return {"type": "websocket.receive", "text": data}
+
+
+def session(*messages: dict) -> ChatSocketSession:
+    return ChatSocketSession(FakeWebSocket(*messages), user=None, token="token", chat_service=None)
+
+
+class TestChatSocketReceive:
+    async def test_binary_frame_closes_with_unsupported_data(self):
+        result = await session({"type": "websocket.receive", "bytes": b"\x00\x01"})._receive()
+
+        assert result == (status.WS_1003_UNSUPPORTED_DATA, "binary frames are not supported")
+
+    async def test_invalid_json_closes_with_unsupported_data(self):
+        result = await session(text("{not json"))._receive()
+
+        assert result == (status.WS_1003_UNSUPPORTED_DATA, "invalid json")
+
+    async def test_client_disconnect_is_raised(self):
+        with pytest.raises(WebSocketDisconnect) as err:
+            await session({"type": "websocket.disconnect", "code": 1001})._receive()
+
+        assert err.value.code == 1001
+
+    async def test_text_frames_are_handled_until_binary_frame(self):
+        socket = session(
+            text('{"type": "ping"}'), text('{"type": "pong"}'), {"type": "websocket.receive", "bytes": b""}
+        )
+
+        assert (await socket._receive())[0] == status.WS_1003_UNSUPPORTED_DATA
+        assert socket._outbox.get_nowait() == {"type": "pong"}
+        assert socket._outbox.empty()
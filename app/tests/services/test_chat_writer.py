@@ -0,0 +1,196 @@
+import asyncio
+
+import orjson
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from tortoise.exceptions import IntegrityError, OperationalError
+
+from app.core import config
+from app.services import chat_writer as chat_writer_module
+from app.services.chat_writer import (
+    CHAT_WRITE_DEAD_LETTER_STREAM,
+    CHAT_WRITE_STREAM,
+    ChatMessageWriter,
+)
+from app.utils import metrics as metrics_module
+
+_sleep = asyncio.sleep
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeStreams"):
+        self.redis = redis
+        self.commands: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xack(self, stream, group, *ids):
+        self.commands.append(("xack", ids))
+
+    def xdel(self, stream, *ids):
+        self.commands.append(("xdel", ids))
+
+    def hincrby(self, key, field, amount):
+        self.redis.metrics[field] = self.redis.metrics.get(field, 0) + amount
+
+    async def execute(self):
+        for name, ids in self.commands:
+            if name == "xack":
+                self.redis.acked.extend(ids)
+            else:
+                self.redis.streams[CHAT_WRITE_STREAM] = [
+                    entry for entry in self.redis.streams[CHAT_WRITE_STREAM] if entry[0] not in ids
+                ]
+
+
+class FakeStreams:
+    """
+    chat_writer가 쓰는 스트림 명령만 흉내 내는 Redis 대역입니다.
+    """
+
+    def __init__(self):
+        self.streams: dict[str, list[tuple[str, dict]]] = {CHAT_WRITE_STREAM: [], CHAT_WRITE_DEAD_LETTER_STREAM: []}
+        self.acked: list[str] = []
+        self.metrics: dict[str, int] = {}
+        self.delivered = 0
+        self.group_failures = 0
+
+    async def xadd(self, stream, fields):
+        entry_id = f"{len(self.streams[stream]) + 1}-0"
+        self.streams[stream].append((entry_id, fields))
+        return entry_id
+
+    async def xgroup_create(self, *args, **kwargs):
+        if self.group_failures:
+            self.group_failures -= 1
+            raise RedisConnectionError("redis is down")
+
+    async def xautoclaim(self, *args, **kwargs):
+        return "0-0", [], []
+
+    async def xreadgroup(self, group, consumer, streams, count, block):
+        entries = self.streams[CHAT_WRITE_STREAM][self.delivered :]
+        self.delivered += len(entries)
+        if not entries and block:
+            await _sleep(block / 1000)
+        return [[CHAT_WRITE_STREAM, entries]] if entries else []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def entry(entry_id: str, user_id: str, message: str) -> tuple[str, dict]:
+    row = {
+        "user_id": user_id,
+        "session_id": "s1",
+        "role": "user",
+        "message": message,
+        "reference_guide_id": None,
+        "created_at": "2026-01-01T00:00:00+09:00",
+    }
+    return entry_id, {"rows": orjson.dumps([row])}
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeStreams()
+    monkeypatch.setattr(chat_writer_module, "redis_client", fake)
+    monkeypatch.setattr(metrics_module, "redis_client", fake)
+    return fake
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    rows: list[dict] = []
+
+    async def insert(batch):
+        if any(row["user_id"] == "deleted@example.com" for row in batch):
+            raise IntegrityError("foreign key constraint fails")
+        rows.extend(batch)
+
+    monkeypatch.setattr(ChatMessageWriter, "_insert", staticmethod(insert))
+    return rows
+
+
+class TestChatMessageWriterFlush:
+    async def test_bad_entry_goes_to_dead_letter_and_rest_is_saved(self, redis, saved):
+        writer = ChatMessageWriter()
+        entries = [
+            entry("1-0", "a@example.com", "안녕"),
+            entry("2-0", "deleted@example.com", "x"),
+            entry("3-0", "b@example.com", "네"),
+        ]
+
+        await writer._flush(entries)
+
+        assert [row["message"] for row in saved] == ["안녕", "네"]
+        assert redis.acked == ["1-0", "2-0", "3-0"]
+        ((_, dead),) = redis.streams[CHAT_WRITE_DEAD_LETTER_STREAM]
+        assert dead["entry_id"] == "2-0"
+        assert orjson.loads(dead["rows"])[0]["user_id"] == "deleted@example.com"
+        assert "IntegrityError" in dead["error"]
+
+    async def test_malformed_entry_goes_to_dead_letter(self, redis, saved):
+        writer = ChatMessageWriter()
+
+        await writer._flush([entry("1-0", "a@example.com", "안녕"), ("2-0", {"rows": b"{not json"})])
+
+        assert [row["message"] for row in saved] == ["안녕"]
+        assert [dead["entry_id"] for _, dead in redis.streams[CHAT_WRITE_DEAD_LETTER_STREAM]] == ["2-0"]
+
+    async def test_transient_failure_leaves_batch_unacked(self, redis, monkeypatch):
+        async def insert(batch):
+            raise OperationalError("lost connection")
+
+        monkeypatch.setattr(ChatMessageWriter, "_insert", staticmethod(insert))
+
+        with pytest.raises(OperationalError):
+            await ChatMessageWriter()._flush([entry("1-0", "a@example.com", "안녕")])
+
+        assert redis.acked == []
+        assert redis.streams[CHAT_WRITE_DEAD_LETTER_STREAM] == []
+
+
+class TestChatMessageWriterRun:
+    async def test_survives_redis_outage_at_startup(self, redis, saved, monkeypatch):
+        monkeypatch.setattr(config, "CHAT_WRITE_BEHIND_ENABLED", True)
+        monkeypatch.setattr(chat_writer_module.asyncio, "sleep", lambda _: _sleep(0))  # 재시도 대기 생략
+        monkeypatch.setattr(config, "CHAT_WRITE_FLUSH_MS", 1)
+        redis.group_failures = 2
+        redis.streams[CHAT_WRITE_STREAM].append(entry("1-0", "a@example.com", "안녕"))
+        writer = ChatMessageWriter()
+
+        writer.start()
+        await _sleep(0.05)
+        await writer.stop()
+
+        assert [row["message"] for row in saved] == ["안녕"]
+        assert redis.acked == ["1-0"]
+
+
+class TestChatMessageWriterEnqueue:
+    async def test_drops_guide_refs_the_user_does_not_own(self, redis, monkeypatch):
+        monkeypatch.setattr(config, "CHAT_WRITE_BEHIND_ENABLED", True)
+        guides = [("a@example.com", 7), ("b@example.com", 8)]
+
+        class GuideQuery:
+            def __init__(self, id__in):
+                self.ids = id__in
+
+            async def values_list(self, *fields):
+                return [guide for guide in guides if guide[1] in self.ids]
+
+        monkeypatch.setattr(chat_writer_module.LLMLifeGuide, "filter", GuideQuery)
+        row = {"user_id": "a@example.com", "session_id": "s1", "role": "user", "message": "안녕"}
+
+        for guide_id in (7, 8, 9, "7", None):
+            await ChatMessageWriter().enqueue([{**row, "reference_guide_id": guide_id}])
+
+        queued = [
+            orjson.loads(fields["rows"])[0]["reference_guide_id"] for _, fields in redis.streams[CHAT_WRITE_STREAM]
+        ]
+        assert queued == [7, None, None, None, None]
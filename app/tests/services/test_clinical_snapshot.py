@@ -0,0 +1,161 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import clinical_snapshot as clinical_snapshot_module
+from app.services.clinical_snapshot import ClinicalSnapshot, ClinicalSnapshotStore
+from app.utils import metrics as metrics_module
+
+SNAPSHOT_KEY = "clinical:snapshot:a@example.com"
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis", buffering: bool):
+        self.redis = redis
+        self.buffering = buffering  # transaction()의 콜백 안에서는 multi() 전까지 즉시 실행
+        self.queued: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, key):
+        assert not self.buffering
+        return await self.redis.get(key)
+
+    async def hgetall(self, key):
+        assert not self.buffering
+        return await self.redis.hgetall(key)
+
+    def multi(self):
+        self.buffering = True
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.queued]
+
+
+class FakeRedis:
+    """
+    스냅샷 저장소가 쓰는 해시/카운터 명령과 transaction()만 흉내 내는 Redis 대역입니다. (WATCH 충돌은 흉내 내지 않음)
+    """
+
+    def __init__(self):
+        self.values: dict[str, object] = {}
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def hget(self, key, field):
+        return self.values.get(key, {}).get(field)
+
+    async def hgetall(self, key):
+        return dict(self.values.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self, buffering=True)
+
+    async def transaction(self, func, *watches, value_from_callable=False):
+        pipe = FakePipeline(self, buffering=False)
+        value = await func(pipe)
+        result = await pipe.execute()
+        return value if value_from_callable else result
+
+    def _incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+
+    def _hset(self, key, mapping):
+        self.values.setdefault(key, {}).update(
+            {field: value.decode() if isinstance(value, bytes) else str(value) for field, value in mapping.items()}
+        )
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def _expire(self, key, ttl):
+        pass
+
+    def _hincrby(self, key, field, amount):
+        pass
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(clinical_snapshot_module, "redis_client", fake)
+    monkeypatch.setattr(metrics_module, "redis_client", fake)
+    return fake
+
+
+@pytest.fixture
+def user():
+    return SimpleNamespace(id="a@example.com", resident_registration_number="")
+
+
+class FakeDatabase:
+    """
+    build()가 읽는 기저질환 목록입니다. during_build가 있으면 DB를 읽은 직후(저장 전)에 실행합니다.
+    """
+
+    def __init__(self, store: ClinicalSnapshotStore):
+        self.diseases: list[dict] = []
+        self.during_build = None
+        store.build = self.build
+
+    async def build(self, user) -> ClinicalSnapshot:
+        snapshot = ClinicalSnapshot(user_id=user.id, diseases=list(self.diseases))
+        if self.during_build is not None:
+            during_build, self.during_build = self.during_build, None
+            await during_build()
+        return snapshot
+
+
+class TestClinicalSnapshotRebuild:
+    async def test_cold_read_stores_snapshot(self, redis, user):
+        store = ClinicalSnapshotStore()
+        FakeDatabase(store).diseases.append({"id": 1, "name": "고혈압"})
+
+        assert (await store.get(user)).disease_names == ["고혈압"]
+        assert redis.values[SNAPSHOT_KEY]["diseases"] == '[{"id":1,"name":"고혈압"}]'
+
+    async def test_write_during_cold_read_is_not_lost(self, redis, user):
+        store = ClinicalSnapshotStore()
+        db = FakeDatabase(store)
+
+        async def add_disease():
+            db.diseases.append({"id": 1, "name": "고혈압"})
+            await store.upsert(user.id, "diseases", {"id": 1, "name": "고혈압"})  # 스냅샷이 아직 없음
+
+        db.during_build = add_disease
+        assert (await store.get(user)).diseases == []  # DB를 먼저 읽은 요청의 결과
+        assert SNAPSHOT_KEY not in redis.values  # 변경이 빠진 스냅샷은 저장하지 않음
+
+        assert (await store.get(user)).disease_names == ["고혈압"]
+        assert SNAPSHOT_KEY in redis.values
+
+    async def test_invalidate_during_rebuild_wins(self, redis, user):
+        store = ClinicalSnapshotStore()
+        db = FakeDatabase(store)
+        db.during_build = lambda: store.invalidate(user.id)
+
+        await store.rebuild(user)
+
+        assert SNAPSHOT_KEY not in redis.values
+
+    async def test_writes_update_stored_snapshot(self, redis, user):
+        store = ClinicalSnapshotStore()
+        FakeDatabase(store)
+        await store.get(user)
+
+        await store.upsert(user.id, "allergies", {"id": 3, "name": "페니실린"})
+        await store.remove(user.id, "allergies", 3)
+        await store.upsert(user.id, "allergies", {"id": 4, "name": "아스피린"})
+
+        assert (await store.get(user)).allergy_names == ["아스피린"]
+        assert "알러지: 아스피린" in await store.get_context(user)
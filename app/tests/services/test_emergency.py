@@ -0,0 +1,97 @@
+import pytest
+
+from app.core import config
+from app.services.emergency import EmergencyDetector, normalize_symptom_text
+
+LEXICON = {
+    "version": "test",
+    "severities": ["emergency", "urgent", "caution"],
+    "categories": {
+        "호흡곤란": {"severity": "emergency", "terms": ["숨이차", "호흡곤란"], "variants": ["숨이쳐"]},
+        "고열": {"severity": "urgent", "terms": ["고열"]},
+        "어지러움": {"severity": "caution", "terms": ["어지러"]},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def lexicon_detector() -> EmergencyDetector:
+    return EmergencyDetector.from_file(config.EMERGENCY_LEXICON_PATH)
+
+
+class TestNormalizeSymptomText:
+    def test_ignores_spacing_punctuation_and_case(self):
+        assert normalize_symptom_text("숨이 차요!!") == normalize_symptom_text("숨이차요") == "숨이차요"
+        assert normalize_symptom_text("ＣＯＶＩＤ ㅠㅠ") == "covid"
+
+    def test_composes_separately_typed_jamo(self):
+        assert normalize_symptom_text("ㅅㅜㅁ이 차요") == "숨이차요"
+
+
+class TestEmergencyDetector:
+    def test_reports_highest_severity_first(self):
+        scan = EmergencyDetector(LEXICON).scan("어지러워요. 고열에 숨이 차요")
+
+        assert scan.is_emergency
+        assert scan.categories == ["호흡곤란", "고열", "어지러움"]
+
+    def test_matches_typo_variants_and_jamo_input(self):
+        detector = EmergencyDetector(LEXICON)
+
+        assert detector.scan("숨이 쳐요").is_emergency
+        assert detector.scan("ㅅㅜㅁ이 차요").is_emergency
+
+    def test_overlapping_terms_are_all_found(self):
+        scan = EmergencyDetector(LEXICON).scan("호흡곤란으로 숨이 차요")
+
+        assert {match.term for match in scan.matches} == {"숨이차", "호흡곤란"}
+
+    def test_no_match_is_empty_scan(self):
+        scan = EmergencyDetector(LEXICON).scan("타이레놀 하루 몇 번 먹나요?")
+
+        assert scan.severity is None and not scan.is_emergency and scan.categories == []
+
+    def test_rejects_unknown_severity(self):
+        lexicon = {**LEXICON, "categories": {"x": {"severity": "fatal", "terms": ["x"]}}}
+
+        with pytest.raises(ValueError):
+            EmergencyDetector(lexicon)
+
+
+class TestEmergencyLexicon:
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "간질환이 있는데 이 약 먹어도 되나요?",
+            "협심증 약을 먹고 있는데 타이레놀 같이 먹어도 돼요?",
+            "중풍 예방약 복용 중이에요",
+            "뇌졸중 가족력이 있는데 아스피린 먹어도 되나요?",
+            "항경련제를 먹고 있어요",
+            "간질 약 먹는 시간을 바꿔도 되나요?",
+            "부정맥 약이랑 감기약 같이 먹어도 돼요?",
+            "자살 예방 캠페인 포스터 봤어요",
+            "기저질환: 협심증, 뇌졸중, 간질 / 알러지: 없음",
+        ],
+    )
+    def test_disease_history_and_medication_questions_are_not_emergencies(self, lexicon_detector, message):
+        assert not lexicon_detector.scan(message).is_emergency
+
+    @pytest.mark.parametrize(
+        ("message", "category"),
+        [
+            ("숨이 차요", "호흡곤란"),
+            ("가슴이 조이는 것 같아요", "흉통"),
+            ("아이가 경련을 해요", "경련"),
+            ("갑자기 발작했어요", "경련"),
+            ("중풍이 온 것 같아요", "뇌졸중징후"),
+            ("말이 어눌해졌어요", "뇌졸중징후"),
+            ("죽고 싶어요", "자해위험"),
+            ("자살하고 싶어요", "자해위험"),
+            ("약을 한꺼번에 먹었어요", "과다복용"),
+        ],
+    )
+    def test_symptom_phrasing_is_emergency(self, lexicon_detector, message, category):
+        scan = lexicon_detector.scan(message)
+
+        assert scan.is_emergency
+        assert category in scan.categories
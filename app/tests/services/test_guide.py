@@ -0,0 +1,195 @@
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.core import config
+from app.dtos.guide import GuideRequest
+from app.services import guide as guide_module
+from app.services.guide import GuideService
+from app.utils import metrics as metrics_module
+from app.utils.single_flight import flight_digest
+
+USER = SimpleNamespace(id="a@example.com")
+CACHE_KEY = "guide:cache:a@example.com"
+FINGERPRINT_KEY = "guide:fingerprint:a@example.com"
+GUIDE = {
+    "guide_id": 1,
+    "guide_type": "복약",
+    "user_current_status": "기저질환: 고혈압",
+    "generated_content": "하루 한 번 같은 시간에 복용하세요.",
+    "is_emergency_alert": False,
+    "created_at": "2026-10-01T09:00:00",
+}
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.queued: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.queued.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.queued]
+
+
+class FakeRedis:
+    """
+    가이드 캐시가 쓰는 문자열/해시 명령만 흉내 내는 Redis 대역입니다. (TTL은 무시)
+    """
+
+    def __init__(self):
+        self.values: dict[str, object] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def hget(self, key, field):
+        return self.values.get(key, {}).get(field)
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _hmget(self, key, *fields):
+        return [self.values.get(key, {}).get(field) for field in fields]
+
+    def _hset(self, key, mapping):
+        self.values.setdefault(key, {}).update(mapping)
+
+    def _hincrby(self, key, field, amount):
+        self.values.setdefault(key, {})
+        self.values[key][field] = self.values[key].get(field, 0) + amount
+
+    def _expire(self, key, seconds):
+        return key in self.values
+
+
+class FakeGuides:
+    """
+    LLMLifeGuide의 exists/filter().order_by().first() 조회만 흉내 냅니다.
+    """
+
+    def __init__(self, latest=None):
+        self.latest = latest
+
+    async def exists(self, **filters):
+        return self.latest is not None
+
+    def filter(self, **filters):
+        return self
+
+    def order_by(self, *fields):
+        return self
+
+    async def first(self):
+        return self.latest
+
+
+def _request(records: str) -> GuideRequest:
+    return GuideRequest(user_id=USER.id, medical_records=records, medication_info="아모디핀정")
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(guide_module, "redis_client", fake)
+    monkeypatch.setattr(metrics_module, "redis_client", fake)
+    monkeypatch.setattr(config, "GUIDE_REGENERATE_DELAY_SECONDS", 0)
+    monkeypatch.setattr(guide_module, "LLMLifeGuide", FakeGuides())
+    guide_module._pending_regenerations.clear()
+    return fake
+
+
+@pytest.fixture
+def service(monkeypatch) -> GuideService:
+    """
+    현재 프로필이 "기저질환: 고혈압"이고, 생성한 가이드를 generated에 기록하는 GuideService입니다.
+    """
+    service = GuideService()
+    service.profile = _request("기저질환: 고혈압")
+    service.generated = []
+
+    async def build_request(user):
+        return service.profile
+
+    async def generate(request):
+        service.generated.append(request)
+        return {**GUIDE, "guide_id": 100 + len(service.generated)}
+
+    monkeypatch.setattr(service, "build_request", build_request)
+    monkeypatch.setattr(service, "_generate", generate)
+    return service
+
+
+def _cache(redis: FakeRedis, request: GuideRequest) -> None:
+    redis.values[CACHE_KEY] = {"fingerprint": flight_digest(request.model_dump()), "guide": orjson.dumps(GUIDE)}
+
+
+async def _drain_regenerations():
+    await asyncio.gather(*list(guide_module._background_tasks))
+
+
+class TestGetOrGenerate:
+    async def test_returns_cached_guide_when_fingerprint_is_unchanged(self, redis, service):
+        _cache(redis, service.profile)
+        redis.values[FINGERPRINT_KEY] = flight_digest(service.profile.model_dump())
+
+        guide = await service.get_or_generate(USER)
+
+        assert guide == {**GUIDE, "refreshed": False, "is_stale": False}
+        assert service.generated == []
+        assert not guide_module._pending_regenerations
+
+    async def test_profile_change_returns_stale_guide_and_regenerates_once(self, redis, service):
+        _cache(redis, service.profile)
+        service.profile = _request("기저질환: 고혈압, 당뇨")
+
+        await service.invalidate_profile(USER)
+        guide = await service.get_or_generate(USER)
+        again = await service.get_or_generate(USER)
+
+        assert guide == {**GUIDE, "refreshed": False, "is_stale": True}
+        assert again["is_stale"] is True
+        assert len(guide_module._background_tasks) == 1
+        await _drain_regenerations()
+        assert service.generated == [service.profile]
+
+    async def test_first_guide_is_generated_in_the_request(self, redis, service):
+        guide = await service.get_or_generate(USER)
+
+        assert (guide["guide_id"], guide["refreshed"], guide["is_stale"]) == (101, True, False)
+        assert service.generated == [service.profile]
+        assert not guide_module._background_tasks
+
+
+class TestRegeneration:
+    async def test_user_without_a_guide_is_not_regenerated(self, redis, service):
+        await service.invalidate_profile(USER)
+        await _drain_regenerations()
+
+        assert service.generated == []
+        assert redis.values[FINGERPRINT_KEY] == flight_digest(service.profile.model_dump())
+
+    async def test_regeneration_is_skipped_when_cached_guide_already_matches(self, redis, service):
+        _cache(redis, service.profile)
+
+        await service.invalidate_profile(USER)
+        await _drain_regenerations()
+
+        assert service.generated == []
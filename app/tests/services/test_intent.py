@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from app.core import config
+from app.services import intent as intent_module
+from app.services.intent import INTENT_LABELS, IntentClassifier, get_intent_classifier, intent_features
+
+
+def toy_model(n_features: int = 1024) -> dict:
+    """
+    "약"이 들어가면 복약, "아파"가 들어가면 증상 쪽으로 기우는 두 레이블 모델입니다.
+    """
+    weights: dict[str, list[float]] = {}
+    for ngram, label_weights in ((" 약", [4.0, 0.0]), ("아파", [0.0, 4.0])):
+        index, sign = intent_module._slot(ngram, n_features)
+        weights[str(index)] = [weight * sign for weight in label_weights]
+    return {
+        "version": "toy",
+        "labels": ["복약", "증상"],
+        "n_features": n_features,
+        "ngram_range": [1, 3],
+        "intercept": [0.0, 0.0],
+        "weights": weights,
+    }
+
+
+class TestIntentFeatures:
+    def test_is_l2_normalized_and_deterministic(self):
+        features = intent_features("타이레놀 먹어도 돼요?", 1024)
+
+        assert features == intent_features("타이레놀 먹어도 돼요?", 1024)
+        assert math.isclose(math.sqrt(sum(value * value for value in features.values())), 1.0)
+        assert all(0 <= index < 1024 for index in features)
+
+    def test_normalizes_width_and_case_but_keeps_word_boundaries(self):
+        assert intent_features("ＡＰＰ 알람", 1024) == intent_features("app 알람", 1024)
+        assert intent_features("약 먹어요", 1024) != intent_features("약먹어요", 1024)
+
+    def test_empty_text_has_no_features(self):
+        assert intent_features("   ", 1024) == {}
+
+
+class TestIntentClassifier:
+    def test_scores_with_sparse_weights(self):
+        classifier = IntentClassifier(toy_model())
+
+        assert classifier.predict("약 먹어도 되나요").label == "복약"
+        assert classifier.predict("배가 아파요").label == "증상"
+
+    def test_confidence_is_softmax_probability(self):
+        classifier = IntentClassifier(toy_model())
+
+        assert classifier.predict("").confidence == pytest.approx(0.5)
+        assert 0.5 < classifier.predict("약 먹어도 되나요").confidence < 1.0
+
+    @pytest.mark.parametrize(
+        ("message", "label"),
+        [
+            ("타이레놀이랑 술 같이 먹어도 돼요?", "복약"),
+            ("비밀번호를 바꾸고 싶어요", "시스템"),
+        ],
+    )
+    def test_shipped_model_labels_training_examples(self, message, label):
+        classifier = IntentClassifier.from_file(config.INTENT_MODEL_PATH)
+
+        assert classifier.labels == list(INTENT_LABELS)
+        assert classifier.predict(message).label == label
+
+    def test_missing_model_falls_back_to_llm(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "INTENT_MODEL_PATH", str(tmp_path / "missing.json"))
+        get_intent_classifier.cache_clear()
+        try:
+            assert get_intent_classifier() is None
+        finally:
+            get_intent_classifier.cache_clear()
@@ -0,0 +1,67 @@
+from app.services.interaction import InteractionEngine
+
+DATASET = {
+    "version": "test-v1",
+    "ingredients": {
+        "아세트아미노펜": {"classes": ["해열진통제"], "aliases": ["타이레놀"]},
+        "이부프로펜": {"classes": ["NSAID"], "aliases": ["부루펜"]},
+        "아스피린": {"classes": ["NSAID", "항혈소판제"], "aliases": ["aspirin"]},
+        "와파린": {"classes": ["항응고제"], "aliases": ["쿠마딘"]},
+        "아목시실린": {"classes": ["페니실린계"], "aliases": []},
+    },
+    "products": {"타이레놀정500밀리그램": ["아세트아미노펜"], "콤비정": ["아세트아미노펜", "이부프로펜"]},
+    "interactions": [
+        {"a": "NSAID", "b": "항응고제", "severity": "major", "message": "출혈 위험이 커집니다."},
+        {"a": "아스피린", "b": "이부프로펜", "severity": "moderate", "message": "아스피린 효과가 줄어듭니다."},
+    ],
+    "allergies": {"페니실린": ["페니실린계"]},
+    "diseases": {"위궤양": [{"target": "NSAID", "severity": "major", "message": "위장 출혈 위험이 있습니다."}]},
+}
+
+
+def check(medications: list[str], allergies: list[str] | None = None, diseases: list[str] | None = None):
+    return InteractionEngine(DATASET).check(medications, allergies or [], diseases or [])
+
+
+class TestInteractionEngine:
+    def test_class_level_interaction_is_found_through_ingredient_classes(self):
+        result = check(["부루펜", "와파린"])
+
+        assert [(warning.kind, warning.severity) for warning in result.warnings] == [("interaction", "major")]
+        assert result.warnings[0].medications == ["부루펜", "와파린"]
+        assert result.dataset_version == "test-v1"
+
+    def test_warnings_are_sorted_by_severity(self):
+        result = check(["aspirin", "이부프로펜", "쿠마딘"])
+
+        severities = [warning.severity for warning in result.warnings]
+        assert severities == sorted(severities, key=["contraindicated", "major", "moderate", "minor"].index)
+        assert {warning.subject for warning in result.warnings} == {"NSAID + 항응고제", "아스피린 + 이부프로펜"}
+
+    def test_duplicate_ingredient_across_products(self):
+        result = check(["타이레놀정 500mg", "콤비정"])
+
+        assert [(warning.kind, warning.subject) for warning in result.warnings] == [("duplicate", "아세트아미노펜")]
+
+    def test_resolves_bracketed_ingredient_and_reports_unknown_names(self):
+        result = check(["모르는정(와파린)", "부루펜", "처음보는약"])
+
+        assert result.warnings[0].kind == "interaction"
+        assert result.unrecognized_medications == ["처음보는약"]
+
+    def test_allergy_to_class_and_to_ingredient_name(self):
+        result = check(["아목시실린", "타이레놀"], allergies=["페니실린", "아세트아미노펜"])
+
+        assert {(warning.medications[0], warning.subject) for warning in result.warnings} == {
+            ("아목시실린", "페니실린"),
+            ("타이레놀", "아세트아미노펜"),
+        }
+        assert {warning.severity for warning in result.warnings} == {"contraindicated"}
+
+    def test_disease_contraindication(self):
+        result = check(["부루펜", "타이레놀"], diseases=["위궤양"])
+
+        assert [(warning.kind, warning.medications) for warning in result.warnings] == [("disease", ["부루펜"])]
+
+    def test_no_warnings_for_unrelated_medications(self):
+        assert check(["타이레놀", "아목시실린"]).warnings == []
@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import config
+from app.utils import metrics as metrics_module
+from app.utils import single_flight as single_flight_module
+from app.utils.single_flight import SingleFlight, flight_digest
+
+
+class FakePubSub:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.channels: list[str] = []
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.append(channel)
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def get_message(self, timeout: float):
+        try:
+            return {"type": "message", "data": await asyncio.wait_for(self.queue.get(), timeout)}
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        for channel in self.channels:
+            self.redis.subscribers[channel].remove(self.queue)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """
+    SingleFlight가 쓰는 문자열/pub-sub 명령만 흉내 내는 Redis 대역입니다. (만료는 흉내 내지 않음)
+    여러 SingleFlight 인스턴스가 하나를 공유하면 API 프로세스 여러 개가 같은 Redis를 쓰는 상황이 됩니다.
+    """
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def expire(self, key, ttl):
+        return key in self.values
+
+    async def publish(self, channel, payload):
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait(payload)
+
+    async def hincrby(self, *args):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+@pytest.fixture
+def redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(single_flight_module, "redis_client", fake)
+    monkeypatch.setattr(metrics_module, "redis_client", fake)
+    monkeypatch.setattr(config, "SINGLE_FLIGHT_POLL_SECONDS", 0.01)
+    return fake
+
+
+class Compute:
+    def __init__(self, result="가이드", error: Exception | None = None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_flight_digest_ignores_key_order():
+    assert flight_digest({"a": 1, "b": [1, 2]}) == flight_digest({"b": [1, 2], "a": 1})
+    assert flight_digest({"a": 1}) != flight_digest({"a": 2})
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_in_one_process_share_one_run(self, redis):
+        flights, compute = SingleFlight("t"), Compute()
+
+        calls = [asyncio.create_task(flights.run({"q": 1}, compute, timeout=5)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        compute.release.set()
+
+        assert await asyncio.gather(*calls) == ["가이드"] * 5
+        assert compute.calls == 1
+
+    async def test_follower_process_receives_leader_result(self, redis):
+        leader, follower = SingleFlight("t"), SingleFlight("t")  # 같은 Redis를 쓰는 두 프로세스
+        lead_compute, follow_compute = Compute(), Compute()
+
+        led = asyncio.create_task(leader.run({"q": 1}, lead_compute, timeout=5))
+        await asyncio.sleep(0.01)
+        followed = asyncio.create_task(follower.run({"q": 1}, follow_compute, timeout=5))
+        await asyncio.sleep(0.01)
+        lead_compute.release.set()
+
+        assert await led == await followed == "가이드"
+        assert (lead_compute.calls, follow_compute.calls) == (1, 0)
+
+    async def test_retry_after_completion_reuses_stored_result(self, redis):
+        compute = Compute()
+        compute.release.set()
+        await SingleFlight("t").run({"q": 1}, compute, timeout=5)
+
+        assert await SingleFlight("t").run({"q": 1}, compute, timeout=5) == "가이드"
+        assert compute.calls == 1
+
+    async def test_leader_http_error_reaches_followers_and_is_not_stored(self, redis):
+        leader, follower = SingleFlight("t"), SingleFlight("t")
+        failing = Compute(error=HTTPException(status_code=502, detail="LLM 오류"))
+
+        led = asyncio.create_task(leader.run({"q": 1}, failing, timeout=5))
+        await asyncio.sleep(0.01)
+        followed = asyncio.create_task(follower.run({"q": 1}, Compute(), timeout=5))
+        await asyncio.sleep(0.01)
+        failing.release.set()
+
+        for call in (led, followed):
+            with pytest.raises(HTTPException) as err:
+                await call
+            assert err.value.status_code == 502
+        assert not any(":result:" in key for key in redis.values)
+
+    async def test_follower_takes_over_when_leader_disappears(self, redis):
+        digest = flight_digest({"q": 1})
+        await redis.set(f"flight:t:lock:{digest}", "dead-leader")  # 결과 없이 죽은 리더의 락
+        compute = Compute()
+        compute.release.set()
+
+        following = asyncio.create_task(SingleFlight("t").run({"q": 1}, compute, timeout=5))
+        await asyncio.sleep(0.03)
+        assert compute.calls == 0
+        await redis.delete(f"flight:t:lock:{digest}")  # 락 만료
+
+        assert await following == "가이드"
+        assert compute.calls == 1
+
+    async def test_follower_computes_itself_after_timeout(self, redis):
+        await redis.set(f"flight:t:lock:{flight_digest({'q': 1})}", "slow-leader")
+        compute = Compute()
+        compute.release.set()
+
+        assert await SingleFlight("t").run({"q": 1}, compute, timeout=0.05) == "가이드"
+        assert compute.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_shared_run(self, redis):
+        flights, compute = SingleFlight("t"), Compute()
+
+        first = asyncio.create_task(flights.run({"q": 1}, compute, timeout=5))
+        second = asyncio.create_task(flights.run({"q": 1}, compute, timeout=5))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        compute.release.set()
+
+        assert await second == "가이드"
+        assert compute.calls == 1
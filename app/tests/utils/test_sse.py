@@ -0,0 +1,81 @@
+import asyncio
+
+import orjson
+import pytest
+
+from app.utils.sse import coalesce, sse_frame
+
+
+async def stream(tokens: list[str], delay: float = 0.0, error: Exception | None = None):
+    for token in tokens:
+        if delay:
+            await asyncio.sleep(delay)
+        yield token
+    if error is not None:
+        raise error
+
+
+async def collect(chunks) -> list[str]:
+    return [chunk async for chunk in chunks]
+
+
+class TestCoalesce:
+    async def test_groups_tokens_up_to_max_chars(self):
+        chunks = await collect(coalesce(stream(["ab", "cd", "ef", "g"]), max_delay=10, max_chars=4))
+
+        assert chunks == ["abcd", "efg"]
+
+    async def test_flushes_after_max_delay(self):
+        chunks = await collect(coalesce(stream(["a", "b", "c"], delay=0.05), max_delay=0.01, max_chars=100))
+
+        assert chunks == ["a", "b", "c"]
+
+    async def test_yields_pending_text_before_upstream_error(self):
+        chunks = coalesce(stream(["ab", "c"], error=RuntimeError("upstream closed")), max_delay=10, max_chars=100)
+
+        received = []
+        with pytest.raises(RuntimeError, match="upstream closed"):
+            async for chunk in chunks:
+                received.append(chunk)
+
+        assert received == ["abc"]
+
+    async def test_closing_consumer_closes_upstream(self):
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield "x"
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        chunks = coalesce(endless(), max_delay=10, max_chars=3)
+        assert await anext(chunks) == "xxx"
+        await chunks.aclose()
+
+        assert closed.is_set()
+
+    async def test_slow_consumer_bounds_upstream_read_ahead(self):
+        read = 0
+
+        async def counted():
+            nonlocal read
+            while True:
+                read += 1
+                yield "x"
+
+        chunks = coalesce(counted(), max_delay=10, max_chars=1, buffer_size=4)
+        await anext(chunks)
+        await asyncio.sleep(0.05)  # 클라이언트가 다음 덩어리를 가져가지 않는 동안
+
+        assert read <= 1 + 4 + 1  # 내보낸 토큰 + 버퍼 + 넣으려고 기다리는 토큰
+        await chunks.aclose()
+
+
+def test_sse_frame_is_single_data_event():
+    frame = sse_frame({"type": "delta", "text": "안녕"})
+
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert orjson.loads(frame[len(b"data: ") : -2]) == {"type": "delta", "text": "안녕"}
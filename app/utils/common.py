@@ -7,7 +7,9 @@ from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
 
 from app.core import config
 
-redis_client = redis.from_url("redis://172.17.0.1:6379", decode_responses=True)
+redis_client = redis.from_url(config.REDIS_URL, decode_responses=True)
+# msgpack 등 바이너리 값을 그대로 다루기 위한 클라이언트
+redis_binary_client = redis.from_url(config.REDIS_URL)
 
 conf = ConnectionConfig(
     MAIL_USERNAME=config.SMTP_USER,         # 네이버 이메일 주소 전체
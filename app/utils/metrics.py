@@ -0,0 +1,85 @@
+import time
+from collections import defaultdict
+
+from app.core import config
+from app.utils.common import redis_client
+
+METRICS_KEY = "metrics:{namespace}"
+
+
+class MetricsRecorder:
+    """
+    프로세스 내에서 카운터를 누적했다가 주기적으로 Redis 해시(metrics:{namespace})에 합산하는 기록기입니다.
+    요청 경로마다 Redis 왕복이 생기지 않도록 증가 연산은 메모리에서만 수행합니다.
+    """
+
+    def __init__(self, namespace: str, flush_interval: float | None = None):
+        self.namespace = namespace
+        self.flush_interval = flush_interval if flush_interval is not None else config.METRICS_FLUSH_INTERVAL_SECONDS
+        self._pending: defaultdict[str, int] = defaultdict(int)
+        self._last_flush = time.monotonic()
+
+    def incr(self, field: str, amount: int = 1) -> None:
+        """
+        카운터를 증가시킵니다. 실제 Redis 반영은 flush 시점에 이루어집니다.
+
+        Args:
+            field (str): 카운터 이름 (예: hit, miss)
+            amount (int): 증가량
+        """
+        self._pending[field] += amount
+
+    async def maybe_flush(self) -> None:
+        """
+        마지막 반영 이후 flush_interval이 지났다면 누적된 카운터를 Redis에 반영합니다.
+        """
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        누적된 카운터를 Redis 해시에 HINCRBY로 한 번에 합산합니다.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, defaultdict(int)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for field, amount in pending.items():
+                pipe.hincrby(METRICS_KEY.format(namespace=self.namespace), field, amount)
+            await pipe.execute()
+
+
+_recorders: dict[str, MetricsRecorder] = {}
+
+
+def get_metrics_recorder(namespace: str) -> MetricsRecorder:
+    """
+    네임스페이스별 기록기를 프로세스 단위 싱글턴으로 반환합니다.
+
+    Args:
+        namespace (str): 메트릭 네임스페이스 (예: inference_cache)
+
+    Returns:
+        MetricsRecorder: 해당 네임스페이스의 기록기
+    """
+    if namespace not in _recorders:
+        _recorders[namespace] = MetricsRecorder(namespace)
+    return _recorders[namespace]
+
+
+async def read_all_metrics() -> dict[str, dict[str, int]]:
+    """
+    현재 프로세스의 미반영 카운터를 먼저 반영한 뒤, 모든 API 워커가 합산한 메트릭을 조회합니다.
+
+    Returns:
+        dict[str, dict[str, int]]: 네임스페이스별 카운터 값
+    """
+    for recorder in _recorders.values():
+        await recorder.flush()
+
+    metrics: dict[str, dict[str, int]] = {}
+    async for key in redis_client.scan_iter(match=METRICS_KEY.format(namespace="*")):
+        values = await redis_client.hgetall(key)
+        metrics[key.split(":", 1)[1]] = {field: int(value) for field, value in values.items()}
+    return metrics
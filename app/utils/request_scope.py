@@ -0,0 +1,20 @@
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestScope:
+    deadline: float  # 요청의 마감 시각 (unix epoch 초). 워커 작업에 그대로 전달됩니다.
+    # 클라이언트 연결이 끊겼는지 확인 (Starlette request.is_disconnected)
+    is_disconnected: Callable[[], Awaitable[bool]]
+
+    @property
+    def remaining_seconds(self) -> float:
+        return self.deadline - time.time()
+
+
+# 요청 종속성이 설정하고, 같은 요청 안의 InferenceClient가 작업 마감 시각과 연결 끊김 확인에 사용합니다.
+# 요청 밖(백그라운드/배치 작업)에서는 None입니다.
+current_request_scope: ContextVar[RequestScope | None] = ContextVar("current_request_scope", default=None)
@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+from fastapi import HTTPException
+
+from app.core import config
+from app.utils.common import redis_client
+from app.utils.metrics import get_metrics_recorder
+
+FLIGHT_LOCK_KEY = "flight:{namespace}:lock:{digest}"  # 선행 요청(리더) 표시, 값은 리더 토큰
+FLIGHT_RESULT_KEY = (
+    "flight:{namespace}:result:{digest}"  # 끝난 결과 (SINGLE_FLIGHT_RESULT_TTL_SECONDS 동안 재시도 요청도 재사용)
+)
+FLIGHT_CHANNEL = "flight:{namespace}:done:{digest}"  # 결과/실패 알림 (pub/sub)
+
+
+def flight_digest(inputs: Any) -> str:
+    """
+    입력(프롬프트, 생성 옵션 등 JSON 직렬화 가능한 값)을 키 순서와 무관한 해시로 만듭니다.
+    """
+    return hashlib.sha256(orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class SingleFlight:
+    """
+    입력이 같은 비싼 생성 작업(LLM 호출, 가이드 생성)이 동시에 여러 번 요청되면 한 번만 실행하고 결과를 나눠 주는 분산 single-flight입니다.
+
+    같은 프로세스의 동시 요청은 하나의 태스크를 함께 기다리고, 프로세스 간에는 Redis 락(SET NX)을 잡은 요청이 리더가 되어 실행합니다.
+    나머지는 결과 채널을 구독해 기다리다 리더가 저장/발행한 결과를 받습니다. 리더는 실행하는 동안 락을 연장하므로,
+    리더 프로세스가 죽으면 락이 SINGLE_FLIGHT_LOCK_TTL_SECONDS 안에 만료되고 기다리던 요청 중 하나가 리더를 이어받습니다.
+    대기 시간이 timeout을 넘으면 기다리지 않고 직접 실행합니다. 리더가 HTTPException으로 실패하면 기다리던 요청도 같은 오류를 받습니다.
+
+    결과는 JSON 직렬화 가능한 값이어야 합니다.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.metrics = get_metrics_recorder("single_flight")
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def run(self, inputs: Any, compute: Callable[[], Awaitable[Any]], timeout: float) -> Any:
+        """
+        같은 입력의 작업이 진행 중이면 그 결과를 기다리고, 없으면 compute를 실행합니다.
+        호출한 요청이 취소되어도(연결 끊김) 진행 중인 작업은 끝까지 실행되어 함께 기다리던 요청과 재시도 요청이 결과를 받습니다.
+
+        Args:
+            inputs (Any): 작업을 식별하는 입력 (JSON 직렬화 가능)
+            compute (Callable): 실제 작업
+            timeout (float): 다른 요청의 결과를 기다릴 최대 시간(초). 넘으면 직접 실행
+
+        Returns:
+            Any: 작업 결과
+        """
+        digest = flight_digest(inputs)
+        task = self._inflight.get(digest)
+        if task is None:
+            task = asyncio.create_task(self._run(digest, compute, timeout))
+            self._inflight[digest] = task
+            task.add_done_callback(lambda done: self._finished(digest, done))
+        else:
+            self.metrics.incr(f"{self.namespace}:shared")
+        return await asyncio.shield(task)
+
+    def _finished(self, digest: str, task: asyncio.Task) -> None:
+        self._inflight.pop(digest, None)
+        if not task.cancelled():
+            task.exception()  # 기다리던 요청이 모두 취소된 경우에도 "never retrieved" 경고가 나지 않도록 확인 처리
+
+    async def _run(self, digest: str, compute: Callable[[], Awaitable[Any]], timeout: float) -> Any:
+        deadline = time.monotonic() + timeout
+        lock_key = FLIGHT_LOCK_KEY.format(namespace=self.namespace, digest=digest)
+        result_key = FLIGHT_RESULT_KEY.format(namespace=self.namespace, digest=digest)
+        while True:
+            # 방금 끝난 작업의 결과가 남아 있으면(재시도 요청) 락 없이 바로 사용합니다.
+            payload = await redis_client.get(result_key)
+            if payload is None:
+                token = uuid.uuid4().hex
+                if await redis_client.set(lock_key, token, nx=True, ex=config.SINGLE_FLIGHT_LOCK_TTL_SECONDS):
+                    return await self._lead(digest, token, compute)
+                payload = await self._follow(digest, deadline)
+            if payload is not None:
+                self.metrics.incr(f"{self.namespace}:follower")
+                await self.metrics.maybe_flush()
+                body = orjson.loads(payload)
+                if "error" in body:
+                    raise HTTPException(**body["error"])
+                return body["result"]
+            if time.monotonic() >= deadline:
+                self.metrics.incr(f"{self.namespace}:timeout")
+                return await compute()
+            # 리더가 결과 없이 사라짐(프로세스 종료, 예외) → 락을 다시 시도해 리더를 이어받습니다.
+            self.metrics.incr(f"{self.namespace}:takeover")
+
+    async def _lead(self, digest: str, token: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        lock_key = FLIGHT_LOCK_KEY.format(namespace=self.namespace, digest=digest)
+        keepalive = asyncio.create_task(self._keep_lock(lock_key, token))
+        self.metrics.incr(f"{self.namespace}:leader")
+        try:
+            result = await compute()
+        except HTTPException as err:
+            await self._publish(digest, {"error": {"status_code": err.status_code, "detail": err.detail}}, store=False)
+            raise
+        else:
+            await self._publish(digest, {"result": result}, store=True)
+            return result
+        finally:
+            keepalive.cancel()
+            # 조회 후 삭제 사이에 락이 만료되어 다른 리더가 잡을 수 있지만, 그 경우에도 결과를 한 번 더 만들 뿐입니다.
+            if await redis_client.get(lock_key) == token:
+                await redis_client.delete(lock_key)
+            await self.metrics.maybe_flush()
+
+    async def _keep_lock(self, lock_key: str, token: str) -> None:
+        ttl = config.SINGLE_FLIGHT_LOCK_TTL_SECONDS
+        while True:
+            await asyncio.sleep(ttl / 3)
+            if await redis_client.get(lock_key) != token:
+                return
+            await redis_client.expire(lock_key, ttl)
+
+    async def _publish(self, digest: str, body: dict[str, Any], store: bool) -> None:
+        payload = orjson.dumps(body)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            if store:
+                pipe.set(
+                    FLIGHT_RESULT_KEY.format(namespace=self.namespace, digest=digest),
+                    payload,
+                    ex=config.SINGLE_FLIGHT_RESULT_TTL_SECONDS,
+                )
+            pipe.publish(FLIGHT_CHANNEL.format(namespace=self.namespace, digest=digest), payload)
+            await pipe.execute()
+
+    async def _follow(self, digest: str, deadline: float) -> str | None:
+        """
+        리더의 결과를 기다립니다. 리더가 결과 없이 락을 놓았거나 deadline이 지나면 None을 반환합니다.
+        발행을 놓치지 않도록 채널을 먼저 구독한 뒤 저장된 결과와 락을 확인합니다.
+        """
+        lock_key = FLIGHT_LOCK_KEY.format(namespace=self.namespace, digest=digest)
+        result_key = FLIGHT_RESULT_KEY.format(namespace=self.namespace, digest=digest)
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(FLIGHT_CHANNEL.format(namespace=self.namespace, digest=digest))
+        try:
+            while True:
+                payload = await redis_client.get(result_key)
+                if payload is not None:
+                    return payload
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not await redis_client.exists(lock_key):
+                    return None
+                message = await pubsub.get_message(timeout=min(remaining, config.SINGLE_FLIGHT_POLL_SECONDS))
+                if message is not None:
+                    return message["data"]
+        finally:
+            await pubsub.aclose()
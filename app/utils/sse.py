@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+import orjson
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # nginx가 응답을 버퍼링하면 토큰이 모였다가 한꺼번에 전달되므로 프록시 버퍼링을 끕니다.
+    "X-Accel-Buffering": "no",
+}
+
+_END = object()
+
+
+def sse_frame(data: dict[str, Any]) -> bytes:
+    """
+    SSE data 프레임 하나를 만듭니다. (orjson은 bytes를 바로 반환하므로 문자열 인코딩 단계가 없습니다)
+    """
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _pump(tokens: AsyncIterator[str], queue: asyncio.Queue[Any]) -> None:
+    try:
+        async for token in tokens:
+            await queue.put(token)
+    except Exception as err:
+        await queue.put(err)
+    else:
+        await queue.put(_END)
+
+
+async def _next(queue: asyncio.Queue[Any], flush_at: float | None) -> Any:
+    """
+    다음 토큰을 기다립니다. 묶는 중인 덩어리가 있으면 flush_at까지만 기다리고, 시간이 다 되면 None을 반환합니다.
+    """
+    if flush_at is None:
+        return await queue.get()
+    try:
+        return await asyncio.wait_for(queue.get(), max(0.0, flush_at - time.monotonic()))
+    except TimeoutError:
+        return None
+
+
+async def coalesce(
+    tokens: AsyncIterator[str], max_delay: float, max_chars: int, buffer_size: int = 256
+) -> AsyncGenerator[str]:
+    """
+    작은 토큰들을 시간/크기 예산 안에서 묶어 내보냅니다.
+    첫 토큰이 버퍼에 들어온 뒤 max_delay초가 지나거나 max_chars자 이상 모이면 한 덩어리로 내보내므로
+    토큰마다 프레임/시스템 콜이 생기지 않으면서 체감 지연은 max_delay 이내로 유지됩니다.
+
+    업스트림은 최대 buffer_size개 토큰까지만 앞서 읽습니다. 클라이언트가 느려 전송이 밀리면
+    이 버퍼가 차서 업스트림 읽기가 멈추고, 그 압력이 TCP 흐름 제어로 LLM 서버까지 전달됩니다.
+    반복을 중단하면 업스트림 반복도 닫힙니다.
+
+    Args:
+        tokens (AsyncIterator[str]): 업스트림 토큰 스트림
+        max_delay (float): 첫 토큰 이후 덩어리를 내보내기까지 최대 대기 시간(초)
+        max_chars (int): 덩어리 최대 글자 수
+        buffer_size (int): 업스트림을 앞서 읽을 최대 토큰 수
+
+    Yields:
+        str: 묶인 텍스트 덩어리
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer_size)
+    reader = asyncio.create_task(_pump(tokens, queue))
+    try:
+        pending: list[str] = []
+        size = 0
+        flush_at: float | None = None
+        while True:
+            item = await _next(queue, flush_at)
+            if isinstance(item, str):
+                pending.append(item)
+                size += len(item)
+                flush_at = flush_at or time.monotonic() + max_delay
+                if size < max_chars:
+                    continue
+            if pending:
+                yield "".join(pending)
+                pending, size, flush_at = [], 0, None
+            if isinstance(item, Exception):
+                raise item
+            if item is _END:
+                return
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+        aclose = getattr(tokens, "aclose", None)
+        if aclose is not None:
+            await aclose()
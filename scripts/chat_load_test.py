@@ -0,0 +1,121 @@
+"""
+챗봇 HTTP 경로(POST /chat/message)와 WebSocket 경로(/chat/ws)의 처리량을 비교하는 부하 테스트입니다.
+
+같은 메시지 N개를 보내 초당 완료 메시지 수와 응답 완료 지연(p50/p95)을 출력합니다.
+HTTP는 동시 요청 --concurrency개로, WebSocket은 연결 --connections개에 연결당 동시 요청을 나눠(최대 CHAT_WS_MAX_INFLIGHT) 보냅니다.
+WebSocket은 첫 토큰 지연도 함께 출력합니다. 기본 메시지는 답변 캐시를 타지 않도록 개인화 표현을 포함합니다.
+
+    uv run uvicorn scripts.llm_standin:app --port 9000
+    uv run uvicorn app.main:app --port 8000 --workers 4
+    uv run python -m scripts.chat_load_test --token <access token> --requests 400 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import httpx
+import orjson
+import websockets
+
+from app.core import config
+
+
+def summarize(name: str, elapsed: float, latencies: list[float], first_tokens: list[float] | None = None) -> None:
+    latencies.sort()
+    line = (
+        f"{name:>4}: {len(latencies)} messages in {elapsed:.2f}s = {len(latencies) / elapsed:.1f} msg/s, "
+        f"p50 {statistics.median(latencies) * 1000:.0f}ms, p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}ms"
+    )
+    if first_tokens:
+        line += f", first token p50 {statistics.median(first_tokens) * 1000:.0f}ms"
+    print(line)
+
+
+async def run_http(args: argparse.Namespace) -> None:
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(args.requests):
+        queue.put_nowait(index)
+
+    async def client(http: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            index = queue.get_nowait()
+            started = time.perf_counter()
+            response = await http.post("/chat/message", params={"message": args.message.format(index=index)})
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    headers = {"Authorization": f"Bearer {args.token}"}
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=120) as http:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(args.concurrency)))
+        summarize("http", time.perf_counter() - started, latencies)
+
+
+async def run_ws(args: argparse.Namespace) -> None:
+    latencies: list[float] = []
+    first_tokens: list[float] = []
+    url = args.base_url.replace("http", "ws", 1) + "/chat/ws"
+    inflight = max(1, min(config.CHAT_WS_MAX_INFLIGHT, args.concurrency // args.connections))
+    counter = iter(range(args.requests))
+
+    async def connection() -> None:
+        async with websockets.connect(url, additional_headers={"Authorization": f"Bearer {args.token}"}) as socket:
+            pending: dict[str, tuple[float, float | None]] = {}  # request_id → (보낸 시각, 첫 토큰 시각)
+
+            async def send_next() -> None:
+                index = next(counter, None)
+                if index is not None:
+                    request_id = uuid.uuid4().hex
+                    pending[request_id] = (time.perf_counter(), None)
+                    message = args.message.format(index=index)
+                    await socket.send(orjson.dumps({"type": "message", "request_id": request_id, "message": message}))
+
+            for _ in range(inflight):
+                await send_next()
+            while pending:
+                frame = orjson.loads(await socket.recv())
+                request_id = frame.get("request_id")
+                if frame["type"] == "ping":
+                    await socket.send(b'{"type":"pong"}')
+                elif frame["type"] == "delta" and pending[request_id][1] is None:
+                    pending[request_id] = (pending[request_id][0], time.perf_counter())
+                elif frame["type"] in ("done", "error") and request_id in pending:
+                    sent, first_token = pending.pop(request_id)
+                    if frame["type"] == "error":
+                        raise RuntimeError(frame["detail"])
+                    latencies.append(time.perf_counter() - sent)
+                    first_tokens.append((first_token or time.perf_counter()) - sent)
+                    await send_next()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(args.connections)))
+    summarize("ws", time.perf_counter() - started, latencies, first_tokens)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare chat throughput over HTTP and WebSocket")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", default=os.getenv("CHAT_LOAD_TEST_TOKEN"), help="access token")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 진행할 메시지 수")
+    parser.add_argument("--connections", type=int, default=4, help="WebSocket 연결 수")
+    parser.add_argument("--message", default="제가 먹는 혈압약을 아침 대신 저녁에 먹어도 되나요? ({index})")
+    parser.add_argument("--mode", choices=("both", "http", "ws"), default="both")
+    args = parser.parse_args()
+    if not args.token:
+        raise SystemExit("--token or CHAT_LOAD_TEST_TOKEN is required")
+
+    if args.mode in ("both", "http"):
+        await run_http(args)
+    if args.mode in ("both", "ws"):
+        await run_ws(args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+사용자 임상 정보 스냅샷(Redis clinical:snapshot:{user_id})을 일괄 재구성하거나 DB와 어긋났는지 검사합니다.
+
+    # 전체(또는 --user로 지정한) 사용자 스냅샷을 DB에서 다시 만듭니다. (배포 후 백필, 형식 버전 변경 시)
+    uv run python -m scripts.clinical_snapshot rebuild [--user a@b.com ...]
+
+    # 저장된 스냅샷을 DB와 비교해 어긋난 사용자와 섹션을 출력합니다. --repair면 어긋난 스냅샷을 다시 만듭니다.
+    uv run python -m scripts.clinical_snapshot check [--repair]
+
+어긋난 사용자가 있으면 check는 종료 코드 1로 끝납니다. (주기 작업에서 경보용)
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+
+from tortoise import Tortoise
+
+from app.db.databases import TORTOISE_ORM
+from app.models.user import User
+from app.services.clinical_snapshot import clinical_snapshots
+
+
+async def iter_users(user_ids: list[str] | None, batch_size: int) -> AsyncIterator[User]:
+    if user_ids:
+        for user in await User.filter(id__in=user_ids):
+            yield user
+        return
+    offset = 0
+    while batch := await User.all().order_by("id").offset(offset).limit(batch_size):
+        for user in batch:
+            yield user
+        offset += len(batch)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or verify per-user clinical snapshots")
+    parser.add_argument("command", choices=("rebuild", "check"))
+    parser.add_argument("--user", action="append", dest="users", help="대상 사용자 ID (여러 번 지정 가능, 없으면 전체)")
+    parser.add_argument("--repair", action="store_true", help="check: 어긋난 스냅샷을 다시 만듭니다")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    total, drifted = 0, 0
+
+    async def process(user: User) -> None:
+        nonlocal drifted
+        async with semaphore:
+            if args.command == "rebuild":
+                await clinical_snapshots.rebuild(user)
+                return
+            drift = await clinical_snapshots.check(user, repair=args.repair)
+            if drift:
+                drifted += 1
+                print(f"{user.id}: {', '.join(drift)}{' (repaired)' if args.repair else ''}")
+
+    try:
+        pending: set[asyncio.Task] = set()
+        async for user in iter_users(args.users, args.batch_size):
+            total += 1
+            pending.add(asyncio.create_task(process(user)))
+            if len(pending) >= args.batch_size:
+                await asyncio.gather(*pending)
+                pending.clear()
+        await asyncio.gather(*pending)
+        await clinical_snapshots.metrics.flush()
+    finally:
+        await Tortoise.close_connections()
+
+    if args.command == "rebuild":
+        print(f"rebuilt {total} snapshots")
+        return 0
+    print(f"checked {total} users, {drifted} drifted")
+    return 1 if drifted and not args.repair else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
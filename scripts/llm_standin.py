@@ -0,0 +1,79 @@
+"""
+개발/부하 테스트용 LLM 대역 서버 (OpenAI 호환 POST /v1/chat/completions, stream=true 지원).
+
+실제 LLM 없이 챗봇 스트리밍 경로를 확인할 수 있도록 고정 답변을 토큰 단위로 일정 간격마다 SSE로 내보냅니다.
+클라이언트가 연결을 끊으면 생성을 멈추고 중단된 토큰 수를 로그로 남깁니다.
+
+    uv run uvicorn scripts.llm_standin:app --port 9000
+    (API 서버: LLM_BASE_URL=http://localhost:9000/v1)
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+TOKEN_INTERVAL_SECONDS = float(os.getenv("STANDIN_TOKEN_INTERVAL_SECONDS", "0.02"))
+ANSWER = (
+    "말씀하신 증상과 복용 중인 약을 함께 고려하면, 처방받은 용법대로 복용을 이어가시는 것이 좋습니다. "
+    "복용 후 어지러움이나 두근거림이 계속되면 복용을 임의로 중단하지 마시고 처방한 의사나 약사와 상담해 주세요. "
+    "본 답변은 의학적 진단을 대신하지 않습니다."
+)
+
+logger = logging.getLogger("uvicorn.error")
+app = FastAPI()
+
+
+def tokenize(text: str) -> list[str]:
+    # 실제 BPE 토큰처럼 어절을 2~3글자 조각으로 나눕니다.
+    return [text[index : index + 3] for index in range(0, len(text), 3)]
+
+
+def chunk(completion_id: str, model: str, delta: dict, finish_reason: str | None = None) -> bytes:
+    body = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return b"data: " + orjson.dumps(body) + b"\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    model = body.get("model", "standin")
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    tokens = tokenize(ANSWER)
+
+    if not body.get("stream"):
+        return ORJSONResponse(
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": ANSWER}, "finish_reason": "stop"}],
+            }
+        )
+
+    async def generate():
+        sent = 0
+        try:
+            yield chunk(completion_id, model, {"role": "assistant"})
+            for token in tokens:
+                await asyncio.sleep(TOKEN_INTERVAL_SECONDS)
+                yield chunk(completion_id, model, {"content": token})
+                sent += 1
+            yield chunk(completion_id, model, {}, "stop")
+            yield b"data: [DONE]\n\n"
+        finally:
+            if sent < len(tokens):
+                logger.info("generation aborted by client after %d/%d tokens", sent, len(tokens))
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
@@ -0,0 +1,84 @@
+"""
+챗봇 질문 유형(복약/증상/일반/시스템) 분류 모델을 오프라인에서 학습해 앱이 읽는 JSON으로 내보냅니다.
+
+학습 데이터는 JSONL 형식이며 각 줄은 {"text": str, "label": str} 입니다.
+특징은 앱과 같은 app.services.intent.intent_features(해시 문자 n-gram)를 사용하고, scikit-learn 로지스틱 회귀로 학습한 뒤
+절댓값이 --prune 미만인 가중치를 버린 희소 가중치만 저장합니다.
+
+    uv run --group ai python -m scripts.train_intent_classifier
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_score
+
+from app.core import config
+from app.services.intent import INTENT_LABELS, intent_features
+
+
+def vectorize(texts: list[str], n_features: int, ngram_range: tuple[int, int]) -> csr_matrix:
+    rows, cols, values = [], [], []
+    for row, text in enumerate(texts):
+        for index, value in intent_features(text, n_features, ngram_range).items():
+            rows.append(row)
+            cols.append(index)
+            values.append(value)
+    return csr_matrix((values, (rows, cols)), shape=(len(texts), n_features))
+
+
+def main() -> None:
+    data_dir = Path(config.INTENT_MODEL_PATH).parent
+    parser = argparse.ArgumentParser(description="Train the chat question-type classifier")
+    parser.add_argument("--data", type=Path, default=data_dir / "chat_intents.jsonl")
+    parser.add_argument("--out", type=Path, default=Path(config.INTENT_MODEL_PATH))
+    parser.add_argument("--n-features", type=int, default=2**18)
+    parser.add_argument("--c", type=float, default=10.0)
+    parser.add_argument("--prune", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    with args.data.open(encoding="utf-8") as f:
+        samples = [json.loads(line) for line in f if line.strip()]
+    unknown = {sample["label"] for sample in samples} - set(INTENT_LABELS)
+    if unknown:
+        raise SystemExit(f"unknown labels: {sorted(unknown)}")
+
+    ngram_range = (1, 3)
+    features = vectorize([sample["text"] for sample in samples], args.n_features, ngram_range)
+    targets = np.array([INTENT_LABELS.index(sample["label"]) for sample in samples])
+    model = LogisticRegression(C=args.c, max_iter=1000)
+    accuracy = cross_val_score(model, features, targets, cv=5).mean()
+    model.fit(features, targets)
+
+    # 학습에 없는 유형이 있어도 INTENT_LABELS 순서를 유지하도록 model.classes_ 기준으로 정렬합니다.
+    labels = [INTENT_LABELS[label_index] for label_index in model.classes_]
+    coef = model.coef_
+    weights = {
+        str(index): [round(float(weight), 4) for weight in coef[:, index]]
+        for index in np.flatnonzero(np.abs(coef).max(axis=0) >= args.prune)
+    }
+    args.out.write_text(
+        json.dumps(
+            {
+                "version": f"intent-{datetime.now():%Y%m%d%H%M%S}",
+                "labels": labels,
+                "n_features": args.n_features,
+                "ngram_range": list(ngram_range),
+                "intercept": [round(float(value), 4) for value in model.intercept_],
+                "weights": weights,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+        encoding="utf-8",
+    )
+    print(f"trained on {len(samples)} samples (5-fold accuracy {accuracy:.3f}), {len(weights)} features -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()